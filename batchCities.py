@@ -0,0 +1,161 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+
+# The MIT License (MIT)
+
+# This code is part of the Random3Dcity package
+
+# Copyright (c) 2015
+# Filip Biljecki
+# Delft University of Technology
+# fbiljecki@gmail.com
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Generate many independent cities in one process, or in a pool of processes, without starting the engine for each of them.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+#-- The scripts of the engine, next to this one, are imported once per process and called for each job
+import randomiseCity
+import generateCityGML
+
+
+#-- Parse command-line arguments
+PARSER = argparse.ArgumentParser(description='Generator of many cities in CityGML in warm processes, according to a list of jobs.')
+PARSER.add_argument('-j', '--jobs',
+    help='JSON lines file with a job per line, e.g. {"directory": "city1", "seed": 1, "n": 50, "city": ["-v", "1"], "options": ["-gr", "1"]}.', required=True)
+PARSER.add_argument('-pr', '--processes',
+    help='Number of processes among which the jobs are divided (default is 1, the jobs run in this process).', required=False)
+PARSER.add_argument('-rs', '--results',
+    help='Append the timings of each job to this JSON lines file.', required=False)
+ARGS = vars(PARSER.parse_args())
+JOBSFILE = ARGS['jobs']
+if ARGS['processes'] is not None:
+    PROCESSES = int(ARGS['processes'])
+else:
+    PROCESSES = 1
+RESULTS = ARGS['results']
+
+#-- Functions
+
+def loadJobs(fname):
+    """Read the jobs, one JSON object per line: the output directory, and either the number of buildings of a random city (n, with an optional seed and arguments of randomiseCity.py as city) or the XML of the buildings (filename).
+    The arguments of generateCityGML.py are given as options."""
+    jobs = []
+    jobsFile = open(fname, "r")
+    for line in jobsFile:
+        if not line.strip():
+            continue
+        job = json.loads(line)
+        if 'directory' not in job:
+            raise ValueError("The job " + line.strip() + " does not have an output directory.")
+        if ('n' in job) == ('filename' in job):
+            raise ValueError("The job " + line.strip() + " should have either the number of buildings (n) or the XML of the buildings (filename).")
+        jobs.append(job)
+    jobsFile.close()
+    return jobs
+
+
+def checkArguments(script, arguments):
+    """Parse the arguments of a job with the parser of a script of the engine, which ends the process on the arguments it does not accept."""
+    try:
+        script.PARSER.parse_args(arguments)
+    except SystemExit:
+        raise ValueError(script.__name__ + ".py does not accept the arguments " + ' '.join(arguments) + ".")
+
+
+def runJob(numberedJob):
+    """Randomise the city of a job if needed and generate its CityGML files.
+    Output: a dictionary with the timings of the job, or its error."""
+    number, job = numberedJob
+    result = {'job': number, 'directory': job['directory']}
+    start = time.time()
+    try:
+        if not os.path.isdir(job['directory']):
+            os.makedirs(job['directory'])
+        if 'filename' in job:
+            fname = job['filename']
+        else:
+            arguments = ['-o', job['directory'] + '/buildings.xml', '-n', str(job['n'])]
+            if job.get('seed') is not None:
+                arguments += ['-sd', str(job['seed'])]
+            arguments += [str(argument) for argument in job.get('city', [])]
+            checkArguments(randomiseCity, arguments)
+            fname = randomiseCity.writeCity(arguments)
+        generationstart = time.time()
+        arguments = ['-i', fname, '-o', job['directory'], '-rp', '0'] + [str(argument) for argument in job.get('options', [])]
+        checkArguments(generateCityGML, arguments)
+        buildingcounter = generateCityGML.generateCity(arguments, messages=False)
+    except Exception as error:
+        result['error'] = repr(error)
+        result['total'] = time.time() - start
+        return result
+    end = time.time()
+    result['buildings'] = buildingcounter
+    result['randomisation'] = generationstart - start
+    result['generation'] = end - generationstart
+    result['total'] = end - start
+    result['throughput'] = result['buildings'] / result['total']
+    return result
+
+
+#----------------------------------------------------------------------
+#-- Start of the program
+if __name__ == '__main__':
+    jobs = loadJobs(JOBSFILE)
+    print("Running", len(jobs), "job(s) with", PROCESSES, "process(es)...")
+    batchstart = time.time()
+    if PROCESSES > 1:
+        #-- Each process keeps the engine it imported warm for its jobs
+        pool = multiprocessing.Pool(PROCESSES)
+        results = pool.imap(runJob, enumerate(jobs))
+    else:
+        results = (runJob(numberedJob) for numberedJob in enumerate(jobs))
+    if RESULTS:
+        resultsFile = open(RESULTS, "a")
+    failed = 0
+    buildingcounter = 0
+    for result in results:
+        if 'error' in result:
+            failed += 1
+            print("Job", result['job'], "(" + result['directory'] + ") failed:", result['error'])
+        else:
+            buildingcounter += result['buildings']
+            print("Job", result['job'], "(" + result['directory'] + "):", result['buildings'], "building(s) in", "%.2f" % result['total'], "s,", "%.1f" % result['throughput'], "building(s) per second")
+        if RESULTS:
+            resultsFile.write(json.dumps(result, sort_keys=True) + '\n')
+    if RESULTS:
+        resultsFile.close()
+    if PROCESSES > 1:
+        pool.close()
+        pool.join()
+    duration = time.time() - batchstart
+    print("\nGenerated", len(jobs) - failed, "of", len(jobs), "job(s) with", buildingcounter, "building(s) in", "%.2f" % duration, "s,", "%.1f" % (buildingcounter / duration), "building(s) per second.")
+    if failed:
+        sys.exit(1)
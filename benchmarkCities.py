@@ -0,0 +1,168 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+
+# The MIT License (MIT)
+
+# This code is part of the Random3Dcity package
+
+# Copyright (c) 2015
+# Filip Biljecki
+# Delft University of Technology
+# fbiljecki@gmail.com
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+
+"""
+Benchmark the generator on a fixed set of cities: its start-up (the interpreter, the imports and the setup until the first building) and its throughput.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+
+#-- Parse command-line arguments
+PARSER = argparse.ArgumentParser(description='Benchmark of the generator of CityGML on a fixed set of cities, to track its start-up and throughput between versions.')
+PARSER.add_argument('-cs', '--cases',
+    help='Run only these cases (comma separated, by default all of them).', required=False)
+PARSER.add_argument('-rt', '--repeat',
+    help='Number of runs of each case, of which the median is taken (default is 3).', required=False)
+PARSER.add_argument('-rs', '--results',
+    help='Append the results of each case to this JSON lines file.', required=False)
+PARSER.add_argument('-bl', '--baseline',
+    help='JSON lines file with the results of an earlier benchmark, to which the results are compared (the last line of each case).', required=False)
+
+#-- The scripts of the engine, next to this one
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+RANDOMISERFILE = DIRECTORY + '/randomiseCity.py'
+GENERATORFILE = DIRECTORY + '/generateCityGML.py'
+
+#-- The fixed cities of the benchmark: the number of buildings of a random city with seed 1 and the arguments of generateCityGML.py
+CASES = [
+    {'name': 'start', 'n': 1, 'options': ['-re', 'LOD1_2_F0_H3']},
+    {'name': 'LOD1', 'n': 200, 'options': ['-re', 'LOD1_2_F0_H3']},
+    {'name': 'LOD2', 'n': 200, 'options': ['-re', 'LOD2_2_F0']},
+    {'name': 'LOD3', 'n': 100, 'options': ['-re', 'LOD3_2']},
+    {'name': 'all', 'n': 50, 'options': []},
+    {'name': 'variants', 'n': 20, 'options': ['-gr', '1', '-ov', '1']},
+]
+SEED = 1
+
+
+#-- Functions
+
+def median(values):
+    """Median of a list of numbers."""
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def runCase(case, directory, repeat):
+    """Randomise the city of a case and generate it a number of times, each time in a new process.
+    Output: the median timings of the runs in seconds. The start-up is the time of the process until its first building, including the start of the interpreter."""
+    xml = directory + '/buildings.xml'
+    subprocess.check_call([sys.executable, RANDOMISERFILE, '-n', str(case['n']), '-sd', str(SEED), '-o', xml], stdout=open(os.devnull, 'w'))
+    benchmark = directory + '/benchmark.jsonl'
+    runs = []
+    for run in range(repeat):
+        output = directory + '/city'
+        if os.path.isdir(output):
+            shutil.rmtree(output)
+        os.mkdir(output)
+        start = time.time()
+        subprocess.check_call([sys.executable, GENERATORFILE, '-i', xml, '-o', output, '-rp', '0', '-bm', benchmark] + case['options'], stdout=open(os.devnull, 'w'))
+        wall = time.time() - start
+        benchmarkFile = open(benchmark, "r")
+        timings = json.loads(benchmarkFile.readlines()[-1])
+        benchmarkFile.close()
+        timings['wall'] = wall
+        runs.append(timings)
+    result = {'case': case['name'], 'buildings': runs[0]['buildings'], 'representations': runs[0]['representations'], 'repeat': repeat,
+              'date': time.strftime('%Y-%m-%dT%H:%M:%S'), 'python': sys.version.split()[0]}
+    result['start'] = median([timings['wall'] - timings['generation'] - timings['writing'] for timings in runs])
+    for name in ['generation', 'writing', 'wall']:
+        result[name] = median([timings[name] for timings in runs])
+    result['throughput'] = result['buildings'] / result['wall']
+    return result
+
+
+def loadBaseline(fname):
+    """The last results of each case in a file of results."""
+    baseline = {}
+    baselineFile = open(fname, "r")
+    for line in baselineFile:
+        if line.strip():
+            result = json.loads(line)
+            baseline[result['case']] = result
+    baselineFile.close()
+    return baseline
+
+
+#----------------------------------------------------------------------
+#-- Start of the program
+if __name__ == '__main__':
+    ARGS = vars(PARSER.parse_args())
+    if ARGS['cases'] is not None:
+        names = ARGS['cases'].split(',')
+        for name in names:
+            if name not in [case['name'] for case in CASES]:
+                raise ValueError("There is no case " + name + " in the benchmark.")
+        cases = [case for case in CASES if case['name'] in names]
+    else:
+        cases = CASES
+    if ARGS['repeat'] is not None:
+        repeat = int(ARGS['repeat'])
+        if repeat < 1:
+            raise ValueError("Each case needs at least one run.")
+    else:
+        repeat = 3
+    if ARGS['baseline'] is not None:
+        baseline = loadBaseline(ARGS['baseline'])
+    else:
+        baseline = {}
+    print("%-10s %9s %6s %10s %12s %10s %10s %14s" % ("Case", "Buildings", "Files", "Start (s)", "Buildings (s)", "Files (s)", "Total (s)", "Buildings/s"))
+    directory = tempfile.mkdtemp()
+    try:
+        for case in cases:
+            casedirectory = directory + '/' + case['name']
+            os.mkdir(casedirectory)
+            result = runCase(case, casedirectory, repeat)
+            print("%-10s %9d %6d %10.3f %12.3f %10.3f %10.3f %14.1f" % (case['name'], result['buildings'], result['representations'], result['start'], result['generation'], result['writing'], result['wall'], result['throughput']))
+            #-- The change since the baseline, where a negative start-up or a positive throughput is an improvement
+            if case['name'] in baseline:
+                previous = baseline[case['name']]
+                print("%-10s %9s %6s %+9.1f%% %12s %10s %10s %+13.1f%%" % ("", "", "", 100.0 * (result['start'] / previous['start'] - 1), "", "", "", 100.0 * (result['throughput'] / previous['throughput'] - 1)))
+            if ARGS['results']:
+                resultsFile = open(ARGS['results'], "a")
+                resultsFile.write(json.dumps(result, sort_keys=True) + '\n')
+                resultsFile.close()
+    finally:
+        shutil.rmtree(directory)
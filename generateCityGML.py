@@ -34,13 +34,44 @@ from __future__ import print_function
 Generate CityGML files according to the building XML specifications.
 """
 
+import time
+#-- Start of the script, and the processor time taken until then by the interpreter (its start and the compilation of the script)
+STARTTIME = time.time()
+STARTCPU = getattr(time, 'process_time', getattr(time, 'clock', None))()
+
 from lxml import etree
 import argparse
 import random
-import numpy
 import math
-import uuid
 import copy
+import os
+import json
+import shutil
+import hashlib
+import mmap
+import gzip
+import sys
+import subprocess
+import threading
+import fnmatch
+import importlib
+import socket
+import zlib
+import string
+import traceback
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+try:
+    import resource
+except ImportError:
+    #-- Not available on Windows, where the plan does not predict the memory
+    resource = None
+
+#-- The components of the engine are imported on demand, except the shared geometry and the construction of the buildings
+from random3dcity.geometry import ns_gml, ns_bldg, ns_xlink, openingGeometries
+from random3dcity.city import BUILDINGCOMPONENTS, CITYGMLHEADER, CITYGMLFOOTER, createCityGML, CityModels, producedBuilder, representationNames, buildingSpecification, sharedValues, buildingDimensions, CityGMLbuilding, rotateBuilding
 
 
 #-- Parse command-line arguments
@@ -61,10 +92,67 @@ PARSER.add_argument('-ov', '--solids',
     help='Generate solids and semantic variants (ov = other variants).', required=False)
 PARSER.add_argument('-s', '--street',
     help='Generate a road network.', required=False)
+PARSER.add_argument('-st', '--streettiles',
+    help='Split the road network into tiles, each of them a Road of its own.', required=False)
 PARSER.add_argument('-v', '--vegetation',
     help='Generate vegetation.', required=False)
 PARSER.add_argument('-rp', '--report',
-    help='Report on the progress. Disable with Python3.', required=False)
+    help='Report on the progress with events as JSON lines, to the standard error or to this file (default is true; allowed values 0/1, True/False, or a file).', required=False)
+PARSER.add_argument('-ri', '--reportinterval',
+    help='Seconds between the events of the progress (default is 10).', required=False)
+PARSER.add_argument('-cp', '--checkpoint',
+    help='Persist the completed buildings every N buildings so that an interrupted run can be resumed.', required=False)
+PARSER.add_argument('-rs', '--resume', nargs='?', const='1',
+    help='Resume an interrupted run from its last checkpoint.', required=False)
+PARSER.add_argument('-ca', '--cache',
+    help='Directory of the cache of generated buildings, reused between runs.', required=False)
+PARSER.add_argument('-cs', '--cachesize',
+    help='Size limit of the cache in MB (default is 1024).', required=False)
+PARSER.add_argument('-pi', '--previous',
+    help='XML of buildings of a previous run: only the added and changed buildings are generated, the others are taken from its CityGML files.', required=False)
+PARSER.add_argument('-pd', '--previousdirectory',
+    help='Directory with the CityGML files of the previous run (default is the output directory).', required=False)
+PARSER.add_argument('-wt', '--writers',
+    help='Number of threads writing the CityGML files while the buildings are generated (by default the files are written at the end).', required=False)
+PARSER.add_argument('-wk', '--workers',
+    help='Number of processes among which the buildings are divided.', required=False)
+PARSER.add_argument('--worker', help=argparse.SUPPRESS, required=False)
+PARSER.add_argument('-rw', '--representationworkers',
+    help='Number of processes among which the representations are divided, balanced by their time measured on a few buildings.', required=False)
+PARSER.add_argument('--group', help=argparse.SUPPRESS, required=False)
+PARSER.add_argument('--shared', help=argparse.SUPPRESS, required=False)
+PARSER.add_argument('-gz', '--compress',
+    help='Compress the CityGML files with gzip.', required=False)
+PARSER.add_argument('-at', '--attributes',
+    help='Write a table with the attributes of the buildings, including the derived ones (csv, npz, or both as csv,npz).', required=False)
+PARSER.add_argument('-mt', '--metrics',
+    help='Write a table with the volume, areas per semantic class and heights of each building in each representation (csv, npz, or both as csv,npz).', required=False)
+PARSER.add_argument('-va', '--validate',
+    help='Validate the generated polygons and solids, and write a report of the errors (csv, npz, or both as csv,npz).', required=False)
+PARSER.add_argument('-dv', '--deviations',
+    help='Write a table with the deviations between pairs of representations of each building (comma separated pairs, e.g. LOD1_2_F0_H3:LOD3_2,LOD2_2_F0:LOD3_2).', required=False)
+PARSER.add_argument('-ig', '--implicit',
+    help='Write the repeated building installations and openings (e.g. dormers and windows) as instances of an implicit geometry.', required=False)
+PARSER.add_argument('-cm', '--combined',
+    help='Representations to combine in one file, in which each building carries all of them (comma separated, e.g. LOD1_2_F0_H3,LOD2_2_F0,LOD3_2).', required=False)
+PARSER.add_argument('-re', '--representations',
+    help='Generate only the representations matching these patterns (comma separated, wildcards allowed, e.g. LOD1_2_*,LOD3_2,interior-*).', required=False)
+PARSER.add_argument('-sm', '--stream',
+    help='Stream representations while the buildings are generated instead of writing their files (comma separated representation=target, where the target is - for the standard output, a named pipe, or unix: followed by the path of a socket, e.g. LOD2_2_F0=-,LOD1_2_F0_H3=unix:/tmp/loader.sock).', required=False)
+PARSER.add_argument('-pl', '--plan',
+    help='Write nothing, but generate a sample of this number of buildings and predict the size, polygons and time of each representation, and the peak memory of the whole run.', required=False)
+PARSER.add_argument('-pb', '--planbuildings',
+    help='Number of buildings of the run predicted by the plan (default is the number of buildings in the XML).', required=False)
+PARSER.add_argument('-tg', '--target',
+    help='Generate buildings until a representation reaches a size in bytes, polygons or vertices (e.g. LOD2_2_F0=2GB, LOD3_2=1000000polygons or LOD1_2_F0_H3=5000000vertices).', required=False)
+PARSER.add_argument('-en', '--ensemble',
+    help='Write this number of realisations of the city with noise on the coordinates, after its CityGML files.', required=False)
+PARSER.add_argument('-nm', '--noise',
+    help='Noise of the realisations as standard deviations (comma separated, e.g. vertices=0.05,heights=0.02,dimensions=0.01,seed=1): of each vertex in metres, and of the scale of the height and of the footprint of each building.', required=False)
+PARSER.add_argument('-qr', '--quarantine',
+    help='Leave out the buildings that fail and record them in quarantine.jsonl in the output directory, instead of stopping the run (default is true).', required=False)
+PARSER.add_argument('-bm', '--benchmark',
+    help='Append the timings of the run (start of the interpreter, setup, buildings and writing) to this JSON lines file.', required=False)
 
 def argRead(ar, default=None):
     """Corrects the argument input in case it is not in the format True/False."""
@@ -81,5690 +169,1915 @@ def argRead(ar, default=None):
         raise ValueError("Argument value not recognised.")
     return ar
 
-ARGS = vars(PARSER.parse_args())
-BUILDINGFILE = ARGS['filename']
-DIRECTORY = ARGS['directory']
-ROTATIONENABLED = argRead(ARGS['rotation'], True)
-BUILDINGPARTS = argRead(ARGS['parts'], True)
-ASSIGNID = argRead(ARGS['id'], True)
-VARIANTS = argRead(ARGS['geometricref'], False)
-SOLIDS = argRead(ARGS['solids'], False)
-STREETS = argRead(ARGS['street'], False)
-VEGETATION = argRead(ARGS['vegetation'], False)
-REPORT = argRead(ARGS['report'], True)
-
-if REPORT:
-    try:
-        from fish import ProgressFish
-    except:
-        print("--Package Fish (used for reporting) failed to load, hence reporting is disabled--")
-        #-- Just disable reporting if Fish fails to load
-        REPORT = False
-
-#-- Name spaces
-ns_citygml = "http://www.opengis.net/citygml/2.0"
-
-ns_gml = "http://www.opengis.net/gml"
-ns_bldg = "http://www.opengis.net/citygml/building/2.0"
-ns_tran = "http://www.opengis.net/citygml/transportation/2.0"
-ns_veg = "http://www.opengis.net/citygml/vegetation/2.0"
-ns_xsi = "http://www.w3.org/2001/XMLSchema-instance"
-ns_xAL = "urn:oasis:names:tc:ciq:xsdschema:xAL:2.0"
-ns_xlink = "http://www.w3.org/1999/xlink"
-ns_dem = "http://www.opengis.net/citygml/relief/2.0"
-ns_fme = "http://www.safe.com/xml/xmltables"
-
-nsmap = {
-    None: ns_citygml,
-    'gml': ns_gml,
-    'bldg': ns_bldg,
-    'tran': ns_tran,
-    'veg': ns_veg,
-    'xsi': ns_xsi,
-    'xAL': ns_xAL,
-    'xlink': ns_xlink,
-    'dem': ns_dem,
-    'fme': ns_fme
-}
-
-
-#-- Functions
-
-def createCityGML(suffix):
-    """Creates a CityGML foundation to be filled later by the remaining part of the script."""
-    CityModel = etree.Element("CityModel", nsmap=nsmap)
-    citymodelname = etree.SubElement(CityModel, "{%s}name" % ns_gml)
-    citymodelname.text = str(suffix)
-    boundedBy = etree.SubElement(CityModel, "{%s}boundedBy" % ns_gml)
-    Envelope = etree.SubElement(boundedBy, "{%s}Envelope" % ns_gml, srsDimension="3")
-    Envelope.attrib["srsName"] = "EPSG:28992"
-    lowercorner = etree.SubElement(Envelope, "{%s}lowerCorner" % ns_gml)
-    lowercorner.text = '0 0 0'
-    uppercorner = etree.SubElement(Envelope, "{%s}upperCorner" % ns_gml)
-    uppercorner.text = '4000 4000 25'
-    return CityModel
-
-
-def storeCityGML(suffix):
-    "Write the CityGML file."
-    citygml = etree.tostring(CityGMLs[suffix], pretty_print=True)
-    #-- Write the CityGML file
-    if str(suffix) == 'Ground Truth':
-        fname = DIRECTORY + '/' + 'groundTruth.gml'
+def configure(arguments):
+    """Set the options of a run from the arguments of the script (a list of strings, as the command line without the name of the script)."""
+    global ARGUMENTS, ARGS, BUILDINGFILE, DIRECTORY, ROTATIONENABLED, BUILDINGPARTS, ASSIGNID, VARIANTS, SOLIDS, STREETS, STREETTILES, VEGETATION, REPORT, REPORTINTERVAL, CHECKPOINT, RESUME, QUARANTINE, CACHE, PREVIOUS, ATTRIBUTES, METRICS, DEVIATIONS, VALIDATE, IMPLICIT, WRITERS, WORKERS, WORKER, COMPRESS, COMBINED, REPRESENTATIONS, BENCHMARK, STREAMS, TARGET, TARGETSIZE, ENSEMBLE, NOISE, REPRESENTATIONWORKERS, GROUP, SHARED, PLAN, PLANWORKERS, PLANWRITERS, PLANCHECKPOINT, PLANBUILDINGS, SCHEDULER, STANDARDOUTPUT, MESSAGES, PREVIOUSDIRECTORY, CACHESIZE
+    ARGUMENTS = arguments
+    ARGS = vars(PARSER.parse_args(arguments))
+    BUILDINGFILE = ARGS['filename']
+    DIRECTORY = ARGS['directory']
+    ROTATIONENABLED = argRead(ARGS['rotation'], True)
+    BUILDINGPARTS = argRead(ARGS['parts'], True)
+    ASSIGNID = argRead(ARGS['id'], True)
+    VARIANTS = argRead(ARGS['geometricref'], False)
+    SOLIDS = argRead(ARGS['solids'], False)
+    STREETS = argRead(ARGS['street'], False)
+    STREETTILES = argRead(ARGS['streettiles'], False)
+    VEGETATION = argRead(ARGS['vegetation'], False)
+    if ARGS['report'] is not None and ARGS['report'] not in ['0', '1', 'False', 'True']:
+        #-- The events are appended to a file
+        REPORT = ARGS['report']
     else:
-        fname = DIRECTORY + '/' + str(suffix) + '.gml'
-    citygmlFile = open(fname, "w")
-    #-- Header of the XML
-    citygmlFile.write("<?xml version=\"1.0\" encoding=\"utf-8\"?>\n")
-    citygmlFile.write("<!-- Generated by Random3Dcity (http://github.com/tudelft3d/Random3Dcity), a tool developed by Filip Biljecki at TU Delft. Version: 2015-03-11. -->\n")
-    # citygmlFile.write(citygml)
-    citygmlFile.write(citygml.decode('utf-8'))
-    citygmlFile.close()
-
-
-def verticesBody(o, x, y, z, h=None, top=None, override=None):
-    """Calculates the vertices of the building block/body depending on the input."""
-    #-- If the h value is not supplied than it is zero
-    if not h:
-         h = 0.0
-    if top:
-        if top < 1.5:
-            z = z + float(top) * h
-    elif top is None:
-            if override:
-                z = override
-            else:
-                z = z + h
-
-    p = []
-    p0 = "%s %s %s" % (o[0],o[1],o[2])
-    p.append(p0)
-    p1 = "%s %s %s" % (o[0]+x,o[1],o[2])
-    p.append(p1)
-    p2 = "%s %s %s" % (o[0]+x,o[1]+y,o[2])
-    p.append(p2)
-    p3 = "%s %s %s" % (o[0],o[1]+y,o[2])
-    p.append(p3)
-    p4 = "%s %s %s" % (o[0],o[1],o[2]+z)
-    p.append(p4)
-    p5 = "%s %s %s" % (o[0]+x,o[1],o[2]+z)
-    p.append(p5)
-    p6 = "%s %s %s" % (o[0]+x,o[1]+y,o[2]+z)
-    p.append(p6)
-    p7 = "%s %s %s" % (o[0],o[1]+y,o[2]+z)
-    p.append(p7)
-
-    return p
-
-
-def verticesBodyList(o, x, y, z, h=None, top=None):
-    """Calculates the vertices of the building block/body as a list depending on the input. Redundant function."""
-    #-- If the h value is not supplied than it is zero
-    if not h:
-         h = 0.0
-    if top:
-        z = z + float(top) * h
-
-    p = []
-    p0 = [o[0],o[1],o[2]]
-    p.append(p0)
-    p1 = [o[0]+x,o[1],o[2]]
-    p.append(p1)
-    p2 = [o[0]+x,o[1]+y,o[2]]
-    p.append(p2)
-    p3 = [o[0],o[1]+y,o[2]]
-    p.append(p3)
-    p4 = [o[0],o[1],o[2]+z]
-    p.append(p4)
-    p5 = [o[0]+x,o[1],o[2]+z]
-    p.append(p5)
-    p6 = [o[0]+x,o[1]+y,o[2]+z]
-    p.append(p6)
-    p7 = [o[0],o[1]+y,o[2]+z]
-    p.append(p7)
-    return p
-
-
-def verticesRoof(b, h, rtype, width=None):
-    """Calculates the vertices of the building roof."""
-    #-- The basic information
-    o, x, y, z = b
-    #-- If no roof
-    if not h:
-        h = 0.0
-    #-- Roof points
-    r = []
-    if rtype == 'Gabled':
-        r0 = "%s %s %s" % (o[0]+.5*x, o[1], o[2]+z+h)
-        r.append(r0)
-        r1 = "%s %s %s" % (o[0]+.5*x, o[1]+y, o[2]+z+h)
-        r.append(r1)
-    elif rtype == 'Shed':
-        r0 = "%s %s %s" % (o[0], o[1], o[2]+z+h)
-        r.append(r0)
-        r1 = "%s %s %s" % (o[0], o[1]+y, o[2]+z+h)
-        r.append(r1)
-    elif rtype == 'Hipped' or rtype == 'Pyramidal':
-        r0 = "%s %s %s" % (o[0]+.5*x, o[1]+width, o[2]+z+h)
-        r.append(r0)
-        r1 = "%s %s %s" % (o[0]+.5*x, o[1]+y-width, o[2]+z+h)
-        r.append(r1)        
-    return r
-
-
-def verticesOverhangs(b, p, h, rtype, ovh, r, width=None):
-    """Calculates the vertices of the roof overhangs"""
-    #-- The basic information about the building
-    o, x, y, z = b
-    #-- Roof points
-    if r:
-        r0, r1 = r
-    #-- Overhang lenghts
-    ovhx, ovhy = ovh
-
-    overhangs = []
-    interior = []
-
-    #-- Overhang points
-    if rtype == 'Gabled':
-
-        if ovhx > 0:
-            fx = (.5*x) / ovhx
-            ovhz = h / fx
-        else:
-            ovhz = 0
-
-        overhangs.append("")
-        overhangs[0] += r0
-        overhangs[0] += " %s %s %s" % (o[0]+.5*x, o[1]-ovhy, o[2]+z+h)
-        overhangs[0] += " %s %s %s" % (o[0]+x+ovhx, o[1]-ovhy, o[2]+z-ovhz)
-        overhangs[0] += " %s %s %s" % (o[0]+x+ovhx, o[1]+y+ovhy, o[2]+z-ovhz)
-        overhangs[0] += " %s %s %s" % (o[0]+.5*x, o[1]+y+ovhy, o[2]+z+h)
-        overhangs[0] += " " + r1
-        overhangs[0] += " " + p[6]
-        overhangs[0] += " " + p[5]
-        overhangs[0] += " " + r0
-        #-- The above polygon has no interior
-        interior.append(None)
-        
-        overhangs.append("")
-        overhangs[1] += r1
-        overhangs[1] += " %s %s %s" % (o[0]+.5*x, o[1]+y+ovhy, o[2]+z+h)
-        overhangs[1] += " %s %s %s" % (o[0]-ovhx, o[1]+y+ovhy, o[2]+z-ovhz)
-        overhangs[1] += " %s %s %s" % (o[0]-ovhx, o[1]-ovhy, o[2]+z-ovhz)
-        overhangs[1] += " %s %s %s" % (o[0]+.5*x, o[1]-ovhy, o[2]+z+h)
-        overhangs[1] += " " + r0
-        overhangs[1] += " " + p[4]
-        overhangs[1] += " " + p[7]
-        overhangs[1] += " " + r1
-        #-- The above polygon has no interior
-        interior.append(None)
-
-        eaves = o[2]+z-ovhz
-
-    elif rtype == 'Shed':
-
-        if ovhx > 0:
-            fx = x / ovhx
-            ovhz = h / fx
-        else:
-            ovhz = 0
-
-        overhangs.append("")
-        overhangs[0] += "%s %s %s" % (o[0]-ovhx, o[1]-ovhy, o[2]+z+h+ovhz)
-        overhangs[0] += " %s %s %s" % (o[0]+x+ovhx, o[1]-ovhy, o[2]+z-ovhz)
-        overhangs[0] += " %s %s %s" % (o[0]+x+ovhx, o[1]+y+ovhy, o[2]+z-ovhz)
-        overhangs[0] += " %s %s %s" % (o[0]-ovhx, o[1]+y+ovhy, o[2]+z+h+ovhz)
-        overhangs[0] += " %s %s %s" % (o[0]-ovhx, o[1]-ovhy, o[2]+z+h+ovhz)
-
-        interior.append("")
-        interior[0] += r0
-        interior[0] += " " + r1
-        interior[0] += " " + p[6]
-        interior[0] += " " + p[5]
-        interior[0] += " " + r0
-
-        eaves = o[2]+z-ovhz
-
-    elif rtype == 'Hipped' or rtype == 'Pyramidal':
-
-        if ovhx > 0:
-            fx = (.5*x) / ovhx
-            ovhz = h / fx
-            
-            fy = h / ovhz
-            ovhy = width / fy
-
-        else:
-            ovhy = 0
-            ovhz = 0
-
-        overhangs.append("")
-        overhangs[0] += "%s %s %s" % (o[0]-ovhx, o[1]-ovhy, o[2]+z-ovhz)
-        overhangs[0] += " %s %s %s" % (o[0]+x+ovhx, o[1]-ovhy, o[2]+z-ovhz)
-        overhangs[0] += " " + p[5]
-        overhangs[0] += " " + p[4]
-        overhangs[0] += " %s %s %s" % (o[0]-ovhx, o[1]-ovhy, o[2]+z-ovhz)
-        interior.append(None)
-
-        overhangs.append("")
-        overhangs[1] += "%s %s %s" % (o[0]+x+ovhx, o[1]-ovhy, o[2]+z-ovhz)
-        overhangs[1] += " %s %s %s" % (o[0]+x+ovhx, o[1]+y+ovhy, o[2]+z-ovhz)
-        overhangs[1] += " " + p[6]
-        overhangs[1] += " " + p[5]
-        overhangs[1] += " %s %s %s" % (o[0]+x+ovhx, o[1]-ovhy, o[2]+z-ovhz)
-        interior.append(None)
-
-        overhangs.append("")
-        overhangs[2] += "%s %s %s" % (o[0]-ovhx, o[1]+y+ovhy, o[2]+z-ovhz)
-        overhangs[2] += " " + p[7]
-        overhangs[2] += " " + p[6]
-        overhangs[2] += " %s %s %s" % (o[0]+x+ovhx, o[1]+y+ovhy, o[2]+z-ovhz)
-        overhangs[2] += " %s %s %s" % (o[0]-ovhx, o[1]+y+ovhy, o[2]+z-ovhz)
-        interior.append(None)
-
-        overhangs.append("")
-        overhangs[3] += "%s %s %s" % (o[0]-ovhx, o[1]-ovhy, o[2]+z-ovhz)
-        overhangs[3] += " " + p[4]
-        overhangs[3] += " " + p[7]
-        overhangs[3] += " %s %s %s" % (o[0]-ovhx, o[1]+y+ovhy, o[2]+z-ovhz)
-        overhangs[3] += " %s %s %s" % (o[0]-ovhx, o[1]-ovhy, o[2]+z-ovhz)
-        interior.append(None)
-
-        eaves = o[2]+z-ovhz
-    
-    elif rtype == 'Flat':
-
-        overhangs.append("")
-        overhangs[0] += "%s %s %s" % (o[0]-ovhx,o[1]-ovhy,o[2]+z)
-        overhangs[0] += " %s %s %s" % (o[0]+x+ovhx,o[1]-ovhy,o[2]+z)
-        overhangs[0] += " %s %s %s" % (o[0]+x+ovhx,o[1]+y+ovhy,o[2]+z)
-        overhangs[0] += " %s %s %s" % (o[0]-ovhx,o[1]+y+ovhy,o[2]+z)
-        overhangs[0] += " %s %s %s" % (o[0]-ovhx,o[1]-ovhy,o[2]+z)
-
-        interior.append("")
-        interior[0] += p[4]
-        interior[0] += " " + p[7]
-        interior[0] += " " + p[6]
-        interior[0] += " " + p[5]
-        interior[0] += " " + p[4]
-        eaves = o[2]+z
-
-    ovhy_recalculated = ovhy
-
-    #-- Overhang points
-    return overhangs, interior, eaves, ovhy_recalculated
-
-def wallOpeningOrganiser(openings):
-    """Divide the openings per wall."""
-    if openings:
-        holes = [[], [], [], []]
-        opns = [[], [], [], []]
-        for i in range(0,4):
-            opns[i].append([])
-            opns[i].append([])
-        door = openings[0]
-        if door != '':
-            doorwall = int(door['wall'])
-            holes[doorwall].append(door['ring'])
-            opns[doorwall][0] = door
-
-        for o in openings[1]:
-            try:
-                windowwall = int(o['wall'])
-            except:
-                windowwall = int(o['side'])
-            holes[windowwall].append(o['ring'])
-            opns[windowwall][1].append(o)
-
+        REPORT = argRead(ARGS['report'], True)
+    if ARGS['reportinterval'] is not None:
+        REPORTINTERVAL = float(ARGS['reportinterval'])
+        if REPORTINTERVAL <= 0:
+            raise ValueError("The interval of the report has to be a positive number of seconds.")
     else:
-        holes = None
-        opns = None
-
-    return holes, opns
-
-
-def GMLPointList(point):
-    """Translates the list of coordinates of one point to a string representation (GML)."""
-    x = point[0]
-    y = point[1]
-    z = point[2]
-    return "%s %s %s" % (x, y, z)
-
-
-def multiGMLPointList(points):
-    """Translates the list of multiple points to a string representation (GML)."""
-    l = ""
-    for t in points:
-        if len(l) > 0:
-            l += " "
-        l += GMLPointList(t)
-    return l
-
-
-def GMLstring2points(pointstring):
-    """Converts the list of points in string (GML) to a list."""
-    listPoints = []
-    #-- List of coordinates
-    coords = pointstring.split()
-    #-- Store the coordinate tuple
-    assert(len(coords) % 3 == 0)
-    for i in range(0, len(coords), 3):
-        listPoints.append([coords[i], coords[i+1], coords[i+2]])
-    return listPoints
-
-
-def GMLreverser(pointlist):
-    """Reverses the order of the points, i.e. the normal of the ring."""
-    revlist = pointlist[::-1]
-    return revlist
-
-
-def GMLreversedRing(r):
-    """Reverses a ring."""
-    gmllist= GMLstring2points(r)
-    revgmllist= GMLreverser(gmllist)
-    revring = multiGMLPointList(revgmllist)
-    return revring
-
-
-def dormerVertices(dormers, p, h, rtype, oList, width):
-    """Computes the vertices of a dormer."""
-    [o, x, y, z] = oList
-    dList = []
-    dListGML = []
-    for drm in dormers:
-        d = [[], [], [], [], [], []]
-        dGML = [[], [], [], [], [], []]
-        if rtype == 'Gabled':
-            xperimiter = (float(drm['origin'][1]) * x * 0.5) / h
-            xperimiter2 = (float(drm['size'][1]) * x * 0.5) / h + xperimiter
-            if drm['side'] == 1:
-                d[1] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + drm['origin'][1]]
-                d[2] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + drm['origin'][1]]
-                d[4] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[5] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[0] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[3] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-            elif drm['side'] == 3:
-                d[1] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]), p[5][2] + drm['origin'][1]]
-                d[2] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + drm['origin'][1]]
-                d[4] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[5] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[0] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[3] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-        
-        elif rtype == 'Shed':
-            xperimiter = (float(drm['origin'][1]) * x * 1.0) / h
-            xperimiter2 = (float(drm['size'][1]) * x * 1.0) / h + xperimiter            
-            if drm['side'] == 1:
-                d[1] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + drm['origin'][1]]
-                d[2] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + drm['origin'][1]]
-                d[4] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[5] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[0] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[3] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-       
-        elif rtype == 'Hipped' or rtype == 'Pyramidal':
-            xperimiter = (float(drm['origin'][1]) * x * 0.5) / h
-            xperimiter2 = (float(drm['size'][1]) * x * 0.5) / h + xperimiter
-            yperimiter = (float(drm['origin'][1]) * width) / h
-            yperimiter2 = (float(drm['size'][1]) * width) / h + yperimiter
-            if drm['side'] == 1:
-                d[1] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + drm['origin'][1]]
-                d[2] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + drm['origin'][1]]
-                d[4] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[5] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[0] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[3] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-            elif drm['side'] == 3:
-                d[1] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]), p[5][2] + drm['origin'][1]]
-                d[2] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + drm['origin'][1]]
-                d[4] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[5] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[0] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[3] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-            elif drm['side'] == 0:
-                d[1] = [p[4][0]+float(drm['origin'][0]), p[4][1] + yperimiter, p[5][2] + drm['origin'][1]]
-                d[2] = [p[4][0]+float(drm['origin'][0])+float(drm['size'][0]), p[4][1]  + yperimiter, p[5][2] + drm['origin'][1]]
-                d[4] = [p[4][0]+float(drm['origin'][0]), p[4][1]  + yperimiter, p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[5] = [p[4][0]+float(drm['origin'][0])+float(drm['size'][0]), p[4][1]  + yperimiter, p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[0] = [p[4][0]+float(drm['origin'][0]), p[4][1]  + yperimiter2, p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[3] = [p[4][0]+float(drm['origin'][0])+float(drm['size'][0]), p[4][1]  + yperimiter2, p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-            elif drm['side'] == 2:
-                d[1] = [p[6][0]-float(drm['origin'][0]), p[6][1] - yperimiter, p[5][2] + drm['origin'][1]]
-                d[2] = [p[6][0]-float(drm['origin'][0])-float(drm['size'][0]), p[6][1]  - yperimiter, p[5][2] + drm['origin'][1]]
-                d[4] = [p[6][0]-float(drm['origin'][0]), p[6][1] - yperimiter, p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[5] = [p[6][0]-float(drm['origin'][0])-float(drm['size'][0]), p[6][1]  - yperimiter, p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[0] = [p[6][0]-float(drm['origin'][0]), p[6][1] - yperimiter2, p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[3] = [p[6][0]-float(drm['origin'][0])-float(drm['size'][0]), p[6][1] - yperimiter2, p[5][2] + drm['origin'][1] + float(drm['size'][1])]                
-
-        elif rtype == 'Flat':
-            #-- Valid only for roof windows
-            xperimiter = float(drm['origin'][1])
-            xperimiter2 = float(drm['size'][1]) + xperimiter 
-            if drm['side'] == 1:
-                d[1] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2]]
-                d[2] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2]]
-                d[4] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[5] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
-                d[0] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2]]
-                d[3] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2]]
-
-        if d != [[], [], [], [], [], []]:
-            for i in range(0, 6):
-                #for j in range(0, 3):
-                #    d[i][j] = round(d[i][j], 2)
-                dGML[i] = GMLPointList(d[i])
-        dList.append(d)
-        dListGML.append(dGML)
-
-    return dList, dListGML
-
-def interiordormerVertices(dormers, p, h, rtype, oList, width, wallThickness, rWth, dormerTickness, topThickness, rWth2=None):
-    """Computes the vertices of a dormer."""
-    [o, x, y, z] = oList
-    dList = []
-    dListGML = []
-    for drm in dormers:
-        d = [[], [], [], [], [], []]
-        dGML = [[], [], [], [], [], []]
-        if rtype == 'Gabled':
-            xperimiter = (float(drm['origin'][1]) * x * 0.5) / h
-            xperimiter2 = (float(drm['size'][1]) * x * 0.5) / h + xperimiter
-            intxper = (xperimiter + dormerTickness) - rWth
-            dper2 = ((drm['origin'][1] + float(drm['size'][1]) - dormerTickness) * x * 0.5) / h + rWth
-            hper1 = intxper * h / (.5 * x)
-            if drm['side'] == 1:
-                d[1] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + hper1]
-                d[2] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + hper1]
-                d[4] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                d[5] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                d[0] = [p[1][0]- dper2, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                d[3] = [p[1][0]- dper2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-            elif drm['side'] == 3:
-                # d[1] = [p[1][0]+xperimiter + dormerTickness, p[1][1] - float(drm['origin'][0]) - dormerTickness, p[5][2] + hper1]
-                # d[2] = [p[1][0]+xperimiter + dormerTickness, p[1][1] - float(drm['origin'][0]) - float(drm['size'][0]) + dormerTickness, p[5][2] + hper1]
-                # d[4] = [p[1][0]+xperimiter + dormerTickness, p[1][1] - float(drm['origin'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                # d[5] = [p[1][0]+xperimiter + dormerTickness, p[1][1] - float(drm['origin'][0]) - float(drm['size'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                # d[0] = [p[1][0]+xperimiter2 + (rWth-dormerTickness), p[1][1] - float(drm['origin'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                # d[3] = [p[1][0]+xperimiter2 + (rWth-dormerTickness), p[1][1] - float(drm['origin'][0]) - float(drm['size'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
- 
-                d[1] = [p[4][0]+xperimiter + dormerTickness, p[7][1] - float(drm['origin'][0]) - dormerTickness, p[5][2] + hper1]
-                d[2] = [p[4][0]+xperimiter + dormerTickness, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]) + dormerTickness, p[5][2] + hper1]
-                d[4] = [p[4][0]+xperimiter + dormerTickness, p[7][1] - float(drm['origin'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                d[5] = [p[4][0]+xperimiter + dormerTickness, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                d[0] = [p[4][0] + dper2, p[7][1] - float(drm['origin'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                d[3] = [p[4][0] + dper2, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-        
-        elif rtype == 'Shed':
-            xperimiter = (float(drm['origin'][1]) * x) / h
-            xperimiter2 = (float(drm['size'][1]) * x) / h + xperimiter 
-            intxper = (xperimiter + dormerTickness) - rWth
-            dper2 = ((drm['origin'][1] + float(drm['size'][1]) - dormerTickness) * x) / h + rWth
-            hper1 = intxper * h / x
-            if drm['side'] == 1:
-                # d[1] = [p[1][0]-xperimiter - rWth, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1]]
-                # d[2] = [p[1][0]-xperimiter - rWth, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1]]
-                # d[4] = [p[1][0]-xperimiter - rWth, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - topThickness]
-                # d[5] = [p[1][0]-xperimiter - rWth, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - topThickness]
-                # d[0] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - topThickness]
-                # d[3] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - topThickness]
-                d[1] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + hper1]
-                d[2] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + hper1]
-                d[4] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                d[5] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                d[0] = [p[1][0] - dper2, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                d[3] = [p[1][0] - dper2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-
-        elif rtype == 'Hipped' or rtype == 'Pyramidal':
-            xperimiter = (float(drm['origin'][1]) * x * 0.5) / h
-            xperimiter2 = (float(drm['size'][1]) * x * 0.5) / h + xperimiter
-            yperimiter = (float(drm['origin'][1]) * width) / h
-            yperimiter2 = (float(drm['size'][1]) * width) / h + yperimiter
-            intxper = (xperimiter + dormerTickness) - rWth
-            dper2 = ((drm['origin'][1] + float(drm['size'][1]) - dormerTickness) * x * 0.5) / h + rWth
-            hper1 = intxper * h / (.5 * x)
-
-            intyper = (yperimiter + dormerTickness) - rWth2
-            dper2_2 = ((drm['origin'][1] + float(drm['size'][1]) - dormerTickness) * width) / h + rWth2
-            hper2 = (intyper) * h / width
-            if drm['side'] == 1:
-                # d[1] = [p[1][0]-xperimiter - rWth, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1]]
-                # d[2] = [p[1][0]-xperimiter - rWth, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1]]
-                # d[4] = [p[1][0]-xperimiter - rWth, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - topThickness]
-                # d[5] = [p[1][0]-xperimiter - rWth, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - topThickness]
-                # d[0] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - topThickness]
-                # d[3] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - topThickness]
-                d[1] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + hper1]
-                d[2] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + hper1]
-                d[4] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                d[5] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                d[0] = [p[1][0] - dper2, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                d[3] = [p[1][0] - dper2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-            elif drm['side'] == 3:
-                d[1] = [p[4][0]+xperimiter + dormerTickness, p[7][1] - float(drm['origin'][0]) - dormerTickness, p[5][2] + hper1]
-                d[2] = [p[4][0]+xperimiter + dormerTickness, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]) + dormerTickness, p[5][2] + hper1]
-                d[4] = [p[4][0]+xperimiter + dormerTickness, p[7][1] - float(drm['origin'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                d[5] = [p[4][0]+xperimiter + dormerTickness, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                d[0] = [p[4][0]+ dper2, p[7][1] - float(drm['origin'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                d[3] = [p[4][0]+ dper2, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-            elif drm['side'] == 0:
-                d[1] = [p[4][0]+float(drm['origin'][0]) + dormerTickness, p[4][1] + yperimiter + dormerTickness, p[5][2] + hper2]
-                d[2] = [p[4][0]+float(drm['origin'][0])+float(drm['size'][0]) - dormerTickness, p[4][1] + yperimiter + dormerTickness, p[5][2] + hper2]
-                d[4] = [p[4][0]+float(drm['origin'][0]) + dormerTickness, p[4][1]  + yperimiter + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                d[5] = [p[4][0]+float(drm['origin'][0])+float(drm['size'][0]) - dormerTickness, p[4][1] + yperimiter + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                d[0] = [p[4][0]+float(drm['origin'][0]) + dormerTickness, p[4][1] + dper2_2, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                d[3] = [p[4][0]+float(drm['origin'][0])+float(drm['size'][0]) - dormerTickness, p[4][1] + dper2_2, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-            elif drm['side'] == 2:
-                d[1] = [p[6][0]-float(drm['origin'][0]) - dormerTickness, p[6][1] - yperimiter - dormerTickness, p[5][2] + hper2]
-                d[2] = [p[6][0]-float(drm['origin'][0])-float(drm['size'][0]) + dormerTickness, p[6][1]  - yperimiter - dormerTickness, p[5][2] + hper2]
-                d[4] = [p[6][0]-float(drm['origin'][0]) - dormerTickness, p[6][1] - yperimiter - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                d[5] = [p[6][0]-float(drm['origin'][0])-float(drm['size'][0]) + dormerTickness, p[6][1]  - yperimiter - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                d[0] = [p[6][0]-float(drm['origin'][0]) - dormerTickness, p[6][1] - dper2_2, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
-                d[3] = [p[6][0]-float(drm['origin'][0])-float(drm['size'][0]) + dormerTickness, p[6][1] - dper2_2, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]              
-
-        if d != [[], [], [], [], [], []]:
-            for i in range(0, 6):
-                #for j in range(0, 3):
-                #    d[i][j] = round(d[i][j], 2)
-                dGML[i] = GMLPointList(d[i])
-        dList.append(d)
-        dListGML.append(dGML)
-
-    return dList, dListGML
-
-
-
-def chimneyVertices(chimneys, p, h, rtype, oList, width):
-    """
-    Computes the vertices of a chimney.
-    The origin in chimneys is different than the one in dormers, hence a separate function.
-    """
-    [o, x, y, z] = oList
-    dList = []
-    dListGML = []
-    for drm in chimneys:
-        d = [[], [], [], [], [], [], [], []]
-        dGML = [[], [], [], [], [], [], [], []]
-        chHeight = float(drm['size'][2])
-        if rtype == 'Gabled':
-            #xperimiter = (float(drm['origin'][1]) * x * 0.5) / h
-            #xperimiter2 = (float(drm['size'][1]) * x * 0.5) / h + xperimiter
-            xperimiter = float(drm['origin'][1])
-            xperimiter2 = float(drm['size'][1]) + xperimiter
-            zperimiter1 = (xperimiter * h) / (x*.5)
-            zperimiter2 = (xperimiter2 * h) / (x*.5)
-            if drm['side'] == 1:
-                d[1] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter1]
-                d[2] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter1]
-                d[4] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter2 + chHeight]
-                d[5] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter2 + chHeight]
-                d[0] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter2]
-                d[3] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter2]
-                d[7] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter2 + chHeight]
-                d[6] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter2 + chHeight]
-            elif drm['side'] == 3:
-                d[1] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]), p[5][2] + zperimiter1]
-                d[2] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + zperimiter1]
-                d[4] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]), p[5][2] + zperimiter2 + chHeight]
-                d[5] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + zperimiter2 + chHeight]
-                d[0] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]), p[5][2] + zperimiter2]
-                d[3] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + zperimiter2]
-                d[7] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]), p[5][2] + zperimiter2 + chHeight]
-                d[6] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + zperimiter2 + chHeight]
-
-        elif rtype == 'Shed':
-            #xperimiter = (float(drm['origin'][1]) * x * 1.0) / h
-            xperimiter = float(drm['origin'][1]) 
-            #xperimiter2 = (float(drm['size'][1]) * x * 1.0) / h + xperimiter
-            xperimiter2 = float(drm['size'][1]) + xperimiter
-            zperimiter1 = (xperimiter * h) / x
-            zperimiter2 = (xperimiter2 * h) / x
-            if drm['side'] == 1:
-                d[1] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter1]
-                d[2] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter1]
-                d[4] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter2 + chHeight]
-                d[5] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter2 + chHeight]
-                d[0] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter2]
-                d[3] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter2]
-                d[7] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter2 + chHeight]
-                d[6] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter2 + chHeight]
-       
-        elif rtype == 'Hipped' or rtype == 'Pyramidal':
-
-            xperimiter = float(drm['origin'][1])
-            xperimiter2 = float(drm['size'][1]) + xperimiter
-            yperimiter = (float(drm['origin'][1]) * width) / h
-            yperimiter2 = (float(drm['size'][1]) * width) / h + yperimiter
-            zperimiter1 = (xperimiter * h) / (x*.5)
-            zperimiter2 = (xperimiter2 * h) / (x*.5)
-
-            if drm['side'] == 1:
-                d[1] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter1]
-                d[2] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter1]
-                d[4] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter2 + chHeight]
-                d[5] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter2 + chHeight]
-                d[0] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter2]
-                d[3] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter2]
-                d[7] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter2 + chHeight]
-                d[6] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter2 + chHeight]
-            elif drm['side'] == 3:
-                d[1] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]), p[5][2] + zperimiter1]
-                d[2] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + zperimiter1]
-                d[4] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]), p[5][2] + zperimiter2 + chHeight]
-                d[5] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + zperimiter2 + chHeight]
-                d[0] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]), p[5][2] + zperimiter2]
-                d[3] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + zperimiter2]
-                d[7] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]), p[5][2] + zperimiter2 + chHeight]
-                d[6] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + zperimiter2 + chHeight]
-
-        elif rtype == 'Flat':
-            #-- Not valid for dormers
-            xperimiter = float(drm['origin'][1])
-            xperimiter2 = float(drm['size'][1]) + xperimiter    
-            if drm['side'] == 1:
-                d[1] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2]]
-                d[2] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2]]
-                d[4] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + chHeight]
-                d[5] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + chHeight]
-                d[0] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2]]
-                d[3] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2]]
-                d[7] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2] + chHeight]
-                d[6] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + chHeight]
-
-        if d != [[], [], [], [], [], []]:
-            for i in range(0, 8):
-                #for j in range(0, 3):
-                #    d[i][j] = round(d[i][j], 2)
-                dGML[i] = GMLPointList(d[i])
-        dList.append(d)
-        dListGML.append(dGML)
-
-    return dList, dListGML
-
-def adjustRoofFeatures(roofType, eaves, old_origin, overhang_x, overhang_y, side):
-    """This function adjusts the location of the features of the roof for models of different geometric references."""
-    old_x = old_origin[0]
-    old_y = old_origin[1]
-
-    if roofType == 'Gabled' or roofType == 'Shed' or roofType == 'Hipped' or roofType == 'Pyramidal':
-        if side == 1 or side == 3:
-            adjusted_x = old_x + overhang_y
-            adjusted_y = old_y + eaves
-        elif side == 0 or side == 2:
-            adjusted_x = old_x + overhang_x
-            adjusted_y = old_y + eaves
-    elif roofType == 'Flat':
-        adjusted_x = old_x + overhang_y
-        adjusted_y = old_y + overhang_x
-        #xperimiter = float(drm['origin'][1])
-
-    return [adjusted_x, adjusted_y]
-
-def gabledRoof(XMLelement, p, r, override_wall=None, semantics=None, openings=None, roofopenings=None, rfWindows=None, embrasure=None, pList=None):
-    """Constructs a building with a gabled roof."""
-    #-- Roof Surface
-    roof0 = "%s %s %s %s %s" % (r[0], r[1], p[7], p[4], r[0])
-    roof1 = "%s %s %s %s %s" % (r[1], r[0], p[5], p[6], r[1])
-
-    #-- Wall Surface
-    face0 = "%s %s %s %s %s %s" % (p[4], p[0], p[1], p[5], r[0], p[4])
-    if override_wall:
-        face1 = override_wall['wall']
+        REPORTINTERVAL = 10.0
+    if ARGS['checkpoint'] is not None:
+        CHECKPOINT = int(ARGS['checkpoint'])
     else:
-        face1 = "%s %s %s %s %s" % (p[5], p[1], p[2], p[6], p[5])
-    face2 = "%s %s %s %s %s %s" % (p[6], p[2], p[3], p[7], r[1], p[6])
-    face3 = "%s %s %s %s %s" % (p[7], p[3], p[0], p[4], p[7])
-
-    if openings:
-        holes, opns = wallOpeningOrganiser(openings)
+        CHECKPOINT = None
+    RESUME = argRead(ARGS['resume'], False)
+    QUARANTINE = argRead(ARGS['quarantine'], True)
+    CACHE = ARGS['cache']
+    PREVIOUS = ARGS['previous']
+    if ARGS['attributes'] is not None:
+        ATTRIBUTES = ARGS['attributes'].split(',')
     else:
-        holes = None
-        opns = None
-
-    if embrasure and openings:
-        embO = embrasuresGeometry(openings, pList, embrasure)
-
-    if semantics:
-        if roofopenings:
-            if rfWindows:
-                multiSurface2(XMLelement, roof0, "RoofSurface", roofopenings[3], 3, rfWindows[3])
-                multiSurface2(XMLelement, roof1, "RoofSurface", roofopenings[1], 3, rfWindows[1])
-            else:
-                multiSurface(XMLelement, roof0, "RoofSurface", roofopenings[3], 3)
-                multiSurface(XMLelement, roof1, "RoofSurface", roofopenings[1], 3)
-        else:
-            multiSurface(XMLelement, roof0, "RoofSurface")
-            multiSurface(XMLelement, roof1, "RoofSurface")
-        if openings:
-            if embrasure:
-                multiSurfaceWithEmbrasure(XMLelement, face0, "WallSurface", holes[0], 3, embO[0])
-            else:
-                multiSurface(XMLelement, face0, "WallSurface", holes[0], 3, opns[0])
-        else:
-            multiSurface(XMLelement, face0, "WallSurface", None)
-        if openings:
-            if embrasure:
-                multiSurfaceWithEmbrasure(XMLelement, face1, "WallSurface", holes[1], 3, embO[1])
-            else:
-                multiSurface(XMLelement, face1, "WallSurface", holes[1], 3, opns[1])
-        else:    
-            multiSurface(XMLelement, face1, "WallSurface", None)
-        if openings:
-            if embrasure:
-                multiSurfaceWithEmbrasure(XMLelement, face2, "WallSurface", holes[2], 3, embO[2])
-            else:
-                multiSurface(XMLelement, face2, "WallSurface", holes[2], 3, opns[2])
-        else:    
-            multiSurface(XMLelement, face2, "WallSurface", None)
-        if openings:
-            if embrasure:
-                multiSurfaceWithEmbrasure(XMLelement, face3, "WallSurface", holes[3], 3, embO[3])
-            else:
-                multiSurface(XMLelement, face3, "WallSurface", holes[3], 3, opns[3])
-        else:    
-            multiSurface(XMLelement, face3, "WallSurface", None)
-
-        #-- Building part
-        for fc in override_wall['rest']:
-            multiSurface(XMLelement, fc, "WallSurface", None)
-        for fc in override_wall['roof']:
-            multiSurface(XMLelement, fc, "RoofSurface", None)
-        for fc in override_wall['outerfloor']:
-            multiSurface(XMLelement, fc, "OuterFloorSurface", None)
-
+        ATTRIBUTES = None
+    if ARGS['metrics'] is not None:
+        METRICS = ARGS['metrics'].split(',')
     else:
-        if roofopenings is not None:
-            addsurface(False, XMLelement, roof0, roofopenings[3])
-            addsurface(False, XMLelement, roof1, roofopenings[1])
-        else:
-            addsurface(False, XMLelement, roof0)
-            addsurface(False, XMLelement, roof1)
-        if holes is not None:
-            if embrasure:
-                addSurfaceWithEmbrasure(False, XMLelement, face0, holes[0], embO[0])
-                addSurfaceWithEmbrasure(False, XMLelement, face1, holes[1], embO[1])
-                addSurfaceWithEmbrasure(False, XMLelement, face2, holes[2], embO[2])
-                addSurfaceWithEmbrasure(False, XMLelement, face3, holes[3], embO[3])
-            else:
-                addsurface(False, XMLelement, face0)
-                addsurface(False, XMLelement, face1)
-                addsurface(False, XMLelement, face2)
-                addsurface(False, XMLelement, face3)
-
-        else:
-            addsurface(False, XMLelement, face0)
-            addsurface(False, XMLelement, face1)
-            addsurface(False, XMLelement, face2)
-            addsurface(False, XMLelement, face3)
-
-        for fc in override_wall['rest']:
-            addsurface(False, XMLelement, fc)
-        for fc in override_wall['roof']:
-            addsurface(False, XMLelement, fc)
-        for fc in override_wall['outerfloor']:
-            addsurface(False, XMLelement, fc)
-
-
-def shedRoof(XMLelement, p, r, override_wall=None, semantics=None, openings=None, roofopenings=None, rfWindows=None, embrasure=None, pList=None):
-    """Constructs a building with a shed roof."""
-    #-- Roof Surface
-    roof1 = "%s %s %s %s %s" % (r[1], r[0], p[5], p[6], r[1])
-
-    #-- Wall Surface
-    face0 = "%s %s %s %s %s" % (r[0], p[0], p[1], p[5], r[0])
-    if override_wall:
-        face1 = override_wall['wall']
+        METRICS = None
+    if ARGS['deviations'] is not None:
+        DEVIATIONS = [pair.split(':') for pair in ARGS['deviations'].split(',')]
     else:
-        face1 = "%s %s %s %s %s" % (p[5], p[1], p[2], p[6], p[5])
-    face2 = "%s %s %s %s %s" % (p[6], p[2], p[3], r[1], p[6])
-    face3 = "%s %s %s %s %s" % (r[1], p[3], p[0], r[0], r[1])
-
-    if openings:
-        holes, opns = wallOpeningOrganiser(openings)
+        DEVIATIONS = None
+    if ARGS['validate'] is not None:
+        VALIDATE = ARGS['validate'].split(',')
     else:
-        holes = None
-        opns = None
-
-    if embrasure and openings:
-        embO = embrasuresGeometry(openings, pList, embrasure)
-
-
-    if semantics:
-        if roofopenings:
-            if rfWindows:
-                multiSurface2(XMLelement, roof1, "RoofSurface", roofopenings[1], 3, rfWindows[1])
-            else:
-                multiSurface(XMLelement, roof1, "RoofSurface", roofopenings[1], 3)
-        else:
-            multiSurface(XMLelement, roof1, "RoofSurface")
-        if openings:
-            if embrasure:
-                multiSurfaceWithEmbrasure(XMLelement, face0, "WallSurface", holes[0], 3, embO[0])
-            else:
-                multiSurface(XMLelement, face0, "WallSurface", holes[0], 3, opns[0])
-        else:
-            multiSurface(XMLelement, face0, "WallSurface", None)
-        if openings:
-            if embrasure:
-                multiSurfaceWithEmbrasure(XMLelement, face1, "WallSurface", holes[1], 3, embO[1])
-            else:
-                multiSurface(XMLelement, face1, "WallSurface", holes[1], 3, opns[1])
-        else:    
-            multiSurface(XMLelement, face1, "WallSurface", None)
-        if openings:
-            if embrasure:
-                multiSurfaceWithEmbrasure(XMLelement, face2, "WallSurface", holes[2], 3, embO[2])
-            else:
-                multiSurface(XMLelement, face2, "WallSurface", holes[2], 3, opns[2])
-        else:    
-            multiSurface(XMLelement, face2, "WallSurface", None)
-        if openings:
-            if embrasure:
-                multiSurfaceWithEmbrasure(XMLelement, face3, "WallSurface", holes[3], 3, embO[3])
-            else:
-                multiSurface(XMLelement, face3, "WallSurface", holes[3], 3, opns[3])
-        else:    
-            multiSurface(XMLelement, face3, "WallSurface", None) 
-
-        #-- Building part
-        for fc in override_wall['rest']:
-            multiSurface(XMLelement, fc, "WallSurface", None)
-        for fc in override_wall['roof']:
-            multiSurface(XMLelement, fc, "RoofSurface", None)
-        for fc in override_wall['outerfloor']:
-            multiSurface(XMLelement, fc, "OuterFloorSurface", None)
-
+        VALIDATE = None
+    #-- The volume of the representations that are not closed is measured on their solids
+    if METRICS or DEVIATIONS:
+        SOLIDS = True
+    IMPLICIT = argRead(ARGS['implicit'], False)
+    if ARGS['writers'] is not None:
+        WRITERS = int(ARGS['writers'])
     else:
-        if roofopenings is not None:
-            addsurface(False, XMLelement, roof1, roofopenings[1])
-        else:
-            addsurface(False, XMLelement, roof1)
-        if holes is not None and embrasure:
-            addSurfaceWithEmbrasure(False, XMLelement, face0, holes[0], embO[0])
-            addSurfaceWithEmbrasure(False, XMLelement, face1, holes[1], embO[1])
-            addSurfaceWithEmbrasure(False, XMLelement, face2, holes[2], embO[2])
-            addSurfaceWithEmbrasure(False, XMLelement, face3, holes[3], embO[3])            
-        else:
-            #addsurface(False, XMLelement, roof1)
-            addsurface(False, XMLelement, face0)
-            addsurface(False, XMLelement, face1)
-            addsurface(False, XMLelement, face2)
-            addsurface(False, XMLelement, face3)
-
-        for fc in override_wall['rest']:
-            addsurface(False, XMLelement, fc)
-        for fc in override_wall['roof']:
-            addsurface(False, XMLelement, fc)
-        for fc in override_wall['outerfloor']:
-            addsurface(False, XMLelement, fc)
-
-
-def hippedRoof(XMLelement, p, r, override_wall=None, semantics=None, openings=None, roofopenings=None, rfWindows=None, embrasure=None, pList=None):
-    """Constructs a building with a hipped or pyramidal roof."""
-    #-- Roof Surface
-    #-- Pyramidal roof has the same point r0 and r1
-    if r[0] == r[1]:
-        roof0 = "%s %s %s %s" % (r[0], p[7], p[4], r[0])
-        roof1 = "%s %s %s %s" % (r[1], p[5], p[6], r[1])    
+        WRITERS = None
+    if ARGS['workers'] is not None:
+        WORKERS = int(ARGS['workers'])
     else:
-        roof0 = "%s %s %s %s %s" % (r[0], r[1], p[7], p[4], r[0])
-        roof1 = "%s %s %s %s %s" % (r[1], r[0], p[5], p[6], r[1])
-    roofX = "%s %s %s %s" % (r[0], p[4], p[5], r[0])
-    roofY = "%s %s %s %s" % (r[1], p[6], p[7], r[1])
-
-    #-- Wall Surface
-    face0 = "%s %s %s %s %s" % (p[0], p[1], p[5], p[4], p[0])
-    if override_wall:
-        face1 = override_wall['wall']
+        WORKERS = None
+    #-- Index of this process if it is one of the workers started by the main process
+    if ARGS['worker'] is not None:
+        WORKER = int(ARGS['worker'])
     else:
-        face1 = "%s %s %s %s %s" % (p[5], p[1], p[2], p[6], p[5])
-    face2 = "%s %s %s %s %s" % (p[2], p[3], p[7], p[6], p[2])
-    face3 = "%s %s %s %s %s" % (p[3], p[0], p[4], p[7], p[3])   
-
-    if openings:
-        holes, opns = wallOpeningOrganiser(openings)
+        WORKER = None
+    COMPRESS = argRead(ARGS['compress'], False)
+    if ARGS['combined'] is not None:
+        COMBINED = ARGS['combined'].split(',')
     else:
-        holes = None
-        opns = None
-
-    if embrasure and openings:
-        embO = embrasuresGeometry(openings, pList, embrasure)  
-
-    if semantics:
-        if roofopenings:
-            if rfWindows:
-                multiSurface2(XMLelement, roof0, "RoofSurface", roofopenings[3], 3, rfWindows[3])
-                multiSurface2(XMLelement, roof1, "RoofSurface", roofopenings[1], 3, rfWindows[1])
-                multiSurface2(XMLelement, roofX, "RoofSurface", roofopenings[0], 3, rfWindows[0])
-                multiSurface2(XMLelement, roofY, "RoofSurface", roofopenings[2], 3, rfWindows[2])
-            else:
-                multiSurface(XMLelement, roof0, "RoofSurface", roofopenings[3], 3)
-                multiSurface(XMLelement, roof1, "RoofSurface", roofopenings[1], 3)
-                multiSurface(XMLelement, roofX, "RoofSurface", roofopenings[0], 3)
-                multiSurface(XMLelement, roofY, "RoofSurface", roofopenings[2], 3)
-        else:
-            multiSurface(XMLelement, roof0, "RoofSurface")
-            multiSurface(XMLelement, roof1, "RoofSurface")
-            multiSurface(XMLelement, roofX, "RoofSurface")
-            multiSurface(XMLelement, roofY, "RoofSurface")
-        if openings:
-            if embrasure:
-                multiSurfaceWithEmbrasure(XMLelement, face0, "WallSurface", holes[0], 3, embO[0])
-            else:
-                multiSurface(XMLelement, face0, "WallSurface", holes[0], 3, opns[0])
-        else:
-            multiSurface(XMLelement, face0, "WallSurface", None)
-        if openings:
-            if embrasure:
-                multiSurfaceWithEmbrasure(XMLelement, face1, "WallSurface", holes[1], 3, embO[1])
-            else:
-                multiSurface(XMLelement, face1, "WallSurface", holes[1], 3, opns[1])
-        else:    
-            multiSurface(XMLelement, face1, "WallSurface", None)
-        if openings:
-            if embrasure:
-                multiSurfaceWithEmbrasure(XMLelement, face2, "WallSurface", holes[2], 3, embO[2])
-            else:
-                multiSurface(XMLelement, face2, "WallSurface", holes[2], 3, opns[2])
-        else:    
-            multiSurface(XMLelement, face2, "WallSurface", None)
-        if openings:
-            if embrasure:
-                multiSurfaceWithEmbrasure(XMLelement, face3, "WallSurface", holes[3], 3, embO[3])
-            else:
-                multiSurface(XMLelement, face3, "WallSurface", holes[3], 3, opns[3])
-        else:    
-            multiSurface(XMLelement, face3, "WallSurface", None)   
-
-        #-- Building part
-        for fc in override_wall['rest']:
-            multiSurface(XMLelement, fc, "WallSurface", None)
-        for fc in override_wall['roof']:
-            multiSurface(XMLelement, fc, "RoofSurface", None)
-        for fc in override_wall['outerfloor']:
-            multiSurface(XMLelement, fc, "OuterFloorSurface", None)
-
+        COMBINED = None
+    if ARGS['representations'] is not None:
+        REPRESENTATIONS = ARGS['representations'].split(',')
     else:
-        if roofopenings is not None:
-            addsurface(False, XMLelement, roof0, roofopenings[3])
-            addsurface(False, XMLelement, roof1, roofopenings[1])
-            addsurface(False, XMLelement, roofX, roofopenings[0])
-            addsurface(False, XMLelement, roofY, roofopenings[2])           
-        else:
-            addsurface(False, XMLelement, roof0)
-            addsurface(False, XMLelement, roof1)
-            addsurface(False, XMLelement, roofX)
-            addsurface(False, XMLelement, roofY)
-        if holes is not None and embrasure:
-            addSurfaceWithEmbrasure(False, XMLelement, face0, holes[0], embO[0])
-            addSurfaceWithEmbrasure(False, XMLelement, face1, holes[1], embO[1])
-            addSurfaceWithEmbrasure(False, XMLelement, face2, holes[2], embO[2])
-            addSurfaceWithEmbrasure(False, XMLelement, face3, holes[3], embO[3])            
-        else:
-            addsurface(False, XMLelement, face0)
-            addsurface(False, XMLelement, face1)
-            addsurface(False, XMLelement, face2)
-            addsurface(False, XMLelement, face3)
-
-        for fc in override_wall['rest']:
-            addsurface(False, XMLelement, fc)
-        for fc in override_wall['roof']:
-            addsurface(False, XMLelement, fc)
-        for fc in override_wall['outerfloor']:
-            addsurface(False, XMLelement, fc)
-
-
-def hippedAttic(CompositeSurface, intcoor, p, r, fel, cel, wallThickness, topThickness, atticbottom=False, roofopenings=None):
-    """Constructs the interior of the attic of a hipped roof."""
-    [Xa, Ya, Xb, Yb] = intcoor
-    rA = str(r[0][0]) + ' ' + str(float(r[0][1]) + wallThickness) + ' ' + str(cel)
-    rB = str(r[1][0]) + ' ' + str(float(r[1][1]) - wallThickness) + ' ' + str(cel)
-    p0F = str(Xa) + ' ' + str(Ya) + ' ' + str(fel)
-    p1F = str(Xb) + ' ' + str(Ya) + ' ' + str(fel)
-    p2F = str(Xb) + ' ' + str(Yb) + ' ' + str(fel)
-    p3F = str(Xa) + ' ' + str(Yb) + ' ' + str(fel)
-    S = "%s %s %s %s" % (p0F, p1F, rA, p0F)
-    E = "%s %s %s %s %s" % (p1F, p2F, rB, rA, p1F)
-    N = "%s %s %s %s" % (p2F, p3F, rB, p2F)
-    W = "%s %s %s %s %s" % (p3F, p0F, rA, rB, p3F)
-    bottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
-
-    if roofopenings is not None:
-        addsurface(False, CompositeSurface, S, roofopenings[0])
-        addsurface(False, CompositeSurface, E, roofopenings[1])
-        addsurface(False, CompositeSurface, N, roofopenings[2])
-        addsurface(False, CompositeSurface, W, roofopenings[3])
-
+        REPRESENTATIONS = None
+    BENCHMARK = ARGS['benchmark']
+    if ARGS['stream'] is not None:
+        STREAMS = {}
+        for stream in ARGS['stream'].split(','):
+            if '=' not in stream:
+                raise ValueError("The stream " + stream + " does not have the form representation=target.")
+            representation, target = stream.split('=', 1)
+            STREAMS[representation] = target
+        #-- The streams are written by the writer threads
+        if WRITERS is None:
+            WRITERS = 1
     else:
-        addsurface(False, CompositeSurface, S)
-        addsurface(False, CompositeSurface, E)
-        addsurface(False, CompositeSurface, N)
-        addsurface(False, CompositeSurface, W)
-    if atticbottom is True:
-        addsurface(False, CompositeSurface, bottom)
-
-def gabledAttic(CompositeSurface, intcoor, p, r, fel, cel, wallThickness, topThickness, atticbottom=False, roofopenings=None):
-    """Constructs the interior of the attic of a gabled roof."""
-    [Xa, Ya, Xb, Yb] = intcoor
-    rA = str(r[0][0]) + ' ' + str(float(r[0][1]) + wallThickness) + ' ' + str(cel)
-    rB = str(r[1][0]) + ' ' + str(float(r[1][1]) - wallThickness) + ' ' + str(cel)
-    p0F = str(Xa) + ' ' + str(Ya) + ' ' + str(fel)
-    p1F = str(Xb) + ' ' + str(Ya) + ' ' + str(fel)
-    p2F = str(Xb) + ' ' + str(Yb) + ' ' + str(fel)
-    p3F = str(Xa) + ' ' + str(Yb) + ' ' + str(fel)
-    bottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
-    S = "%s %s %s %s" % (p0F, p1F, rA, p0F)
-    E = "%s %s %s %s %s" % (p1F, p2F, rB, rA, p1F)
-    N = "%s %s %s %s" % (p2F, p3F, rB, p2F)
-    W = "%s %s %s %s %s" % (p3F, p0F, rA, rB, p3F)
-
-    if roofopenings is not None:
-        addsurface(False, CompositeSurface, S, roofopenings[0])
-        addsurface(False, CompositeSurface, E, roofopenings[1])
-        addsurface(False, CompositeSurface, N, roofopenings[2])
-        addsurface(False, CompositeSurface, W, roofopenings[3])
-
+        STREAMS = None
+    if ARGS['target'] is not None:
+        if '=' not in ARGS['target']:
+            raise ValueError("The target " + ARGS['target'] + " does not have the form representation=size.")
+        TARGET, TARGETSIZE = ARGS['target'].split('=', 1)
     else:
-        addsurface(False, CompositeSurface, S)
-        addsurface(False, CompositeSurface, E)
-        addsurface(False, CompositeSurface, N)
-        addsurface(False, CompositeSurface, W)
-
-    if atticbottom is True:
-        addsurface(False, CompositeSurface, bottom)
-
-def pyramidalAttic(CompositeSurface, intcoor, p, r, fel, cel, wallThickness, topThickness, atticbottom=False, roofopenings=None):
-    """Constructs the interior of the attic of a pyramidal roof."""
-    [Xa, Ya, Xb, Yb] = intcoor
-    rA = str(r[0][0]) + ' ' + str(r[0][1]) + ' ' + str(cel)
-    p0F = str(Xa) + ' ' + str(Ya) + ' ' + str(fel)
-    p1F = str(Xb) + ' ' + str(Ya) + ' ' + str(fel)
-    p2F = str(Xb) + ' ' + str(Yb) + ' ' + str(fel)
-    p3F = str(Xa) + ' ' + str(Yb) + ' ' + str(fel)
-    bottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
-    S = "%s %s %s %s" % (p0F, p1F, rA, p0F)
-    E = "%s %s %s %s" % (p1F, p2F, rA, p1F)
-    N = "%s %s %s %s" % (p2F, p3F, rA, p2F)
-    W = "%s %s %s %s" % (p3F, p0F, rA, p3F)
-    addsurface(False, CompositeSurface, bottom)
-    addsurface(False, CompositeSurface, S)
-    addsurface(False, CompositeSurface, E)
-    addsurface(False, CompositeSurface, N)
-    addsurface(False, CompositeSurface, W)
-
-    if roofopenings is not None:
-        addsurface(False, CompositeSurface, S, roofopenings[0])
-        addsurface(False, CompositeSurface, E, roofopenings[1])
-        addsurface(False, CompositeSurface, N, roofopenings[2])
-        addsurface(False, CompositeSurface, W, roofopenings[3])
-
+        TARGET = None
+    if ARGS['ensemble'] is not None:
+        ENSEMBLE = int(ARGS['ensemble'])
     else:
-        addsurface(False, CompositeSurface, S)
-        addsurface(False, CompositeSurface, E)
-        addsurface(False, CompositeSurface, N)
-        addsurface(False, CompositeSurface, W)
-    if atticbottom is True:
-        addsurface(False, CompositeSurface, bottom)
-
-def shedAttic(CompositeSurface, intcoor, p, r, fel, cel, wallThickness, topThickness, atticbottom=False, roofopenings=None):
-    """Constructs the interior of the attic of a shed roof."""
-    [Xa, Ya, Xb, Yb] = intcoor
-    rA = str(float(r[0][0]) + wallThickness) + ' ' + str(float(r[0][1]) + wallThickness) + ' ' + str(cel)
-    rB = str(float(r[1][0]) + wallThickness) + ' ' + str(float(r[1][1]) - wallThickness) + ' ' + str(cel)
-    p0F = str(Xa) + ' ' + str(Ya) + ' ' + str(fel)
-    p1F = str(Xb) + ' ' + str(Ya) + ' ' + str(fel)
-    p2F = str(Xb) + ' ' + str(Yb) + ' ' + str(fel)
-    p3F = str(Xa) + ' ' + str(Yb) + ' ' + str(fel)
-    bottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
-    top = "%s %s %s %s %s" % (rA, p1F, p2F, rB, rA)
-    S = "%s %s %s %s" % (p0F, p1F, rA, p0F)
-    N = "%s %s %s %s" % (p2F, p3F, rB, p2F)
-    W = "%s %s %s %s %s" % (p0F, rA, rB, p3F, p0F)
-    addsurface(False, CompositeSurface, bottom)
-    addsurface(False, CompositeSurface, top)
-    addsurface(False, CompositeSurface, S)
-    addsurface(False, CompositeSurface, N)
-    addsurface(False, CompositeSurface, W)
-
-    if roofopenings is not None:
-        addsurface(False, CompositeSurface, S, roofopenings[0])
-        #addsurface(False, CompositeSurface, E, roofopenings[1])
-        addsurface(False, CompositeSurface, N, roofopenings[2])
-        addsurface(False, CompositeSurface, W, roofopenings[3])
-
+        ENSEMBLE = None
+    if ARGS['noise'] is not None:
+        NOISE = {}
+        for term in ARGS['noise'].split(','):
+            if term.split('=')[0] not in ['vertices', 'heights', 'dimensions', 'seed'] or '=' not in term:
+                raise ValueError("The noise " + term + " is not one of vertices=, heights=, dimensions= or seed=.")
+            NOISE[term.split('=')[0]] = float(term.split('=', 1)[1])
     else:
-        addsurface(False, CompositeSurface, S)
-        #addsurface(False, CompositeSurface, E)
-        addsurface(False, CompositeSurface, N)
-        addsurface(False, CompositeSurface, W)
-    if atticbottom is True:
-        addsurface(False, CompositeSurface, bottom)
-
-def flatRoof(XMLelement, p, r, override_wall=None, semantics=None, openings=None, roofopenings=None, rfWindows=None, embrasure=None, pList=None):
-    """Constructs a building with a flat roof."""
-    #-- Top face / Roof Surface
-    faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
-
-    #-- Wall Surface
-    face0 = "%s %s %s %s %s" % (p[0], p[1], p[5], p[4], p[0])
-    if override_wall:
-        face1 = override_wall['wall']
+        NOISE = None
+    if ENSEMBLE and not NOISE:
+        raise ValueError("The realisations of the ensemble need a noise model (-nm).")
+    if ARGS['representationworkers'] is not None:
+        REPRESENTATIONWORKERS = int(ARGS['representationworkers'])
     else:
-        face1 = "%s %s %s %s %s" % (p[5], p[1], p[2], p[6], p[5])
-    face2 = "%s %s %s %s %s" % (p[2], p[3], p[7], p[6], p[2])
-    face3 = "%s %s %s %s %s" % (p[3], p[0], p[4], p[7], p[3])
-
-    if openings:
-        holes, opns = wallOpeningOrganiser(openings)
+        REPRESENTATIONWORKERS = None
+    #-- Representations of this process if it is one of the representation workers started by the main process, and the values they share
+    if ARGS['group'] is not None:
+        GROUP = ARGS['group'].split(',')
+        #-- Written by the main process once all the files are complete
+        ENSEMBLE = BENCHMARK = None
     else:
-        holes = None
-        opns = None
-
-    if embrasure and openings:
-        embO = embrasuresGeometry(openings, pList, embrasure)        
-
-
-    if semantics:
-        #-- Roofs
-        if roofopenings:
-            multiSurface2(XMLelement, faceTop, "RoofSurface", roofopenings[1], 3, rfWindows[1])
-        else:
-            multiSurface(XMLelement, faceTop, "RoofSurface", None)
-        #-- Walls
-        if openings:
-            if embrasure:
-                multiSurfaceWithEmbrasure(XMLelement, face0, "WallSurface", holes[0], 3, embO[0])
-            else:
-                multiSurface(XMLelement, face0, "WallSurface", holes[0], 3, opns[0])
-        else:
-            multiSurface(XMLelement, face0, "WallSurface", None)
-        if openings:
-            if embrasure:
-                multiSurfaceWithEmbrasure(XMLelement, face1, "WallSurface", holes[1], 3, embO[1])
-            else:
-                multiSurface(XMLelement, face1, "WallSurface", holes[1], 3, opns[1])
-        else:    
-            multiSurface(XMLelement, face1, "WallSurface", None)
-        if openings:
-            if embrasure:
-                multiSurfaceWithEmbrasure(XMLelement, face2, "WallSurface", holes[2], 3, embO[2])
-            else:
-                multiSurface(XMLelement, face2, "WallSurface", holes[2], 3, opns[2])
-        else:    
-            multiSurface(XMLelement, face2, "WallSurface", None)
-        if openings:
-            if embrasure:
-                multiSurfaceWithEmbrasure(XMLelement, face3, "WallSurface", holes[3], 3, embO[3])
-            else:
-                multiSurface(XMLelement, face3, "WallSurface", holes[3], 3, opns[3])
-        else:    
-            multiSurface(XMLelement, face3, "WallSurface", None)
-
-        #-- Building part
-        for fc in override_wall['rest']:
-            multiSurface(XMLelement, fc, "WallSurface", None)
-        for fc in override_wall['roof']:
-            multiSurface(XMLelement, fc, "RoofSurface", None)
-        for fc in override_wall['outerfloor']:
-            multiSurface(XMLelement, fc, "OuterFloorSurface", None)
-
+        GROUP = None
+    SHARED = ARGS['shared']
+    #-- A plan writes nothing, so the options that write or divide the run are only kept for the prediction
+    if ARGS['plan'] is not None:
+        PLAN = int(ARGS['plan'])
+        if PLAN < 1:
+            raise ValueError("The sample of the plan needs at least one building.")
+        PLANWORKERS, PLANWRITERS, PLANCHECKPOINT = WORKERS, WRITERS, CHECKPOINT
+        WORKERS = WRITERS = CHECKPOINT = STREAMS = CACHE = PREVIOUS = REPRESENTATIONWORKERS = None
+        RESUME = QUARANTINE = False
     else:
-        addsurface(False, XMLelement, faceTop)
-        if holes is not None and embrasure:
-            addSurfaceWithEmbrasure(False, XMLelement, face0, holes[0], embO[0])
-            addSurfaceWithEmbrasure(False, XMLelement, face1, holes[1], embO[1])
-            addSurfaceWithEmbrasure(False, XMLelement, face2, holes[2], embO[2])
-            addSurfaceWithEmbrasure(False, XMLelement, face3, holes[3], embO[3])            
-        else:
-            addsurface(False, XMLelement, face0)
-            addsurface(False, XMLelement, face1)
-            addsurface(False, XMLelement, face2)
-            addsurface(False, XMLelement, face3)
-
-        for fc in override_wall['rest']:
-            addsurface(False, XMLelement, fc)
-        for fc in override_wall['roof']:
-            addsurface(False, XMLelement, fc)
-        for fc in override_wall['outerfloor']:
-            addsurface(False, XMLelement, fc)
-
-
-def roofOverhangs(XMLelement, overhangs, interiors, semantics=None):
-    """Add surfaces for overhangs."""
-    i = 0
-    if semantics:
-        for overhang in overhangs:
-            multiSurface(XMLelement, overhang, "RoofSurface", interiors, 3)
-            i += 1
+        PLAN = None
+    if ARGS['planbuildings'] is not None:
+        PLANBUILDINGS = int(ARGS['planbuildings'])
     else:
-        for overhang in overhangs:
-            plainMultiSurface(XMLelement, overhang)
-            i += 1
-
-
-def openingRing(op, p):
-    """Makes a linear ring of the feature (opening)."""
-    X = op['origin'][0]
-    Y = op['origin'][1]
-    width = op['size'][0]
-    height = op['size'][1]
-
-    if op['wall'] == 0:
-        ring = "%s %s %s " % (p[0][0]+X, p[0][1], p[0][2]+Y)
-        ring+= "%s %s %s " % (p[0][0]+X, p[0][1], p[0][2]+Y+height)
-        ring+= "%s %s %s " % (p[0][0]+X+width, p[0][1], p[0][2]+Y+height)
-        ring+= "%s %s %s " % (p[0][0]+X+width, p[0][1], p[0][2]+Y)
-        ring+= "%s %s %s" % (p[0][0]+X, p[0][1], p[0][2]+Y)
-    elif op['wall'] == 1:
-        ring = "%s %s %s " % (p[1][0], p[1][1]+X, p[1][2]+Y)
-        ring+= "%s %s %s " % (p[1][0], p[1][1]+X, p[1][2]+Y+height)
-        ring+= "%s %s %s " % (p[1][0], p[1][1]+X+width, p[1][2]+Y+height)
-        ring+= "%s %s %s " % (p[1][0], p[1][1]+X+width, p[1][2]+Y)
-        ring+= "%s %s %s" % (p[1][0], p[1][1]+X, p[1][2]+Y)
-    elif op['wall'] == 2:
-        ring = "%s %s %s " % (p[2][0]-X, p[2][1], p[2][2]+Y)
-        ring+= "%s %s %s " % (p[2][0]-X, p[2][1], p[2][2]+Y+height)
-        ring+= "%s %s %s " % (p[2][0]-X-width, p[2][1], p[2][2]+Y+height)
-        ring+= "%s %s %s " % (p[2][0]-X-width, p[2][1], p[2][2]+Y)
-        ring+= "%s %s %s" % (p[2][0]-X, p[2][1], p[2][2]+Y)
-    elif op['wall'] == 3:
-        ring = "%s %s %s " % (p[3][0], p[3][1]-X, p[3][2]+Y)
-        ring+= "%s %s %s " % (p[3][0], p[3][1]-X, p[3][2]+Y+height)
-        ring+= "%s %s %s " % (p[3][0], p[3][1]-X-width, p[3][2]+Y+height)
-        ring+= "%s %s %s " % (p[3][0], p[3][1]-X-width, p[3][2]+Y)
-        ring+= "%s %s %s" % (p[3][0], p[3][1]-X, p[3][2]+Y)
-
+        PLANBUILDINGS = None
+    #-- The main process of the representation workers measures the representations and derives the values shared by them, the workers write the files
+    SCHEDULER = REPRESENTATIONWORKERS is not None and GROUP is None
+    if SCHEDULER:
+        WRITERS = None
+    #-- The standard output is taken over by a representation streamed to it, so the messages go to the standard error
+    STANDARDOUTPUT = getattr(sys.stdout, 'buffer', sys.stdout)
+    if STREAMS and '-' in STREAMS.values():
+        MESSAGES = sys.stderr
     else:
-        raise ValueError("The door is positioned on an unknown wall.")
-
-    return ring
-
-def embrasuresGeometry(openings, p, embrasure):
-    """Makes a linear ring of the feature (opening) with embrasure."""
-
-    embO = [[], [], [], []]
-
-    j = 0
-
-    for t in openings:
-
-        if j == 0:
-            currentType = 'Door'
-        elif j == 1:
-            currentType = 'Window'
-
-        j += 1
-
-        if type(t) is not list:
-            t = [t]
-        for op in t:
-            if op == '':
-                continue
-            X = float(op['origin'][0])
-            Y = float(op['origin'][1])
-            width = float(op['size'][0])
-            height = float(op['size'][1])
-
-            odict = {}
-
-            if op['wall'] == 0:
-
-                W0 = "%s %s %s" % (p[0][0]+X, p[0][1], p[0][2]+Y)
-                W1 = "%s %s %s" % (p[0][0]+X+width, p[0][1], p[0][2]+Y)
-                W2 = "%s %s %s" % (p[0][0]+X+width, p[0][1], p[0][2]+Y+height)
-                W3 = "%s %s %s" % (p[0][0]+X, p[0][1], p[0][2]+Y+height)
-
-                O0 = "%s %s %s" % (p[0][0]+X, p[0][1]+embrasure, p[0][2]+Y)
-                O1 = "%s %s %s" % (p[0][0]+X+width, p[0][1]+embrasure, p[0][2]+Y)
-                O2 = "%s %s %s" % (p[0][0]+X+width, p[0][1]+embrasure, p[0][2]+Y+height)
-                O3 = "%s %s %s" % (p[0][0]+X, p[0][1]+embrasure, p[0][2]+Y+height)
-
-            elif op['wall'] == 1:
-
-                W0 = "%s %s %s" % (p[1][0], p[1][1]+X, p[1][2]+Y)
-                W1 = "%s %s %s" % (p[1][0], p[1][1]+X+width, p[1][2]+Y)
-                W2 = "%s %s %s" % (p[1][0], p[1][1]+X+width, p[1][2]+Y+height)
-                W3 = "%s %s %s" % (p[1][0], p[1][1]+X, p[1][2]+Y+height)
-
-                O0 = "%s %s %s" % (p[1][0]-embrasure, p[1][1]+X, p[1][2]+Y)
-                O1 = "%s %s %s" % (p[1][0]-embrasure, p[1][1]+X+width, p[1][2]+Y)
-                O2 = "%s %s %s" % (p[1][0]-embrasure, p[1][1]+X+width, p[1][2]+Y+height)
-                O3 = "%s %s %s" % (p[1][0]-embrasure, p[1][1]+X, p[1][2]+Y+height)
+        MESSAGES = sys.stdout
+    if ARGS['previousdirectory'] is not None:
+        PREVIOUSDIRECTORY = ARGS['previousdirectory']
+    else:
+        PREVIOUSDIRECTORY = DIRECTORY
+    if ARGS['cachesize'] is not None:
+        CACHESIZE = float(ARGS['cachesize']) * 1024 * 1024
+    else:
+        CACHESIZE = 1024 * 1024 * 1024
 
+#-- Number of serialised fragments waiting for each writer thread before the generation has to wait for it
+WRITERQUEUE = 64
+#-- Number of buildings on which the time of each representation is measured to divide them among the representation workers
+CALIBRATIONBUILDINGS = 10
 
-            elif op['wall'] == 2:
+#-- Functions
 
-                W0 = "%s %s %s" % (p[2][0]-X, p[2][1], p[2][2]+Y)
-                W1 = "%s %s %s" % (p[2][0]-X-width, p[2][1], p[2][2]+Y)
-                W2 = "%s %s %s" % (p[2][0]-X-width, p[2][1], p[2][2]+Y+height)
-                W3 = "%s %s %s" % (p[2][0]-X, p[2][1], p[2][2]+Y+height)
+def loadComponent(name):
+    """Import a component of the engine (a module of the package random3dcity) and configure it with the options of this run."""
+    component = importlib.import_module('random3dcity.' + name)
+    component.ASSIGNID = ASSIGNID
+    return component
 
-                O0 = "%s %s %s" % (p[2][0]-X, p[2][1]-embrasure, p[2][2]+Y)
-                O1 = "%s %s %s" % (p[2][0]-X-width, p[2][1]-embrasure, p[2][2]+Y)
-                O2 = "%s %s %s" % (p[2][0]-X-width, p[2][1]-embrasure, p[2][2]+Y+height)
-                O3 = "%s %s %s" % (p[2][0]-X, p[2][1]-embrasure, p[2][2]+Y+height)
 
-            elif op['wall'] == 3:
+def message(*values):
+    """Print a message about the run, unless the messages are turned off."""
+    if MESSAGES is not None:
+        print(*values, file=MESSAGES)
 
-                W0 = "%s %s %s" % (p[3][0], p[3][1]-X, p[3][2]+Y)
-                W1 = "%s %s %s" % (p[3][0], p[3][1]-X-width, p[3][2]+Y)
-                W2 = "%s %s %s" % (p[3][0], p[3][1]-X-width, p[3][2]+Y+height)
-                W3 = "%s %s %s" % (p[3][0], p[3][1]-X, p[3][2]+Y+height)
 
-                O0 = "%s %s %s" % (p[3][0]+embrasure, p[3][1]-X, p[3][2]+Y)
-                O1 = "%s %s %s" % (p[3][0]+embrasure, p[3][1]-X-width, p[3][2]+Y)
-                O2 = "%s %s %s" % (p[3][0]+embrasure, p[3][1]-X-width, p[3][2]+Y+height)
-                O3 = "%s %s %s" % (p[3][0]+embrasure, p[3][1]-X, p[3][2]+Y+height)
+def skippedBuilder(CityModel, *args, **kwargs):
+    """Stand-in for the builders of a component that is not imported, because none of its representations is produced."""
+    return None
 
-            else:
-                raise ValueError("The door is positioned on an unknown wall.")
-##-- Unchanged
-            ringW = O0 + ' '
-            ringW+= O1 + ' '
-            ringW+= O2 + ' '
-            ringW+= O3 + ' '
-            ringW+= O0
-
-            ring0 = W0 + ' '
-            ring0+= O0 + ' '
-            ring0+= O3 + ' '
-            ring0+= W3 + ' '
-            ring0+= W0
-
-            ring1 = W0 + ' '
-            ring1+= W1 + ' '
-            ring1+= O1 + ' '
-            ring1+= O0 + ' '
-            ring1+= W0
-
-            ring2 = W2 + ' '
-            ring2+= O2 + ' '
-            ring2+= O1 + ' '
-            ring2+= W1 + ' '
-            ring2+= W2
-
-            ring3 = W2 + ' '
-            ring3+= W3 + ' '
-            ring3+= O3 + ' '
-            ring3+= O2 + ' '
-            ring3+= W2
-
-
-            odict['surfaces'] = [ring0, ring1, ring2, ring3]
-            odict['openings'] = [ringW]
-            odict['type'] = currentType
-
-            embO[op['wall']].append(odict)
-
-    return embO
-
-def addsurface(skipsm, CompositeSurface, coords, interior=None):
-        """
-        Adds a surface to the CompositeSurface (and others).
-        Input: coordinates of the LinearRing of the surface to be added to the CompositeSurface.
-        Output: Upgraded CompositeSurface.
-        If skipsm is toggled, it will skip the creation of the <gml:SurfaceMember>
-        """
-        if skipsm is False:
-            surfaceMember = etree.SubElement(CompositeSurface, "{%s}surfaceMember" % ns_gml)
-            Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
-        else:
-            Polygon = etree.SubElement(CompositeSurface, "{%s}Polygon" % ns_gml)
-        if ASSIGNID:
-            Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-        PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
-        LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
-        posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-        posList.text = coords
-
-        if interior and interior[0] is not None:
-            for hole in interior:
-                PolygonInterior = etree.SubElement(Polygon, "{%s}interior" % ns_gml)
-                LinearRing = etree.SubElement(PolygonInterior, "{%s}LinearRing" % ns_gml)
-                posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-                posList.text = hole
-
-def addSurfaceWithEmbrasure(skipsm, CompositeSurface, coords, interior=None, embO=None):
-        """
-        Adds a surface to the CompositeSurface.
-        Input: coordinates of the LinearRing of the surface to be added to the CompositeSurface.
-        Output: Upgraded CompositeSurface.
-        If skipsm is toggled, it will skip the creation of the <gml:SurfaceMember>
-        """
-        if skipsm is False:
-            surfaceMember = etree.SubElement(CompositeSurface, "{%s}surfaceMember" % ns_gml)
-            Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
-        else:
-            Polygon = etree.SubElement(CompositeSurface, "{%s}Polygon" % ns_gml)
-        if ASSIGNID:
-            Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-        PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
-        LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
-        posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-        posList.text = coords
-
-        if interior and interior[0] is not None:
-            for hole in interior:
-                PolygonInterior = etree.SubElement(Polygon, "{%s}interior" % ns_gml)
-                LinearRing = etree.SubElement(PolygonInterior, "{%s}LinearRing" % ns_gml)
-                posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-                posList.text = hole
-
-        for opening in embO:
-            for s in opening['surfaces']:
-                surfaceMember = etree.SubElement(CompositeSurface, "{%s}surfaceMember" % ns_gml)
-                Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
-                if ASSIGNID:
-                    Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-                PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
-                LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
-                posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-                posList.text = s
-            for o in opening['openings']:
-                DoorsurfaceMember = etree.SubElement(CompositeSurface, "{%s}surfaceMember" % ns_gml)
-                DoorPolygon = etree.SubElement(DoorsurfaceMember, "{%s}Polygon" % ns_gml)
-                if ASSIGNID:
-                    DoorPolygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-                DoorPolygonExterior = etree.SubElement(DoorPolygon, "{%s}exterior" % ns_gml)
-                DoorLinearRing = etree.SubElement(DoorPolygonExterior, "{%s}LinearRing" % ns_gml)
-                DoorposList = etree.SubElement(DoorLinearRing, "{%s}posList" % ns_gml)
-                DoorposList.text = o#['ring']
-
-def interiorDormer(cs, d, side):
-    """Interior of a dormer."""
-    dList, dListGML = d
-    d1 = dListGML[0] + ' ' + dListGML[1] + ' ' + dListGML[4] + ' ' + dListGML[0]
-    d2 = dListGML[0] + ' ' + dListGML[4] + ' ' + dListGML[5] + ' ' + dListGML[3] + ' ' + dListGML[0]
-    d3 = dListGML[5] + ' ' + dListGML[2] + ' ' + dListGML[3] + ' ' + dListGML[5]
-    addsurface(False, cs, d1) 
-    addsurface(False, cs, d2) 
-    addsurface(False, cs, d3)
-    d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
-    addsurface(False, cs, d4)
-
-def buildinginstallation(bldg, kind, d, semantics=0, window=None, side=None, embrasure=None):
-    """Generate a building installation: for dormers and chimneys."""
-    dList, dListGML = d
-
-    if window is not None:
-        pass
 
-    obi = etree.SubElement(bldg, "{%s}outerBuildingInstallation" % ns_bldg)
-    bi = etree.SubElement(obi, "{%s}BuildingInstallation" % ns_bldg)
-
-
-    def binosemantics(XMLelement, coords, window = None):
-        MultiSurface = etree.SubElement(XMLelement, "{%s}MultiSurface" % ns_gml)
-        surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
-        Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
-        if ASSIGNID:
-            Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-        PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
-        LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
-        posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-        posList.text = coords
-
-        if window is not None:
-
-            PolygonInterior = etree.SubElement(Polygon, "{%s}interior" % ns_gml)
-            LinearRing = etree.SubElement(PolygonInterior, "{%s}LinearRing" % ns_gml)
-            posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-            posList.text = window 
-
-    def bisemantics(XMLelement, coords, semantics, window = None, fillHole = True):
-        boundedBy = etree.SubElement(XMLelement, "{%s}boundedBy" % ns_bldg)
-        semanticSurface = etree.SubElement(boundedBy, "{%s}%s" % (ns_bldg, semantics))     
-        lod3geometry = etree.SubElement(semanticSurface, "{%s}lod3MultiSurface" % ns_bldg)   
-        MultiSurface = etree.SubElement(lod3geometry, "{%s}MultiSurface" % ns_gml)
-        surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
-        Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
-        if ASSIGNID:
-            Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-        PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
-        LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
-        posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-        posList.text = coords
-
-        if window is not None:
-
-            PolygonInterior = etree.SubElement(Polygon, "{%s}interior" % ns_gml)
-            LinearRing = etree.SubElement(PolygonInterior, "{%s}LinearRing" % ns_gml)
-            posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-            posList.text = GMLreversedRing(window)
-
-            if fillHole is True:
-
-                gmlopening = etree.SubElement(semanticSurface, "{%s}opening" % ns_bldg)
-                gmlwin = etree.SubElement(gmlopening, "{%s}Window" % ns_bldg)
-                lod3MultiSurface = etree.SubElement(gmlwin, "{%s}lod3MultiSurface" % ns_bldg)
-                DoorMultiSurface = etree.SubElement(lod3MultiSurface, "{%s}MultiSurface" % ns_gml)
-                DoorsurfaceMember = etree.SubElement(DoorMultiSurface, "{%s}surfaceMember" % ns_gml)
-                DoorPolygon = etree.SubElement(DoorsurfaceMember, "{%s}Polygon" % ns_gml)
-                if ASSIGNID:
-                    DoorPolygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-                DoorPolygonExterior = etree.SubElement(DoorPolygon, "{%s}exterior" % ns_gml)
-                DoorLinearRing = etree.SubElement(DoorPolygonExterior, "{%s}LinearRing" % ns_gml)
-                DoorposList = etree.SubElement(DoorLinearRing, "{%s}posList" % ns_gml)
-                DoorposList.text = window
-
-    def bisemanticsMulti(XMLelement, coords, semantics, window = None):
-        boundedBy = etree.SubElement(XMLelement, "{%s}boundedBy" % ns_bldg)
-        semanticSurface = etree.SubElement(boundedBy, "{%s}%s" % (ns_bldg, semantics))     
-        lod3geometry = etree.SubElement(semanticSurface, "{%s}lod3MultiSurface" % ns_bldg)   
-        MultiSurface = etree.SubElement(lod3geometry, "{%s}MultiSurface" % ns_gml)
-        surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
-
-        for coord in coords:
-
-            Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
-            if ASSIGNID:
-                Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-            PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
-            LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
-            posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-            posList.text = coord
-
-        if window is not None:
-
-            gmlopening = etree.SubElement(semanticSurface, "{%s}opening" % ns_bldg)
-            gmlwin = etree.SubElement(gmlopening, "{%s}Window" % ns_bldg)
-            lod3MultiSurface = etree.SubElement(gmlwin, "{%s}lod3MultiSurface" % ns_bldg)
-            DoorMultiSurface = etree.SubElement(lod3MultiSurface, "{%s}MultiSurface" % ns_gml)
-            DoorsurfaceMember = etree.SubElement(DoorMultiSurface, "{%s}surfaceMember" % ns_gml)
-            DoorPolygon = etree.SubElement(DoorsurfaceMember, "{%s}Polygon" % ns_gml)
-            if ASSIGNID:
-                DoorPolygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-            DoorPolygonExterior = etree.SubElement(DoorPolygon, "{%s}exterior" % ns_gml)
-            DoorLinearRing = etree.SubElement(DoorPolygonExterior, "{%s}LinearRing" % ns_gml)
-            DoorposList = etree.SubElement(DoorLinearRing, "{%s}posList" % ns_gml)
-            DoorposList.text = window
-
-
-    if semantics == 0:
-        if kind == 'dormer':
-            lod3geometry = etree.SubElement(bi, "{%s}lod3Geometry" % ns_bldg)
-            d1 = dListGML[0] + ' ' + dListGML[1] + ' ' + dListGML[4] + ' ' + dListGML[0]
-            d2 = dListGML[0] + ' ' + dListGML[4] + ' ' + dListGML[5] + ' ' + dListGML[3] + ' ' + dListGML[0]
-            d3 = dListGML[5] + ' ' + dListGML[2] + ' ' + dListGML[3] + ' ' + dListGML[5]
-            binosemantics(lod3geometry, d1) 
-            binosemantics(lod3geometry, d2) 
-            binosemantics(lod3geometry, d3)
-
-            if window is None:
-                d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
-                binosemantics(lod3geometry, d4)
-
-            if window is not None:
-
-                if embrasure is not None and embrasure > 0.0:
-
-                    d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
-
-                    if side == 1:
-                        dw = [[], [], [], []]
-                        ew = [[], [], [], []]
-
-                        dw[0] = [dList[4][0], dList[4][1] + window, dList[4][2] - window]
-                        dw[1] = [dList[1][0], dList[1][1] + window, dList[1][2] + window]
-                        dw[2] = [dList[2][0], dList[2][1] - window, dList[2][2] + window]
-                        dw[3] = [dList[5][0], dList[5][1] - window, dList[5][2] - window]
-
-                        ew[0] = [dList[4][0] - embrasure, dList[4][1] + window, dList[4][2] - window]
-                        ew[1] = [dList[1][0] - embrasure, dList[1][1] + window, dList[1][2] + window]
-                        ew[2] = [dList[2][0] - embrasure, dList[2][1] - window, dList[2][2] + window]
-                        ew[3] = [dList[5][0] - embrasure, dList[5][1] - window, dList[5][2] - window]
-
-                    elif side == 3:
-                        dw = [[], [], [], []]
-                        ew = [[], [], [], []]
-
-                        dw[0] = [dList[4][0], dList[4][1] - window, dList[4][2] - window]
-                        dw[1] = [dList[1][0], dList[1][1] - window, dList[1][2] + window]
-                        dw[2] = [dList[2][0], dList[2][1] + window, dList[2][2] + window]
-                        dw[3] = [dList[5][0], dList[5][1] + window, dList[5][2] - window]
-
-                        ew[0] = [dList[4][0] + embrasure, dList[4][1] - window, dList[4][2] - window]
-                        ew[1] = [dList[1][0] + embrasure, dList[1][1] - window, dList[1][2] + window]
-                        ew[2] = [dList[2][0] + embrasure, dList[2][1] + window, dList[2][2] + window]
-                        ew[3] = [dList[5][0] + embrasure, dList[5][1] + window, dList[5][2] - window]
-
-                    elif side == 0:
-                        dw = [[], [], [], []]
-                        ew = [[], [], [], []]
-                        dw[0] = [dList[4][0] + window, dList[4][1], dList[4][2] - window]
-                        dw[1] = [dList[1][0] + window, dList[1][1], dList[1][2] + window]
-                        dw[2] = [dList[2][0] - window, dList[2][1], dList[2][2] + window]
-                        dw[3] = [dList[5][0] - window, dList[5][1], dList[5][2] - window]
-
-                        ew[0] = [dList[4][0] + window, dList[4][1] + embrasure, dList[4][2] - window]
-                        ew[1] = [dList[1][0] + window, dList[1][1] + embrasure, dList[1][2] + window]
-                        ew[2] = [dList[2][0] - window, dList[2][1] + embrasure, dList[2][2] + window]
-                        ew[3] = [dList[5][0] - window, dList[5][1] + embrasure, dList[5][2] - window]
-
-                    elif side == 2:
-                        dw = [[], [], [], []]
-                        ew = [[], [], [], []]
-
-                        dw[0] = [dList[4][0] - window, dList[4][1], dList[4][2] - window]
-                        dw[1] = [dList[1][0] - window, dList[1][1], dList[1][2] + window]
-                        dw[2] = [dList[2][0] + window, dList[2][1], dList[2][2] + window]
-                        dw[3] = [dList[5][0] + window, dList[5][1], dList[5][2] - window]
-
-                        ew[0] = [dList[4][0] - window, dList[4][1] - embrasure, dList[4][2] - window]
-                        ew[1] = [dList[1][0] - window, dList[1][1] - embrasure, dList[1][2] + window]
-                        ew[2] = [dList[2][0] + window, dList[2][1] - embrasure, dList[2][2] + window]
-                        ew[3] = [dList[5][0] + window, dList[5][1] - embrasure, dList[5][2] - window]      
-
-                    dwring = GMLPointList(dw[0]) + ' ' + GMLPointList(dw[3]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(dw[1]) + ' ' + GMLPointList(dw[0])
-                    binosemantics(lod3geometry, d4, dwring)
-
-
-                    dw0 = GMLPointList(dw[0]) + ' ' + GMLPointList(dw[1]) + ' ' + GMLPointList(ew[1]) + ' ' + GMLPointList(ew[0]) + ' ' + GMLPointList(dw[0])
-                    dw1 = GMLPointList(dw[1]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(ew[2]) + ' ' + GMLPointList(ew[1]) + ' ' + GMLPointList(dw[1])
-                    dw2 = GMLPointList(dw[3]) + ' ' + GMLPointList(ew[3]) + ' ' + GMLPointList(ew[2]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(dw[3])
-                    dw3 = GMLPointList(dw[3]) + ' ' + GMLPointList(dw[0]) + ' ' + GMLPointList(ew[0]) + ' ' + GMLPointList(ew[3]) + ' ' + GMLPointList(dw[3])
-
-                    ew0 = GMLPointList(ew[0]) + ' ' + GMLPointList(ew[1]) + ' ' + GMLPointList(ew[2]) + ' ' + GMLPointList(ew[3]) + ' ' + GMLPointList(ew[0])
-
-                    for bipoly in [dw0, dw1, dw2, dw3]:
-                        binosemantics(lod3geometry, bipoly)
-                    binosemantics(lod3geometry, ew0)
-
-                else:
-
-                    d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
-                    if side == 1:
-                        dw = [[], [], [], []]
-                        ew = [[], [], [], []]
-
-                        dw[0] = [dList[4][0], dList[4][1] + window, dList[4][2] - window]
-                        dw[1] = [dList[1][0], dList[1][1] + window, dList[1][2] + window]
-                        dw[2] = [dList[2][0], dList[2][1] - window, dList[2][2] + window]
-                        dw[3] = [dList[5][0], dList[5][1] - window, dList[5][2] - window]
-
-                        ew[0] = [dList[4][0], dList[4][1] + window, dList[4][2] - window]
-                        ew[1] = [dList[1][0], dList[1][1] + window, dList[1][2] + window]
-                        ew[2] = [dList[2][0], dList[2][1] - window, dList[2][2] + window]
-                        ew[3] = [dList[5][0], dList[5][1] - window, dList[5][2] - window]
-
-                    elif side == 3:
-                        dw = [[], [], [], []]
-                        ew = [[], [], [], []]
-
-                        dw[0] = [dList[4][0], dList[4][1] - window, dList[4][2] - window]
-                        dw[1] = [dList[1][0], dList[1][1] - window, dList[1][2] + window]
-                        dw[2] = [dList[2][0], dList[2][1] + window, dList[2][2] + window]
-                        dw[3] = [dList[5][0], dList[5][1] + window, dList[5][2] - window]
-
-                        ew[0] = [dList[4][0], dList[4][1] - window, dList[4][2] - window]
-                        ew[1] = [dList[1][0], dList[1][1] - window, dList[1][2] + window]
-                        ew[2] = [dList[2][0], dList[2][1] + window, dList[2][2] + window]
-                        ew[3] = [dList[5][0], dList[5][1] + window, dList[5][2] - window]
-
-                    elif side == 0:
-                        dw = [[], [], [], []]
-                        ew = [[], [], [], []]
-                        dw[0] = [dList[4][0] + window, dList[4][1], dList[4][2] - window]
-                        dw[1] = [dList[1][0] + window, dList[1][1], dList[1][2] + window]
-                        dw[2] = [dList[2][0] - window, dList[2][1], dList[2][2] + window]
-                        dw[3] = [dList[5][0] - window, dList[5][1], dList[5][2] - window]
-
-                        ew[0] = [dList[4][0] + window, dList[4][1], dList[4][2] - window]
-                        ew[1] = [dList[1][0] + window, dList[1][1], dList[1][2] + window]
-                        ew[2] = [dList[2][0] - window, dList[2][1], dList[2][2] + window]
-                        ew[3] = [dList[5][0] - window, dList[5][1], dList[5][2] - window]
-
-                    elif side == 2:
-                        dw = [[], [], [], []]
-                        ew = [[], [], [], []]
-                        dw[0] = [dList[4][0] - window, dList[4][1], dList[4][2] - window]
-                        dw[1] = [dList[1][0] - window, dList[1][1], dList[1][2] + window]
-                        dw[2] = [dList[2][0] + window, dList[2][1], dList[2][2] + window]
-                        dw[3] = [dList[5][0] + window, dList[5][1], dList[5][2] - window]
-
-                        ew[0] = [dList[4][0] - window, dList[4][1], dList[4][2] - window]
-                        ew[1] = [dList[1][0] - window, dList[1][1], dList[1][2] + window]
-                        ew[2] = [dList[2][0] + window, dList[2][1], dList[2][2] + window]
-                        ew[3] = [dList[5][0] + window, dList[5][1], dList[5][2] - window]               
-
-                    dwring = GMLPointList(dw[0]) + ' ' + GMLPointList(dw[3]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(dw[1]) + ' ' + GMLPointList(dw[0])
-                    #ew0 = GMLPointList(ew[0]) + ' ' + GMLPointList(ew[1]) + ' ' + GMLPointList(ew[2]) + ' ' + GMLPointList(ew[3]) + ' ' + GMLPointList(ew[0])
-                    binosemantics(lod3geometry, d4, dwring)
-                    #binosemantics(lod3geometry, ew0)
-
-        elif kind == 'chimney':
-            lod3geometry = etree.SubElement(bi, "{%s}lod3Geometry" % ns_bldg)
-            d1 = dListGML[0] + ' ' + dListGML[1] + ' ' + dListGML[4] + ' ' + dListGML[7] + ' ' + dListGML[0]
-            d2 = dListGML[3] + ' ' + dListGML[6] + ' ' + dListGML[5] + ' ' + dListGML[2] + ' ' + dListGML[3]
-            d3 = dListGML[0] + ' ' + dListGML[7] + ' ' + dListGML[6] + ' ' + dListGML[3] + ' ' + dListGML[0]
-            d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
-            binosemantics(lod3geometry, d1) 
-            binosemantics(lod3geometry, d2) 
-            binosemantics(lod3geometry, d3)
-            binosemantics(lod3geometry, d4)
-
-            d5 = dListGML[7] + ' ' + dListGML[4] + ' ' + dListGML[5] + ' ' + dListGML[6] + ' ' + dListGML[7]
-            binosemantics(lod3geometry, d5)
-            #-- Closure surface in the roof
-            # d0 = dListGML[0] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[3] + ' ' + dListGML[0]
-            # binosemantics(lod3geometry, d0)
-            #-- Closure surface in the roof
-            d0 = dListGML[0] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[3] + ' ' + dListGML[0]
-            bisemantics(lod3geometry, d0, "ClosureSurface")
-
-    if semantics == 1:
-        if kind == 'dormer':
-            d1 = dListGML[0] + ' ' + dListGML[1] + ' ' + dListGML[4] + ' ' + dListGML[0]
-            d2 = dListGML[0] + ' ' + dListGML[4] + ' ' + dListGML[5] + ' ' + dListGML[3] + ' ' + dListGML[0]
-            d3 = dListGML[5] + ' ' + dListGML[2] + ' ' + dListGML[3] + ' ' + dListGML[5]
-            bisemantics(bi, d1, "WallSurface") 
-            bisemantics(bi, d2, "RoofSurface") 
-            bisemantics(bi, d3, "WallSurface")
-
-            if window is None:
-
-                d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
-                bisemantics(bi, d4, "WallSurface")
-
-            if window is not None:
-
-                #-- Face with the window
-                if embrasure is not None and embrasure > 0.0:
-
-                    d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
-
-                    if side == 1:
-                        dw = [[], [], [], []]
-                        ew = [[], [], [], []]
-
-                        dw[0] = [dList[4][0], dList[4][1] + window, dList[4][2] - window]
-                        dw[1] = [dList[1][0], dList[1][1] + window, dList[1][2] + window]
-                        dw[2] = [dList[2][0], dList[2][1] - window, dList[2][2] + window]
-                        dw[3] = [dList[5][0], dList[5][1] - window, dList[5][2] - window]
-
-                        ew[0] = [dList[4][0] - embrasure, dList[4][1] + window, dList[4][2] - window]
-                        ew[1] = [dList[1][0] - embrasure, dList[1][1] + window, dList[1][2] + window]
-                        ew[2] = [dList[2][0] - embrasure, dList[2][1] - window, dList[2][2] + window]
-                        ew[3] = [dList[5][0] - embrasure, dList[5][1] - window, dList[5][2] - window]
-
-                    elif side == 3:
-                        dw = [[], [], [], []]
-                        ew = [[], [], [], []]
-
-                        dw[0] = [dList[4][0], dList[4][1] - window, dList[4][2] - window]
-                        dw[1] = [dList[1][0], dList[1][1] - window, dList[1][2] + window]
-                        dw[2] = [dList[2][0], dList[2][1] + window, dList[2][2] + window]
-                        dw[3] = [dList[5][0], dList[5][1] + window, dList[5][2] - window]
-
-                        ew[0] = [dList[4][0] + embrasure, dList[4][1] - window, dList[4][2] - window]
-                        ew[1] = [dList[1][0] + embrasure, dList[1][1] - window, dList[1][2] + window]
-                        ew[2] = [dList[2][0] + embrasure, dList[2][1] + window, dList[2][2] + window]
-                        ew[3] = [dList[5][0] + embrasure, dList[5][1] + window, dList[5][2] - window]
-
-                    elif side == 0:
-                        dw = [[], [], [], []]
-                        ew = [[], [], [], []]
-                        dw[0] = [dList[4][0] + window, dList[4][1], dList[4][2] - window]
-                        dw[1] = [dList[1][0] + window, dList[1][1], dList[1][2] + window]
-                        dw[2] = [dList[2][0] - window, dList[2][1], dList[2][2] + window]
-                        dw[3] = [dList[5][0] - window, dList[5][1], dList[5][2] - window]
-
-                        ew[0] = [dList[4][0] + window, dList[4][1] + embrasure, dList[4][2] - window]
-                        ew[1] = [dList[1][0] + window, dList[1][1] + embrasure, dList[1][2] + window]
-                        ew[2] = [dList[2][0] - window, dList[2][1] + embrasure, dList[2][2] + window]
-                        ew[3] = [dList[5][0] - window, dList[5][1] + embrasure, dList[5][2] - window]
-
-                    elif side == 2:
-                        dw = [[], [], [], []]
-                        ew = [[], [], [], []]
-
-                        dw[0] = [dList[4][0] - window, dList[4][1], dList[4][2] - window]
-                        dw[1] = [dList[1][0] - window, dList[1][1], dList[1][2] + window]
-                        dw[2] = [dList[2][0] + window, dList[2][1], dList[2][2] + window]
-                        dw[3] = [dList[5][0] + window, dList[5][1], dList[5][2] - window]
-
-                        ew[0] = [dList[4][0] - window, dList[4][1] - embrasure, dList[4][2] - window]
-                        ew[1] = [dList[1][0] - window, dList[1][1] - embrasure, dList[1][2] + window]
-                        ew[2] = [dList[2][0] + window, dList[2][1] - embrasure, dList[2][2] + window]
-                        ew[3] = [dList[5][0] + window, dList[5][1] - embrasure, dList[5][2] - window]      
-
-                    dwring = GMLPointList(dw[0]) + ' ' + GMLPointList(dw[3]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(dw[1]) + ' ' + GMLPointList(dw[0])
-                    bisemantics(bi, d4, "WallSurface", dwring, False)
-
-
-                    dw0 = GMLPointList(dw[0]) + ' ' + GMLPointList(dw[1]) + ' ' + GMLPointList(ew[1]) + ' ' + GMLPointList(ew[0]) + ' ' + GMLPointList(dw[0])
-                    dw1 = GMLPointList(dw[1]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(ew[2]) + ' ' + GMLPointList(ew[1]) + ' ' + GMLPointList(dw[1])
-                    dw2 = GMLPointList(dw[3]) + ' ' + GMLPointList(ew[3]) + ' ' + GMLPointList(ew[2]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(dw[3])
-                    dw3 = GMLPointList(dw[3]) + ' ' + GMLPointList(dw[0]) + ' ' + GMLPointList(ew[0]) + ' ' + GMLPointList(ew[3]) + ' ' + GMLPointList(dw[3])
-
-                    ew0 = GMLPointList(ew[0]) + ' ' + GMLPointList(ew[1]) + ' ' + GMLPointList(ew[2]) + ' ' + GMLPointList(ew[3]) + ' ' + GMLPointList(ew[0])
-
-                    bisemanticsMulti(bi, [dw0, dw1, dw2, dw3], "WallSurface", ew0)
-
-                else:
+def componentBuilders(name, prefixes, builders):
+    """Builders of a component, which is imported only if one of the produced representations starts with one of the prefixes (always if there are no prefixes)."""
+    if prefixes and not any(representation.startswith(tuple(prefixes)) for representation in CityGMLs):
+        return [skippedBuilder for builder in builders]
+    component = loadComponent(name)
+    if REPRESENTATIONS is None and GROUP is None:
+        builders = [getattr(component, builder) for builder in builders]
+    else:
+        builders = [producedBuilder(getattr(component, builder)) for builder in builders]
+    if PLAN or SCHEDULER:
+        return [timedBuilder(builder) for builder in builders]
+    return builders
 
-                    d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
-                    if side == 1:
-                        dw = [[], [], [], []]
-                        dw[0] = [dList[4][0], dList[4][1] + window, dList[4][2] - window]
-                        dw[1] = [dList[1][0], dList[1][1] + window, dList[1][2] + window]
-                        dw[2] = [dList[2][0], dList[2][1] - window, dList[2][2] + window]
-                        dw[3] = [dList[5][0], dList[5][1] - window, dList[5][2] - window]
-                    elif side == 3:
-                        dw = [[], [], [], []]
-                        dw[0] = [dList[4][0], dList[4][1] - window, dList[4][2] - window]
-                        dw[1] = [dList[1][0], dList[1][1] - window, dList[1][2] + window]
-                        dw[2] = [dList[2][0], dList[2][1] + window, dList[2][2] + window]
-                        dw[3] = [dList[5][0], dList[5][1] + window, dList[5][2] - window]
-                    elif side == 0:
-                        dw = [[], [], [], []]
-                        dw[0] = [dList[4][0] + window, dList[4][1], dList[4][2] - window]
-                        dw[1] = [dList[1][0] + window, dList[1][1], dList[1][2] + window]
-                        dw[2] = [dList[2][0] - window, dList[2][1], dList[2][2] + window]
-                        dw[3] = [dList[5][0] - window, dList[5][1], dList[5][2] - window]
-                    elif side == 2:
-                        dw = [[], [], [], []]
-                        dw[0] = [dList[4][0] - window, dList[4][1], dList[4][2] - window]
-                        dw[1] = [dList[1][0] - window, dList[1][1], dList[1][2] + window]
-                        dw[2] = [dList[2][0] + window, dList[2][1], dList[2][2] + window]
-                        dw[3] = [dList[5][0] + window, dList[5][1], dList[5][2] - window]                
-
-                    dwring = GMLPointList(dw[0]) + ' ' + GMLPointList(dw[3]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(dw[1]) + ' ' + GMLPointList(dw[0])
-                    ew0 = GMLPointList(dw[0]) + ' ' + GMLPointList(dw[1]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(dw[3]) + ' ' + GMLPointList(dw[0])
-                    bisemantics(bi, d4, "WallSurface", ew0, True)
-                    #bisemantics(bi, d4, "WallSurface", dwring, ew0)
-
-        elif kind == 'chimney':
-            lod3geometry = etree.SubElement(bi, "{%s}lod3Geometry" % ns_bldg)
-            d1 = dListGML[0] + ' ' + dListGML[1] + ' ' + dListGML[4] + ' ' + dListGML[7] + ' ' + dListGML[0]
-            d2 = dListGML[3] + ' ' + dListGML[6] + ' ' + dListGML[5] + ' ' + dListGML[2] + ' ' + dListGML[3]
-            d3 = dListGML[0] + ' ' + dListGML[7] + ' ' + dListGML[6] + ' ' + dListGML[3] + ' ' + dListGML[0]
-            d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
-            bisemantics(lod3geometry, d1, "WallSurface") 
-            bisemantics(lod3geometry, d2, "WallSurface") 
-            bisemantics(lod3geometry, d3, "WallSurface")
-            bisemantics(lod3geometry, d4, "WallSurface")
-
-            #-- Closure surface on the top
-            d5 = dListGML[7] + ' ' + dListGML[4] + ' ' + dListGML[5] + ' ' + dListGML[6] + ' ' + dListGML[7]
-            bisemantics(lod3geometry, d5, "ClosureSurface")
-            #-- Closure surface in the roof
-            d0 = dListGML[0] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[3] + ' ' + dListGML[0]
-            bisemantics(lod3geometry, d0, "ClosureSurface")
-
-def buildinginstallationSolid(skipsm, cs, kind, d, semantics=0, window=None, side=None, embrasure=None):
-    """Generate the solid of a building installation."""
-    dList, dListGML = d
-
-    if semantics == 0:
-        if kind == 'dormer':
-            d1 = dListGML[0] + ' ' + dListGML[1] + ' ' + dListGML[4] + ' ' + dListGML[0]
-            d2 = dListGML[0] + ' ' + dListGML[4] + ' ' + dListGML[5] + ' ' + dListGML[3] + ' ' + dListGML[0]
-            d3 = dListGML[5] + ' ' + dListGML[2] + ' ' + dListGML[3] + ' ' + dListGML[5]
-            addsurface(skipsm, cs, d1) 
-            addsurface(skipsm, cs, d2) 
-            addsurface(skipsm, cs, d3)
-
-            #d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
-            #addsurface(skipsm, cs, d4)
-
-            #-- Face with the window
-            if embrasure is not None and embrasure > 0.0:
-
-                d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
-                if side == 1:
-                    dw = [[], [], [], []]
-                    ew = [[], [], [], []]
-
-                    dw[0] = [dList[4][0], dList[4][1] + window, dList[4][2] - window]
-                    dw[1] = [dList[1][0], dList[1][1] + window, dList[1][2] + window]
-                    dw[2] = [dList[2][0], dList[2][1] - window, dList[2][2] + window]
-                    dw[3] = [dList[5][0], dList[5][1] - window, dList[5][2] - window]
-
-                    ew[0] = [dList[4][0] - embrasure, dList[4][1] + window, dList[4][2] - window]
-                    ew[1] = [dList[1][0] - embrasure, dList[1][1] + window, dList[1][2] + window]
-                    ew[2] = [dList[2][0] - embrasure, dList[2][1] - window, dList[2][2] + window]
-                    ew[3] = [dList[5][0] - embrasure, dList[5][1] - window, dList[5][2] - window]
-
-                elif side == 3:
-                    dw = [[], [], [], []]
-                    ew = [[], [], [], []]
-
-                    dw[0] = [dList[4][0], dList[4][1] - window, dList[4][2] - window]
-                    dw[1] = [dList[1][0], dList[1][1] - window, dList[1][2] + window]
-                    dw[2] = [dList[2][0], dList[2][1] + window, dList[2][2] + window]
-                    dw[3] = [dList[5][0], dList[5][1] + window, dList[5][2] - window]
-
-                    ew[0] = [dList[4][0] + embrasure, dList[4][1] - window, dList[4][2] - window]
-                    ew[1] = [dList[1][0] + embrasure, dList[1][1] - window, dList[1][2] + window]
-                    ew[2] = [dList[2][0] + embrasure, dList[2][1] + window, dList[2][2] + window]
-                    ew[3] = [dList[5][0] + embrasure, dList[5][1] + window, dList[5][2] - window]
-
-                elif side == 0:
-                    dw = [[], [], [], []]
-                    ew = [[], [], [], []]
-                    dw[0] = [dList[4][0] + window, dList[4][1], dList[4][2] - window]
-                    dw[1] = [dList[1][0] + window, dList[1][1], dList[1][2] + window]
-                    dw[2] = [dList[2][0] - window, dList[2][1], dList[2][2] + window]
-                    dw[3] = [dList[5][0] - window, dList[5][1], dList[5][2] - window]
-
-                    ew[0] = [dList[4][0] + window, dList[4][1] + embrasure, dList[4][2] - window]
-                    ew[1] = [dList[1][0] + window, dList[1][1] + embrasure, dList[1][2] + window]
-                    ew[2] = [dList[2][0] - window, dList[2][1] + embrasure, dList[2][2] + window]
-                    ew[3] = [dList[5][0] - window, dList[5][1] + embrasure, dList[5][2] - window]
-
-                elif side == 2:
-                    dw = [[], [], [], []]
-                    ew = [[], [], [], []]
-
-                    dw[0] = [dList[4][0] - window, dList[4][1], dList[4][2] - window]
-                    dw[1] = [dList[1][0] - window, dList[1][1], dList[1][2] + window]
-                    dw[2] = [dList[2][0] + window, dList[2][1], dList[2][2] + window]
-                    dw[3] = [dList[5][0] + window, dList[5][1], dList[5][2] - window]
-
-                    ew[0] = [dList[4][0] - window, dList[4][1] - embrasure, dList[4][2] - window]
-                    ew[1] = [dList[1][0] - window, dList[1][1] - embrasure, dList[1][2] + window]
-                    ew[2] = [dList[2][0] + window, dList[2][1] - embrasure, dList[2][2] + window]
-                    ew[3] = [dList[5][0] + window, dList[5][1] - embrasure, dList[5][2] - window]      
-
-                dwring = GMLPointList(dw[0]) + ' ' + GMLPointList(dw[3]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(dw[1]) + ' ' + GMLPointList(dw[0])
-                addsurface(skipsm, cs, d4, [dwring])
-
-
-                dw0 = GMLPointList(dw[0]) + ' ' + GMLPointList(dw[1]) + ' ' + GMLPointList(ew[1]) + ' ' + GMLPointList(ew[0]) + ' ' + GMLPointList(dw[0])
-                dw1 = GMLPointList(dw[1]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(ew[2]) + ' ' + GMLPointList(ew[1]) + ' ' + GMLPointList(dw[1])
-                dw2 = GMLPointList(dw[3]) + ' ' + GMLPointList(ew[3]) + ' ' + GMLPointList(ew[2]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(dw[3])
-                dw3 = GMLPointList(dw[3]) + ' ' + GMLPointList(dw[0]) + ' ' + GMLPointList(ew[0]) + ' ' + GMLPointList(ew[3]) + ' ' + GMLPointList(dw[3])
-
-                ew0 = GMLPointList(ew[0]) + ' ' + GMLPointList(ew[1]) + ' ' + GMLPointList(ew[2]) + ' ' + GMLPointList(ew[3]) + ' ' + GMLPointList(ew[0])
-
-                addsurface(skipsm, cs, dw0)
-                addsurface(skipsm, cs, dw1)
-                addsurface(skipsm, cs, dw2)
-                addsurface(skipsm, cs, dw3)
-                addsurface(skipsm, cs, ew0)
 
-            else:
-                d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
-                addsurface(skipsm, cs, d4)
+def producedRepresentation(suffix):
+    """Whether a representation is produced in this run."""
+    if REPRESENTATIONS is None:
+        return True
+    return any(fnmatch.fnmatchcase(suffix, pattern) for pattern in REPRESENTATIONS)
 
 
-def plainMultiSurface(surfaceMember, coords, interior=None):
-    """Adds a polygon to the SurfaceMember."""
-    Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
-    if ASSIGNID:
-        Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-    PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
-    LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
-    posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-    posList.text = coords
+def CityGMLhead(suffix):
+    """Serialised beginning of the CityModel (its name and envelope) that precedes the first cityObjectMember."""
+    skeleton = etree.tostring(createCityGML(suffix), pretty_print=True)
+    return skeleton[:-len(CITYGMLFOOTER)]
 
-    if interior and interior[0] is not None:
-        for hole in interior:
-            PolygonInterior = etree.SubElement(Polygon, "{%s}interior" % ns_gml)
-            LinearRing = etree.SubElement(PolygonInterior, "{%s}LinearRing" % ns_gml)
-            posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-            posList.text = hole
 
+def CityGMLfragment(suffix):
+    """Serialise the cityObjectMembers currently held in the memory and remove them from the CityModel.
+    The fragment is exactly the part of the pretty printed file these members take, so the fragments can be concatenated."""
+    CityModel = CityGMLs[suffix]
+    if len(CityModel) == 2:
+        return b''
+    citygml = etree.tostring(CityModel, pretty_print=True)
+    del CityModel[2:]
+    return citygml[len(CityGMLheads[suffix]):-len(CITYGMLFOOTER)]
 
-def multiSurface(bldg, coords, semantics, interior=None, LOD=None, opening=None):
-    """
-    Write a surface with input coordinates.
-    Input: coordinates of the LinearRing.
-    Output: CompositeSurface.
-    """
-    boundedBy = etree.SubElement(bldg, "{%s}boundedBy" % ns_bldg)
-    semanticSurface = etree.SubElement(boundedBy, "{%s}%s" % (ns_bldg, semantics))
-    if LOD == 3:
-        lodXMultiSurface = etree.SubElement(semanticSurface, "{%s}lod3MultiSurface" % ns_bldg)
-    elif LOD == 2:
-        lodXMultiSurface = etree.SubElement(semanticSurface, "{%s}lod2MultiSurface" % ns_bldg)
-    else:
-        lodXMultiSurface = etree.SubElement(semanticSurface, "{%s}lod2MultiSurface" % ns_bldg)
-    MultiSurface = etree.SubElement(lodXMultiSurface, "{%s}MultiSurface" % ns_gml)
-    surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
-    Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
-    if ASSIGNID:
-        Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-    PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
-    LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
-    posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-    posList.text = coords
-
-    if interior and interior[0] is not None:
-        for hole in interior:
-            PolygonInterior = etree.SubElement(Polygon, "{%s}interior" % ns_gml)
-            LinearRing = etree.SubElement(PolygonInterior, "{%s}LinearRing" % ns_gml)
-            posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-            posList.text = hole
-
-    if opening:
-
-        dooropening = opening[0]
-
-        if dooropening != []:
-            gmlopening = etree.SubElement(semanticSurface, "{%s}opening" % ns_bldg)
-            gmldoor = etree.SubElement(gmlopening, "{%s}Door" % ns_bldg)
-            lod3MultiSurface = etree.SubElement(gmldoor, "{%s}lod3MultiSurface" % ns_bldg)
-            DoorMultiSurface = etree.SubElement(lod3MultiSurface, "{%s}MultiSurface" % ns_gml)
-            DoorsurfaceMember = etree.SubElement(DoorMultiSurface, "{%s}surfaceMember" % ns_gml)
-            DoorPolygon = etree.SubElement(DoorsurfaceMember, "{%s}Polygon" % ns_gml)
-            if ASSIGNID:
-                DoorPolygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-            DoorPolygonExterior = etree.SubElement(DoorPolygon, "{%s}exterior" % ns_gml)
-            DoorLinearRing = etree.SubElement(DoorPolygonExterior, "{%s}LinearRing" % ns_gml)
-            DoorposList = etree.SubElement(DoorLinearRing, "{%s}posList" % ns_gml)
-            DoorposList.text = GMLreversedRing(dooropening['ring'])
-
-        if len(opening[1]) > 0:
-            for win in opening[1]:
-                #print win
-                gmlopening = etree.SubElement(semanticSurface, "{%s}opening" % ns_bldg)
-                gmlwin = etree.SubElement(gmlopening, "{%s}Window" % ns_bldg)
-                lod3MultiSurface = etree.SubElement(gmlwin, "{%s}lod3MultiSurface" % ns_bldg)
-                DoorMultiSurface = etree.SubElement(lod3MultiSurface, "{%s}MultiSurface" % ns_gml)
-                DoorsurfaceMember = etree.SubElement(DoorMultiSurface, "{%s}surfaceMember" % ns_gml)
-                DoorPolygon = etree.SubElement(DoorsurfaceMember, "{%s}Polygon" % ns_gml)
-                if ASSIGNID:
-                    DoorPolygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-                DoorPolygonExterior = etree.SubElement(DoorPolygon, "{%s}exterior" % ns_gml)
-                DoorLinearRing = etree.SubElement(DoorPolygonExterior, "{%s}LinearRing" % ns_gml)
-                DoorposList = etree.SubElement(DoorLinearRing, "{%s}posList" % ns_gml)
-                DoorposList.text = GMLreversedRing(win['ring'])
-
-def multiSurface2(bldg, coords, semantics, interior=None, LOD=None, window=None):
-    """
-    Write a surface with input coordinates.
-    Input: coordinates of the LinearRing.
-    Output: MultiSurface.
-    """
-    boundedBy = etree.SubElement(bldg, "{%s}boundedBy" % ns_bldg)
-    semanticSurface = etree.SubElement(boundedBy, "{%s}%s" % (ns_bldg, semantics))
-    if LOD == 3:
-        lodXMultiSurface = etree.SubElement(semanticSurface, "{%s}lod3MultiSurface" % ns_bldg)
-    elif LOD == 2:
-        lodXMultiSurface = etree.SubElement(semanticSurface, "{%s}lod2MultiSurface" % ns_bldg)
-    else:
-        lodXMultiSurface = etree.SubElement(semanticSurface, "{%s}lod2MultiSurface" % ns_bldg)
-    MultiSurface = etree.SubElement(lodXMultiSurface, "{%s}MultiSurface" % ns_gml)
-    surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
-    Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
-    if ASSIGNID:
-        Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-    PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
-    LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
-    posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-    posList.text = coords
-
-    if interior and interior[0] is not None:
-        for hole in interior:
-            PolygonInterior = etree.SubElement(Polygon, "{%s}interior" % ns_gml)
-            LinearRing = etree.SubElement(PolygonInterior, "{%s}LinearRing" % ns_gml)
-            posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-            posList.text = hole
-
-    if window:
-        if len(window) > 0:
-            for win in window:
-                #print win
-                gmlopening = etree.SubElement(semanticSurface, "{%s}opening" % ns_bldg)
-                gmlwin = etree.SubElement(gmlopening, "{%s}Window" % ns_bldg)
-                lod3MultiSurface = etree.SubElement(gmlwin, "{%s}lod3MultiSurface" % ns_bldg)
-                DoorMultiSurface = etree.SubElement(lod3MultiSurface, "{%s}MultiSurface" % ns_gml)
-                DoorsurfaceMember = etree.SubElement(DoorMultiSurface, "{%s}surfaceMember" % ns_gml)
-                DoorPolygon = etree.SubElement(DoorsurfaceMember, "{%s}Polygon" % ns_gml)
-                if ASSIGNID:
-                    DoorPolygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-                DoorPolygonExterior = etree.SubElement(DoorPolygon, "{%s}exterior" % ns_gml)
-                DoorLinearRing = etree.SubElement(DoorPolygonExterior, "{%s}LinearRing" % ns_gml)
-                DoorposList = etree.SubElement(DoorLinearRing, "{%s}posList" % ns_gml)
-                DoorposList.text = win
-
-
-def multiSurfaceWithEmbrasure(bldg, coords, semantics, interior=None, LOD=None, embO=None):
-    """
-    Write a surface with input coordinates, taking into account the embrasures.
-    Input: coordinates of the LinearRing.
-    Output: CompositeSurface.
-    """
-    boundedBy = etree.SubElement(bldg, "{%s}boundedBy" % ns_bldg)
-    semanticSurface = etree.SubElement(boundedBy, "{%s}%s" % (ns_bldg, semantics))
-    if LOD == 3:
-        lodXMultiSurface = etree.SubElement(semanticSurface, "{%s}lod3MultiSurface" % ns_bldg)
-    elif LOD == 2:
-        lodXMultiSurface = etree.SubElement(semanticSurface, "{%s}lod2MultiSurface" % ns_bldg)
-    else:
-        lodXMultiSurface = etree.SubElement(semanticSurface, "{%s}lod2MultiSurface" % ns_bldg)
-    MultiSurface = etree.SubElement(lodXMultiSurface, "{%s}MultiSurface" % ns_gml)
-    surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
-    Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
-    if ASSIGNID:
-        Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-    PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
-    LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
-    posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-    posList.text = coords
-
-    if interior and interior[0] is not None:
-        for hole in interior:
-            PolygonInterior = etree.SubElement(Polygon, "{%s}interior" % ns_gml)
-            LinearRing = etree.SubElement(PolygonInterior, "{%s}LinearRing" % ns_gml)
-            posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-            posList.text = hole
-
-    for opening in embO:
-        for s in opening['surfaces']:
-            # MultiSurface = etree.SubElement(lodXMultiSurface, "{%s}MultiSurface" % ns_gml)
-            surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
-            Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
-            if ASSIGNID:
-                Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-            PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
-            LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
-            posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-            posList.text = s
-        for o in opening['openings']:
-            gmlopening = etree.SubElement(semanticSurface, "{%s}opening" % ns_bldg)
-            if opening['type'] == 'Door':
-                gmldoor = etree.SubElement(gmlopening, "{%s}Door" % ns_bldg)
-            elif opening['type'] == 'Window':
-                gmldoor = etree.SubElement(gmlopening, "{%s}Window" % ns_bldg)
-            else:
-                raise ValueError("Door or window allowed.")
-            lod3MultiSurface = etree.SubElement(gmldoor, "{%s}lod3MultiSurface" % ns_bldg)
-            DoorMultiSurface = etree.SubElement(lod3MultiSurface, "{%s}MultiSurface" % ns_gml)
-            DoorsurfaceMember = etree.SubElement(DoorMultiSurface, "{%s}surfaceMember" % ns_gml)
-            DoorPolygon = etree.SubElement(DoorsurfaceMember, "{%s}Polygon" % ns_gml)
-            if ASSIGNID:
-                DoorPolygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-            DoorPolygonExterior = etree.SubElement(DoorPolygon, "{%s}exterior" % ns_gml)
-            DoorLinearRing = etree.SubElement(DoorPolygonExterior, "{%s}LinearRing" % ns_gml)
-            DoorposList = etree.SubElement(DoorLinearRing, "{%s}posList" % ns_gml)
-            DoorposList.text = o#['ring']
-
-
-def multiSurfaceLOD0(bldg, coords, footedge):
-    """
-    Write a surface with input coordinates.
-    Input: coordinates of the LinearRing.
-    Output: MultiSurface.
-    """
-    if footedge == "footprint":
-        lod0MultiSurface = etree.SubElement(bldg, "{%s}lod0FootPrint" % ns_bldg)
-    elif footedge == "roofedge":
-        lod0MultiSurface = etree.SubElement(bldg, "{%s}lod0RoofEdge" % ns_bldg)
-    MultiSurface = etree.SubElement(lod0MultiSurface, "{%s}MultiSurface" % ns_gml)
-    surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
-    Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
-    if ASSIGNID:
-        Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-    PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
-    LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
-    posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-    posList.text = coords
-
-
-def CityGMLbuildingLOD0(CityModel, ID, attributes, o, x, y, z, h=None, rtype=None, top=None, override=None, LOD=None, aux=None, buildingpart=None, fd=False):
-    """
-    Generate a cityObjectMember representing a building in LOD0.
-    Output: CityGML code of the cityObjectMember.
-    """
-    cityObject = etree.SubElement(CityModel, "cityObjectMember")
-    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
-    bldg.attrib['{%s}id' % ns_gml] = ID
-    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
-    roofType.text = rtype
-
-    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
-    yearOfConstructionXML.text = attributes['yearOfConstruction']
-    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
-    functionXML.text = attributes['function']
-    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
-    storeysAboveGroundXML.text = attributes['storeysAboveGround']
-    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
-    storeysAboveGroundXML.text = attributes['storeysAboveGround']
-
-    if top is not None:
-        if top == 1.0 and rtype == 'Shed':
-            p = verticesBody(o, x, y, z, h, None, override)
-        else:
-            p = verticesBody(o, x, y, z, h, top)
-    elif top is None:
-        p = verticesBody(o, x, y, z, h, None, override)
-
-    #-- Is the building part covered by overhangs?
-    if buildingpart is not None:
-        if x > aux['xsize'] and aux['ovhx'] >= buildingpart['x']:
-            covered = True
-        else:
-            covered = False
-    else:
-        covered = None
-
-    footprints = []
-    roofedges = []
-
-
-    #-- Account for building parts
-    if buildingpart is not None and not covered:
-
-        #-- Accounting for overhangs
-        if x > aux['xsize']:# or x < aux['xsize']:
-            bp = [None] * 8
-            bp[0] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[3] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-            bp[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-
-            #-- Top with the rest of the building
-            bpT = [None] * 8
-            tH = GMLstring2points(p[4])[0][2]
-            bpT[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], tH])
-            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
-            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-            bpT[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
- 
-        elif fd and x < aux['xsize']:
-
-            bp = [None] * 8
-            eastline = GMLstring2points(p[1])[0][0]
-            bp[0] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[3] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-            bp[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-
-            #-- Top with the rest of the building
-            bpT = [None] * 8
-            tH = GMLstring2points(p[4])[0][2]
-            bpT[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], tH])
-            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
-            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-            bpT[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
 
-        else:
-            bp = [None] * 8
-            bp[0] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[1] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[2] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[3] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-            bp[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-
-            #-- Top with the rest of the building
-            bpT = [None] * 8
-            tH = GMLstring2points(p[4])[0][2]
-            bpT[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], tH])
-            bpT[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], tH])
-            bpT[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-            bpT[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-
-        if buildingpart['type'] == 'Alcove':
-            if LOD == '0.1':
-                faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
-                footprints.append(faceBottom)
-                #faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
-                #roofedges.append(faceTop)
-            elif LOD == '0.2':
-                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
-                footprints.append(faceBottom)
-                faceTop = "%s %s %s %s %s %s %s %s %s" % (p[4], p[5], bpT[4], bpT[5], bpT[6], bpT[7], p[6], p[7], p[4])
-                roofedges.append(faceTop)    
-            elif LOD == '0.3':
-                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
-                footprints.append(faceBottom)
-                faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
-                roofedges.append(faceTop)
-                gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
-                roofedges.append(gtop)                         
-        elif buildingpart['type'] == 'Garage':
-            if LOD == '0.1' or LOD == '0.2' or LOD == '0.3':
-                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
-                footprints.append(faceBottom)
-                if LOD == '0.2':
-                    faceTop = "%s %s %s %s %s %s %s %s %s" % (p[4], p[5], bpT[4], bpT[5], bpT[6], bpT[7], p[6], p[7], p[4])
-                    roofedges.append(faceTop)
-                elif LOD == '0.3':
-                    faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
-                    roofedges.append(faceTop)
-                    gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
-                    roofedges.append(gtop)
+def CityGMLfilename(suffix):
+    """Path of the CityGML file of a representation."""
+    if str(suffix) == 'Ground Truth':
+        return DIRECTORY + '/' + 'groundTruth.gml'
     else:
-        footprint = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
-        footprints.append(footprint)
-        if LOD == '0.2' or LOD == '0.3':
-            faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
-            roofedges.append(faceTop)
-
-
-    #-- Bottom face
-    for ft in footprints:
-        multiSurfaceLOD0(bldg, GMLreversedRing(ft), "footprint")
+        return DIRECTORY + '/' + str(suffix) + '.gml'
 
-    #-- Top face
-    for re in roofedges:
-        multiSurfaceLOD0(bldg, re, "roofedge")
 
-
-def CityGMLbuildingLOD1(CityModel, ID, attributes, o, x, y, z, h=None, rtype=None, top=None, override=None, LOD=None, aux=None, buildingpart=None, fd=False):
-    """
-    Generate a cityObjectMember representing a building in LOD1.
-    Input: ID, origin, width, depth, height, and optionally: height of the roof, roof type, block model top modelling rule, walls modelling rule.
-    Output: CityGML code of the cityObjectMember.
-    """
-    cityObject = etree.SubElement(CityModel, "cityObjectMember")
-    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
-    bldg.attrib['{%s}id' % ns_gml] = ID
-    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
-    roofType.text = rtype
-
-    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
-    yearOfConstructionXML.text = attributes['yearOfConstruction']
-    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
-    functionXML.text = attributes['function']
-    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
-    storeysAboveGroundXML.text = attributes['storeysAboveGround']
-
-    if top is not None:
-        if top == 1.0 and rtype == 'Shed':
-            p = verticesBody(o, x, y, z, h, None, override)
-        else:
-            p = verticesBody(o, x, y, z, h, top)
-    elif top is None:
-        p = verticesBody(o, x, y, z, h, None, override)
-
-    lod1MultiSurface = etree.SubElement(bldg, "{%s}lod1MultiSurface" % ns_bldg)
-    MultiSurface = etree.SubElement(lod1MultiSurface, "{%s}MultiSurface" % ns_gml)
-    surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
-    
-
-    faces = []
-    face0 = "%s %s %s %s %s" % (p[0], p[1], p[5], p[4], p[0])
-    faces.append(face0)
-    face2 = "%s %s %s %s %s" % (p[2], p[3], p[7], p[6], p[2])
-    faces.append(face2)
-    face3 = "%s %s %s %s %s" % (p[3], p[0], p[4], p[7], p[3])
-    faces.append(face3)
-
-    #-- Is the building part covered by overhangs?
-    if buildingpart is not None:
-        if x > aux['xsize'] and aux['ovhx'] >= buildingpart['x']:
-            covered = True
-        else:
-            covered = False
+def openCityGML(fname):
+    """Open a CityGML file for writing, compressed with gzip if requested."""
+    if COMPRESS:
+        return gzip.open(fname + '.gz', "wb")
     else:
-        covered = None
-
-    #-- Account for building parts
-    if buildingpart is not None and not covered:
-
-        #-- Accounting for overhangs
-        if x > aux['xsize']:# or x < aux['xsize']:
-            bp = [None] * 8
-            bp[0] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[3] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-            bp[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-
-            #-- Top with the rest of the building
-            bpT = [None] * 8
-            tH = GMLstring2points(p[4])[0][2]
-            bpT[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], tH])
-            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
-            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-            bpT[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-
-        elif fd and x < aux['xsize']:
-
-            bp = [None] * 8
-            eastline = GMLstring2points(p[1])[0][0]
-            bp[0] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[3] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-            bp[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-
-            #-- Top with the rest of the building
-            bpT = [None] * 8
-            tH = GMLstring2points(p[4])[0][2]
-            bpT[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], tH])
-            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
-            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-            bpT[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-
+        return open(fname, "wb")
+
+
+def copyFile(fname, target):
+    """Append a file to an open file.
+    The data is copied by the kernel (copy_file_range or sendfile) when possible, without passing through the memory of Python."""
+    source = open(fname, "rb")
+    size = os.fstat(source.fileno()).st_size
+    copied = 0
+    if not isinstance(target, gzip.GzipFile):
+        target.flush()
+        try:
+            while copied < size:
+                if hasattr(os, 'copy_file_range'):
+                    n = os.copy_file_range(source.fileno(), target.fileno(), size - copied, copied)
+                else:
+                    n = os.sendfile(target.fileno(), source.fileno(), copied, size - copied)
+                if n == 0:
+                    break
+                copied += n
+        except (AttributeError, OSError):
+            pass
+        #-- The position of the file object follows the copied data, unless it is a pipe or a socket
+        try:
+            target.seek(0, os.SEEK_END)
+        except (IOError, OSError):
+            pass
+    if copied < size:
+        source.seek(copied)
+        shutil.copyfileobj(source, target)
+    source.close()
+
+
+def startCityGML(citygmlFile, suffix):
+    """Write the beginning of a CityGML file: the header, the CityModel and the buildings persisted in the checkpoints or by the workers."""
+    #-- Header of the XML
+    citygmlFile.write(CITYGMLHEADER)
+    citygmlFile.write(CityGMLheads[suffix])
+    #-- Buildings persisted in the checkpoints come first
+    if CHECKPOINT:
+        copyFile(checkpointFilename(suffix), citygmlFile)
+    #-- Buildings generated by the workers, in their order
+    if WORKERS:
+        for worker in range(WORKERS):
+            copyFile(spoolFilename(worker, suffix), citygmlFile)
 
-        else:
-            bp = [None] * 8
-            bp[0] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[1] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[2] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[3] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-            bp[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-
-            #-- Top with the rest of the building
-            bpT = [None] * 8
-            tH = GMLstring2points(p[4])[0][2]
-            bpT[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], tH])
-            bpT[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], tH])
-            bpT[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-            bpT[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-
-        if buildingpart['type'] == 'Alcove':
-            if LOD == '1.1':
-                face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
-                faces.append(face1)
-                faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
-                faces.append(faceBottom)
-                faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
-                faces.append(faceTop)
-            elif LOD == '1.2':
-                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
-                faces.append(faceBottom)
-                faceTop = "%s %s %s %s %s %s %s %s %s" % (p[4], p[5], bpT[4], bpT[5], bpT[6], bpT[7], p[6], p[7], p[4])
-                faces.append(faceTop)
-                face1_0 = "%s %s %s %s %s" % (p[1], bp[0], bpT[4], p[5], p[1])
-                faces.append(face1_0)
-                face1_1 = "%s %s %s %s %s" % (p[2], p[6], bpT[7], bp[3], p[2])
-                faces.append(face1_1)
-                gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bpT[5], bpT[4], bp[0])
-                faces.append(gface0)
-                gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bpT[6], bpT[5], bp[1])
-                faces.append(gface1)
-                gface3 = "%s %s %s %s %s" % (bp[3], bpT[7], bpT[6], bp[2], bp[3])
-                faces.append(gface3)
-            elif LOD == '1.3':
-                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
-                faces.append(faceBottom)
-                faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
-                faces.append(faceTop)
-                face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
-                faces.append(face1)
-                gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
-                faces.append(gface0)
-                gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
-                faces.append(gface1)
-                gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
-                faces.append(gface3)
-                gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
-                faces.append(gtop)                
-        elif buildingpart['type'] == 'Garage':
-            if LOD == '1.1' or LOD == '1.2' or LOD == '1.3':
-                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
-                faces.append(faceBottom)
-                if LOD == '1.1' or LOD == '1.2':
-                    faceTop = "%s %s %s %s %s %s %s %s %s" % (p[4], p[5], bpT[4], bpT[5], bpT[6], bpT[7], p[6], p[7], p[4])
-                    faces.append(faceTop)
-                    face1_0 = "%s %s %s %s %s" % (p[1], bp[0], bpT[4], p[5], p[1])
-                    faces.append(face1_0)
-                    face1_1 = "%s %s %s %s %s" % (p[2], p[6], bpT[7], bp[3], p[2])
-                    faces.append(face1_1)
-                    gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bpT[5], bpT[4], bp[0])
-                    faces.append(gface0)
-                    gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bpT[6], bpT[5], bp[1])
-                    faces.append(gface1)
-                    gface3 = "%s %s %s %s %s" % (bp[3], bpT[7], bpT[6], bp[2], bp[3])
-                    faces.append(gface3)
-                elif LOD == '1.3':
-                    faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
-                    faces.append(faceTop)
-                    face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
-                    faces.append(face1)
-                    gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
-                    faces.append(gface0)
-                    gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
-                    faces.append(gface1)
-                    gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
-                    faces.append(gface3)
-                    gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
-                    faces.append(gtop)
-    else:
-        face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
-        faces.append(face1)
-        faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
-        faces.append(faceBottom)
-        faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
-        faces.append(faceTop)
 
-    for face in faces:
-        plainMultiSurface(surfaceMember, face)
+def storeCityGML(suffix):
+    "Write the CityGML file."
+    citygmlFile = openCityGML(CityGMLfilename(suffix))
+    startCityGML(citygmlFile, suffix)
+    for fragment in CityGMLfragments[suffix]:
+        citygmlFile.write(fragment)
+    citygmlFile.write(CITYGMLFOOTER)
+    citygmlFile.close()
 
 
-def CityGMLbuildingLOD1Semantics(CityModel, ID, attributes, o, x, y, z, h=None, rtype=None, top=None, override=None, LOD=None, aux=None, buildingpart=None, fd=False):
-    """
-    Generate a cityObjectMember representing a building in a special experimental form of LOD1 currently not really supported by the standard.
-    Input: ID, origin, width, depth, height, and optionally: height of the roof, roof type, block model top modelling rule, walls modelling rule.
-    Output: CityGML code of the cityObjectMember.
-    """
-    cityObject = etree.SubElement(CityModel, "cityObjectMember")
-    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
-    bldg.attrib['{%s}id' % ns_gml] = ID
-    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
-    roofType.text = rtype
-
-    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
-    yearOfConstructionXML.text = attributes['yearOfConstruction']
-    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
-    functionXML.text = attributes['function']
-    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
-    storeysAboveGroundXML.text = attributes['storeysAboveGround']
-
-    if top is not None:
-        if top == 1.0 and rtype == 'Shed':
-            p = verticesBody(o, x, y, z, h, None, override)
+def writeEnsemble():
+    """Write the realisations of the ensemble, each in a directory ensemble/1, ensemble/2..., with the same files as the city and noise on their coordinates.
+    Each file is read once, and only its perturbed coordinates are formatted for each realisation."""
+    ensemble = loadComponent('ensemble')
+    buildingIndex = dict((b.attrib['ID'], i) for i, b in enumerate(buildings))
+    origins = [[float(x) for x in b.findall('origin')[0].text.split(" ")] for b in buildings]
+    for realisation in range(1, ENSEMBLE + 1):
+        if not os.path.isdir(DIRECTORY + '/ensemble/' + str(realisation)):
+            os.makedirs(DIRECTORY + '/ensemble/' + str(realisation))
+    for suffix in CityGMLheads:
+        #-- The streamed representations do not have a file
+        if STREAMS and suffix in STREAMS:
+            continue
+        fname = CityGMLfilename(suffix)
+        if COMPRESS:
+            citygmlFile = gzip.open(fname + '.gz', "rb")
         else:
-            p = verticesBody(o, x, y, z, h, top)
-    elif top is None:
-        p = verticesBody(o, x, y, z, h, None, override)
-
-    Wfaces = []
-    Rfaces = []
-    Gfaces = []
-
-    face0 = "%s %s %s %s %s" % (p[0], p[1], p[5], p[4], p[0])
-    Wfaces.append(face0)
-    face2 = "%s %s %s %s %s" % (p[2], p[3], p[7], p[6], p[2])
-    Wfaces.append(face2)
-    face3 = "%s %s %s %s %s" % (p[3], p[0], p[4], p[7], p[3])
-    Wfaces.append(face3)
-
-    #-- Is the building part covered by overhangs?
-    if buildingpart is not None:
-        if x > aux['xsize'] and aux['ovhx'] >= buildingpart['x']:
-            covered = True
-        else:
-            covered = False
-    else:
-        covered = None
-
-    #-- Account for building parts
-    if buildingpart is not None and not covered:
-
-        #-- Accounting for overhangs
-        if x > aux['xsize']:# or x < aux['xsize']:
-            bp = [None] * 8
-            bp[0] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[3] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-            bp[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-
-            #-- Top with the rest of the building
-            bpT = [None] * 8
-            tH = GMLstring2points(p[4])[0][2]
-            bpT[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], tH])
-            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
-            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-            bpT[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-
-        elif fd and x < aux['xsize']:
-
-            bp = [None] * 8
-            eastline = GMLstring2points(p[1])[0][0]
-            bp[0] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[3] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-            bp[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-
-            #-- Top with the rest of the building
-            bpT = [None] * 8
-            tH = GMLstring2points(p[4])[0][2]
-            bpT[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], tH])
-            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
-            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-            bpT[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-
-
+            citygmlFile = open(fname, "rb")
+        skeleton = ensemble.coordinateSkeleton(citygmlFile.read(), buildingIndex, origins)
+        citygmlFile.close()
+        for realisation in range(1, ENSEMBLE + 1):
+            realisationFile = openCityGML(DIRECTORY + '/ensemble/' + str(realisation) + '/' + os.path.basename(fname))
+            realisationFile.write(ensemble.perturbedCityGML(skeleton, NOISE, realisation))
+            realisationFile.close()
+
+
+def writeFragments(fragmentQueue):
+    """Thread writing the fragments of its queue to the CityGML files, until it receives None.
+    An error is kept for the main thread, and the queue is still drained so that the generation does not wait forever."""
+    while True:
+        item = fragmentQueue.get()
+        if item is None:
+            break
+        suffix, fragment = item
+        if writerErrors:
+            continue
+        try:
+            if fragment is None:
+                writerFiles[suffix].write(CITYGMLFOOTER)
+                writerFiles[suffix].close()
+            else:
+                writerFiles[suffix].write(fragment)
+        except Exception as e:
+            writerErrors.append(e)
+
+
+def openStream(target):
+    """Open the target to which a representation is streamed: the standard output (-), a Unix socket on which a consumer listens (unix:path), or a named pipe.
+    Opening a named pipe waits for its reader."""
+    if target == '-':
+        return STANDARDOUTPUT
+    if target.startswith('unix:'):
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.connect(target[len('unix:'):])
+        streamFile = connection.makefile('wb')
+        #-- The socket is closed with the file
+        connection.close()
+        return streamFile
+    return open(target, "wb")
+
+
+def startWriters():
+    """Open the CityGML files and start the threads which write the buildings while they are generated.
+    The files are written under a temporary name, which is replaced when they are complete. The streamed representations are written to their target instead."""
+    for suffix in CityGMLheads:
+        if STREAMS and suffix in STREAMS:
+            writerFiles[suffix] = openStream(STREAMS[suffix])
         else:
-            bp = [None] * 8
-            bp[0] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[1] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[2] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[3] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-            bp[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-
-            #-- Top with the rest of the building
-            bpT = [None] * 8
-            tH = GMLstring2points(p[4])[0][2]
-            bpT[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], tH])
-            bpT[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], tH])
-            bpT[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-            bpT[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-
-        if buildingpart['type'] == 'Alcove':
-            if LOD == '1.1':
-                face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
-                Wfaces.append(face1)
-                faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
-                Gfaces.append(faceBottom)
-                faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
-                Rfaces.append(faceTop)
-            elif LOD == '1.2':
-                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
-                Gfaces.append(faceBottom)
-                faceTop = "%s %s %s %s %s %s %s %s %s" % (p[4], p[5], bpT[4], bpT[5], bpT[6], bpT[7], p[6], p[7], p[4])
-                Rfaces.append(faceTop)
-                face1_0 = "%s %s %s %s %s" % (p[1], bp[0], bpT[4], p[5], p[1])
-                Wfaces.append(face1_0)
-                face1_1 = "%s %s %s %s %s" % (p[2], p[6], bpT[7], bp[3], p[2])
-                Wfaces.append(face1_1)
-                gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bpT[5], bpT[4], bp[0])
-                Wfaces.append(gface0)
-                gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bpT[6], bpT[5], bp[1])
-                Wfaces.append(gface1)
-                gface3 = "%s %s %s %s %s" % (bp[3], bpT[7], bpT[6], bp[2], bp[3])
-                Wfaces.append(gface3)
-            elif LOD == '1.3':
-                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
-                Gfaces.append(faceBottom)
-                faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
-                Rfaces.append(faceTop)
-                face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
-                Wfaces.append(face1)
-                gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
-                Wfaces.append(gface0)
-                gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
-                Wfaces.append(gface1)
-                gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
-                Wfaces.append(gface3)
-                gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
-                Rfaces.append(gtop)                
-        elif buildingpart['type'] == 'Garage':
-            if LOD == '1.1' or LOD == '1.2' or LOD == '1.3':
-                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
-                Gfaces.append(faceBottom)
-                if LOD == '1.1' or LOD == '1.2':
-                    faceTop = "%s %s %s %s %s %s %s %s %s" % (p[4], p[5], bpT[4], bpT[5], bpT[6], bpT[7], p[6], p[7], p[4])
-                    Rfaces.append(faceTop)
-                    face1_0 = "%s %s %s %s %s" % (p[1], bp[0], bpT[4], p[5], p[1])
-                    Wfaces.append(face1_0)
-                    face1_1 = "%s %s %s %s %s" % (p[2], p[6], bpT[7], bp[3], p[2])
-                    Wfaces.append(face1_1)
-                    gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bpT[5], bpT[4], bp[0])
-                    Wfaces.append(gface0)
-                    gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bpT[6], bpT[5], bp[1])
-                    Wfaces.append(gface1)
-                    gface3 = "%s %s %s %s %s" % (bp[3], bpT[7], bpT[6], bp[2], bp[3])
-                    Wfaces.append(gface3)
-                elif LOD == '1.3':
-                    faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
-                    Rfaces.append(faceTop)
-                    face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
-                    Wfaces.append(face1)
-                    gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
-                    Wfaces.append(gface0)
-                    gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
-                    Wfaces.append(gface1)
-                    gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
-                    Wfaces.append(gface3)
-                    gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
-                    Rfaces.append(gtop)
-    else:
-        face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
-        Wfaces.append(face1)
-        faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
-        Gfaces.append(faceBottom)
-        faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
-        Rfaces.append(faceTop)
-
-    for face in Wfaces:
-        multiSurface(bldg, face, "WallSurface", None)
-    for face in Gfaces:
-        multiSurface(bldg, face, "GroundSurface", None)
-    for face in Rfaces:
-        multiSurface(bldg, face, "RoofSurface", None)
-
-
-def CityGMLbuildingLOD1Solid(CityModel, ID, attributes, o, x, y, z, h=None, rtype=None, top=None, override=None, LOD=None, aux=None, buildingpart=None, fd=False):
-    """
-    Generate a cityObjectMember representing a building as an LOD1 solid.
-    Input: ID, origin, width, depth, height, and optionally: height of the roof, roof type, block model top modelling rule, walls modelling rule.
-    Output: CityGML code of the cityObjectMember.
-    """
-    cityObject = etree.SubElement(CityModel, "cityObjectMember")
-    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
-    bldg.attrib['{%s}id' % ns_gml] = ID
-    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
-    roofType.text = rtype
-
-    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
-    yearOfConstructionXML.text = attributes['yearOfConstruction']
-    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
-    functionXML.text = attributes['function']
-    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
-    storeysAboveGroundXML.text = attributes['storeysAboveGround']
-
-    if top is not None:
-        if top == 1.0 and rtype == 'Shed':
-            p = verticesBody(o, x, y, z, h, None, override)
+            writerFiles[suffix] = openCityGML(CityGMLfilename(suffix) + '.tmp')
+        startCityGML(writerFiles[suffix], suffix)
+    for i in range(WRITERS):
+        fragmentQueue = queue.Queue(maxsize=WRITERQUEUE)
+        writer = threading.Thread(target=writeFragments, args=(fragmentQueue,))
+        writer.daemon = True
+        writer.start()
+        writerThreads.append([writer, fragmentQueue])
+    #-- Each representation is always written by the same thread
+    for i, suffix in enumerate(CityGMLheads):
+        writerQueues[suffix] = writerThreads[i % WRITERS][1]
+
+
+def releaseFragments(suffix):
+    """Release the serialised buildings of a representation from the memory.
+    When the files are written during the generation, they are handed over to the writer thread of the representation, which keeps their order.
+    A worker appends them to its spool file instead."""
+    if WORKER is not None:
+        for fragment in CityGMLfragments[suffix]:
+            spoolFiles[suffix].write(fragment)
+    elif WRITERS and suffix in CityGMLheads and len(CityGMLfragments[suffix]) > 0:
+        #-- Waits if the writer is behind, so that the memory stays bounded
+        writerQueues[suffix].put((suffix, b''.join(CityGMLfragments[suffix])))
+    CityGMLfragments[suffix] = []
+
+
+def stopWriters():
+    """Complete the CityGML files written by the threads and give them their final name."""
+    for suffix in CityGMLheads:
+        releaseFragments(suffix)
+        writerQueues[suffix].put((suffix, None))
+    for writer, fragmentQueue in writerThreads:
+        fragmentQueue.put(None)
+    for writer, fragmentQueue in writerThreads:
+        writer.join()
+    if writerErrors:
+        raise writerErrors[0]
+    for suffix in CityGMLheads:
+        if STREAMS and suffix in STREAMS:
+            continue
+        if COMPRESS:
+            getattr(os, 'replace', os.rename)(CityGMLfilename(suffix) + '.tmp.gz', CityGMLfilename(suffix) + '.gz')
         else:
-            p = verticesBody(o, x, y, z, h, top)
-    elif top is None:
-        p = verticesBody(o, x, y, z, h, None, override)
-
-    lod1Solid = etree.SubElement(bldg, "{%s}lod1Solid" % ns_bldg)
-    Solid = etree.SubElement(lod1Solid, "{%s}Solid" % ns_gml)
-    if ASSIGNID:
-        Solid.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-    exterior = etree.SubElement(Solid, "{%s}exterior" % ns_gml)
-    CompositeSurface = etree.SubElement(exterior, "{%s}CompositeSurface" % ns_gml)
-
-    faces = []
-    face0 = "%s %s %s %s %s" % (p[0], p[1], p[5], p[4], p[0])
-    faces.append(face0)
-    face2 = "%s %s %s %s %s" % (p[2], p[3], p[7], p[6], p[2])
-    faces.append(face2)
-    face3 = "%s %s %s %s %s" % (p[3], p[0], p[4], p[7], p[3])
-    faces.append(face3)
-
-    #-- Is the building part covered by overhangs?
-    if buildingpart is not None:
-        if x > aux['xsize'] and aux['ovhx'] >= buildingpart['x']:
-            covered = True
+            getattr(os, 'replace', os.rename)(CityGMLfilename(suffix) + '.tmp', CityGMLfilename(suffix))
+
+
+def spoolFilename(worker, suffix):
+    """Path of the file in which a worker accumulates the buildings of a representation or the rows of a table."""
+    return DIRECTORY + '/spool/' + str(worker) + '/' + str(suffix) + '.part'
+
+
+def startSpool():
+    """Open the spool files of this worker."""
+    if not os.path.isdir(DIRECTORY + '/spool/' + str(WORKER)):
+        os.makedirs(DIRECTORY + '/spool/' + str(WORKER))
+    for representation in outputs:
+        spoolFiles[representation] = open(spoolFilename(WORKER, representation), "wb")
+        spoolIndex['offsets'][representation] = []
+
+
+def spoolBuilding(ID):
+    """Append the buildings held in the memory to the spool files, and index where each building ends in them."""
+    spoolIndex['buildings'].append(ID)
+    for representation in outputs:
+        releaseFragments(representation)
+        spoolIndex['offsets'][representation].append(spoolFiles[representation].tell())
+
+
+def storeSpool():
+    """Close the spool files of this worker and write their index."""
+    for representation in outputs:
+        spoolFiles[representation].close()
+    spoolIndex['reused'] = reusedcounter
+    indexFile = open(DIRECTORY + '/spool/' + str(WORKER) + '/index.json', "w")
+    json.dump(spoolIndex, indexFile)
+    indexFile.close()
+
+
+def startWorkers():
+    """Start a process for each worker. They run this script with the same options on their share of the buildings."""
+    workers = []
+    for worker in range(WORKERS):
+        #-- The workers report their own progress, with their number
+        workers.append(subprocess.Popen([sys.executable, os.path.abspath(__file__)] + ARGUMENTS + ['--worker', str(worker)], stdout=open(os.devnull, 'w')))
+    return workers
+
+
+def stopWorkers(workers):
+    """Wait for the workers and check that their spool files are complete according to their index.
+    Output: the number of buildings the workers reused."""
+    reused = 0
+    for worker in range(WORKERS):
+        if workers[worker].wait() != 0:
+            raise ValueError("The worker " + str(worker) + " failed.")
+        indexFile = open(DIRECTORY + '/spool/' + str(worker) + '/index.json', "r")
+        index = json.load(indexFile)
+        indexFile.close()
+        first, last = workerBuildings(worker)
+        if index['buildings'] != [b.attrib['ID'] for b in buildings[first:last]]:
+            raise ValueError("The worker " + str(worker) + " did not process its buildings.")
+        for representation in outputs:
+            if os.path.getsize(spoolFilename(worker, representation)) != ([0] + index['offsets'][representation])[-1]:
+                raise ValueError("The spool file of " + representation + " of the worker " + str(worker) + " is incomplete.")
+        reused += index['reused']
+    return reused
+
+
+def workerBuildings(worker):
+    """Range of the buildings processed by a worker: the buildings are divided in consecutive blocks, so their order is kept."""
+    block = -(-len(buildings) // WORKERS)
+    return min(worker * block, len(buildings)), min((worker + 1) * block, len(buildings))
+
+
+def checkpointFilename(suffix):
+    """Path of the file in which the checkpointed buildings of a representation are accumulated."""
+    return DIRECTORY + '/checkpoint/' + str(suffix) + '.part'
+
+
+def checkpointOptions():
+    """Options which have to be the same to continue a checkpointed run."""
+    return {'filename': os.path.abspath(ARGS['filename']), 'rotation': ROTATIONENABLED, 'parts': BUILDINGPARTS, 'id': ASSIGNID, 'geometricref': VARIANTS, 'solids': SOLIDS, 'street': STREETS, 'streettiles': STREETTILES, 'vegetation': VEGETATION, 'combined': COMBINED, 'implicit': IMPLICIT, 'attributes': ATTRIBUTES, 'metrics': METRICS, 'validate': VALIDATE, 'deviations': DEVIATIONS, 'representations': sorted(outputs)}
+
+
+def startCheckpoint():
+    """Start the checkpoint files from scratch."""
+    if not os.path.isdir(DIRECTORY + '/checkpoint'):
+        os.makedirs(DIRECTORY + '/checkpoint')
+    for representation in outputs:
+        open(checkpointFilename(representation), "wb").close()
+    storeJournal(0, None, dict((representation, 0) for representation in outputs))
+
+
+def storeJournal(counter, ID, offsets):
+    """Record how many buildings have been persisted and the size of each part file at that moment."""
+    journal = {'buildings': counter, 'last': ID, 'interval': CHECKPOINT, 'offsets': offsets, 'options': checkpointOptions()}
+    journalFile = open(DIRECTORY + '/checkpoint/journal.json.tmp', "w")
+    json.dump(journal, journalFile)
+    journalFile.flush()
+    os.fsync(journalFile.fileno())
+    journalFile.close()
+    #-- Replace the previous journal atomically
+    getattr(os, 'replace', os.rename)(DIRECTORY + '/checkpoint/journal.json.tmp', DIRECTORY + '/checkpoint/journal.json')
+
+
+def storeCheckpoint(counter, ID):
+    """Append the buildings held in the memory to the part files and journal the last processed building."""
+    offsets = {}
+    for representation in outputs:
+        partFile = open(checkpointFilename(representation), "ab")
+        for fragment in CityGMLfragments[representation]:
+            partFile.write(fragment)
+        partFile.flush()
+        os.fsync(partFile.fileno())
+        offsets[representation] = partFile.tell()
+        partFile.close()
+        releaseFragments(representation)
+    storeJournal(counter, ID, offsets)
+
+
+def loadCheckpoint():
+    """Read the journal of an interrupted run and discard the data written after its last checkpoint.
+    Output: the number of buildings already processed and the ID of the last one."""
+    journalFile = open(DIRECTORY + '/checkpoint/journal.json', "r")
+    journal = json.load(journalFile)
+    journalFile.close()
+    if journal['options'] != checkpointOptions():
+        raise ValueError("The checkpoint was made with different options or a different file of buildings.")
+    for representation in outputs:
+        partFile = open(checkpointFilename(representation), "r+b")
+        partFile.truncate(journal['offsets'][representation])
+        partFile.close()
+    return journal['buildings'], journal['last'], journal['interval']
+
+
+def attributeNames():
+    """Columns of the table of attributes: the properties in the XML of buildings followed by the values derived from the geometry."""
+    names = ['ID']
+    for b in buildings[:1]:
+        names += [prop.tag for prop in b.findall('properties')[0]]
+    names += ['xSize', 'ySize', 'zSize', 'h', 'r', 'floors', 'floorHeight', 'rotation', 'eaves', 'chimneyHeight', 'footprintArea', 'xSizeF1', 'ySizeF1', 'zSizeF1', 'hF1', 'xSizeFd', 'ySizeFd', 'zSizeFd', 'hFd']
+    return names
+
+
+def metricNames():
+    """Columns of the table of geometric metrics."""
+    return ['ID', 'representation', 'polygons', 'area', 'volume', 'volumeOf', 'groundArea', 'wallArea', 'roofArea', 'openingArea', 'otherArea', 'footprintArea', 'zMin', 'zMax', 'height', 'roofHeight']
+
+
+def validityNames():
+    """Columns of the report of the validation."""
+    return ['ID', 'representation', 'error', 'element', 'value']
+
+
+def deviationNames():
+    """Columns of the table of deviations between representations."""
+    return ['ID', 'representation', 'reference', 'volumeDifference', 'footprintAreaDifference', 'heightDifference', 'hausdorffDistance']
+
+
+def tableNames(table):
+    """Columns of a table."""
+    if table == 'attributes':
+        return attributeNames()
+    elif table == 'metrics':
+        return metricNames()
+    elif table == 'validity':
+        return validityNames()
+    elif table == 'deviations':
+        return deviationNames()
+
+
+def tableRow(values):
+    """Serialise a row of a table as a line of CSV."""
+    row = []
+    for value in values:
+        if value is None:
+            row.append('')
         else:
-            covered = False
+            row.append(str(value))
+    return (','.join(row) + '\n').encode('utf-8')
+
+
+def tableData(table):
+    """All the rows of a table, including the checkpointed ones and the ones of the workers."""
+    rows = []
+    if CHECKPOINT:
+        partFile = open(checkpointFilename(table), "rb")
+        rows.append(partFile.read())
+        partFile.close()
+    if WORKERS:
+        for worker in range(WORKERS):
+            partFile = open(spoolFilename(worker, table), "rb")
+            rows.append(partFile.read())
+            partFile.close()
+    rows += CityGMLfragments[table]
+    return b''.join(rows)
+
+
+def storeTable(table):
+    """Write a table as CSV and/or as a compressed NumPy archive with an array per column."""
+    data = tableData(table)
+    names = tableNames(table)
+    if 'csv' in tables[table]:
+        tableFile = open(DIRECTORY + '/' + table + '.csv', "wb")
+        tableFile.write((','.join(names) + '\n').encode('utf-8'))
+        tableFile.write(data)
+        tableFile.close()
+    if 'npz' in tables[table]:
+        #-- Imported here, so that the runs without archives do not load NumPy
+        import numpy
+        values = [line.split(',') for line in data.decode('utf-8').splitlines()]
+        columns = {}
+        for i in range(len(names)):
+            column = [row[i] for row in values]
+            try:
+                columns[names[i]] = numpy.array([float(value) if value != '' else numpy.nan for value in column])
+            except ValueError:
+                columns[names[i]] = numpy.array(column)
+        numpy.savez_compressed(DIRECTORY + '/' + table + '.npz', **columns)
+
+
+def loadPreviousTable(table):
+    """Rows of a table written by the previous run, grouped by the building ID."""
+    rows = {}
+    fname = PREVIOUSDIRECTORY + '/' + table + '.csv'
+    if not os.path.isfile(fname):
+        return rows
+    tableFile = open(fname, "rb")
+    if tableFile.readline() == (','.join(tableNames(table)) + '\n').encode('utf-8'):
+        for line in tableFile:
+            ID = line.split(b',')[0].decode('utf-8')
+            rows[ID] = rows.get(ID, b'') + line
+    tableFile.close()
+    return rows
+
+
+def CityGMLvalidity(suffix, ID):
+    """Rows of the report of the validation for the building in the memory of a representation."""
+    members = buildingMembers(suffix, ID)
+    rows = []
+    vertices, starts, ringpolygon, interior, classes, polygons = measureBuilding(suffix, ID)
+    if len(polygons) > 0:
+        for error, polygon, value in polygonErrors(vertices, starts, ringpolygon, interior, polygons):
+            rows.append(tableRow([ID, suffix, error, polygons[polygon].attrib.get('{%s}id' % ns_gml, polygon), value]))
+    solidcounter = 0
+    for Solid in [Solid for member in members for Solid in member.iter('{%s}Solid' % ns_gml)]:
+        vertices, starts, ringpolygon, interior, classes, polygons = polygonArrays([Solid])
+        for error, value in shellErrors(vertices, starts):
+            rows.append(tableRow([ID, suffix, error, Solid.attrib.get('{%s}id' % ns_gml, 'solid' + str(solidcounter)), value]))
+        solidcounter += 1
+    return b''.join(rows)
+
+
+def reportValidity():
+    """Print the number of errors found in each representation."""
+    errorcounter = {}
+    for line in tableData('validity').decode('utf-8').splitlines():
+        representation = line.split(',')[1]
+        errorcounter[representation] = errorcounter.get(representation, 0) + 1
+    if len(errorcounter) == 0:
+        message("All the generated polygons and solids are valid.")
+    for representation in sorted(errorcounter):
+        message(errorcounter[representation], "error(s) found in", representation)
+
+
+def buildingMembers(suffix, ID):
+    """The cityObjectMembers of a building in the memory of a representation."""
+    return [member for member in CityGMLs[suffix][2:] if member[0].attrib.get('{%s}id' % ns_gml) == ID]
+
+
+def measureBuilding(suffix, ID):
+    """Arrays of the polygons of the building in the memory of a representation (see polygonArrays), extracted once per building."""
+    if suffix not in measures:
+        measures[suffix] = polygonArrays(buildingMembers(suffix, ID))
+    return measures[suffix]
+
+
+def volumeRepresentations(suffix):
+    """Representations whose closed shell gives the volume of a representation, in order of preference: the representation itself, its solid (e.g. LOD3_2_solid for LOD3_2 and LOD3_2_S0),
+    for LOD0 the LOD1 with the same footprint and height, and for LOD2_3 the LOD2_2 without the overhangs, which are open surfaces outside the body of the building."""
+    base = suffix
+    for ending in ['_S0', '_semantics', '_solid']:
+        if base.endswith(ending):
+            base = base[:-len(ending)]
+    candidates = [suffix, base + '_solid']
+    if base.startswith('LOD0_'):
+        candidates += ['LOD1_' + base[5:], 'LOD1_' + base[5:] + '_solid']
+    elif base.startswith('LOD2_3_'):
+        candidates += ['LOD2_2_' + base[7:], 'LOD2_2_' + base[7:] + '_solid']
+    return candidates
+
+
+def shellVolume(suffix, ID):
+    """Volume of the building in a representation, measured on the first of its volume representations (see volumeRepresentations) in which the building is a closed shell, and the name of that representation.
+    Output: (volume, representation), or (None, None) if none of them is closed."""
+    for candidate in volumeRepresentations(suffix):
+        if candidate not in CityGMLs:
+            continue
+        metrics = geometricMetrics(measureBuilding(candidate, ID))
+        if metrics is not None and metrics['volume'] is not None:
+            return metrics['volume'], candidate
+    return None, None
+
+
+def CityGMLmetrics(suffix, ID):
+    """Row of the table of geometric metrics for the building in the memory of a representation."""
+    metrics = geometricMetrics(measureBuilding(suffix, ID))
+    if metrics is None:
+        return b''
+    metrics['volume'], metrics['volumeOf'] = shellVolume(suffix, ID)
+    names = metricNames()
+    return tableRow([ID, suffix] + [metrics[name] for name in names[2:]])
+
+
+def CityGMLdeviation(suffix, reference, ID):
+    """Row of the table of deviations between the building in the memory of a representation and in a reference representation."""
+    arrays = measureBuilding(suffix, ID)
+    referencearrays = measureBuilding(reference, ID)
+    metrics = geometricMetrics(arrays)
+    referencemetrics = geometricMetrics(referencearrays)
+    if metrics is None or referencemetrics is None:
+        return b''
+    #-- Volumes of the closed outer shells, as in the metrics
+    volume = shellVolume(suffix, ID)[0]
+    referencevolume = shellVolume(reference, ID)[0]
+    if volume is None or referencevolume is None:
+        volumeDifference = None
     else:
-        covered = None
-
-    #-- Account for building parts
-    if buildingpart is not None and not covered:
-
-        #-- Accounting for overhangs
-        if x > aux['xsize']:# or x < aux['xsize']:
-            bp = [None] * 8
-            bp[0] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[3] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-            bp[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-
-            #-- Top with the rest of the building
-            bpT = [None] * 8
-            tH = GMLstring2points(p[4])[0][2]
-            bpT[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], tH])
-            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
-            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-            bpT[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-
-        elif fd and x < aux['xsize']:
-
-            bp = [None] * 8
-            eastline = GMLstring2points(p[1])[0][0]
-            bp[0] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[3] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-            bp[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-
-            #-- Top with the rest of the building
-            bpT = [None] * 8
-            tH = GMLstring2points(p[4])[0][2]
-            bpT[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], tH])
-            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
-            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-            bpT[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-
-
-        else:
-            bp = [None] * 8
-            bp[0] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[1] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[2] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[3] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-            bp[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-
-            #-- Top with the rest of the building
-            bpT = [None] * 8
-            tH = GMLstring2points(p[4])[0][2]
-            bpT[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], tH])
-            bpT[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], tH])
-            bpT[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-            bpT[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-
-        if buildingpart['type'] == 'Alcove':
-            if LOD == '1.1':
-                face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
-                faces.append(face1)
-                faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
-                faces.append(faceBottom)
-                faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
-                faces.append(faceTop)
-            elif LOD == '1.2':
-                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
-                faces.append(faceBottom)
-                faceTop = "%s %s %s %s %s %s %s %s %s" % (p[4], p[5], bpT[4], bpT[5], bpT[6], bpT[7], p[6], p[7], p[4])
-                faces.append(faceTop)
-                face1_0 = "%s %s %s %s %s" % (p[1], bp[0], bpT[4], p[5], p[1])
-                faces.append(face1_0)
-                face1_1 = "%s %s %s %s %s" % (p[2], p[6], bpT[7], bp[3], p[2])
-                faces.append(face1_1)
-                gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bpT[5], bpT[4], bp[0])
-                faces.append(gface0)
-                gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bpT[6], bpT[5], bp[1])
-                faces.append(gface1)
-                gface3 = "%s %s %s %s %s" % (bp[3], bpT[7], bpT[6], bp[2], bp[3])
-                faces.append(gface3)
-            elif LOD == '1.3':
-                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
-                faces.append(faceBottom)
-                faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
-                faces.append(faceTop)
-                face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
-                faces.append(face1)
-                gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
-                faces.append(gface0)
-                gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
-                faces.append(gface1)
-                gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
-                faces.append(gface3)
-                gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
-                faces.append(gtop)                
-        elif buildingpart['type'] == 'Garage':
-            if LOD == '1.1' or LOD == '1.2' or LOD == '1.3':
-                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
-                faces.append(faceBottom)
-                if LOD == '1.1' or LOD == '1.2':
-                    faceTop = "%s %s %s %s %s %s %s %s %s" % (p[4], p[5], bpT[4], bpT[5], bpT[6], bpT[7], p[6], p[7], p[4])
-                    faces.append(faceTop)
-                    face1_0 = "%s %s %s %s %s" % (p[1], bp[0], bpT[4], p[5], p[1])
-                    faces.append(face1_0)
-                    face1_1 = "%s %s %s %s %s" % (p[2], p[6], bpT[7], bp[3], p[2])
-                    faces.append(face1_1)
-                    gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bpT[5], bpT[4], bp[0])
-                    faces.append(gface0)
-                    gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bpT[6], bpT[5], bp[1])
-                    faces.append(gface1)
-                    gface3 = "%s %s %s %s %s" % (bp[3], bpT[7], bpT[6], bp[2], bp[3])
-                    faces.append(gface3)
-                elif LOD == '1.3':
-                    faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
-                    faces.append(faceTop)
-                    face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
-                    faces.append(face1)
-                    gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
-                    faces.append(gface0)
-                    gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
-                    faces.append(gface1)
-                    gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
-                    faces.append(gface3)
-                    gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
-                    faces.append(gtop)
+        volumeDifference = volume - referencevolume
+    differences = [volumeDifference, metrics['footprintArea'] - referencemetrics['footprintArea'], metrics['zMax'] - referencemetrics['zMax'], hausdorffDistance(arrays[0], referencearrays[0])]
+    #-- The same geometry computed in another order differs by the rounding of the floating point numbers
+    differences = [0.0 if difference is not None and abs(difference) < DEVIATIONTOLERANCE else difference for difference in differences]
+    return tableRow([ID, suffix, reference] + differences)
+
+
+def cacheVersion():
+    """Digest of this script and of its components, so that the cached buildings are invalidated when the generator changes."""
+    digest = hashlib.sha1()
+    components = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'random3dcity')
+    for fname in [os.path.abspath(__file__)] + [os.path.join(components, name) for name in sorted(os.listdir(components)) if name.endswith('.py')]:
+        scriptFile = open(fname, "rb")
+        digest.update(scriptFile.read())
+        scriptFile.close()
+    return digest.hexdigest()
+
+
+def cacheKey(b):
+    """Content address of a building: its specification and the options that affect its geometry and its rows in the tables.
+    The rows of the metrics and the validation cover all the representations of the run, so these are part of the key as well."""
+    key = hashlib.sha1(CACHEVERSION.encode('utf-8'))
+    key.update(json.dumps([ROTATIONENABLED, BUILDINGPARTS, ASSIGNID, COMBINED, IMPLICIT, ATTRIBUTES, METRICS, VALIDATE, DEVIATIONS, sorted(outputs)]).encode('utf-8'))
+    key.update(etree.tostring(b, with_tail=False))
+    return key.hexdigest()
+
+
+def cacheFilename(key):
+    """Path of a cached building."""
+    return CACHE + '/' + key[:2] + '/' + key + '.bin'
+
+
+def loadCachedBuilding(key):
+    """Read the serialised representations of a building from the cache.
+    Output: a dictionary with the fragment of each representation, or None if they are not all available."""
+    fname = cacheFilename(key)
+    try:
+        cacheFile = open(fname, "rb")
+    except (IOError, OSError):
+        return None
+    index = json.loads(cacheFile.readline().decode('utf-8'))
+    data = cacheFile.read()
+    cacheFile.close()
+    if not all(representation in index for representation in outputs):
+        return None
+    #-- Mark as recently used
+    try:
+        os.utime(fname, None)
+    except OSError:
+        pass
+    cached = {}
+    for representation in index:
+        start, length = index[representation]
+        cached[representation] = data[start:start+length]
+    return cached
+
+
+def storeCachedBuilding(key, fragments):
+    """Write the serialised representations of a building to the cache, together with the ones of other option sets already there."""
+    global cacheusage
+    fname = cacheFilename(key)
+    if os.path.isfile(fname):
+        cached = loadCachedBuilding(key) or {}
+        cacheusage -= os.path.getsize(fname)
     else:
-        face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
-        faces.append(face1)
-        faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
-        faces.append(faceBottom)
-        faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
-        faces.append(faceTop)
-
-    for face in faces:
-        addsurface(False, CompositeSurface, face)
-
-
-def CityGMLbuildingLOD2Solid(CityModel, ID, attributes, o, x, y, z, h, rtype=None, width=None, ovh=None, rep=None, LOD=None, aux=None, buildingpart=None, fd=False):
+        cached = {}
+        if not os.path.isdir(os.path.dirname(fname)):
+            try:
+                os.makedirs(os.path.dirname(fname))
+            except OSError:
+                #-- Made by another worker in the meantime
+                if not os.path.isdir(os.path.dirname(fname)):
+                    raise
+    cached.update(fragments)
+    index = {}
+    data = []
+    start = 0
+    for representation in cached:
+        index[representation] = [start, len(cached[representation])]
+        data.append(cached[representation])
+        start += len(cached[representation])
+    cacheFile = open(fname + '.tmp', "wb")
+    cacheFile.write(json.dumps(index).encode('utf-8') + b'\n')
+    cacheFile.write(b''.join(data))
+    cacheFile.close()
+    getattr(os, 'replace', os.rename)(fname + '.tmp', fname)
+    cacheusage += os.path.getsize(fname)
+    if cacheusage > CACHESIZE:
+        evictCache()
+
+
+def runOptions():
+    """Options with which the files of a run are generated, which a later run has to share to reuse its buildings."""
+    options = checkpointOptions()
+    del options['filename']
+    options['compress'] = COMPRESS
+    if STREAMS:
+        options['representations'] = [representation for representation in options['representations'] if representation not in STREAMS]
+    return options
+
+
+def storeOptions():
+    """Write the options of the run next to its files."""
+    optionsFile = open(DIRECTORY + '/options.json', "w")
+    json.dump(runOptions(), optionsFile, sort_keys=True)
+    optionsFile.close()
+
+
+def checkPreviousOptions():
+    """Check that the files of the previous run are uncompressed and generated with the options of this run, so that its buildings can be reused."""
+    fname = PREVIOUSDIRECTORY + '/options.json'
+    if not os.path.isfile(fname):
+        raise ValueError("The options of the previous run are unknown because " + fname + " is missing, so its buildings cannot be reused.")
+    optionsFile = open(fname, "r")
+    previous = json.load(optionsFile)
+    optionsFile.close()
+    options = runOptions()
+    if previous.pop('compress'):
+        raise ValueError("The CityGML files of the previous run are compressed (-gz), and the buildings can only be reused from uncompressed files.")
+    del options['compress']
+    previousrepresentations = previous.pop('representations')
+    missing = [representation for representation in options.pop('representations') if representation not in previousrepresentations]
+    if missing:
+        raise ValueError("The previous run did not write " + ', '.join(missing) + ", so its buildings cannot be reused.")
+    for name in sorted(options):
+        if previous.get(name) != options[name]:
+            raise ValueError("The previous run was generated with another value of the option " + name + " (" + json.dumps(previous.get(name)) + " instead of " + json.dumps(options[name]) + "), so its buildings cannot be reused.")
+
+
+def indexPreviousCityGML(suffix):
+    """Map a previously generated CityGML file and index its cityObjectMembers.
+    Output: the mapped file and a dictionary of the byte ranges of the members of each city object."""
+    fname = PREVIOUSDIRECTORY + '/' + os.path.basename(CityGMLfilename(suffix))
+    #-- The members are found by their bytes, which only the uncompressed files have
+    if not os.path.isfile(fname) and os.path.isfile(fname + '.gz'):
+        raise ValueError("The previous CityGML file " + fname + ".gz is compressed, and the buildings can only be reused from uncompressed files.")
+    if not os.path.isfile(fname):
+        raise ValueError("The previous CityGML file " + fname + " is missing.")
+    previousFile = open(fname, "rb")
+    data = mmap.mmap(previousFile.fileno(), 0, access=mmap.ACCESS_READ)
+    previousFile.close()
+    return data, indexCityGML(data)
+
+
+def indexCityGML(data):
+    """Index the cityObjectMembers of a serialised CityGML file by the gml:id of their city object.
+    Output: a dictionary of the byte ranges of the members of each city object."""
+    index = {}
+    start = data.find(b'\n  <cityObjectMember>')
+    while start != -1:
+        start += 1
+        end = data.find(b'  </cityObjectMember>\n', start) + len(b'  </cityObjectMember>\n')
+        #-- The city object is on the line after the start of the member
+        objectline = data[data.find(b'\n', start)+1:data.find(b'>', data.find(b'\n', start))]
+        idstart = objectline.find(b' gml:id="')
+        if idstart != -1:
+            idstart += len(b' gml:id="')
+            objectID = objectline[idstart:objectline.find(b'"', idstart)].decode('utf-8')
+            index.setdefault(objectID, []).append((start, end))
+        start = data.find(b'\n  <cityObjectMember>', end - 1)
+    return index
+
+
+def previousBuilding(ID):
+    """Serialised representations of a building taken from the previous CityGML files, or None if they are not complete."""
+    reused = {}
+    for representation in CityGMLheads:
+        data, index = previousCityGMLs[representation]
+        reused[representation] = b''.join(data[start:end] for start, end in index.get(ID, []))
+    for table in tables:
+        if ID not in previoustables[table]:
+            return None
+        reused[table] = previoustables[table][ID]
+    return reused
+
+
+def reusedBuilding(b, ID, cachekey=None):
+    """Serialised representations of a building which does not have to be generated again, or None."""
+    if PREVIOUS and ID in unchangedbuildings:
+        reused = previousBuilding(ID)
+        if reused is not None:
+            return reused
+    if CACHE:
+        return loadCachedBuilding(cachekey)
+    return None
+
+
+def cacheEntries():
+    """List the cached buildings as (last use, size, path)."""
+    entries = []
+    for dirpath, dirnames, filenames in os.walk(CACHE):
+        for filename in filenames:
+            if filename.endswith('.bin'):
+                path = os.path.join(dirpath, filename)
+                try:
+                    entries.append((os.path.getmtime(path), os.path.getsize(path), path))
+                except OSError:
+                    #-- Evicted by another worker in the meantime
+                    continue
+    return entries
+
+
+def evictCache():
+    """Remove the least recently used buildings until the cache fits in its size limit."""
+    global cacheusage
+    entries = sorted(cacheEntries())
+    cacheusage = sum(entry[1] for entry in entries)
+    for lastuse, size, path in entries:
+        if cacheusage <= CACHESIZE:
+            break
+        #-- The cache may be shared by the workers, which evict buildings as well
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        cacheusage -= size
+
+
+#-- Order of the properties of a Building in CityGML 2.0 after its attributes
+BUILDINGPROPERTIES = ['lod0FootPrint', 'lod0RoofEdge', 'lod1Solid', 'lod1MultiSurface', 'lod1TerrainIntersection', 'lod2Solid', 'lod2MultiSurface', 'lod2MultiCurve', 'lod2TerrainIntersection',
+                      'outerBuildingInstallation', 'interiorBuildingInstallation', 'boundedBy', 'lod3Solid', 'lod3MultiSurface', 'lod3MultiCurve', 'lod3TerrainIntersection',
+                      'lod4Solid', 'lod4MultiSurface', 'lod4MultiCurve', 'lod4TerrainIntersection', 'interiorRoom', 'consistsOfBuildingPart', 'address']
+
+
+class CombinationError(ValueError):
+    """Representations that cannot be combined. It is an error of the options rather than of a building, so it stops the run even when the failing buildings are quarantined."""
+
+
+def propertyLOD(child):
+    """LOD of a property of a building which is not a geometry property itself (e.g. boundedBy), from the first geometry property inside it."""
+    for element in child.iter():
+        name = etree.QName(element).localname
+        if name.startswith('lod') and name[3:4].isdigit():
+            return name[3]
+    return ''
+
+
+def relabelLOD(child, representation):
     """
-    Create LOD2 of the building with a basic roof shape. Solid representation.
+    Put a property of a building (e.g. lod3Solid, or boundedBy) at the LOD of the name of its representation, and return that LOD.
+    Some representations are built with the builders of another LOD (e.g. LOD2_2_F0 with the ones of LOD3, and the surfaces of the building parts of LOD3_2 with the ones of LOD2), so the LOD of their geometry properties is not the one of the representation.
+    Boundary surfaces exist from LOD2, so the other representations keep the LOD of their geometry properties.
     """
-    cityObject = etree.SubElement(CityModel, "cityObjectMember")
-    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
-    bldg.attrib['{%s}id' % ns_gml] = ID
-    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
-    roofType.text = rtype
-    
-    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
-    yearOfConstructionXML.text = attributes['yearOfConstruction']
-    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
-    functionXML.text = attributes['function']
-    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
-    storeysAboveGroundXML.text = attributes['storeysAboveGround']
-
-    p = verticesBody(o, x, y, z)
-    r = verticesRoof([o, x, y, z], h, rtype, width)
-
-    #-- Computations for the LOD2 with explicit overhangs
-    eaves = z
-    upperEaves = z
-    if ovh is not None:
-        overhangs, interiors, eaves, ovhy_recalculated = verticesOverhangs([o, x, y, z], p, h, rtype, ovh, r, width)
-        if rtype == 'Shed':
-            upperEaves = z + h + (z - eaves)
-    else:
-        overhangs = None
-
-    if rep == 'solid':
-        lod2rep = etree.SubElement(bldg, "{%s}lod2Solid" % ns_bldg)
-        repres = etree.SubElement(lod2rep, "{%s}Solid" % ns_gml)
-        exterior = etree.SubElement(repres, "{%s}exterior" % ns_gml)
-        CompositeSurface = etree.SubElement(exterior, "{%s}CompositeSurface" % ns_gml)
-    elif rep == 'brep':
-        lod2rep = etree.SubElement(bldg, "{%s}lod2MultiSurface" % ns_bldg)
-        repres = etree.SubElement(lod2rep, "{%s}MultiSurface" % ns_gml)
-        surfaceMember = etree.SubElement(repres, "{%s}surfaceMember" % ns_gml)
-    if ASSIGNID:
-        repres.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-    
-
-    #-- Is the building part covered by overhangs?
-    if buildingpart is not None:
-        if x > aux['xsize'] and aux['ovhx'] >= buildingpart['x']:
-            covered = True
-        else:
-            covered = False
-    else:
-        covered = None
-
-    east_faces = {}
-    east_faces['rest'] = []
-    east_faces['roof'] = []
-    east_faces['outerfloor'] = []
-    #-- Account for building parts
-    if buildingpart is not None and not covered:
-
-        #-- Accounting for overhangs
-        if x > aux['xsize']:# or x < aux['xsize']:
-            bp = [None] * 8
-            bp[0] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[3] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-            bp[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-
-            #-- Top with the rest of the building
-            bpT = [None] * 8
-            tH = GMLstring2points(p[4])[0][2]
-            bpT[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], tH])
-            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
-            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-            bpT[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-
-        elif fd and x < aux['xsize']:
-
-            bp = [None] * 8
-            eastline = GMLstring2points(p[1])[0][0]
-            bp[0] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[3] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-            bp[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-
-            #-- Top with the rest of the building
-            bpT = [None] * 8
-            tH = GMLstring2points(p[4])[0][2]
-            bpT[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], tH])
-            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
-            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-            bpT[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+    if not (representation.startswith('LOD') and representation[3:4].isdigit() and int(representation[3]) >= 2):
+        return propertyLOD(child)
+    for element in child.iter('{%s}*' % ns_bldg):
+        name = etree.QName(element).localname
+        if name.startswith('lod') and name[3:4].isdigit():
+            element.tag = '{%s}lod%s%s' % (ns_bldg, representation[3], name[4:])
+    return representation[3]
 
 
-        else:
-            bp = [None] * 8
-            bp[0] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[1] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[2] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[3] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-            bp[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-
-            #-- Top with the rest of the building
-            bpT = [None] * 8
-            tH = GMLstring2points(p[4])[0][2]
-            bpT[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], tH])
-            bpT[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], tH])
-            bpT[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-            bpT[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-
-        if buildingpart['type'] == 'Alcove':
-            if LOD == '2.0':
-                face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
-                east_faces['wall'] = face1
-                faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
-
-            elif LOD == '2.1' or LOD == '2.2' or LOD == '2.3':
-                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
-
-                face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
-                east_faces['wall'] = face1
-                gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
-                east_faces['rest'].append(gface0)
-                gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
-                east_faces['rest'].append(gface1)
-                gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
-                east_faces['rest'].append(gface3)
-                gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
-                east_faces['outerfloor'].append(gtop)                
-        elif buildingpart['type'] == 'Garage':
-            if LOD == '2.0' or LOD == '2.1' or LOD == '2.2' or LOD == '2.3':
-                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
-                face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
-                east_faces['wall'] = face1
-                gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
-                east_faces['rest'].append(gface0)
-                gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
-                east_faces['rest'].append(gface1)
-                gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
-                east_faces['rest'].append(gface3)
-                gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
-                east_faces['roof'].append(gtop)
-    else:
-        face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
-        east_faces['wall'] = face1
-        faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
-
-    #-- Bottom face (in all cases regardless of the roof type)
-    faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
-    if rep == 'solid':
-        addsurface(False, CompositeSurface, faceBottom)
-    elif rep == 'brep':
-        plainMultiSurface(surfaceMember, faceBottom)
-
-    #-- Roof surfaces and wall surfaces depending on the type of the roof.
-    if rtype == 'Gabled':
-        if rep == 'solid':
-            gabledRoof(CompositeSurface, p, r, east_faces)
-        elif rep == 'brep':
-            gabledRoof(surfaceMember, p, r, east_faces)
-            if overhangs is not None and ovh[0] > 0:
-                roofOverhangs(surfaceMember, overhangs, interiors)
-
-    elif rtype == 'Shed':
-        if rep == 'solid':
-            shedRoof(CompositeSurface, p, r, east_faces)
-        elif rep == 'brep':
-            shedRoof(surfaceMember, p, r, east_faces)
-            if overhangs is not None and ovh[0] > 0:
-                roofOverhangs(surfaceMember, overhangs, interiors)
-        #shedRoof(CompositeSurface, p, r, east_faces)
-
-    elif rtype == 'Hipped' or rtype == 'Pyramidal':
-        if rep == 'solid':
-            hippedRoof(CompositeSurface, p, r, east_faces)
-        elif rep == 'brep':
-            hippedRoof(surfaceMember, p, r, east_faces)
-            if overhangs is not None and ovh[0] > 0:
-                roofOverhangs(surfaceMember, overhangs, interiors)
-        #hippedRoof(CompositeSurface, p, r, east_faces)
-
-    elif rtype == 'Flat' or None:
-        if rep == 'solid':
-            flatRoof(CompositeSurface, p, r, east_faces)
-        elif rep == 'brep':
-            flatRoof(surfaceMember, p, r, east_faces)
-            if overhangs is not None and ovh[0] > 0:
-                roofOverhangs(surfaceMember, overhangs, interiors)
-        #flatRoof(CompositeSurface, p, r, east_faces)
-
-def CityGMLbuildingLOD2Semantics(CityModel, ID, attributes, o, x, y, z, h, rtype=None, width=None, ovh=None, LOD=None, aux=None, buildingpart=None, fd=False):
+def CityGMLbuildingCombined(CityModel, ID, representations):
     """
-    Create LOD2 of the building with a basic roof shape and standard semantics (brep multisurfaces).
+    Generate a cityObjectMember with a building carrying the geometries of several representations of the same building.
+    The properties are ordered as in the CityGML schema, and identical polygons are stored only once, and referenced from the other representations with xlink:href.
+    The cityObjectMember is added to the CityModel, unless none of the representations has the building.
     """
+    #-- Attributes, and the properties of each kind (e.g. lod2Solid, or boundedBy at LOD2) with the representation providing them
+    attributes = None
+    properties = {}
+    provided = {}
+    tag = None
+    for representation in representations:
+        for member in CityGMLs[representation][2:]:
+            source = member[0]
+            if source.attrib.get('{%s}id' % ns_gml) != ID:
+                continue
+            tag = source.tag
+            #-- Attributes are taken from the first representation
+            if attributes is None:
+                attributes = [copy.deepcopy(child) for child in source if child.find('.//{%s}*' % ns_gml) is None]
+            for child in source:
+                if child.find('.//{%s}*' % ns_gml) is None:
+                    continue
+                child = copy.deepcopy(child)
+                lod = relabelLOD(child, representation)
+                name = etree.QName(child).localname
+                #-- A building has only one of each geometry property (e.g. lod2Solid), and one set of semantic surfaces or installations per LOD
+                if name.startswith('lod'):
+                    kind = name
+                else:
+                    kind = name + ' at LOD' + lod
+                if provided.get(kind, representation) != representation:
+                    raise CombinationError("The representations " + provided[kind] + " and " + representation + " both have a " + kind + " and cannot be combined.")
+                provided[kind] = representation
+                properties.setdefault(name, []).append(child)
+    if tag is None:
+        return
     cityObject = etree.SubElement(CityModel, "cityObjectMember")
-    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
+    bldg = etree.SubElement(cityObject, tag)
     bldg.attrib['{%s}id' % ns_gml] = ID
-    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
-    roofType.text = rtype
-
-    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
-    yearOfConstructionXML.text = attributes['yearOfConstruction']
-    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
-    functionXML.text = attributes['function']
-    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
-    storeysAboveGroundXML.text = attributes['storeysAboveGround']
-
-    p = verticesBody(o, x, y, z)
-    r = verticesRoof([o, x, y, z], h, rtype, width)
-
-    #-- Computations for the LOD2 with explicit overhangs
-    eaves = z
-    upperEaves = z
-    if ovh is not None:
-        overhangs, interiors, eaves, ovhy_recalculated = verticesOverhangs([o, x, y, z], p, h, rtype, ovh, r, width)
-        if rtype == 'Shed':
-            upperEaves = z + h + (z - eaves)
-    else:
-        overhangs = None
-
-    #-- Is the building part covered by overhangs?
-    if buildingpart is not None:
-        if x > aux['xsize'] and aux['ovhx'] >= buildingpart['x']:
-            covered = True
+    for child in attributes:
+        bldg.append(child)
+    #-- Properties that are not in the schema order are kept at the end
+    for name in sorted(properties, key=lambda name: BUILDINGPROPERTIES.index(name) if name in BUILDINGPROPERTIES else len(BUILDINGPROPERTIES)):
+        for child in properties[name]:
+            bldg.append(child)
+    sharePolygons(bldg, ID)
+
+
+def sharePolygons(bldg, ID):
+    """Store each polygon of the building only once: the repeated ones are replaced with an xlink:href to the first one."""
+    polygons = {}
+    for Polygon in bldg.iter('{%s}Polygon' % ns_gml):
+        rings = tuple(posList.text for posList in Polygon.iter('{%s}posList' % ns_gml))
+        polygons.setdefault(rings, []).append(Polygon)
+    for rings in polygons:
+        if len(polygons[rings]) < 2:
+            continue
+        first = polygons[rings][0]
+        if '{%s}id' % ns_gml not in first.attrib:
+            #-- Derived from the coordinates, so that the identifier is stable between runs
+            first.attrib['{%s}id' % ns_gml] = ID + '_' + hashlib.sha1(' '.join(rings).encode('utf-8')).hexdigest()[:16]
+        for Polygon in polygons[rings][1:]:
+            surfaceMember = Polygon.getparent()
+            surfaceMember.remove(Polygon)
+            surfaceMember.attrib['{%s}href' % ns_xlink] = '#' + first.attrib['{%s}id' % ns_gml]
+
+
+def timedBuilder(builder):
+    """Wrap a builder so that the time it takes is added to the time of its representation, for the plan or the division of the representations."""
+    def build(CityModel, *args, **kwargs):
+        if CityModel is None:
+            return builder(CityModel, *args, **kwargs)
+        start = time.time()
+        result = builder(CityModel, *args, **kwargs)
+        #-- The name of the CityModel is the representation
+        plantimes[CityModel[0].text] = plantimes.get(CityModel[0].text, 0.0) + time.time() - start
+        return result
+    return build
+
+
+def timedFragment(serialise):
+    """Wrap the serialisation of the buildings so that the time it takes is added to the time of their representation, for the plan or the division of the representations."""
+    def fragment(suffix):
+        start = time.time()
+        result = serialise(suffix)
+        plantimes[suffix] = plantimes.get(suffix, 0.0) + time.time() - start
+        return result
+    return fragment
+
+
+def peakMemory():
+    """Peak resident memory of this process in bytes, or None if it cannot be measured on this system."""
+    if resource is None:
+        return None
+    #-- In kilobytes, except on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return peak
+    return peak * 1024
+
+
+def planDuration(seconds):
+    """Duration as hours, minutes and seconds."""
+    seconds = int(round(seconds))
+    return "%d:%02d:%02d" % (seconds // 3600, seconds // 60 % 60, seconds % 60)
+
+
+def countPolygons(data):
+    """Number of polygons in serialised CityGML, without the ones referenced with xlink:href."""
+    return data.count(b'<gml:Polygon>') + data.count(b'<gml:Polygon ')
+
+
+def countVertices(data):
+    """Number of points in the posLists of serialised CityGML, where the first point of each ring is repeated at its end."""
+    vertices = 0
+    start = data.find(b'<gml:posList')
+    while start != -1:
+        start = data.find(b'>', start) + 1
+        end = data.find(b'</gml:posList>', start)
+        vertices += (data.count(b' ', start, end) + 1) // 3
+        start = data.find(b'<gml:posList', end)
+    return vertices
+
+
+def targetAmount(size):
+    """Measure and amount of a target size: bytes (e.g. 2GB, 500MB or 1000000B), polygons (e.g. 1000000polygons) or vertices (e.g. 5000000vertices)."""
+    units = {'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3, 'TB': 1024 ** 4, 'polygons': 1, 'vertices': 1}
+    number = size.rstrip(string.ascii_letters)
+    unit = size[len(number):] or 'B'
+    if unit not in units:
+        raise ValueError("The unit of the target size " + size + " is not one of " + ', '.join(sorted(units)) + ".")
+    try:
+        amount = float(number) * units[unit]
+    except ValueError:
+        raise ValueError("The target size " + size + " is not a number followed by a unit.")
+    if unit in ['polygons', 'vertices']:
+        return unit, amount
+    return 'bytes', amount
+
+
+def measureTarget(data):
+    """Size of serialised CityGML in the measure of the target."""
+    if TARGETMEASURE == 'polygons':
+        return countPolygons(data)
+    elif TARGETMEASURE == 'vertices':
+        return countVertices(data)
+    return len(data)
+
+
+def reportPlan():
+    """Predict the size, polygons and time of each representation and table, and the peak memory of the whole run from the generated sample of buildings.
+    The buildings of the sample are scaled to the number of buildings of the run, the other city objects are taken as they are."""
+    sample = len(buildings)
+    scale = float(PLANBUILDINGS) / sample
+    message("\nPlan of", PLANBUILDINGS, "building(s), predicted from a sample of", sample, "building(s):\n")
+    message("%-28s %14s %14s %12s" % ("Representation", "Size (MB)", "Polygons", "Time"))
+    totalsize = totalpolygons = totaltime = heldsize = 0.0
+    for representation in outputs:
+        buildingdata = b''.join(CityGMLfragments[representation][:sample])
+        otherdata = b''.join(CityGMLfragments[representation][sample:])
+        heldsize += len(buildingdata) * scale + len(otherdata)
+        size = len(buildingdata) * scale + len(otherdata)
+        if representation in CityGMLheads:
+            size += len(CITYGMLHEADER) + len(CityGMLheads[representation]) + len(CITYGMLFOOTER)
+            polygons = countPolygons(buildingdata) * scale + countPolygons(otherdata)
         else:
-            covered = False
-    else:
-        covered = None
-
-    east_faces = {}
-    east_faces['rest'] = []
-    east_faces['roof'] = []
-    east_faces['outerfloor'] = []
-    #-- Account for building parts
-    if buildingpart is not None and not covered:
-
-        #-- Accounting for overhangs
-        if x > aux['xsize']:# or x < aux['xsize']:
-            bp = [None] * 8
-            bp[0] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[3] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-            bp[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-
-            #-- Top with the rest of the building
-            bpT = [None] * 8
-            tH = GMLstring2points(p[4])[0][2]
-            bpT[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], tH])
-            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
-            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-            bpT[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-
-        elif fd and x < aux['xsize']:
-
-            bp = [None] * 8
-            eastline = GMLstring2points(p[1])[0][0]
-            bp[0] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[3] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-            bp[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-
-            #-- Top with the rest of the building
-            bpT = [None] * 8
-            tH = GMLstring2points(p[4])[0][2]
-            bpT[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], tH])
-            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
-            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-            bpT[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-
-
+            polygons = 0
+        #-- The files are compressed as the sample compresses
+        if COMPRESS and len(buildingdata) > 0:
+            size *= float(len(zlib.compress(buildingdata, 9))) / len(buildingdata)
+        buildingtime = planlooptimes.get(representation, 0.0)
+        duration = buildingtime * scale + plantimes.get(representation, 0.0) - buildingtime
+        if PLANWORKERS:
+            duration /= PLANWORKERS
+        totalsize += size
+        totalpolygons += polygons
+        totaltime += duration
+        message("%-28s %14.1f %14d %12s" % (representation, size / 1048576, polygons, planDuration(duration)))
+    #-- Everything else done for each building: reading its data, the rotation, the tables and the LOD3 models that are not produced
+    shared = (planloop - sum(planlooptimes.values())) * scale
+    if PLANWORKERS:
+        shared /= PLANWORKERS
+    #-- Only the parsing of the XML depends on the number of buildings
+    setup = generationstart - STARTTIME + STARTCPU + planparse * (float(PLANBUILDINGS) / specbuildings - 1)
+    message("%-28s %14s %14s %12s" % ("shared", "", "", planDuration(shared)))
+    message("%-28s %14s %14s %12s" % ("setup", "", "", planDuration(setup)))
+    message("%-28s %14.1f %14d %12s" % ("total", totalsize / 1048576, totalpolygons, planDuration(totaltime + shared + setup)))
+    message("\nThe time does not include writing the files.")
+    if TARGET:
+        perbuilding = measureTarget(b''.join(CityGMLfragments[TARGET][:sample])) / float(sample)
+        if perbuilding == 0:
+            message("The buildings of the sample do not add to the size of", TARGET + ".")
         else:
-            bp = [None] * 8
-            bp[0] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[1] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-            bp[2] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[3] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-            bp[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-            bp[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-            bp[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-
-            #-- Top with the rest of the building
-            bpT = [None] * 8
-            tH = GMLstring2points(p[4])[0][2]
-            bpT[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], tH])
-            bpT[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], tH])
-            bpT[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-            bpT[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
-
-        if buildingpart['type'] == 'Alcove':
-            if LOD == '2.0':
-                face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
-                east_faces['wall'] = face1
-                faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
-
-            elif LOD == '2.1' or LOD == '2.2' or LOD == '2.3':
-                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
-                face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
-                east_faces['wall'] = face1
-                gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
-                east_faces['rest'].append(gface0)
-                gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
-                east_faces['rest'].append(gface1)
-                gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
-                east_faces['rest'].append(gface3)
-                gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
-                east_faces['outerfloor'].append(gtop)                
-        elif buildingpart['type'] == 'Garage':
-            if LOD == '2.0' or LOD == '2.1' or LOD == '2.2' or LOD == '2.3':
-                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
-                face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
-                east_faces['wall'] = face1
-                gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
-                east_faces['rest'].append(gface0)
-                gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
-                east_faces['rest'].append(gface1)
-                gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
-                east_faces['rest'].append(gface3)
-                gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
-                east_faces['roof'].append(gtop)
+            needed = int(math.ceil((TARGETAMOUNT - measureTarget(CITYGMLHEADER + CityGMLheads[TARGET] + CITYGMLFOOTER)) / perbuilding))
+            message("About", needed, "building(s) reach the target of", TARGETSIZE, "of", TARGET + ".")
+    peak = peakMemory()
+    if peak is None:
+        return
+    perbuilding = sum(len(b''.join(CityGMLfragments[representation][:sample])) for representation in outputs) / float(sample)
+    #-- The buildings are held in the memory until they are written, and the XML is held during the whole run
+    if PLANWORKERS:
+        held = perbuilding
+    elif PLANWRITERS or PLANCHECKPOINT:
+        held = perbuilding * ((PLANCHECKPOINT or 1) + (WRITERQUEUE if PLANWRITERS else 0))
     else:
-        face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
-        east_faces['wall'] = face1
-        faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
-
-    #-- Bottom face (in all cases regardless of the roof type)
-    multiSurface(bldg, faceBottom, "GroundSurface", None)
-
-    #-- Roof surfaces and wall surfaces depending on the type of the roof.
-    if rtype == 'Gabled':
-        gabledRoof(bldg, p, r, east_faces, True)
-        if overhangs is not None and ovh[0] > 0:
-            roofOverhangs(bldg, overhangs, interiors, True)
-
-    elif rtype == 'Shed':
-        shedRoof(bldg, p, r, east_faces, True)
-        if overhangs is not None and ovh[0] > 0:
-            roofOverhangs(bldg, overhangs, interiors, True)
-
-    elif rtype == 'Hipped' or rtype == 'Pyramidal':
-        hippedRoof(bldg, p, r, east_faces, True)
-        if overhangs is not None and ovh[0] > 0:
-            roofOverhangs(bldg, overhangs, interiors, True)
-
-    elif rtype == 'Flat' or None:
-        flatRoof(bldg, p, r, east_faces, True)
-        if overhangs is not None and ovh[0] > 0:
-            roofOverhangs(bldg, overhangs, interiors, True)
-
-def CityGMLbuildingLOD3Semantics(CityModel, ID, attributes, o, x, y, z, h, rtype=None, ovh=None, width=None, door=None, wallWindows=None, dormers=None, roofWindows=None, chimney=None, embrasure=None, BiSem=1, aux=None, buildingpart=None, aerial=False):
-    """
-    Create LOD3 of the building with an advanced roof shape and semantics (multisurfaces).
-    """
-    cityObject = etree.SubElement(CityModel, "cityObjectMember")
-    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
-    bldg.attrib['{%s}id' % ns_gml] = ID
-    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
-    roofType.text = rtype
-
-    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
-    yearOfConstructionXML.text = attributes['yearOfConstruction']
-    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
-    functionXML.text = attributes['function']
-    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
-    storeysAboveGroundXML.text = attributes['storeysAboveGround']
-
-    p = verticesBody(o, x, y, z)
-    pList = verticesBodyList(o, x, y, z)
-    r = verticesRoof([o, x, y, z], h, rtype, width)
-    if r == []:
-        r = None
-
-    eaves = z
-    upperEaves = z
-    if ovh is not None:
-        overhangs, interiors, eaves, ovhy_recalculated = verticesOverhangs([o, x, y, z], p, h, rtype, ovh, r, width)
-        if rtype == 'Shed':
-            upperEaves = z + h + (z - eaves)
-    else:
-        ovhy_recalculated = None
-
-    #-- Is the building part covered by overhangs?
-    if buildingpart is not None and aerial is True:
-        if x > aux['xsize'] and aux['ovhx'] >= buildingpart['x']:
-            covered = True
-        else:
-            covered = False
-    else:
-        covered = None
-
-    east_faces = {}
-    east_faces['rest'] = []
-    east_faces['roof'] = []
-    east_faces['outerfloor'] = []
-    #-- Account for building parts
-    if buildingpart is not None and not covered:
-
-        bp = [None] * 8
-        bp[0] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-        bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-        bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-        bp[3] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-        bp[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-        bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-        bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-        bp[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-
-        faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
-        face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
-        east_faces['wall'] = face1
-        gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
-        east_faces['rest'].append(gface0)
-        gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
-        east_faces['rest'].append(gface1)
-        gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
-        east_faces['rest'].append(gface3)
-        gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
-        if buildingpart['type'] == 'Alcove':
-            east_faces['outerfloor'].append(gtop)
-        elif buildingpart['type'] == 'Garage':
-            east_faces['roof'].append(gtop)
+        held = heldsize
+    peak += specmemory * (float(PLANBUILDINGS) / specbuildings - 1) + held - perbuilding * sample
+    message("Peak memory of", "each process:" if PLANWORKERS else "the process:", "%.1f MB" % (peak / 1048576))
+
+
+def representationGroups():
+    """Divide the representations among the representation workers, balancing the time measured on the calibration buildings: the longest first, each to the least loaded worker.
+    The combined representation stays with the representations it combines."""
+    units = []
+    for representation in CityGMLheads:
+        if COMBINED and (representation == 'combined' or representation in COMBINED):
+            continue
+        units.append([representation])
+    if COMBINED:
+        units.append(COMBINED + ['combined'])
+    costs = [sum(plantimes.get(representation, 0.0) for representation in unit) for unit in units]
+    groups = [[] for i in range(REPRESENTATIONWORKERS)]
+    loads = [0.0] * REPRESENTATIONWORKERS
+    for cost, unit in sorted(zip(costs, units), key=lambda costunit: -costunit[0]):
+        group = loads.index(min(loads))
+        groups[group] += unit
+        loads[group] += cost
+    return [group for group in groups if group]
+
+
+def runRepresentationWorkers():
+    """Start a process for each group of representations, which generates the buildings with the values derived here and writes the files of its representations, and wait for them."""
+    sharedFile = open(DIRECTORY + '/shared.json', "w")
+    json.dump(sharedvalues, sharedFile)
+    sharedFile.close()
+    workers = []
+    for group in representationGroups():
+        workers.append(subprocess.Popen([sys.executable, os.path.abspath(__file__)] + ARGUMENTS + ['--group', ','.join(group), '--shared', DIRECTORY + '/shared.json', '-rp', '0'], stdout=open(os.devnull, 'w')))
+    for worker in range(len(workers)):
+        if workers[worker].wait() != 0:
+            raise ValueError("The representation worker " + str(worker) + " failed.")
+    os.remove(DIRECTORY + '/shared.json')
+    #-- A building that failed in the representations of a worker is left out of the files of the others too
+    if QUARANTINE and os.path.isfile(DIRECTORY + '/quarantine.jsonl'):
+        quarantineFile = open(DIRECTORY + '/quarantine.jsonl', "r")
+        failed = set(json.loads(line)['id'] for line in quarantineFile)
+        quarantineFile.close()
+        for representation in CityGMLheads:
+            dropBuildings(representation, failed)
+
+
+def dropBuildings(suffix, IDs):
+    """Remove buildings from a written CityGML file, rewriting it only if it contains some of them."""
+    fname = CityGMLfilename(suffix)
+    if COMPRESS:
+        citygmlFile = gzip.open(fname + '.gz', "rb")
+        data = citygmlFile.read()
     else:
-        face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
-        east_faces['wall'] = face1
-        faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
-
-    ropenings = [[], [], [], []]
-    ropenings_rw = [[], [], [], []]
-
-    #-- Dormers
-    if dormers or roofWindows:
-        if dormers and len(dormers) > 0:
-            for drm in dormers:
-                #-- Get a list of vertices of each dormer
-                dList, dListGML = dormerVertices([drm], pList, h, rtype, [o, x, y, z], width)
-                #-- Get the opening for creating a hole in the roof surface
-                #--Inverted
-                ropenings[int(drm['side'])].append(str(dListGML[0][0] + ' ' + dListGML[0][3] + ' ' + dListGML[0][2] + ' ' + dListGML[0][1] + ' ' + dListGML[0][0]))
-                #-- Construct the dormer
-                if aerial is True:
-                    buildinginstallation(bldg, "dormer", [dList[0], dListGML[0]], BiSem, None, drm['side'], embrasure)
-                elif aerial is None or aerial is False:
-                    buildinginstallation(bldg, "dormer", [dList[0], dListGML[0]], BiSem, 0.1, drm['side'], embrasure)
-        elif roofWindows and len(roofWindows) > 0:
-            # ropenings_rw.append("")
-            # ropenings_rw.append([])
-            for rfw in roofWindows:
-                #-- Get a list of vertices of each window. It is the same as for dormer so the same function is used.
-                dList, dListGML = dormerVertices([rfw], pList, h, rtype, [o, x, y, z], width)
-                #-- Get the opening for creating a hole in the roof surface
-                ropenings[int(rfw['side'])].append(str(dListGML[0][0] + ' ' + dListGML[0][3] + ' ' + dListGML[0][2] + ' ' + dListGML[0][1] + ' ' + dListGML[0][0])) 
-                ropenings_rw[int(rfw['side'])].append(str(dListGML[0][0] + ' ' + dListGML[0][1] + ' ' + dListGML[0][2] + ' ' + dListGML[0][3] + ' ' + dListGML[0][0])) 
-
-    #-- Deal with chimney(s)
-    if chimney:
-        if len(chimney) > 0:
-            for ch in chimney:
-                #-- List of vertices
-                dList, dListGML = chimneyVertices([ch], pList, h, rtype, [o, x, y, z], width)
-                #-- Get the opening for creating a hole in the roof surface
-                ropenings[int(ch['side'])].append(str(dListGML[0][0] + ' ' + dListGML[0][3] + ' ' + dListGML[0][2] + ' ' + dListGML[0][1] + ' ' + dListGML[0][0]))
-                #-- Construct the chimney
-                buildinginstallation(bldg, "chimney", [dList[0], dListGML[0]], BiSem, None, ch['side'])
-                chimneyHeight = dList[0][7][2]
-    else:
-        chimneyHeight = None
-
-
-    #-- Bottom face (in all cases the same regardless of the roof type)
-    #faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
-    multiSurface(bldg, faceBottom, "GroundSurface", None, 3)
-
-    openings = []
-    #-- Door
-    if door:
-        door['ring'] = openingRing(door, pList)
-        openings.append(door)
-    else:
-        openings.append("")
-
-    if wallWindows:
-        if len(wallWindows) > 0:
-            openings.append([])
-            i = 0
-            for ww in wallWindows:
-                wallWindows[i]['ring'] = openingRing(ww, pList)
-                openings[1].append(wallWindows[i])
-                i += 1
+        citygmlFile = open(fname, "rb")
+        data = mmap.mmap(citygmlFile.fileno(), 0, access=mmap.ACCESS_READ)
+    citygmlFile.close()
+    index = indexCityGML(data)
+    dropped = sorted(member for ID in IDs for member in index.get(ID, []))
+    if dropped:
+        citygmlFile = openCityGML(fname + '.tmp')
+        kept = 0
+        for start, end in dropped:
+            citygmlFile.write(data[kept:start])
+            kept = end
+        citygmlFile.write(data[kept:])
+        citygmlFile.close()
+    if not COMPRESS:
+        data.close()
+    if dropped and COMPRESS:
+        getattr(os, 'replace', os.rename)(fname + '.tmp.gz', fname + '.gz')
+    elif dropped:
+        getattr(os, 'replace', os.rename)(fname + '.tmp', fname)
+
+
+def startQuarantine():
+    """Start the quarantine file of the run. A resumed run keeps the buildings quarantined before its checkpoint, since the ones after it are processed again."""
+    fname = DIRECTORY + '/quarantine.jsonl'
+    kept = []
+    if RESUME and os.path.isfile(fname):
+        quarantineFile = open(fname, "r")
+        for line in quarantineFile:
+            if json.loads(line)['position'] < buildingcounter:
+                kept.append(line)
+        quarantineFile.close()
+    #-- The file is created by the first building that fails, so a run stopping on an error leaves none behind
+    if kept:
+        quarantineFile = open(fname, "w")
+        quarantineFile.writelines(kept)
+        quarantineFile.close()
+    elif os.path.isfile(fname):
+        os.remove(fname)
+
+
+def failedRepresentation(trace):
+    """The representation in which a building failed, taken from the innermost function of the traceback working on one: the CityModel of a builder or the suffix of the serialisation and the analysis.
+    None if the building failed before its representations, e.g. in the data of the XML."""
+    representation = None
+    #-- The first frame is the loop over the buildings
+    trace = trace.tb_next
+    while trace is not None:
+        names = trace.tb_frame.f_locals
+        if names.get('CityModel') is not None:
+            representation = names['CityModel'][0].text
+        elif isinstance(names.get('suffix'), str):
+            representation = names['suffix']
+        trace = trace.tb_next
+    return representation
+
+
+def quarantineBuilding(b, position, ID):
+    """Record the building that just failed in the quarantine file: where it failed, the traceback and its specification in the XML."""
+    error, trace = sys.exc_info()[1:]
+    record = {'id': ID, 'position': position, 'representation': failedRepresentation(trace), 'error': type(error).__name__ + ': ' + str(error),
+              'traceback': traceback.format_exc(), 'building': etree.tostring(b, with_tail=False).decode('utf-8')}
+    #-- One write of the whole line, so that the lines of the workers appending to the same file do not mix
+    descriptor = os.open(DIRECTORY + '/quarantine.jsonl', os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+    os.write(descriptor, (json.dumps(record, sort_keys=True) + '\n').encode('utf-8'))
+    os.close(descriptor)
+
+
+def rollbackBuilding(fragmentcounts):
+    """Discard what a failed building left behind: its members in the CityModels and its serialised representations and rows."""
+    for representation in CityGMLs:
+        del CityGMLs[representation][2:]
+    for output in fragmentcounts:
+        del CityGMLfragments[output][fragmentcounts[output]:]
+    measures.clear()
+    openingGeometries.clear()
+
+
+def reportQuarantine():
+    """Tell how many buildings were left out because they failed. The quarantine file is removed if none did."""
+    if not os.path.isfile(DIRECTORY + '/quarantine.jsonl'):
+        return
+    quarantineFile = open(DIRECTORY + '/quarantine.jsonl', "r")
+    quarantined = len(quarantineFile.readlines())
+    quarantineFile.close()
+    if quarantined > 0:
+        message("\nLeft out", quarantined, "building(s) that failed, recorded in", DIRECTORY + '/quarantine.jsonl.')
     else:
-        openings.append("")
-
-
-
-    #-- Roof surfaces and wall surfaces depending on the type of the roof.
-    if rtype == 'Gabled':
-        gabledRoof(bldg, p, r, east_faces, True, openings, ropenings, ropenings_rw, embrasure, pList)
-        if ovh[0] > 0:
-            roofOverhangs(bldg, overhangs, interiors, True)
-
-    elif rtype == 'Shed':
-        shedRoof(bldg, p, r, east_faces, True, openings, ropenings, ropenings_rw, embrasure, pList)
-        if ovh[0] > 0:
-            roofOverhangs(bldg, overhangs, interiors, True)
-
-    elif rtype == 'Hipped' or rtype == 'Pyramidal':
-        hippedRoof(bldg, p, r, east_faces, True, openings, ropenings, ropenings_rw, embrasure, pList)
-        if ovh[0] > 0:
-            roofOverhangs(bldg, overhangs, interiors, True)
+        os.remove(DIRECTORY + '/quarantine.jsonl')
 
-    elif rtype == 'Flat' or None:
-        flatRoof(bldg, p, r, east_faces, True, openings, ropenings, ropenings_rw, embrasure, pList)
-        if ovh[0] > 0:
-            roofOverhangs(bldg, overhangs, interiors, True)
 
-
-    if rtype == 'Shed':
-        if chimneyHeight is not None:
-            if chimneyHeight < upperEaves:
-                chimneyHeight = upperEaves
-        else:
-            chimneyHeight = upperEaves
-
-    return chimneyHeight, eaves, ovhy_recalculated
-
-
-def CityGMLbuildingLOD3Solid(CityModel, ID, attributes, o, x, y, z, h, rtype=None, ovh=None, width=None, door=None, wallWindows=None, dormers=None, roofWindows=None, chimney=None, embrasure=None, additional=None, rep=None, aux=None, buildingpart=None, aerial=False):
-    """
-    Create LOD3 solid or plain geometry (brep without semantics).
-    """
-    cityObject = etree.SubElement(CityModel, "cityObjectMember")
-    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
-    bldg.attrib['{%s}id' % ns_gml] = ID
-    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
-    roofType.text = rtype
-
-    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
-    yearOfConstructionXML.text = attributes['yearOfConstruction']
-    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
-    functionXML.text = attributes['function']
-    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
-    storeysAboveGroundXML.text = attributes['storeysAboveGround']
-
-    if rep == 'solid':
-        lod3rep = etree.SubElement(bldg, "{%s}lod3Solid" % ns_bldg)
-        repres = etree.SubElement(lod3rep, "{%s}Solid" % ns_gml)
-        exterior = etree.SubElement(repres, "{%s}exterior" % ns_gml)
-        CompositeSurface = etree.SubElement(exterior, "{%s}CompositeSurface" % ns_gml)
-    elif rep == 'brep':
-        lod3rep = etree.SubElement(bldg, "{%s}lod3MultiSurface" % ns_bldg)
-        repres = etree.SubElement(lod3rep, "{%s}MultiSurface" % ns_gml)
-        surfaceMember = etree.SubElement(repres, "{%s}surfaceMember" % ns_gml)
-    if ASSIGNID:
-        repres.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-    
-    p = verticesBody(o, x, y, z)
-    pList = verticesBodyList(o, x, y, z)
-    r = verticesRoof([o, x, y, z], h, rtype, width)
-    if r == []:
-        r = None
-    if ovh is not None:
-        overhangs, interiors, eaves, ovhy_recalculated = verticesOverhangs([o, x, y, z], p, h, rtype, ovh, r, width)
-
-
-    ropenings = [[], [], [], []]
-    ropenings_rw = [[], [], [], []]
-
-    #-- Is the building part covered by overhangs?
-    if buildingpart is not None and aerial is True:
-        if x > aux['xsize'] and aux['ovhx'] >= buildingpart['x']:
-            covered = True
-        else:
-            covered = False
-    else:
-        covered = None
-
-    east_faces = {}
-    east_faces['rest'] = []
-    east_faces['roof'] = []
-    east_faces['outerfloor'] = []
-    #-- Account for building parts
-    if buildingpart is not None and not covered:
-
-        bp = [None] * 8
-        bp[0] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-        bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
-        bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-        bp[3] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
-        bp[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-        bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
-        bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-        bp[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
-
-        faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
-        face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
-        east_faces['wall'] = face1
-        gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
-        east_faces['rest'].append(gface0)
-        gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
-        east_faces['rest'].append(gface1)
-        gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
-        east_faces['rest'].append(gface3)
-        gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
-        east_faces['roof'].append(gtop)
-    else:
-        face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
-        east_faces['wall'] = face1
-        faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
-
-    #-- Dormers
-    roofWindows = None
-    if dormers or roofWindows:
-        if dormers and len(dormers) > 0:
-            for drm in dormers:
-                #-- Get a list of vertices of each dormer
-                dList, dListGML = dormerVertices([drm], pList, h, rtype, [o, x, y, z], width)
-                #-- Get the opening for creating a hole in the roof surface
-                ropenings[int(drm['side'])].append(str(dListGML[0][0] + ' ' + dListGML[0][3] + ' ' + dListGML[0][2] + ' ' + dListGML[0][1] + ' ' + dListGML[0][0]))
-                #-- Construct the dormer
-                if rep == 'solid':
-                    if aerial is True:
-                        buildinginstallationSolid(False, CompositeSurface, "dormer", [dList[0], dListGML[0]], 0, None, drm['side'], embrasure)    
-                    else:
-                        buildinginstallationSolid(False, CompositeSurface, "dormer", [dList[0], dListGML[0]], 0, 0.1, drm['side'], embrasure)
-                elif rep == 'brep':
-                    if aerial is True:
-                        buildinginstallationSolid(False, surfaceMember, "dormer", [dList[0], dListGML[0]], 0, None, drm['side'], embrasure)
-                    else:
-                        buildinginstallationSolid(False, surfaceMember, "dormer", [dList[0], dListGML[0]], 0, 0.1, drm['side'], embrasure)
-
-    #-- Bottom face (in all cases the same regardless of the roof type)
-    #faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
-    if rep == 'solid':
-        addsurface(False, CompositeSurface, faceBottom)
-    elif rep == 'brep':
-        plainMultiSurface(surfaceMember, faceBottom)
-
-    openings = []
-    #-- Door
-    if door:
-        door['ring'] = openingRing(door, pList)
-        openings.append(door)
-    else:
-        openings.append("")
-
-    if wallWindows:
-        if len(wallWindows) > 0:
-            openings.append([])
-            i = 0
-            for ww in wallWindows:
-                wallWindows[i]['ring'] = openingRing(ww, pList)
-                openings[1].append(wallWindows[i])
-                i += 1
+def currentMemory():
+    """Resident memory of this process in bytes. Where it cannot be read (outside Linux), its peak so far, or None if that cannot be measured either."""
+    try:
+        statmFile = open('/proc/self/statm', "r")
+        pages = int(statmFile.read().split()[1])
+        statmFile.close()
+        return pages * os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError, ValueError, AttributeError):
+        return peakMemory()
+
+
+def reportEvent(event):
+    """Write an event of the progress as a line of JSON. The line is written at once, so that the lines of the workers reporting to the same file do not mix."""
+    event['time'] = round(time.time(), 3)
+    if WORKER is not None:
+        event['worker'] = WORKER
+    os.write(reportDescriptor, (json.dumps(event, sort_keys=True) + '\n').encode('utf-8'))
+
+
+def progressEvent(event, sample):
+    """Event with the progress of the run: the buildings done, their throughput since the previous sample, the estimated time left, the bytes serialised per representation and the resident memory.
+    The sample (the time and the buildings of the previous event) is updated."""
+    now = time.time()
+    done = buildingcounter - reportfirst
+    rate = (buildingcounter - sample['buildings']) / max(now - sample['time'], 1e-9)
+    if reportphase == 'buildings' and done > 0:
+        #-- From the average throughput, which is steadier than the one of the last interval
+        eta = round((lastbuilding - buildingcounter) * (now - generationstart) / done, 1)
     else:
-        openings.append("")
-
-    #-- Roof surfaces and wall surfaces depending on the type of the roof.
-    if rtype == 'Gabled':
-        if rep == 'solid':
-            gabledRoof(CompositeSurface, p, r, east_faces, None, openings, ropenings, None, embrasure, pList)
-        elif rep == 'brep':
-            gabledRoof(surfaceMember, p, r, east_faces, None, openings, ropenings, None, embrasure, pList)
-            if overhangs is not None and ovh[0] > 0:
-                roofOverhangs(surfaceMember, overhangs, interiors)
-
-    elif rtype == 'Shed':
-        if rep == 'solid':
-            shedRoof(CompositeSurface, p, r, east_faces, None, openings, ropenings, None, embrasure, pList)
-        elif rep == 'brep':
-            shedRoof(surfaceMember, p, r, east_faces, None, openings, ropenings, None, embrasure, pList)
-            if overhangs is not None and ovh[0] > 0:
-                roofOverhangs(surfaceMember, overhangs, interiors)
-
-    elif rtype == 'Hipped' or rtype == 'Pyramidal':
-        if rep == 'solid':
-            hippedRoof(CompositeSurface, p, r, east_faces, None, openings, ropenings, None, embrasure, pList)
-        elif rep == 'brep':
-            hippedRoof(surfaceMember, p, r, east_faces, None, openings, ropenings, None, embrasure, pList)
-            if overhangs is not None and ovh[0] > 0:
-                roofOverhangs(surfaceMember, overhangs, interiors)
-
-    elif rtype == 'Flat' or None:
-        if rep == 'solid':
-            flatRoof(CompositeSurface, p, r, east_faces, None, openings, ropenings, None, embrasure, pList)
-        elif rep == 'brep':
-            flatRoof(surfaceMember, p, r, east_faces, None, openings, ropenings, None, embrasure, pList)
-            if overhangs is not None and ovh[0] > 0:
-                roofOverhangs(surfaceMember, overhangs, interiors)
-
-
-def CityGMLbuildingInteriorLOD0(CityModel, ID, attributes, o, x, y, z, h, floors, floorHeight, rtype=None, width=None, wallThickness=0.2, joist=0.2, aux=None, buildingpart=None):
-    """Create the interior footprints. One for each storey."""
-    cityObject = etree.SubElement(CityModel, "cityObjectMember")
-    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
-    bldg.attrib['{%s}id' % ns_gml] = ID
-    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
-    roofType.text = rtype
-
-    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
-    yearOfConstructionXML.text = attributes['yearOfConstruction']
-    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
-    functionXML.text = attributes['function']
-    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
-    storeysAboveGroundXML.text = attributes['storeysAboveGround']
-
-    #-- Coordinates of the main interior points (offset from the exterior surface)
-    Xa = o[0] + wallThickness
-    Xb = o[0] + x - wallThickness
-    Ya = o[1] + wallThickness
-    Yb = o[1] + y - wallThickness
-
-    if rtype != 'Flat':
-        floors += 1
-
-    #-- Construct a surface for each floor
-    for floor in range(1, int(floors) + 1):
-        #-- Floor elevation
-        fel = (floor - 1) * floorHeight + 0.5*joist
-        #-- Ceiling elevation
-        cel = floor * floorHeight - 0.5*joist
-        #-- XML tree
-        lod1MultiSurface = etree.SubElement(bldg, "{%s}lod1MultiSurface" % ns_bldg)
-        ms = etree.SubElement(lod1MultiSurface, "{%s}MultiSurface" % ns_gml)
-        if ASSIGNID:
-            ms.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-        # exterior = etree.SubElement(Solid, "{%s}exterior" % ns_gml)
-        # CompositeSurface = etree.SubElement(exterior, "{%s}CompositeSurface" % ns_gml)
-        #-- The eight points of the solid. F=Floor, C=Ceiling
-        p0F = str(Xa) + ' ' + str(Ya) + ' ' + str(fel)
-        p0C = str(Xa) + ' ' + str(Ya) + ' ' + str(cel)
-        p1F = str(Xb) + ' ' + str(Ya) + ' ' + str(fel)
-        p1C = str(Xb) + ' ' + str(Ya) + ' ' + str(cel)
-        p2F = str(Xb) + ' ' + str(Yb) + ' ' + str(fel)
-        p2C = str(Xb) + ' ' + str(Yb) + ' ' + str(cel)
-        p3F = str(Xa) + ' ' + str(Yb) + ' ' + str(fel)
-        p3C = str(Xa) + ' ' + str(Yb) + ' ' + str(cel)
-        if floor == 1:
-            if buildingpart is not None:
-                if buildingpart['type'] == 'Alcove':
-                    bp = [None] * 8
-                    bp[0] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + 0.5*joist])
-                    bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + 0.5*joist])
-                    bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + 0.5*joist])
-                    bp[3] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + 0.5*joist])
-                    bp[4] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
-                    bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
-                    bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
-                    bp[7] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
-                    #E = "%s %s %s %s %s %s %s %s %s" % (p1F, bp[0], bp[4], bp[7], bp[3], p2F, p2C, p1C, p1F)
-                    faceBottom = "%s %s %s %s %s %s %s %s %s" % (p0F, p3F, p2F, bp[3], bp[2], bp[1], bp[0], p1F, p0F)
-
-                elif buildingpart['type'] == 'Garage':
-                    #E = "%s %s %s %s %s" % (p1F, p2F, p2C, p1C, p1F)
-                    faceBottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
-                    #top = "%s %s %s %s %s" % (p0C, p1C, p2C, p3C, p0C)
-                    bp = [None] * 8
-                    bp[0] = GMLPointList([o[0] + x + wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + 0.5*joist])
-                    bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + 0.5*joist])
-                    bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + 0.5*joist])
-                    bp[3] = GMLPointList([o[0] + x + wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + 0.5*joist])
-                    bp[4] = GMLPointList([o[0] + x + wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
-                    bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
-                    bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
-                    bp[7] = GMLPointList([o[0] + x + wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
-                    gbottom = "%s %s %s %s %s" % (bp[0], bp[3], bp[2], bp[1], bp[0])
-                    addsurface(False, ms, gbottom)
-
-            else:
-                # E = "%s %s %s %s %s" % (p1F, p2F, p2C, p1C, p1F)
-                faceBottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
-                # top = "%s %s %s %s %s" % (p0C, p1C, p2C, p3C, p0C)
-        else:
-            faceBottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
-
-        addsurface(False, ms, faceBottom)
-
-
-
-def CityGMLbuildingInteriorLOD1(CityModel, ID, attributes, o, x, y, z, h, floors, floorHeight, rtype=None, width=None, wallThickness=0.2, joist=0.2, aux=None, buildingpart=None):
-    """Create the interior of an "LOD1+" according to (Boeters et al., 2015)."""
-    cityObject = etree.SubElement(CityModel, "cityObjectMember")
-    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
-    bldg.attrib['{%s}id' % ns_gml] = ID
-    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
-    roofType.text = rtype
-
-    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
-    yearOfConstructionXML.text = attributes['yearOfConstruction']
-    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
-    functionXML.text = attributes['function']
-    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
-    storeysAboveGroundXML.text = attributes['storeysAboveGround']
-
-    #-- Coordinates of the main interior points (offset from the exterior surface)
-    Xa = o[0] + wallThickness
-    Xb = o[0] + x - wallThickness
-    Ya = o[1] + wallThickness
-    Yb = o[1] + y - wallThickness
-
-    #-- Floor elevation
-    fel = 0.5*joist
-    #-- Ceiling elevation
-    if rtype == 'Flat':
-        cel = floors * floorHeight - 0.5*joist
+        eta = None
+    sample['time'], sample['buildings'] = now, buildingcounter
+    progress = {'event': event, 'phase': reportphase, 'elapsed': round(now - STARTTIME, 3), 'buildings': buildingcounter, 'total': lastbuilding, 'rate': round(rate, 3), 'eta': eta,
+                'files': filecounter, 'bytes': dict(serialisedbytes), 'rss': currentMemory()}
+    #-- The main process of the representation workers only derives the shared values of the buildings, and generates the representations of the calibration buildings
+    if SCHEDULER:
+        progress['calibration'] = len(calibrationbuildings)
+    return progress
+
+
+def reportProgress(stop, sample):
+    """Thread reporting the progress at every interval until it is stopped. It also reports when nothing moves, so a stalled run can be told from a slow one."""
+    while not stop.wait(REPORTINTERVAL):
+        reportEvent(progressEvent('progress', sample))
+
+
+def startReporter():
+    """Report the start of the generation and start the thread that samples the progress.
+    Output: the stop event of the thread, the thread, and its sample."""
+    global reportDescriptor, reportfirst
+    if REPORT is True:
+        reportDescriptor = sys.stderr.fileno()
     else:
-        cel = floors * floorHeight + 0.5*joist
-    #-- XML tree
-    lod2Solid = etree.SubElement(bldg, "{%s}lod2Solid" % ns_bldg)
-    Solid = etree.SubElement(lod2Solid, "{%s}Solid" % ns_gml)
-    if ASSIGNID:
-        Solid.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-    exterior = etree.SubElement(Solid, "{%s}exterior" % ns_gml)
-    CompositeSurface = etree.SubElement(exterior, "{%s}CompositeSurface" % ns_gml)
-    #-- The eight points of the solid. F=Floor, C=Ceiling
-    p0F = str(Xa) + ' ' + str(Ya) + ' ' + str(fel)
-    p0C = str(Xa) + ' ' + str(Ya) + ' ' + str(cel)
-    p1F = str(Xb) + ' ' + str(Ya) + ' ' + str(fel)
-    p1C = str(Xb) + ' ' + str(Ya) + ' ' + str(cel)
-    p2F = str(Xb) + ' ' + str(Yb) + ' ' + str(fel)
-    p2C = str(Xb) + ' ' + str(Yb) + ' ' + str(cel)
-    p3F = str(Xa) + ' ' + str(Yb) + ' ' + str(fel)
-    p3C = str(Xa) + ' ' + str(Yb) + ' ' + str(cel)
-    
-    S = "%s %s %s %s %s" % (p0F, p1F, p1C, p0C, p0F)
-    if buildingpart is not None:
-        bp = [None] * 8
-        bp[0] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + 0.5*joist])
-        bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + 0.5*joist])
-        bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + 0.5*joist])
-        bp[3] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + 0.5*joist])
-        bp[4] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
-        bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
-        bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
-        bp[7] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
-        E = "%s %s %s %s %s %s %s %s %s" % (p1F, bp[0], bp[4], bp[7], bp[3], p2F, p2C, p1C, p1F)
-        faceBottom = "%s %s %s %s %s %s %s %s %s" % (p0F, p3F, p2F, bp[3], bp[2], bp[1], bp[0], p1F, p0F)
-        gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
-        gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
-        gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
-        gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
-        addsurface(False, CompositeSurface, gface0)
-        addsurface(False, CompositeSurface, gface1)
-        addsurface(False, CompositeSurface, gface3)
-        addsurface(False, CompositeSurface, gtop)
+        reportDescriptor = os.open(REPORT, os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+    reportfirst = buildingcounter
+    sample = {'time': time.time(), 'buildings': buildingcounter}
+    reportEvent({'event': 'start', 'buildings': buildingcounter, 'total': lastbuilding, 'representations': len(CityGMLheads), 'interval': REPORTINTERVAL})
+    stop = threading.Event()
+    thread = threading.Thread(target=reportProgress, args=(stop, sample))
+    thread.daemon = True
+    thread.start()
+    return stop, thread, sample
+
+
+def stopReporter(reporter):
+    """Stop the thread that samples the progress and report the end of the run."""
+    stop, thread, sample = reporter
+    stop.set()
+    thread.join()
+    reportEvent(progressEvent('end', sample))
+    if REPORT is not True:
+        os.close(reportDescriptor)
+
+
+def generateCity(arguments, messages=True, start=None):
+    """Generate the CityGML files of a run with these arguments of the script, in this process (without messages if they are turned off).
+    The timings of the run start at start, the time and the processor time taken until then, by default at the call.
+    Output: the number of buildings in the XML (in the sample of a plan)."""
+    global STARTTIME, STARTCPU, MESSAGES
+    #-- Read by the functions of the run, and by the thread of the reporter while it runs
+    global CACHEVERSION, CHECKPOINT, CityGMLfragments, CityGMLheads, CityGMLs, DEVIATIONTOLERANCE, PLANBUILDINGS, TARGETAMOUNT, TARGETMEASURE, buildingcounter, buildings, cacheusage, calibrationbuildings, filecounter, generationstart, geometricMetrics, hausdorffDistance, lastbuilding, measures, outputs, planloop, planlooptimes, planparse, plantimes, polygonArrays, polygonErrors, previousCityGMLs, previoustables, reportphase, reusedcounter, serialisedbytes, sharedvalues, shellErrors, specbuildings, specmemory, spoolFiles, spoolIndex, tables, unchangedbuildings, writerErrors, writerFiles, writerQueues, writerThreads
+    if start is None:
+        STARTTIME, STARTCPU = time.time(), 0.0
     else:
-        E = "%s %s %s %s %s" % (p1F, p2F, p2C, p1C, p1F)
-        faceBottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
-    N = "%s %s %s %s %s" % (p2F, p3F, p3C, p2C, p2F)
-    W = "%s %s %s %s %s" % (p3F, p0F, p0C, p3C, p3F)
-    addsurface(False, CompositeSurface, E)
-    addsurface(False, CompositeSurface, faceBottom)
-    addsurface(False, CompositeSurface, S)
-    addsurface(False, CompositeSurface, N)
-    addsurface(False, CompositeSurface, W)
-
-    if rtype != 'Flat':
-        p = verticesBody(o, x, y, z)
-        pList = verticesBodyList(o, x, y, z)
-        if rtype == 'Shed':
-            h2 = (h/x) * (x - 2* wallThickness)
-            topThickness = h - h2 - .5*joist
-            rWth = (topThickness/h)*(x)
+        STARTTIME, STARTCPU = start
+    configure(arguments)
+    if not messages:
+        MESSAGES = None
+    loadComponent('geometry')
+    message('Parsing file', BUILDINGFILE, '...')
+
+    #-- Parse the file containing the building information
+    if PLAN:
+        planparse = time.time()
+        specmemory = peakMemory()
+    root = etree.parse(BUILDINGFILE).getroot()
+    #-- Buildings will be stored here
+    buildings = []
+    #-- Streets will be stored here
+    streets = []
+    #-- PlantCover will be stored here
+    plantcover = []
+
+    #-- Find all instances of city objects in the XML and put them in a list
+    for obj in root.getiterator('building'):
+        buildings.append(obj)
+    for obj in root.getiterator('streets'):
+        streets.append(obj)
+    for obj in root.getiterator('parks'):
+        plantcover.append(obj)
+
+    message("There are", len(buildings), "buildings(s) in this XML. Processing...")
+
+    #-- A plan generates a sample of buildings spread evenly over the XML
+    if PLAN:
+        planparse = time.time() - planparse
+        if specmemory is not None:
+            specmemory = peakMemory() - specmemory
+        specbuildings = len(buildings)
+        if specbuildings == 0:
+            raise ValueError("There are no buildings in the XML to plan with.")
+        if PLANBUILDINGS is None:
+            PLANBUILDINGS = specbuildings
+        buildings = [buildings[i * specbuildings // PLAN] for i in range(min(PLAN, specbuildings))]
+
+    #-- The time of each representation is measured for the plan, and to divide the representations among the representation workers
+    serialiseFragment, combineBuilding = CityGMLfragment, CityGMLbuildingCombined
+    if PLAN or SCHEDULER:
+        plantimes = {}
+        serialiseFragment = timedFragment(serialiseFragment)
+        combineBuilding = timedBuilder(combineBuilding)
+
+    #-- Only the selected representations are produced
+    names = representationNames(VARIANTS, SOLIDS, STREETS, VEGETATION)
+    if REPRESENTATIONS:
+        produced = [representation for representation in names if producedRepresentation(representation)]
+        #-- Including the solids on which the volumes of the selected ones are measured
+        if METRICS or DEVIATIONS:
+            produced += [candidate for representation in produced for candidate in volumeRepresentations(representation)]
+        names = [representation for representation in names if representation in produced]
+        if len(names) == 0:
+            raise ValueError("None of the representations generated with these options matches " + ARGS['representations'] + ".")
+
+    #-- All representations of a building in one file
+    if COMBINED:
+        for representation in COMBINED:
+            if representation not in names:
+                raise ValueError("The representation " + representation + " cannot be combined because it is not generated with these options.")
+        names.append('combined')
+
+    #-- A representation worker produces only its group
+    if GROUP:
+        names = [representation for representation in names if representation in GROUP]
+
+    #-- The CityModels of the produced representations, from which the components of their builders are imported
+    message("Opening empty CityGML files...")
+    CityGMLs = CityModels()
+    for representation in names:
+        CityGMLs[representation] = createCityGML(representation)
+
+    #-- Representations streamed instead of written to files
+    if STREAMS:
+        for representation in STREAMS:
+            if representation not in CityGMLs:
+                raise ValueError("The representation " + representation + " cannot be streamed because it is not generated with these options.")
+        if len(set(STREAMS.values())) < len(STREAMS):
+            raise ValueError("Each streamed representation needs a target of its own.")
+
+    #-- Representation whose size decides the number of buildings
+    if TARGET:
+        if TARGET not in CityGMLs:
+            raise ValueError("The representation " + TARGET + " cannot be the target because it is not generated with these options.")
+        TARGETMEASURE, TARGETAMOUNT = targetAmount(TARGETSIZE)
+
+    #-- Builders of the representations, each component imported only if its representations are produced
+    builders = {}
+    for component, prefixes, names in BUILDINGCOMPONENTS:
+        builders.update(zip(names, componentBuilders(component, prefixes, names)))
+    CityGMLstreets, CityGMLplantCoverLOD0, CityGMLplantCoverLOD1 = componentBuilders('features', ['Road-', 'PlantCover-'], ['CityGMLstreets', 'CityGMLplantCoverLOD0', 'CityGMLplantCoverLOD1'])
+    if STREETTILES and 'Road-LOD0' in CityGMLs:
+        streetTiles = loadComponent('features').streetTiles
+    if IMPLICIT:
+        instanceGeometries = loadComponent('implicit').instanceGeometries
+    if METRICS or VALIDATE or DEVIATIONS:
+        from random3dcity.analysis import polygonArrays, geometricMetrics, polygonErrors, shellErrors, hausdorffDistance, DEVIATIONTOLERANCE
+
+    #-- Serialised beginnings of the files, and the buildings serialised so far
+    CityGMLheads = {}
+    CityGMLfragments = {}
+    for representation in CityGMLs:
+        CityGMLheads[representation] = CityGMLhead(representation)
+        CityGMLfragments[representation] = []
+    #-- Spool files of a worker and the index of the buildings in them
+    spoolFiles = {}
+    spoolIndex = {'buildings': [], 'offsets': {}}
+    #-- Files, queues and threads of the writers, and their errors
+    writerFiles = {}
+    writerQueues = {}
+    writerThreads = []
+    writerErrors = []
+    #-- Everything that is accumulated per building: the representations and the tables
+    tables = {}
+    if ATTRIBUTES:
+        tables['attributes'] = ATTRIBUTES
+    if METRICS:
+        tables['metrics'] = METRICS
+    if VALIDATE:
+        tables['validity'] = VALIDATE
+    if DEVIATIONS:
+        for pair in DEVIATIONS:
+            for representation in pair:
+                if representation not in CityGMLs:
+                    raise ValueError("The representation " + representation + " cannot be compared because it is not generated with these options.")
+        tables['deviations'] = ['csv']
+    #-- Polygons of the current building, extracted once for the metrics, validation and deviations
+    measures = {}
+    outputs = list(CityGMLheads)
+    for table in tables:
+        outputs.append(table)
+        CityGMLfragments[table] = []
+
+    #-- Cache of buildings generated in the previous runs
+    if CACHE:
+        CACHEVERSION = cacheVersion()
+        cacheusage = sum(entry[1] for entry in cacheEntries())
+        if cacheusage > CACHESIZE:
+            evictCache()
+
+    #-- Buildings which are the same as in the previous run are taken from its CityGML files
+    if PREVIOUS:
+        previousrecords = {}
+        for obj in etree.parse(PREVIOUS).getroot().iter('building'):
+            previousrecords[obj.attrib['ID']] = etree.tostring(obj, with_tail=False)
+        unchangedbuildings = set()
+        addedcounter = 0
+        for b in buildings:
+            if b.attrib['ID'] not in previousrecords:
+                addedcounter += 1
+            elif previousrecords[b.attrib['ID']] == etree.tostring(b, with_tail=False):
+                unchangedbuildings.add(b.attrib['ID'])
+        changedcounter = len(buildings) - len(unchangedbuildings) - addedcounter
+        message("Compared to the previous XML there are", addedcounter, "added,", changedcounter, "changed and", len(previousrecords) - len(unchangedbuildings) - changedcounter, "removed building(s).")
+        checkPreviousOptions()
+        previousCityGMLs = {}
+        for representation in CityGMLheads:
+            previousCityGMLs[representation] = indexPreviousCityGML(representation)
+        previoustables = {}
+        for table in tables:
+            previoustables[table] = loadPreviousTable(table)
+
+    #-- Continue an interrupted run from its last checkpoint
+    buildingcounter = 0
+    if WORKERS and (CHECKPOINT or RESUME or WRITERS):
+        raise ValueError("The workers cannot be combined with checkpoints, writer threads or streams.")
+    if ENSEMBLE and IMPLICIT:
+        raise ValueError("The realisations of the ensemble cannot be combined with implicit geometries, whose coordinates are relative to their instances.")
+    if REPRESENTATIONWORKERS and (WORKERS or CHECKPOINT or RESUME or CACHE or PREVIOUS or STREAMS or TARGET or tables):
+        raise ValueError("The representation workers cannot be combined with the workers, checkpoints, the cache, a previous run, streams, a target size or tables.")
+    if WORKERS and TARGET:
+        raise ValueError("The workers cannot be combined with a target size, since the buildings are divided among them in advance.")
+
+    if RESUME and os.path.isfile(DIRECTORY + '/checkpoint/journal.json'):
+        buildingcounter, lastID, interval = loadCheckpoint()
+        if buildingcounter > 0 and buildings[buildingcounter-1].attrib['ID'] != lastID:
+            raise ValueError("The checkpoint does not match the file of buildings.")
+        if CHECKPOINT is None:
+            CHECKPOINT = interval
+        message("Resuming after", buildingcounter, "building(s) from the checkpoint...")
+    elif RESUME or CHECKPOINT:
+        if RESUME:
+            message("No checkpoint found, starting from the beginning...")
+        if CHECKPOINT is None:
+            CHECKPOINT = 100
+        startCheckpoint()
+
+    #-- The buildings that fail are recorded by all the processes of the run in one file
+    if QUARANTINE and WORKER is None and GROUP is None:
+        startQuarantine()
+
+    #-- Size of the target representation so far: its beginning and end, and the buildings persisted in the checkpoints
+    if TARGET:
+        targetprogress = measureTarget(CITYGMLHEADER + CityGMLheads[TARGET] + CITYGMLFOOTER)
+        if CHECKPOINT and buildingcounter > 0:
+            partFile = open(checkpointFilename(TARGET), "rb")
+            targetprogress += measureTarget(partFile.read())
+            partFile.close()
+
+    #-- The files are written while the buildings are generated
+    if WRITERS:
+        startWriters()
+
+    #-- Buildings processed by this process
+    lastbuilding = len(buildings)
+    if WORKERS:
+        if WORKER is None:
+            #-- The main process adds the other city objects and assembles the files from the ones of the workers
+            workers = startWorkers()
+            buildingcounter = lastbuilding = 0
+            message("Constructing buildings with", WORKERS, "workers...")
         else:
-            h2 = (h/(.5*x)) * (.5*x - wallThickness)
-            topThickness = h - h2 - .5*joist
-            rWth = (topThickness/h)*(.5*x)
-
-    #-- Extension for the attic
-    if rtype != 'Flat':
-
-        XTa = o[0] + wallThickness
-        XTb = o[0] + x - wallThickness
-        YTa = o[1] + wallThickness
-        YTb = o[1] + y - wallThickness
-
-        r = verticesRoof([o, x, y, z], h, rtype, width)
-        r[0] = GMLstring2points(r[0])[0]
-        r[1] = GMLstring2points(r[1])[0]
-        #-- Floor elevation
-        fel = floors * floorHeight + 0.5*joist
-        #-- Ceiling elevation
-        if rtype == 'Shed':
-            h2 = (h/x) * (x - wallThickness)
-            topThickness = h - h2 - .5*joist
+            buildingcounter, lastbuilding = workerBuildings(WORKER)
+            startSpool()
+
+    #-- Values derived from the LOD3 model of each building, which the main process of the representation workers passes on to them
+    sharedvalues = {}
+    if SHARED:
+        sharedFile = open(SHARED, "r")
+        sharedvalues = json.load(sharedFile)
+        sharedFile.close()
+    if SCHEDULER:
+        calibrationbuildings = set(i * len(buildings) // CALIBRATIONBUILDINGS for i in range(min(CALIBRATIONBUILDINGS, len(buildings))))
+        message("Measuring the representations on", len(calibrationbuildings), "building(s)...")
+
+    #-- Iterate the list of buildings in the XML and extract their data
+    generationstart = time.time()
+    reusedcounter = 0
+    message("Constructing buildings and other city objects...")
+    #-- The progress is sampled by the reporter thread, which reads these
+    reportphase = 'buildings'
+    filecounter = 0
+    if REPORT:
+        serialisedbytes = dict((representation, 0) for representation in CityGMLheads)
+        reporter = startReporter()
+    for b in buildings[buildingcounter:lastbuilding]:
+        #-- Enough buildings to reach the target size (the sample of a plan is always complete)
+        if TARGET and not PLAN and targetprogress >= TARGETAMOUNT:
+            break
+        buildingcounter += 1
+        #-- Building UUID
+        ID = b.attrib['ID']
+        #-- A building quarantined by the main process of the representation workers is left out by them too
+        if sharedvalues.get(ID, []) is None:
+            continue
+        #-- Take the building from the previous run or the cache if it has been generated before with the same options
+        if CACHE:
+            cachekey = cacheKey(b)
         else:
-            h2 = (h/(.5*x)) * (.5*x - wallThickness)
-            topThickness = h - h2 - .5*joist
-        cel = float(r[0][2]) - topThickness
-        # #-- XML tree
-        # lod2Solid = etree.SubElement(bldg, "{%s}lod2Solid" % ns_bldg)
-        # Solid = etree.SubElement(lod2Solid, "{%s}Solid" % ns_gml)
-        # if ASSIGNID:
-        #     Solid.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-        # exterior = etree.SubElement(Solid, "{%s}exterior" % ns_gml)
-        # CompositeSurface = etree.SubElement(exterior, "{%s}CompositeSurface" % ns_gml)
-        if rtype == 'Gabled':
-            gabledAttic(CompositeSurface, [XTa, YTa, XTb, YTb], p, r, fel, cel, wallThickness, topThickness)
-        elif rtype == 'Hipped':
-            hippedAttic(CompositeSurface, [XTa, YTa, XTb, YTb], p, r, fel, cel, wallThickness, topThickness)
-
-        elif rtype == 'Pyramidal':
-            pyramidalAttic(CompositeSurface, [XTa, YTa, XTb, YTb], p, r, fel, cel, wallThickness, topThickness)
-
-        elif rtype == 'Shed':
-            shedAttic(CompositeSurface, [XTa, YTa, XTb, YTb], p, r, fel, cel, wallThickness, topThickness)
-
-    else:
-        top = "%s %s %s %s %s" % (p0C, p1C, p2C, p3C, p0C)
-        addsurface(False, CompositeSurface, top)
-
-
-def CityGMLbuildingInteriorLOD2(CityModel, ID, attributes, o, x, y, z, h, floors, floorHeight, rtype=None, width=None, wallThickness=0.2, joist=0.2, aux=None, buildingpart=None, dormers=None):
-    """Create the interior of an "LOD2+" according to (Boeters et al., 2015)."""
-    cityObject = etree.SubElement(CityModel, "cityObjectMember")
-    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
-    bldg.attrib['{%s}id' % ns_gml] = ID
-    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
-    roofType.text = rtype
-
-    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
-    yearOfConstructionXML.text = attributes['yearOfConstruction']
-    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
-    functionXML.text = attributes['function']
-    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
-    storeysAboveGroundXML.text = attributes['storeysAboveGround']
-
-    #-- Coordinates of the main interior points (offset from the exterior surface)
-    Xa = o[0] + wallThickness
-    Xb = o[0] + x - wallThickness
-    Ya = o[1] + wallThickness
-    Yb = o[1] + y - wallThickness
-
-    #-- XML tree
-    lod2Solid = etree.SubElement(bldg, "{%s}lod2Solid" % ns_bldg)
-    MultiSolid = etree.SubElement(lod2Solid, "{%s}MultiSolid" % ns_gml)
-
-    #-- Construct a solid for each floor
-    for floor in range(1, int(floors) + 1):
-        #-- Floor elevation
-        fel = (floor - 1) * floorHeight + 0.5*joist
-        #-- Ceiling elevation
-        cel = floor * floorHeight - 0.5*joist
-
-        #-- Add solids of the multisolid
-        Solid = etree.SubElement(MultiSolid, "{%s}Solid" % ns_gml)
-        if ASSIGNID:
-            Solid.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-        exterior = etree.SubElement(Solid, "{%s}exterior" % ns_gml)
-        CompositeSurface = etree.SubElement(exterior, "{%s}CompositeSurface" % ns_gml)
-        #-- The eight points of the solid. F=Floor, C=Ceiling
-        p0F = str(Xa) + ' ' + str(Ya) + ' ' + str(fel)
-        p0C = str(Xa) + ' ' + str(Ya) + ' ' + str(cel)
-        p1F = str(Xb) + ' ' + str(Ya) + ' ' + str(fel)
-        p1C = str(Xb) + ' ' + str(Ya) + ' ' + str(cel)
-        p2F = str(Xb) + ' ' + str(Yb) + ' ' + str(fel)
-        p2C = str(Xb) + ' ' + str(Yb) + ' ' + str(cel)
-        p3F = str(Xa) + ' ' + str(Yb) + ' ' + str(fel)
-        p3C = str(Xa) + ' ' + str(Yb) + ' ' + str(cel)
-        if floor == 1:
-            if buildingpart is not None:
-                if buildingpart['type'] == 'Alcove':
-                    bp = [None] * 8
-                    bp[0] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + 0.5*joist])
-                    bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + 0.5*joist])
-                    bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + 0.5*joist])
-                    bp[3] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + 0.5*joist])
-                    bp[4] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
-                    bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
-                    bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
-                    bp[7] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
-                    E = "%s %s %s %s %s %s %s %s %s" % (p1F, bp[0], bp[4], bp[7], bp[3], p2F, p2C, p1C, p1F)
-                    faceBottom = "%s %s %s %s %s %s %s %s %s" % (p0F, p3F, p2F, bp[3], bp[2], bp[1], bp[0], p1F, p0F)
-                    gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
-                    gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
-                    gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
-                    gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
-                    addsurface(False, CompositeSurface, gface0)
-                    addsurface(False, CompositeSurface, gface1)
-                    addsurface(False, CompositeSurface, gface3)
-                    addsurface(False, CompositeSurface, gtop)
-                    top = "%s %s %s %s %s %s %s %s %s" % (p0C, p1C, bp[4], bp[5], bp[6], bp[7], p2C, p3C, p0C)
-                elif buildingpart['type'] == 'Garage':
-                    GarageSolid = etree.SubElement(MultiSolid, "{%s}Solid" % ns_gml)
-                    GarageExterior = etree.SubElement(GarageSolid, "{%s}exterior" % ns_gml)
-                    GarageCompositeSurface = etree.SubElement(GarageExterior, "{%s}CompositeSurface" % ns_gml)
-                    E = "%s %s %s %s %s" % (p1F, p2F, p2C, p1C, p1F)
-                    faceBottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
-                    top = "%s %s %s %s %s" % (p0C, p1C, p2C, p3C, p0C)
-                    bp = [None] * 8
-                    bp[0] = GMLPointList([o[0] + x + 0.0, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + 0.5*joist])
-                    bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + 0.5*joist])
-                    bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + 0.5*joist])
-                    bp[3] = GMLPointList([o[0] + x + 0.0, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + 0.5*joist])
-                    bp[4] = GMLPointList([o[0] + x + 0.0, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
-                    bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
-                    bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
-                    bp[7] = GMLPointList([o[0] + x + 0.0, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
-
-                    gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
-                    gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
-                    gface2 = "%s %s %s %s %s" % (bp[0], bp[4], bp[7], bp[3], bp[0])
-                    gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
-                    gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
-                    gbottom = "%s %s %s %s %s" % (bp[0], bp[3], bp[2], bp[1], bp[0])
-                    addsurface(False, GarageCompositeSurface, gface0)
-                    addsurface(False, GarageCompositeSurface, gface1)
-                    addsurface(False, GarageCompositeSurface, gface2)
-                    addsurface(False, GarageCompositeSurface, gface3)
-                    addsurface(False, GarageCompositeSurface, gtop)
-                    addsurface(False, GarageCompositeSurface, gbottom)
+            cachekey = None
+        reused = reusedBuilding(b, ID, cachekey)
+        if reused is not None:
+            reusedcounter += 1
+            for representation in outputs:
+                CityGMLfragments[representation].append(reused[representation])
+            if REPORT:
+                for representation in CityGMLheads:
+                    serialisedbytes[representation] += len(reused[representation])
+            if TARGET:
+                targetprogress += measureTarget(reused[TARGET])
+            if CHECKPOINT and buildingcounter % CHECKPOINT == 0:
+                storeCheckpoint(buildingcounter, ID)
+            elif WORKER is not None:
+                spoolBuilding(ID)
+            elif WRITERS and not CHECKPOINT:
+                for representation in CityGMLheads:
+                    releaseFragments(representation)
+            continue
+        #-- Everything held so far, to which a failed building is rolled back
+        if QUARANTINE:
+            fragmentcounts = dict((output, len(CityGMLfragments[output])) for output in outputs)
+        try:
+            specification = buildingSpecification(b, BUILDINGPARTS)
+
+            #-- LOD3, first because we need the output of many parameters like absolute height of the chimney, eaves and corrected overhang lenghts
+            if ID in sharedvalues:
+                shared = sharedvalues[ID]
             else:
-                E = "%s %s %s %s %s" % (p1F, p2F, p2C, p1C, p1F)
-                faceBottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
-                top = "%s %s %s %s %s" % (p0C, p1C, p2C, p3C, p0C)
+                shared = sharedValues(specification, builders['CityGMLbuildingLOD3Semantics'])
+
+            #-- The main process of the representation workers only derives the shared values, except for the buildings on which it measures the representations
+            if SCHEDULER:
+                sharedvalues[ID] = shared
+                if buildingcounter - 1 not in calibrationbuildings:
+                    continue
+            dimensions = buildingDimensions(specification, *shared[:3])
+
+            #-- Row of the table of attributes
+            if ATTRIBUTES:
+                footprintArea = specification['xsize'] * specification['ysize']
+                if specification['buildingpart'] is not None:
+                    footprintArea += specification['buildingpart']['x'] * specification['buildingpart']['y']
+                values = [specification[name] for name in ['xsize', 'ysize', 'zsize', 'h', 'r']] + [int(specification['floors']), specification['floorHeight'], specification['rotation'], dimensions['eaves'], dimensions['chimneyHeight'], footprintArea]
+                values += [dimensions[name] for name in ['adjxsize', 'adjysize', 'adjzsize', 'adjh', 'adjxsize_offset', 'adjysize_offset', 'adjzsize_offset', 'adjh_offset']]
+                CityGMLfragments['attributes'].append(tableRow([ID] + [prop.text for prop in specification['properties']] + values))
+
+            ##-- Start generating the CityGML buildings
+            CityGMLbuilding(CityGMLs, specification, dimensions, builders, VARIANTS, SOLIDS)
+
+            #-- Combined representations
+            if COMBINED and CityGMLs['combined'] is not None:
+                combineBuilding(CityGMLs['combined'], ID, COMBINED)
+
+            #-- Perform the rotation of coordinates
+            if ROTATIONENABLED:
+                rotateBuilding(CityGMLs, ID, specification['rotation'], specification['origin'])
+
+            #-- Geometric metrics of each representation
+            if METRICS:
+                metricrows = []
+                for representation in CityGMLs:
+                    if representation != 'combined':
+                        metricrows.append(CityGMLmetrics(representation, ID))
+                CityGMLfragments['metrics'].append(b''.join(metricrows))
+
+            #-- Validation of the geometry of each representation
+            if VALIDATE:
+                errorrows = []
+                for representation in CityGMLs:
+                    if representation != 'combined':
+                        errorrows.append(CityGMLvalidity(representation, ID))
+                CityGMLfragments['validity'].append(b''.join(errorrows))
+
+            #-- Deviations between pairs of representations
+            if DEVIATIONS:
+                CityGMLfragments['deviations'].append(b''.join(CityGMLdeviation(pair[0], pair[1], ID) for pair in DEVIATIONS))
+            measures.clear()
+            openingGeometries.clear()
+
+            #-- Instances of the repeated installations and openings
+            if IMPLICIT:
+                for representation in CityGMLs:
+                    if representation == 'combined':
+                        continue
+                    for member in CityGMLs[representation][2:]:
+                        instanceGeometries(member[0], ID)
+
+            #-- Serialise the building and release it from the memory
+            for representation in CityGMLs:
+                CityGMLfragments[representation].append(serialiseFragment(representation))
+            if REPORT:
+                for representation in CityGMLs:
+                    serialisedbytes[representation] += len(CityGMLfragments[representation][-1])
+            if TARGET:
+                targetprogress += measureTarget(CityGMLfragments[TARGET][-1])
+            if CACHE:
+                storeCachedBuilding(cachekey, dict((representation, CityGMLfragments[representation][-1]) for representation in outputs))
+        except CombinationError:
+            raise
+        except Exception:
+            if not QUARANTINE:
+                raise
+            #-- The building is left out of all the representations and tables, and the run goes on
+            quarantineBuilding(b, buildingcounter - 1, ID)
+            rollbackBuilding(fragmentcounts)
+            if SCHEDULER:
+                sharedvalues[ID] = None
+        if CHECKPOINT and buildingcounter % CHECKPOINT == 0:
+            storeCheckpoint(buildingcounter, ID)
+        elif WORKER is not None:
+            spoolBuilding(ID)
+        elif WRITERS and not CHECKPOINT:
+            for representation in CityGMLheads:
+                releaseFragments(representation)
+
+    #-- End of loop of each building
+    reportphase = 'features'
+
+    if TARGET and not PLAN:
+        if targetprogress >= TARGETAMOUNT:
+            message("\nReached the target of", TARGETSIZE, "of", TARGET, "with", buildingcounter, "building(s).")
         else:
-            faceBottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
-            top = "%s %s %s %s %s" % (p0C, p1C, p2C, p3C, p0C)
-            E = "%s %s %s %s %s" % (p1F, p2F, p2C, p1C, p1F)
-        S = "%s %s %s %s %s" % (p0F, p1F, p1C, p0C, p0F)
-        N = "%s %s %s %s %s" % (p2F, p3F, p3C, p2C, p2F)
-        W = "%s %s %s %s %s" % (p3F, p0F, p0C, p3C, p3F)
-        addsurface(False, CompositeSurface, faceBottom)
-        addsurface(False, CompositeSurface, top)
-        addsurface(False, CompositeSurface, S)
-        addsurface(False, CompositeSurface, E)
-        addsurface(False, CompositeSurface, N)
-        addsurface(False, CompositeSurface, W)
-
-        dormerTickness = .1
-        if rtype != 'Flat':
-            if rtype == 'Shed':
-                h2 = (h/x) * (x - 2* wallThickness)
-                topThickness = h - h2 - .5*joist
-                #rWth = (topThickness/h)*(x)
-                rWth = (topThickness/h)*(x) - wallThickness
-                rWth2 = None
-            elif rtype == 'Pyramidal' or rtype == 'Hipped':
-                h2 = (h/(.5*x)) * (.5*x - wallThickness)
-                topThickness = h - h2 - .5*joist
-                rWth = (topThickness/h)*(.5*x)
-                #rWth2 = (topThickness/h)*(width)
-                # auxl1 = (topThickness*width)/h
-                # rWth2 = topThickness**2 * auxl1
-                rWth2 = wallThickness - ((width * .5*joist)/h)
+            message("\nThe XML has too few buildings for the target of", TARGETSIZE, "of", TARGET + ": reached", int(targetprogress), TARGETMEASURE, "with all", buildingcounter, "building(s).")
+
+    #-- The time of the buildings of a plan, which is scaled to the whole run
+    if PLAN:
+        planloop = time.time() - generationstart
+        planlooptimes = dict(plantimes)
+
+    #-- A worker is done once its buildings are in its spool files
+    if WORKER is not None:
+        storeSpool()
+        if REPORT:
+            stopReporter(reporter)
+        return len(buildings)
+
+    #-- The features filtered out with -re are not generated
+    if STREETS and 'Road-LOD0' in CityGMLs:
+        for s in streets:
+            street_outline = s.findall('outline')[0]
+            street_outline_coors = [float(x) for x in street_outline.text.split(" ")]
+            street_holes_collection = s.findall('holes')[0]
+            street_holes = street_holes_collection.findall('hole')
+            street_data = [street_outline_coors, []]
+            for street_hole in street_holes:
+                street_hole_coors = [float(x) for x in street_hole.text.split(" ")]
+                street_data[1].append(street_hole_coors)        
+            if STREETTILES:
+                #-- Each tile is a Road of its own, and every row of tiles is released from the memory at once
+                for tiles in streetTiles(street_data):
+                    for tile in tiles:
+                        CityGMLstreets(CityGMLs['Road-LOD0'], [tile, None])
+                    CityGMLfragments['Road-LOD0'].append(serialiseFragment('Road-LOD0'))
+                    if WRITERS:
+                        releaseFragments('Road-LOD0')
             else:
-                h2 = (h/(.5*x)) * (.5*x - wallThickness)
-                topThickness = h - h2 - .5*joist
-                rWth = (topThickness/h)*(.5*x)
-                rWth2 = None
-
-        p = verticesBody(o, x, y, z)
-        pList = verticesBodyList(o, x, y, z)
-        ropenings = [[], [], [], []]
-        if dormers and len(dormers) > 0:
-            for drm in dormers:
-                #-- Get a list of vertices of each dormer
-                dList, dListGML = interiordormerVertices([drm], pList, h, rtype, [o, x, y, z], width, wallThickness, rWth, dormerTickness, topThickness, rWth2)
-                #-- Get the opening for creating a hole in the roof surface
-                ropenings[int(drm['side'])].append(str(dListGML[0][0] + ' ' + dListGML[0][3] + ' ' + dListGML[0][2] + ' ' + dListGML[0][1] + ' ' + dListGML[0][0]))
-                interiorDormer(CompositeSurface, [dList[0], dListGML[0]], drm['side'])    
-
-    #-- Solid for the attic
-    if rtype != 'Flat':
-
-        XTa = o[0] + wallThickness
-        XTb = o[0] + x - wallThickness
-        YTa = o[1] + wallThickness
-        YTb = o[1] + y - wallThickness
-
-        r = verticesRoof([o, x, y, z], h, rtype, width)
-        r[0] = GMLstring2points(r[0])[0]
-        r[1] = GMLstring2points(r[1])[0]
-        #-- Floor elevation
-        fel = floors * floorHeight + 0.5*joist
-        #-- Ceiling elevation of the roof. Requires some computations to preserve parallel walls
-
-        cel = float(r[0][2]) - topThickness
-        #-- XML tree
-        # lod2Solid = etree.SubElement(bldg, "{%s}lod2Solid" % ns_bldg)
-        Solid = etree.SubElement(MultiSolid, "{%s}Solid" % ns_gml)
-        if ASSIGNID:
-            Solid.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-        exterior = etree.SubElement(Solid, "{%s}exterior" % ns_gml)
-        CompositeSurface = etree.SubElement(exterior, "{%s}CompositeSurface" % ns_gml)
-        if rtype == 'Gabled':
-            gabledAttic(CompositeSurface, [XTa, YTa, XTb, YTb], p, r, fel, cel, wallThickness, topThickness, True, ropenings)
-
-        elif rtype == 'Hipped':
-
-            hippedAttic(CompositeSurface, [XTa, YTa, XTb, YTb], p, r, fel, cel, wallThickness, topThickness, True, ropenings)
-                #addsurface(False, CompositeSurface, aS)
-        elif rtype == 'Pyramidal':
-            pyramidalAttic(CompositeSurface, [XTa, YTa, XTb, YTb], p, r, fel, cel, wallThickness, topThickness, True, ropenings)
-
-        elif rtype == 'Shed':
-            shedAttic(CompositeSurface, [XTa, YTa, XTb, YTb], p, r, fel, cel, wallThickness, topThickness, True, ropenings)
-
-
-def b2p(exts):
-    """Convert two points of a polygon into its bounding box.
-    (Rectangular polygon parallel with axes.)
-    """
-    p0x = exts[0][0]
-    p0y = exts[0][1]
-    p0 = str(p0x) + ' ' + str(p0y) + ' ' + '0.0' 
-    p1x = exts[0][2]
-    p1y = exts[0][3]
-    p1 = str(p1x) + ' ' + str(p1y) + ' ' + '0.0'
-    pb = str(p1x) + ' ' + str(p0y) + ' ' + '0.0' 
-    pu = str(p0x) + ' ' + str(p1y) + ' ' + '0.0' 
-    e = "%s %s %s %s %s" % (p0, pb, p1, pu, p0)
-    i = []
-    if exts[1] is not None:
-        for h in exts[1]:
-            p0x = h[0]
-            p0y = h[1]
-            p0 = str(p0x) + ' ' + str(p0y) + ' ' + '0.0' 
-            p1x = h[2]
-            p1y = h[3]
-            p1 = str(p1x) + ' ' + str(p1y) + ' ' + '0.0'
-            pb = str(p1x) + ' ' + str(p0y) + ' ' + '0.0' 
-            pu = str(p0x) + ' ' + str(p1y) + ' ' + '0.0' 
-            i.append("%s %s %s %s %s" % (p0, pu, p1, pb, p0))
-    return e, i
-
-
-def b2s(exts):
-    """Convert two points of a solid into its bounding box.
-    (Cube-like solid parallel with axes.)
-    """
-    p0x = exts[0][0]
-    p0y = exts[0][1]
-    p0 = str(p0x) + ' ' + str(p0y) + ' ' + '0.0' 
-    p0T = str(p0x) + ' ' + str(p0y) + ' ' + str(exts[1])
-
-    p1x = exts[0][2]
-    p1y = exts[0][3]
-    p1 = str(p1x) + ' ' + str(p1y) + ' ' + '0.0'
-    p1T = str(p1x) + ' ' + str(p1y) + ' ' + str(exts[1])
-
-    pb = str(p1x) + ' ' + str(p0y) + ' ' + '0.0' 
-    pbT = str(p1x) + ' ' + str(p0y) + ' ' + str(exts[1])
-    pu = str(p0x) + ' ' + str(p1y) + ' ' + '0.0' 
-    puT = str(p0x) + ' ' + str(p1y) + ' ' + str(exts[1])
-
-    surfaces = []
-    surfaces.append("%s %s %s %s %s" % (p0, pu, p1, pb, p0))
-    surfaces.append("%s %s %s %s %s" % (p0T, pbT, p1T, puT, p0T))
-    surfaces.append("%s %s %s %s %s" % (p0, pb, pbT, p0T, p0))
-    surfaces.append("%s %s %s %s %s" % (pb, p1, p1T, pbT, pb))
-    surfaces.append("%s %s %s %s %s" % (p1, pu, puT, p1T, p1))
-    surfaces.append("%s %s %s %s %s" % (pu, p0, p0T, puT, pu))
-
-    return surfaces
-
-
-def CityGMLstreets(CityModel, street_data):
-    """Generates a road network with the thematic module for Transportation Objects."""
-    cityObject = etree.SubElement(CityModel, "cityObjectMember")
-    transpobj = etree.SubElement(cityObject, "{%s}Road" % ns_tran)
-    if ASSIGNID:
-        transpobj.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-    transpms = etree.SubElement(transpobj, "{%s}lod1MultiSurface" % ns_tran)
-    MultiSurface = etree.SubElement(transpms, "{%s}MultiSurface" % ns_gml)
-    surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
-    Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
-    if ASSIGNID:
-        Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-
-    street_points = b2p(street_data)
-
-    PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
-    LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
-    posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-    posList.text = street_points[0]
-
-    for h in street_points[1]:
-        PolygonInterior = etree.SubElement(Polygon, "{%s}interior" % ns_gml)
-        LinearRing = etree.SubElement(PolygonInterior, "{%s}LinearRing" % ns_gml)
-        posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-        posList.text = h
-
-
-def CityGMLplantCoverLOD0(CityModel, pc_data):
-    """Generates a PlantCover as a 2.5D surface."""
-    cityObject = etree.SubElement(CityModel, "cityObjectMember")
-    pcobj = etree.SubElement(cityObject, "{%s}PlantCover" % ns_veg)
-    if ASSIGNID:
-        pcobj.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-    pcms = etree.SubElement(pcobj, "{%s}lod1MultiSurface" % ns_veg)
-    MultiSurface = etree.SubElement(pcms, "{%s}MultiSurface" % ns_gml)
-    surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
-    Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
-    if ASSIGNID:
-        Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-
-    pc_points = b2p([pc_data[0], None])
-
-    PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
-    LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
-    posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
-    posList.text = pc_points[0]
-
-
-def CityGMLplantCoverLOD1(CityModel, pc_data):
-    """Generates a PlantCover as a solid."""
-    cityObject = etree.SubElement(CityModel, "cityObjectMember")
-    pcobj = etree.SubElement(cityObject, "{%s}PlantCover" % ns_veg)
-    if ASSIGNID:
-        pcobj.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-    lod1MultiSolid = etree.SubElement(pcobj, "{%s}lod1MultiSolid" % ns_veg)
-    multiSolid = etree.SubElement(lod1MultiSolid, "{%s}MultiSolid" % ns_gml)
-    solidmember = etree.SubElement(multiSolid, "{%s}solidMember" % ns_gml)
-    Solid = etree.SubElement(solidmember, "{%s}Solid" % ns_gml)
-    if ASSIGNID:
-        Solid.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
-    exterior = etree.SubElement(Solid, "{%s}exterior" % ns_gml)
-    CompositeSurface = etree.SubElement(exterior, "{%s}CompositeSurface" % ns_gml)
-    
-    pc_surfaces = b2s(pc_data)
-
-    for pc_s in pc_surfaces:
-        addsurface(False, CompositeSurface, pc_s)
-
-
-def rotator(vertex, sine, cos, origin_of_rotation):
-    "Rotate the vertex around the origin by an angle (2D). Cos and sin are already precomputed to make the calculations more efficient due to many repetitions."
-    vertex = [float(vertex[0]), float(vertex[1]), float(vertex[2])]
-    rotated = [None, None, vertex[2]]
-    rotated[0] = ((vertex[0]-origin_of_rotation[0]) * cos - (vertex[1]-origin_of_rotation[1]) * sine) + origin_of_rotation[0]
-    rotated[1] = ((vertex[0]-origin_of_rotation[0]) * sine + (vertex[1]-origin_of_rotation[1]) * cos) + origin_of_rotation[1]
-    return rotated
-
-#----------------------------------------------------------------------
-#-- Start of the program
-print('Parsing file', BUILDINGFILE, '...')
-
-#-- Parse the file containing the building information
-BUILDINGFILE = etree.parse(BUILDINGFILE)
-root = BUILDINGFILE.getroot()
-#-- Buildings will be stored here
-buildings = []
-#-- Streets will be stored here
-streets = []
-#-- PlantCover will be stored here
-plantcover = []
-
-#-- Find all instances of city objects in the XML and put them in a list
-for obj in root.getiterator('building'):
-    buildings.append(obj)
-for obj in root.getiterator('streets'):
-    streets.append(obj)
-for obj in root.getiterator('parks'):
-    plantcover.append(obj)
-
-print("There are", len(buildings), "buildings(s) in this XML. Processing...")
-
-print("Opening empty CityGML files...")
-CityGMLs = {}
-
-#-- Instances
-
-## LOD0
-
-#-- LOD0.0
-CityGMLs['LOD0_0'] = createCityGML('LOD0_0')
-
-#-- LOD0.1
-if VARIANTS:
-    CityGMLs['LOD0_1_F0_H0'] = createCityGML('LOD0_1_F0_H0')
-    CityGMLs['LOD0_1_F0_H1'] = createCityGML('LOD0_1_F0_H1')
-    CityGMLs['LOD0_1_F0_H2'] = createCityGML('LOD0_1_F0_H2')
-
-CityGMLs['LOD0_1_F0_H3'] = createCityGML('LOD0_1_F0_H3')
-
-if VARIANTS:
-    CityGMLs['LOD0_1_F0_H4'] = createCityGML('LOD0_1_F0_H4')
-    CityGMLs['LOD0_1_F0_H5'] = createCityGML('LOD0_1_F0_H5')
-    CityGMLs['LOD0_1_F0_H6'] = createCityGML('LOD0_1_F0_H6')
-    CityGMLs['LOD0_1_F0_HAvg'] = createCityGML('LOD0_1_F0_HAvg')
-    CityGMLs['LOD0_1_F0_HMed'] = createCityGML('LOD0_1_F0_HMed')
-
-if VARIANTS:
-    CityGMLs['LOD0_1_F1_H0'] = createCityGML('LOD0_1_F1_H0')
-    CityGMLs['LOD0_1_F1_H1'] = createCityGML('LOD0_1_F1_H1')
-    CityGMLs['LOD0_1_F1_H2'] = createCityGML('LOD0_1_F1_H2')
-    CityGMLs['LOD0_1_F1_H3'] = createCityGML('LOD0_1_F1_H3')
-    CityGMLs['LOD0_1_F1_H4'] = createCityGML('LOD0_1_F1_H4')
-    CityGMLs['LOD0_1_F1_H5'] = createCityGML('LOD0_1_F1_H5')
-    CityGMLs['LOD0_1_F1_H6'] = createCityGML('LOD0_1_F1_H6')
-    CityGMLs['LOD0_1_F1_HAvg'] = createCityGML('LOD0_1_F1_HAvg')
-    CityGMLs['LOD0_1_F1_HMed'] = createCityGML('LOD0_1_F1_HMed')
-
-if VARIANTS:
-    CityGMLs['LOD0_1_Fd_H0'] = createCityGML('LOD0_1_Fd_H0')
-    CityGMLs['LOD0_1_Fd_H1'] = createCityGML('LOD0_1_Fd_H1')
-    CityGMLs['LOD0_1_Fd_H2'] = createCityGML('LOD0_1_Fd_H2')
-    CityGMLs['LOD0_1_Fd_H3'] = createCityGML('LOD0_1_Fd_H3')
-    CityGMLs['LOD0_1_Fd_H4'] = createCityGML('LOD0_1_Fd_H4')
-    CityGMLs['LOD0_1_Fd_H5'] = createCityGML('LOD0_1_Fd_H5')
-    CityGMLs['LOD0_1_Fd_H6'] = createCityGML('LOD0_1_Fd_H6')
-    CityGMLs['LOD0_1_Fd_HAvg'] = createCityGML('LOD0_1_Fd_HAvg')
-    CityGMLs['LOD0_1_Fd_HMed'] = createCityGML('LOD0_1_Fd_HMed')
-
-
-#-- LOD0.2
-if VARIANTS:
-    CityGMLs['LOD0_2_F0_H0'] = createCityGML('LOD0_2_F0_H0')
-    CityGMLs['LOD0_2_F0_H1'] = createCityGML('LOD0_2_F0_H1')
-    CityGMLs['LOD0_2_F0_H2'] = createCityGML('LOD0_2_F0_H2')
-
-CityGMLs['LOD0_2_F0_H3'] = createCityGML('LOD0_2_F0_H3')
-
-if VARIANTS:
-    CityGMLs['LOD0_2_F0_H4'] = createCityGML('LOD0_2_F0_H4')
-    CityGMLs['LOD0_2_F0_H5'] = createCityGML('LOD0_2_F0_H5')
-    CityGMLs['LOD0_2_F0_H6'] = createCityGML('LOD0_2_F0_H6')
-    CityGMLs['LOD0_2_F0_HAvg'] = createCityGML('LOD0_2_F0_HAvg')
-    CityGMLs['LOD0_2_F0_HMed'] = createCityGML('LOD0_2_F0_HMed')
-
-
-if VARIANTS:
-    CityGMLs['LOD0_2_F1_H0'] = createCityGML('LOD0_2_F1_H0')
-    CityGMLs['LOD0_2_F1_H1'] = createCityGML('LOD0_2_F1_H1')
-    CityGMLs['LOD0_2_F1_H2'] = createCityGML('LOD0_2_F1_H2')
-    CityGMLs['LOD0_2_F1_H3'] = createCityGML('LOD0_2_F1_H3')
-    CityGMLs['LOD0_2_F1_H4'] = createCityGML('LOD0_2_F1_H4')
-    CityGMLs['LOD0_2_F1_H5'] = createCityGML('LOD0_2_F1_H5')
-    CityGMLs['LOD0_2_F1_H6'] = createCityGML('LOD0_2_F1_H6')
-    CityGMLs['LOD0_2_F1_HAvg'] = createCityGML('LOD0_2_F1_HAvg')
-    CityGMLs['LOD0_2_F1_HMed'] = createCityGML('LOD0_2_F1_HMed')
-
-if VARIANTS:
-    CityGMLs['LOD0_2_Fd_H0'] = createCityGML('LOD0_2_Fd_H0')
-    CityGMLs['LOD0_2_Fd_H1'] = createCityGML('LOD0_2_Fd_H1')
-    CityGMLs['LOD0_2_Fd_H2'] = createCityGML('LOD0_2_Fd_H2')
-    CityGMLs['LOD0_2_Fd_H3'] = createCityGML('LOD0_2_Fd_H3')
-    CityGMLs['LOD0_2_Fd_H4'] = createCityGML('LOD0_2_Fd_H4')
-    CityGMLs['LOD0_2_Fd_H5'] = createCityGML('LOD0_2_Fd_H5')
-    CityGMLs['LOD0_2_Fd_H6'] = createCityGML('LOD0_2_Fd_H6')
-    CityGMLs['LOD0_2_Fd_HAvg'] = createCityGML('LOD0_2_Fd_HAvg')
-    CityGMLs['LOD0_2_Fd_HMed'] = createCityGML('LOD0_2_Fd_HMed')
-
-#-- LOD0.3
-if VARIANTS:
-    CityGMLs['LOD0_3_F0_H0'] = createCityGML('LOD0_3_F0_H0')
-    CityGMLs['LOD0_3_F0_H1'] = createCityGML('LOD0_3_F0_H1')
-    CityGMLs['LOD0_3_F0_H2'] = createCityGML('LOD0_3_F0_H2')
-
-CityGMLs['LOD0_3_F0_H3'] = createCityGML('LOD0_3_F0_H3')
-
-if VARIANTS:
-    CityGMLs['LOD0_3_F0_H4'] = createCityGML('LOD0_3_F0_H4')
-    CityGMLs['LOD0_3_F0_H5'] = createCityGML('LOD0_3_F0_H5')
-    CityGMLs['LOD0_3_F0_H6'] = createCityGML('LOD0_3_F0_H6')
-    CityGMLs['LOD0_3_F0_HAvg'] = createCityGML('LOD0_3_F0_HAvg')
-    CityGMLs['LOD0_3_F0_HMed'] = createCityGML('LOD0_3_F0_HMed')
-
-if VARIANTS:
-    CityGMLs['LOD0_3_F1_H0'] = createCityGML('LOD0_3_F1_H0')
-    CityGMLs['LOD0_3_F1_H1'] = createCityGML('LOD0_3_F1_H1')
-    CityGMLs['LOD0_3_F1_H2'] = createCityGML('LOD0_3_F1_H2')
-    CityGMLs['LOD0_3_F1_H3'] = createCityGML('LOD0_3_F1_H3')
-    CityGMLs['LOD0_3_F1_H4'] = createCityGML('LOD0_3_F1_H4')
-    CityGMLs['LOD0_3_F1_H5'] = createCityGML('LOD0_3_F1_H5')
-    CityGMLs['LOD0_3_F1_H6'] = createCityGML('LOD0_3_F1_H6')
-    CityGMLs['LOD0_3_F1_HAvg'] = createCityGML('LOD0_3_F1_HAvg')
-    CityGMLs['LOD0_3_F1_HMed'] = createCityGML('LOD0_3_F1_HMed')
-
-if VARIANTS:
-    CityGMLs['LOD0_3_Fd_H0'] = createCityGML('LOD0_3_Fd_H0')
-    CityGMLs['LOD0_3_Fd_H1'] = createCityGML('LOD0_3_Fd_H1')
-    CityGMLs['LOD0_3_Fd_H2'] = createCityGML('LOD0_3_Fd_H2')
-    CityGMLs['LOD0_3_Fd_H3'] = createCityGML('LOD0_3_Fd_H3')
-    CityGMLs['LOD0_3_Fd_H4'] = createCityGML('LOD0_3_Fd_H4')
-    CityGMLs['LOD0_3_Fd_H5'] = createCityGML('LOD0_3_Fd_H5')
-    CityGMLs['LOD0_3_Fd_H6'] = createCityGML('LOD0_3_Fd_H6')
-    CityGMLs['LOD0_3_Fd_HAvg'] = createCityGML('LOD0_3_Fd_HAvg')
-    CityGMLs['LOD0_3_Fd_HMed'] = createCityGML('LOD0_3_Fd_HMed')
-
-## LOD1
-
-#-- LOD1.0
-CityGMLs['LOD1_0_HMin'] = createCityGML('LOD1_0_HMin')
-if SOLIDS:
-    CityGMLs['LOD1_0_HMin_solid'] = createCityGML('LOD1_0_HMin_solid')
-    CityGMLs['LOD1_0_HMin_semantics'] = createCityGML('LOD1_0_HMin_semantics')
-
-if VARIANTS:
-    CityGMLs['LOD1_0_HAvg'] = createCityGML('LOD1_0_HAvg')
-    if SOLIDS:
-        CityGMLs['LOD1_0_HAvg_solid'] = createCityGML('LOD1_0_HAvg_solid')
-        CityGMLs['LOD1_0_HAvg_semantics'] = createCityGML('LOD1_0_HAvg_semantics')
-
-    CityGMLs['LOD1_0_HMax'] = createCityGML('LOD1_0_HMax')
-    if SOLIDS:
-        CityGMLs['LOD1_0_HMax_solid'] = createCityGML('LOD1_0_HMax_solid')
-        CityGMLs['LOD1_0_HMax_semantics'] = createCityGML('LOD1_0_HMax_semantics')
-
-    CityGMLs['LOD1_0_HMedian'] = createCityGML('LOD1_0_HMedian')
-    if SOLIDS:
-        CityGMLs['LOD1_0_HMedian_solid'] = createCityGML('LOD1_0_HMedian_solid')
-        CityGMLs['LOD1_0_HMedian_semantics'] = createCityGML('LOD1_0_HMedian_semantics')
-
-#-- LOD1.1
-if VARIANTS:
-    CityGMLs['LOD1_1_F0_H0'] = createCityGML('LOD1_1_F0_H0')
-    CityGMLs['LOD1_1_F0_H1'] = createCityGML('LOD1_1_F0_H1')
-    CityGMLs['LOD1_1_F0_H2'] = createCityGML('LOD1_1_F0_H2')
-
-CityGMLs['LOD1_1_F0_H3'] = createCityGML('LOD1_1_F0_H3')
-
-if VARIANTS:
-    CityGMLs['LOD1_1_F0_H4'] = createCityGML('LOD1_1_F0_H4')
-    CityGMLs['LOD1_1_F0_H5'] = createCityGML('LOD1_1_F0_H5')
-    CityGMLs['LOD1_1_F0_H6'] = createCityGML('LOD1_1_F0_H6')
-    CityGMLs['LOD1_1_F0_HAvg'] = createCityGML('LOD1_1_F0_HAvg')
-    CityGMLs['LOD1_1_F0_HMed'] = createCityGML('LOD1_1_F0_HMed')
-
-if VARIANTS:
-    CityGMLs['LOD1_1_F1_H0'] = createCityGML('LOD1_1_F1_H0')
-    CityGMLs['LOD1_1_F1_H1'] = createCityGML('LOD1_1_F1_H1')
-    CityGMLs['LOD1_1_F1_H2'] = createCityGML('LOD1_1_F1_H2')
-    CityGMLs['LOD1_1_F1_H3'] = createCityGML('LOD1_1_F1_H3')
-    CityGMLs['LOD1_1_F1_H4'] = createCityGML('LOD1_1_F1_H4')
-    CityGMLs['LOD1_1_F1_H5'] = createCityGML('LOD1_1_F1_H5')
-    CityGMLs['LOD1_1_F1_H6'] = createCityGML('LOD1_1_F1_H6')
-    CityGMLs['LOD1_1_F1_HAvg'] = createCityGML('LOD1_1_F1_HAvg')
-    CityGMLs['LOD1_1_F1_HMed'] = createCityGML('LOD1_1_F1_HMed')
-
-if VARIANTS:
-    CityGMLs['LOD1_1_Fd_H0'] = createCityGML('LOD1_1_Fd_H0')
-    CityGMLs['LOD1_1_Fd_H1'] = createCityGML('LOD1_1_Fd_H1')
-    CityGMLs['LOD1_1_Fd_H2'] = createCityGML('LOD1_1_Fd_H2')
-    CityGMLs['LOD1_1_Fd_H3'] = createCityGML('LOD1_1_Fd_H3')
-    CityGMLs['LOD1_1_Fd_H4'] = createCityGML('LOD1_1_Fd_H4')
-    CityGMLs['LOD1_1_Fd_H5'] = createCityGML('LOD1_1_Fd_H5')
-    CityGMLs['LOD1_1_Fd_H6'] = createCityGML('LOD1_1_Fd_H6')
-    CityGMLs['LOD1_1_Fd_HAvg'] = createCityGML('LOD1_1_Fd_HAvg')
-    CityGMLs['LOD1_1_Fd_HMed'] = createCityGML('LOD1_1_Fd_HMed')
-
-if SOLIDS:
-    if VARIANTS:
-        CityGMLs['LOD1_1_F0_H0_solid'] = createCityGML('LOD1_1_F0_H0_solid')
-        CityGMLs['LOD1_1_F0_H1_solid'] = createCityGML('LOD1_1_F0_H1_solid')
-        CityGMLs['LOD1_1_F0_H2_solid'] = createCityGML('LOD1_1_F0_H2_solid')
-
-    CityGMLs['LOD1_1_F0_H3_solid'] = createCityGML('LOD1_1_F0_H3_solid')
-
-    if VARIANTS:
-        CityGMLs['LOD1_1_F0_H4_solid'] = createCityGML('LOD1_1_F0_H4_solid')
-        CityGMLs['LOD1_1_F0_H5_solid'] = createCityGML('LOD1_1_F0_H5_solid')
-        CityGMLs['LOD1_1_F0_H6_solid'] = createCityGML('LOD1_1_F0_H6_solid')
-        CityGMLs['LOD1_1_F0_HAvg_solid'] = createCityGML('LOD1_1_F0_HAvg_solid')
-        CityGMLs['LOD1_1_F0_HMed_solid'] = createCityGML('LOD1_1_F0_HMed_solid')
-
-    if VARIANTS:
-        CityGMLs['LOD1_1_F1_H0_solid'] = createCityGML('LOD1_1_F1_H0_solid')
-        CityGMLs['LOD1_1_F1_H1_solid'] = createCityGML('LOD1_1_F1_H1_solid')
-        CityGMLs['LOD1_1_F1_H2_solid'] = createCityGML('LOD1_1_F1_H2_solid')
-        CityGMLs['LOD1_1_F1_H3_solid'] = createCityGML('LOD1_1_F1_H3_solid')
-        CityGMLs['LOD1_1_F1_H4_solid'] = createCityGML('LOD1_1_F1_H4_solid')
-        CityGMLs['LOD1_1_F1_H5_solid'] = createCityGML('LOD1_1_F1_H5_solid')
-        CityGMLs['LOD1_1_F1_H6_solid'] = createCityGML('LOD1_1_F1_H6_solid')
-        CityGMLs['LOD1_1_F1_HAvg_solid'] = createCityGML('LOD1_1_F1_HAvg_solid')
-        CityGMLs['LOD1_1_F1_HMed_solid'] = createCityGML('LOD1_1_F1_HMed_solid')
-
-    if VARIANTS:
-        CityGMLs['LOD1_1_Fd_H0_solid'] = createCityGML('LOD1_1_Fd_H0_solid')
-        CityGMLs['LOD1_1_Fd_H1_solid'] = createCityGML('LOD1_1_Fd_H1_solid')
-        CityGMLs['LOD1_1_Fd_H2_solid'] = createCityGML('LOD1_1_Fd_H2_solid')
-        CityGMLs['LOD1_1_Fd_H3_solid'] = createCityGML('LOD1_1_Fd_H3_solid')
-        CityGMLs['LOD1_1_Fd_H4_solid'] = createCityGML('LOD1_1_Fd_H4_solid')
-        CityGMLs['LOD1_1_Fd_H5_solid'] = createCityGML('LOD1_1_Fd_H5_solid')
-        CityGMLs['LOD1_1_Fd_H6_solid'] = createCityGML('LOD1_1_Fd_H6_solid')
-        CityGMLs['LOD1_1_Fd_HAvg_solid'] = createCityGML('LOD1_1_Fd_HAvg_solid')
-        CityGMLs['LOD1_1_Fd_HMed_solid'] = createCityGML('LOD1_1_Fd_HMed_solid')
-
-    if VARIANTS:
-        CityGMLs['LOD1_1_F0_H0_semantics'] = createCityGML('LOD1_1_F0_H0_semantics')
-        CityGMLs['LOD1_1_F0_H1_semantics'] = createCityGML('LOD1_1_F0_H1_semantics')
-        CityGMLs['LOD1_1_F0_H2_semantics'] = createCityGML('LOD1_1_F0_H2_semantics')
-
-    CityGMLs['LOD1_1_F0_H3_semantics'] = createCityGML('LOD1_1_F0_H3_semantics')
-
-    if VARIANTS:
-        CityGMLs['LOD1_1_F0_H4_semantics'] = createCityGML('LOD1_1_F0_H4_semantics')
-        CityGMLs['LOD1_1_F0_H5_semantics'] = createCityGML('LOD1_1_F0_H5_semantics')
-        CityGMLs['LOD1_1_F0_H6_semantics'] = createCityGML('LOD1_1_F0_H6_semantics')
-        CityGMLs['LOD1_1_F0_HAvg_semantics'] = createCityGML('LOD1_1_F0_HAvg_semantics')
-        CityGMLs['LOD1_1_F0_HMed_semantics'] = createCityGML('LOD1_1_F0_HMed_semantics')
-
-    if VARIANTS:
-        CityGMLs['LOD1_1_F1_H0_semantics'] = createCityGML('LOD1_1_F1_H0_semantics')
-        CityGMLs['LOD1_1_F1_H1_semantics'] = createCityGML('LOD1_1_F1_H1_semantics')
-        CityGMLs['LOD1_1_F1_H2_semantics'] = createCityGML('LOD1_1_F1_H2_semantics')
-        CityGMLs['LOD1_1_F1_H3_semantics'] = createCityGML('LOD1_1_F1_H3_semantics')
-        CityGMLs['LOD1_1_F1_H4_semantics'] = createCityGML('LOD1_1_F1_H4_semantics')
-        CityGMLs['LOD1_1_F1_H5_semantics'] = createCityGML('LOD1_1_F1_H5_semantics')
-        CityGMLs['LOD1_1_F1_H6_semantics'] = createCityGML('LOD1_1_F1_H6_semantics')
-        CityGMLs['LOD1_1_F1_HAvg_semantics'] = createCityGML('LOD1_1_F1_HAvg_semantics')
-        CityGMLs['LOD1_1_F1_HMed_semantics'] = createCityGML('LOD1_1_F1_HMed_semantics')
-
-    if VARIANTS:
-        CityGMLs['LOD1_1_Fd_H0_semantics'] = createCityGML('LOD1_1_Fd_H0_semantics')
-        CityGMLs['LOD1_1_Fd_H1_semantics'] = createCityGML('LOD1_1_Fd_H1_semantics')
-        CityGMLs['LOD1_1_Fd_H2_semantics'] = createCityGML('LOD1_1_Fd_H2_semantics')
-        CityGMLs['LOD1_1_Fd_H3_semantics'] = createCityGML('LOD1_1_Fd_H3_semantics')
-        CityGMLs['LOD1_1_Fd_H4_semantics'] = createCityGML('LOD1_1_Fd_H4_semantics')
-        CityGMLs['LOD1_1_Fd_H5_semantics'] = createCityGML('LOD1_1_Fd_H5_semantics')
-        CityGMLs['LOD1_1_Fd_H6_semantics'] = createCityGML('LOD1_1_Fd_H6_semantics')
-        CityGMLs['LOD1_1_Fd_HAvg_semantics'] = createCityGML('LOD1_1_Fd_HAvg_semantics')
-        CityGMLs['LOD1_1_Fd_HMed_semantics'] = createCityGML('LOD1_1_Fd_HMed_semantics')
-
-
-#-- LOD1.2
-if VARIANTS:
-    CityGMLs['LOD1_2_F0_H0'] = createCityGML('LOD1_2_F0_H0')
-    CityGMLs['LOD1_2_F0_H1'] = createCityGML('LOD1_2_F0_H1')
-    CityGMLs['LOD1_2_F0_H2'] = createCityGML('LOD1_2_F0_H2')
-
-CityGMLs['LOD1_2_F0_H3'] = createCityGML('LOD1_2_F0_H3')
-
-if VARIANTS:
-    CityGMLs['LOD1_2_F0_H4'] = createCityGML('LOD1_2_F0_H4')
-    CityGMLs['LOD1_2_F0_H5'] = createCityGML('LOD1_2_F0_H5')
-    CityGMLs['LOD1_2_F0_H6'] = createCityGML('LOD1_2_F0_H6')
-    CityGMLs['LOD1_2_F0_HAvg'] = createCityGML('LOD1_2_F0_HAvg')
-    CityGMLs['LOD1_2_F0_HMed'] = createCityGML('LOD1_2_F0_HMed')
-
-if VARIANTS:
-    CityGMLs['LOD1_2_F1_H0'] = createCityGML('LOD1_2_F1_H0')
-    CityGMLs['LOD1_2_F1_H1'] = createCityGML('LOD1_2_F1_H1')
-    CityGMLs['LOD1_2_F1_H2'] = createCityGML('LOD1_2_F1_H2')
-    CityGMLs['LOD1_2_F1_H3'] = createCityGML('LOD1_2_F1_H3')
-    CityGMLs['LOD1_2_F1_H4'] = createCityGML('LOD1_2_F1_H4')
-    CityGMLs['LOD1_2_F1_H5'] = createCityGML('LOD1_2_F1_H5')
-    CityGMLs['LOD1_2_F1_H6'] = createCityGML('LOD1_2_F1_H6')
-    CityGMLs['LOD1_2_F1_HAvg'] = createCityGML('LOD1_2_F1_HAvg')
-    CityGMLs['LOD1_2_F1_HMed'] = createCityGML('LOD1_2_F1_HMed')
-
-if VARIANTS:
-    CityGMLs['LOD1_2_Fd_H0'] = createCityGML('LOD1_2_Fd_H0')
-    CityGMLs['LOD1_2_Fd_H1'] = createCityGML('LOD1_2_Fd_H1')
-    CityGMLs['LOD1_2_Fd_H2'] = createCityGML('LOD1_2_Fd_H2')
-    CityGMLs['LOD1_2_Fd_H3'] = createCityGML('LOD1_2_Fd_H3')
-    CityGMLs['LOD1_2_Fd_H4'] = createCityGML('LOD1_2_Fd_H4')
-    CityGMLs['LOD1_2_Fd_H5'] = createCityGML('LOD1_2_Fd_H5')
-    CityGMLs['LOD1_2_Fd_H6'] = createCityGML('LOD1_2_Fd_H6')
-    CityGMLs['LOD1_2_Fd_HAvg'] = createCityGML('LOD1_2_Fd_HAvg')
-    CityGMLs['LOD1_2_Fd_HMed'] = createCityGML('LOD1_2_Fd_HMed')
-
-
-if SOLIDS:
-    if VARIANTS:
-        CityGMLs['LOD1_2_F0_H0_solid'] = createCityGML('LOD1_2_F0_H0_solid')
-        CityGMLs['LOD1_2_F0_H1_solid'] = createCityGML('LOD1_2_F0_H1_solid')
-        CityGMLs['LOD1_2_F0_H2_solid'] = createCityGML('LOD1_2_F0_H2_solid')
-
-    CityGMLs['LOD1_2_F0_H3_solid'] = createCityGML('LOD1_2_F0_H3_solid')
-
-    if VARIANTS:
-        CityGMLs['LOD1_2_F0_H4_solid'] = createCityGML('LOD1_2_F0_H4_solid')
-        CityGMLs['LOD1_2_F0_H5_solid'] = createCityGML('LOD1_2_F0_H5_solid')
-        CityGMLs['LOD1_2_F0_H6_solid'] = createCityGML('LOD1_2_F0_H6_solid')
-        CityGMLs['LOD1_2_F0_HAvg_solid'] = createCityGML('LOD1_2_F0_HAvg_solid')
-        CityGMLs['LOD1_2_F0_HMed_solid'] = createCityGML('LOD1_2_F0_HMed_solid')
-
-    if VARIANTS:
-        CityGMLs['LOD1_2_F1_H0_solid'] = createCityGML('LOD1_2_F1_H0_solid')
-        CityGMLs['LOD1_2_F1_H1_solid'] = createCityGML('LOD1_2_F1_H1_solid')
-        CityGMLs['LOD1_2_F1_H2_solid'] = createCityGML('LOD1_2_F1_H2_solid')
-        CityGMLs['LOD1_2_F1_H3_solid'] = createCityGML('LOD1_2_F1_H3_solid')
-        CityGMLs['LOD1_2_F1_H4_solid'] = createCityGML('LOD1_2_F1_H4_solid')
-        CityGMLs['LOD1_2_F1_H5_solid'] = createCityGML('LOD1_2_F1_H5_solid')
-        CityGMLs['LOD1_2_F1_H6_solid'] = createCityGML('LOD1_2_F1_H6_solid')
-        CityGMLs['LOD1_2_F1_HAvg_solid'] = createCityGML('LOD1_2_F1_HAvg_solid')
-        CityGMLs['LOD1_2_F1_HMed_solid'] = createCityGML('LOD1_2_F1_HMed_solid')
-
-    if VARIANTS:
-        CityGMLs['LOD1_2_Fd_H0_solid'] = createCityGML('LOD1_2_Fd_H0_solid')
-        CityGMLs['LOD1_2_Fd_H1_solid'] = createCityGML('LOD1_2_Fd_H1_solid')
-        CityGMLs['LOD1_2_Fd_H2_solid'] = createCityGML('LOD1_2_Fd_H2_solid')
-        CityGMLs['LOD1_2_Fd_H3_solid'] = createCityGML('LOD1_2_Fd_H3_solid')
-        CityGMLs['LOD1_2_Fd_H4_solid'] = createCityGML('LOD1_2_Fd_H4_solid')
-        CityGMLs['LOD1_2_Fd_H5_solid'] = createCityGML('LOD1_2_Fd_H5_solid')
-        CityGMLs['LOD1_2_Fd_H6_solid'] = createCityGML('LOD1_2_Fd_H6_solid')
-        CityGMLs['LOD1_2_Fd_HAvg_solid'] = createCityGML('LOD1_2_Fd_HAvg_solid')
-        CityGMLs['LOD1_2_Fd_HMed_solid'] = createCityGML('LOD1_2_Fd_HMed_solid')
-
-    if VARIANTS:
-        CityGMLs['LOD1_2_F0_H0_semantics'] = createCityGML('LOD1_2_F0_H0_semantics')
-        CityGMLs['LOD1_2_F0_H1_semantics'] = createCityGML('LOD1_2_F0_H1_semantics')
-        CityGMLs['LOD1_2_F0_H2_semantics'] = createCityGML('LOD1_2_F0_H2_semantics')
-
-    CityGMLs['LOD1_2_F0_H3_semantics'] = createCityGML('LOD1_2_F0_H3_semantics')
-
-    if VARIANTS:
-        CityGMLs['LOD1_2_F0_H4_semantics'] = createCityGML('LOD1_2_F0_H4_semantics')
-        CityGMLs['LOD1_2_F0_H5_semantics'] = createCityGML('LOD1_2_F0_H5_semantics')
-        CityGMLs['LOD1_2_F0_H6_semantics'] = createCityGML('LOD1_2_F0_H6_semantics')
-        CityGMLs['LOD1_2_F0_HAvg_semantics'] = createCityGML('LOD1_2_F0_HAvg_semantics')
-        CityGMLs['LOD1_2_F0_HMed_semantics'] = createCityGML('LOD1_2_F0_HMed_semantics')
-
-    if VARIANTS:
-        CityGMLs['LOD1_2_F1_H0_semantics'] = createCityGML('LOD1_2_F1_H0_semantics')
-        CityGMLs['LOD1_2_F1_H1_semantics'] = createCityGML('LOD1_2_F1_H1_semantics')
-        CityGMLs['LOD1_2_F1_H2_semantics'] = createCityGML('LOD1_2_F1_H2_semantics')
-        CityGMLs['LOD1_2_F1_H3_semantics'] = createCityGML('LOD1_2_F1_H3_semantics')
-        CityGMLs['LOD1_2_F1_H4_semantics'] = createCityGML('LOD1_2_F1_H4_semantics')
-        CityGMLs['LOD1_2_F1_H5_semantics'] = createCityGML('LOD1_2_F1_H5_semantics')
-        CityGMLs['LOD1_2_F1_H6_semantics'] = createCityGML('LOD1_2_F1_H6_semantics')
-        CityGMLs['LOD1_2_F1_HAvg_semantics'] = createCityGML('LOD1_2_F1_HAvg_semantics')
-        CityGMLs['LOD1_2_F1_HMed_semantics'] = createCityGML('LOD1_2_F1_HMed_semantics')
-
-    if VARIANTS:
-        CityGMLs['LOD1_2_Fd_H0_semantics'] = createCityGML('LOD1_2_Fd_H0_semantics')
-        CityGMLs['LOD1_2_Fd_H1_semantics'] = createCityGML('LOD1_2_Fd_H1_semantics')
-        CityGMLs['LOD1_2_Fd_H2_semantics'] = createCityGML('LOD1_2_Fd_H2_semantics')
-        CityGMLs['LOD1_2_Fd_H3_semantics'] = createCityGML('LOD1_2_Fd_H3_semantics')
-        CityGMLs['LOD1_2_Fd_H4_semantics'] = createCityGML('LOD1_2_Fd_H4_semantics')
-        CityGMLs['LOD1_2_Fd_H5_semantics'] = createCityGML('LOD1_2_Fd_H5_semantics')
-        CityGMLs['LOD1_2_Fd_H6_semantics'] = createCityGML('LOD1_2_Fd_H6_semantics')
-        CityGMLs['LOD1_2_Fd_HAvg_semantics'] = createCityGML('LOD1_2_Fd_HAvg_semantics')
-        CityGMLs['LOD1_2_Fd_HMed_semantics'] = createCityGML('LOD1_2_Fd_HMed_semantics')
-
-#-- LOD1.3
-if VARIANTS:
-    CityGMLs['LOD1_3_F0_H0'] = createCityGML('LOD1_3_F0_H0')
-    CityGMLs['LOD1_3_F0_H1'] = createCityGML('LOD1_3_F0_H1')
-    CityGMLs['LOD1_3_F0_H2'] = createCityGML('LOD1_3_F0_H2')
-
-CityGMLs['LOD1_3_F0_H3'] = createCityGML('LOD1_3_F0_H3')
-
-if VARIANTS:
-    CityGMLs['LOD1_3_F0_H4'] = createCityGML('LOD1_3_F0_H4')
-    CityGMLs['LOD1_3_F0_H5'] = createCityGML('LOD1_3_F0_H5')
-    CityGMLs['LOD1_3_F0_H6'] = createCityGML('LOD1_3_F0_H6')
-    CityGMLs['LOD1_3_F0_HAvg'] = createCityGML('LOD1_3_F0_HAvg')
-    CityGMLs['LOD1_3_F0_HMed'] = createCityGML('LOD1_3_F0_HMed')
-
-if VARIANTS:
-    CityGMLs['LOD1_3_F1_H0'] = createCityGML('LOD1_3_F1_H0')
-    CityGMLs['LOD1_3_F1_H1'] = createCityGML('LOD1_3_F1_H1')
-    CityGMLs['LOD1_3_F1_H2'] = createCityGML('LOD1_3_F1_H2')
-    CityGMLs['LOD1_3_F1_H3'] = createCityGML('LOD1_3_F1_H3')
-    CityGMLs['LOD1_3_F1_H4'] = createCityGML('LOD1_3_F1_H4')
-    CityGMLs['LOD1_3_F1_H5'] = createCityGML('LOD1_3_F1_H5')
-    CityGMLs['LOD1_3_F1_H6'] = createCityGML('LOD1_3_F1_H6')
-    CityGMLs['LOD1_3_F1_HAvg'] = createCityGML('LOD1_3_F1_HAvg')
-    CityGMLs['LOD1_3_F1_HMed'] = createCityGML('LOD1_3_F1_HMed')
-
-if VARIANTS:
-    CityGMLs['LOD1_3_Fd_H0'] = createCityGML('LOD1_3_Fd_H0')
-    CityGMLs['LOD1_3_Fd_H1'] = createCityGML('LOD1_3_Fd_H1')
-    CityGMLs['LOD1_3_Fd_H2'] = createCityGML('LOD1_3_Fd_H2')
-    CityGMLs['LOD1_3_Fd_H3'] = createCityGML('LOD1_3_Fd_H3')
-    CityGMLs['LOD1_3_Fd_H4'] = createCityGML('LOD1_3_Fd_H4')
-    CityGMLs['LOD1_3_Fd_H5'] = createCityGML('LOD1_3_Fd_H5')
-    CityGMLs['LOD1_3_Fd_H6'] = createCityGML('LOD1_3_Fd_H6')
-    CityGMLs['LOD1_3_Fd_HAvg'] = createCityGML('LOD1_3_Fd_HAvg')
-    CityGMLs['LOD1_3_Fd_HMed'] = createCityGML('LOD1_3_Fd_HMed')
-
-if SOLIDS:
-    if VARIANTS:
-        CityGMLs['LOD1_3_F0_H0_solid'] = createCityGML('LOD1_3_F0_H0_solid')
-        CityGMLs['LOD1_3_F0_H1_solid'] = createCityGML('LOD1_3_F0_H1_solid')
-        CityGMLs['LOD1_3_F0_H2_solid'] = createCityGML('LOD1_3_F0_H2_solid')
-
-    CityGMLs['LOD1_3_F0_H3_solid'] = createCityGML('LOD1_3_F0_H3_solid')
-
-    if VARIANTS:
-        CityGMLs['LOD1_3_F0_H4_solid'] = createCityGML('LOD1_3_F0_H4_solid')
-        CityGMLs['LOD1_3_F0_H5_solid'] = createCityGML('LOD1_3_F0_H5_solid')
-        CityGMLs['LOD1_3_F0_H6_solid'] = createCityGML('LOD1_3_F0_H6_solid')
-        CityGMLs['LOD1_3_F0_HAvg_solid'] = createCityGML('LOD1_3_F0_HAvg_solid')
-        CityGMLs['LOD1_3_F0_HMed_solid'] = createCityGML('LOD1_3_F0_HMed_solid')
-
-    if VARIANTS:
-        CityGMLs['LOD1_3_F1_H0_solid'] = createCityGML('LOD1_3_F1_H0_solid')
-        CityGMLs['LOD1_3_F1_H1_solid'] = createCityGML('LOD1_3_F1_H1_solid')
-        CityGMLs['LOD1_3_F1_H2_solid'] = createCityGML('LOD1_3_F1_H2_solid')
-        CityGMLs['LOD1_3_F1_H3_solid'] = createCityGML('LOD1_3_F1_H3_solid')
-        CityGMLs['LOD1_3_F1_H4_solid'] = createCityGML('LOD1_3_F1_H4_solid')
-        CityGMLs['LOD1_3_F1_H5_solid'] = createCityGML('LOD1_3_F1_H5_solid')
-        CityGMLs['LOD1_3_F1_H6_solid'] = createCityGML('LOD1_3_F1_H6_solid')
-        CityGMLs['LOD1_3_F1_HAvg_solid'] = createCityGML('LOD1_3_F1_HAvg_solid')
-        CityGMLs['LOD1_3_F1_HMed_solid'] = createCityGML('LOD1_3_F1_HMed_solid')
-
-    if VARIANTS:
-        CityGMLs['LOD1_3_Fd_H0_solid'] = createCityGML('LOD1_3_Fd_H0_solid')
-        CityGMLs['LOD1_3_Fd_H1_solid'] = createCityGML('LOD1_3_Fd_H1_solid')
-        CityGMLs['LOD1_3_Fd_H2_solid'] = createCityGML('LOD1_3_Fd_H2_solid')
-        CityGMLs['LOD1_3_Fd_H3_solid'] = createCityGML('LOD1_3_Fd_H3_solid')
-        CityGMLs['LOD1_3_Fd_H4_solid'] = createCityGML('LOD1_3_Fd_H4_solid')
-        CityGMLs['LOD1_3_Fd_H5_solid'] = createCityGML('LOD1_3_Fd_H5_solid')
-        CityGMLs['LOD1_3_Fd_H6_solid'] = createCityGML('LOD1_3_Fd_H6_solid')
-        CityGMLs['LOD1_3_Fd_HAvg_solid'] = createCityGML('LOD1_3_Fd_HAvg_solid')
-        CityGMLs['LOD1_3_Fd_HMed_solid'] = createCityGML('LOD1_3_Fd_HMed_solid')
-
-    if VARIANTS:
-        CityGMLs['LOD1_3_F0_H0_semantics'] = createCityGML('LOD1_3_F0_H0_semantics')
-        CityGMLs['LOD1_3_F0_H1_semantics'] = createCityGML('LOD1_3_F0_H1_semantics')
-        CityGMLs['LOD1_3_F0_H2_semantics'] = createCityGML('LOD1_3_F0_H2_semantics')
-
-    CityGMLs['LOD1_3_F0_H3_semantics'] = createCityGML('LOD1_3_F0_H3_semantics')
-
-    if VARIANTS:
-        CityGMLs['LOD1_3_F0_H4_semantics'] = createCityGML('LOD1_3_F0_H4_semantics')
-        CityGMLs['LOD1_3_F0_H5_semantics'] = createCityGML('LOD1_3_F0_H5_semantics')
-        CityGMLs['LOD1_3_F0_H6_semantics'] = createCityGML('LOD1_3_F0_H6_semantics')
-        CityGMLs['LOD1_3_F0_HAvg_semantics'] = createCityGML('LOD1_3_F0_HAvg_semantics')
-        CityGMLs['LOD1_3_F0_HMed_semantics'] = createCityGML('LOD1_3_F0_HMed_semantics')
-
-    if VARIANTS:
-        CityGMLs['LOD1_3_F1_H0_semantics'] = createCityGML('LOD1_3_F1_H0_semantics')
-        CityGMLs['LOD1_3_F1_H1_semantics'] = createCityGML('LOD1_3_F1_H1_semantics')
-        CityGMLs['LOD1_3_F1_H2_semantics'] = createCityGML('LOD1_3_F1_H2_semantics')
-        CityGMLs['LOD1_3_F1_H3_semantics'] = createCityGML('LOD1_3_F1_H3_semantics')
-        CityGMLs['LOD1_3_F1_H4_semantics'] = createCityGML('LOD1_3_F1_H4_semantics')
-        CityGMLs['LOD1_3_F1_H5_semantics'] = createCityGML('LOD1_3_F1_H5_semantics')
-        CityGMLs['LOD1_3_F1_H6_semantics'] = createCityGML('LOD1_3_F1_H6_semantics')
-        CityGMLs['LOD1_3_F1_HAvg_semantics'] = createCityGML('LOD1_3_F1_HAvg_semantics')
-        CityGMLs['LOD1_3_F1_HMed_semantics'] = createCityGML('LOD1_3_F1_HMed_semantics')
-
-    if VARIANTS:
-        CityGMLs['LOD1_3_Fd_H0_semantics'] = createCityGML('LOD1_3_Fd_H0_semantics')
-        CityGMLs['LOD1_3_Fd_H1_semantics'] = createCityGML('LOD1_3_Fd_H1_semantics')
-        CityGMLs['LOD1_3_Fd_H2_semantics'] = createCityGML('LOD1_3_Fd_H2_semantics')
-        CityGMLs['LOD1_3_Fd_H3_semantics'] = createCityGML('LOD1_3_Fd_H3_semantics')
-        CityGMLs['LOD1_3_Fd_H4_semantics'] = createCityGML('LOD1_3_Fd_H4_semantics')
-        CityGMLs['LOD1_3_Fd_H5_semantics'] = createCityGML('LOD1_3_Fd_H5_semantics')
-        CityGMLs['LOD1_3_Fd_H6_semantics'] = createCityGML('LOD1_3_Fd_H6_semantics')
-        CityGMLs['LOD1_3_Fd_HAvg_semantics'] = createCityGML('LOD1_3_Fd_HAvg_semantics')
-        CityGMLs['LOD1_3_Fd_HMed_semantics'] = createCityGML('LOD1_3_Fd_HMed_semantics')
-
-## LOD2
-#-- LOD2.0
-CityGMLs['LOD2_0_F0'] = createCityGML('LOD2_0_F0')
-if VARIANTS:
-    CityGMLs['LOD2_0_Fd'] = createCityGML('LOD2_0_Fd')
-    CityGMLs['LOD2_0_F1'] = createCityGML('LOD2_0_F1')
-#-- Non semantic version
-if SOLIDS:
-    CityGMLs['LOD2_0_F0_S0'] = createCityGML('LOD2_0_F0_S0')
-if VARIANTS:
-    CityGMLs['LOD2_0_Fd_S0'] = createCityGML('LOD2_0_Fd_S0')
-    CityGMLs['LOD2_0_F1_S0'] = createCityGML('LOD2_0_F1_S0')
-#--Solids
-if SOLIDS:
-    CityGMLs['LOD2_0_F0_solid'] = createCityGML('LOD2_0_F0_solid')
-    if VARIANTS:
-        CityGMLs['LOD2_0_Fd_solid'] = createCityGML('LOD2_0_Fd_solid')
-        CityGMLs['LOD2_0_F1_solid'] = createCityGML('LOD2_0_F1_solid')
-
-#-- LOD2.1
-CityGMLs['LOD2_1_F0'] = createCityGML('LOD2_1_F0')
-if VARIANTS:
-    CityGMLs['LOD2_1_Fd'] = createCityGML('LOD2_1_Fd')
-    CityGMLs['LOD2_1_F1'] = createCityGML('LOD2_1_F1')
-#-- Non semantic version
-if SOLIDS:
-    CityGMLs['LOD2_1_F0_S0'] = createCityGML('LOD2_1_F0_S0')
-if VARIANTS:
-    CityGMLs['LOD2_1_Fd_S0'] = createCityGML('LOD2_1_Fd_S0')
-    CityGMLs['LOD2_1_F1_S0'] = createCityGML('LOD2_1_F1_S0')
-#--Solids
-if SOLIDS:
-    CityGMLs['LOD2_1_F0_solid'] = createCityGML('LOD2_1_F0_solid')
-    if VARIANTS:
-        CityGMLs['LOD2_1_Fd_solid'] = createCityGML('LOD2_1_Fd_solid')
-        CityGMLs['LOD2_1_F1_solid'] = createCityGML('LOD2_1_F1_solid')
-
-#-- LOD2.2
-CityGMLs['LOD2_2_F0'] = createCityGML('LOD2_2_F0')
-if VARIANTS:
-    CityGMLs['LOD2_2_F1'] = createCityGML('LOD2_2_F1')
-    CityGMLs['LOD2_2_Fd'] = createCityGML('LOD2_2_Fd')
-#-- Non semantic version
-if SOLIDS:
-    CityGMLs['LOD2_2_F0_S0'] = createCityGML('LOD2_2_F0_S0')
-if VARIANTS:
-    CityGMLs['LOD2_2_F1_S0'] = createCityGML('LOD2_2_F1_S0')
-    CityGMLs['LOD2_2_Fd_S0'] = createCityGML('LOD2_2_Fd_S0')
-#--Solids
-if SOLIDS:
-    CityGMLs['LOD2_2_F0_solid'] = createCityGML('LOD2_2_F0_solid')
-    if VARIANTS:
-        CityGMLs['LOD2_2_F1_solid'] = createCityGML('LOD2_2_F1_solid')
-        CityGMLs['LOD2_2_Fd_solid'] = createCityGML('LOD2_2_Fd_solid')
-
-#-- LOD2.3
-CityGMLs['LOD2_3_F0'] = createCityGML('LOD2_3_F0')
-if VARIANTS:
-    CityGMLs['LOD2_3_Fd'] = createCityGML('LOD2_3_Fd')
-#-- Non semantic version
-if SOLIDS:
-    CityGMLs['LOD2_3_F0_S0'] = createCityGML('LOD2_3_F0_S0')
-if VARIANTS:
-    CityGMLs['LOD2_3_Fd_S0'] = createCityGML('LOD2_3_Fd_S0')
-#--Solids
-if SOLIDS:
-    CityGMLs['LOD2_3_F0_solid'] = createCityGML('LOD2_3_F0_solid')
-    if VARIANTS:
-        CityGMLs['LOD2_3_Fd_solid'] = createCityGML('LOD2_3_Fd_solid')
-
-#-- LOD2.3 with dormers
-if VARIANTS:
-    CityGMLs['LOD2_3_F0_with_dormers'] = createCityGML('LOD2_3_F0_with_dormers')
-    CityGMLs['LOD2_3_Fd_with_dormers'] = createCityGML('LOD2_3_Fd_with_dormers')
-    #-- Non semantic version
-    if SOLIDS:
-        CityGMLs['LOD2_3_F0_S0_with_dormers'] = createCityGML('LOD2_3_F0_S0_with_dormers')
-    if VARIANTS:
-        CityGMLs['LOD2_3_Fd_S0_with_dormers'] = createCityGML('LOD2_3_Fd_S0_with_dormers')
-    #--Solids
-    if SOLIDS:
-        CityGMLs['LOD2_3_F0_solid_with_dormers'] = createCityGML('LOD2_3_F0_solid_with_dormers')
-        if VARIANTS:
-            CityGMLs['LOD2_3_Fd_solid_with_dormers'] = createCityGML('LOD2_3_Fd_solid_with_dormers')       
-
-#--LOD3 variants
-#--Normal LOD3 with flat openings
-CityGMLs['LOD3_2'] = createCityGML('LOD3_2')
-#--The best LOD3 model available, with embrasures at openings
-CityGMLs['LOD3_3'] = createCityGML('LOD3_3')
-# #CityGMLs['LOD3BI'] = createCityGML('LOD3BI')
-#-- Hybrid models
-CityGMLs['LOD3_1'] = createCityGML('LOD3_1')
-CityGMLs['LOD3_0'] = createCityGML('LOD3_0')
-# CityGMLs['LOD3RF1'] = createCityGML('LOD3RF1')
-
-#-- No semantics
-if SOLIDS:
-    CityGMLs['LOD3_2_S0'] = createCityGML('LOD3_2_S0')
-    CityGMLs['LOD3_3_S0'] = createCityGML('LOD3_3_S0')
-    CityGMLs['LOD3_1_S0'] = createCityGML('LOD3_1_S0')
-    CityGMLs['LOD3_0_S0'] = createCityGML('LOD3_0_S0')
-#--Solid counterparts
-if SOLIDS:
-    CityGMLs['LOD3_2_solid'] = createCityGML('LOD3_2_solid')
-    CityGMLs['LOD3_3_solid'] = createCityGML('LOD3_3_solid')
-    CityGMLs['LOD3_1_solid'] = createCityGML('LOD3_1_solid')
-    CityGMLs['LOD3_0_solid'] = createCityGML('LOD3_0_solid')
-
-#-- Interior
-CityGMLs['interior-LOD0'] = createCityGML('interior-LOD0')
-CityGMLs['interior-LOD1'] = createCityGML('interior-LOD1')
-CityGMLs['interior-LOD2_2'] = createCityGML('interior-LOD2_2')
-CityGMLs['interior-LOD2_3'] = createCityGML('interior-LOD2_3')
-
-#-- Non-building features
-if STREETS:
-    CityGMLs['Road-LOD0'] = createCityGML('Road-LOD0')
-if VEGETATION:
-    CityGMLs['PlantCover-LOD0'] = createCityGML('PlantCover-LOD0')
-    CityGMLs['PlantCover-LOD1'] = createCityGML('PlantCover-LOD1')
-
-#-- Iterate the list of buildings in the XML and extract their data
-buildingcounter = 0
-print("Constructing buildings and other city objects...")
-if REPORT:
-    fish = ProgressFish(total=len(buildings))
-for b in buildings:
-	#-- Report on the progress
-    if REPORT:
-        fish.animate(amount=buildingcounter+1)
-    buildingcounter += 1
-    #-- Building UUID
-    ID = b.attrib['ID']
-    #-- Origin in (x,y,z) as a list of floats
-    origin = b.findall('origin')[0]
-    origin_coords = [float(x) for x in origin.text.split(" ")]
-    #-- Position in the grid
-    order = b.findall('order')[0]
-    order = [int(x) for x in order.text.split(" ")]
-    #-- Rotation angle
-    angle_of_rotationXML = b.findall('rotation')[0]
-    angle_of_rotation = float(angle_of_rotationXML.text)
-    #-- Dimensions of the building
-    xsize = b.findall('xSize')[0]
-    xsize = float(xsize.text)
-    ysize = b.findall('ySize')[0]
-    ysize = float(ysize.text)
-    zsize = b.findall('zSize')[0]
-    zsize = float(zsize.text)
-    #-- Other building geometric properties
-    floors = b.findall('floors')[0]
-    floors = float(floors.text)
-    floorHeight = b.findall('floorHeight')[0]
-    floorHeight = float(floorHeight.text)
-    embrasure = b.findall('embrasure')[0]
-    embrasure = float(embrasure.text)
-    wallThickness = b.findall('wallThickness')[0]
-    wallThickness = float(wallThickness.text)
-    joist = b.findall('joist')[0]
-    joist = float(joist.text)
-
-    #-- Store the attributes
-    attributes = {}
-    attrs = b.findall('properties')[0]
-    attributes['yearOfConstruction'] = str(attrs.findall('yearOfConstruction')[0].text)
-    attributes['function'] = str(attrs.findall('usage')[0].text)
-    attributes['storeysAboveGround'] = str(int(floors))
-
-    #-- Building part
-    if BUILDINGPARTS:
-        bpartXML = b.findall('buildingPart')
-        if len(bpartXML) > 0:
-            buildingpart = {}
-            bpartXML = bpartXML[0]
-            partType = bpartXML.findall('partType')[0].text
-            partOrigin = float(bpartXML.findall('partOrigin')[0].text)
-            width = float(bpartXML.findall('width')[0].text)
-            length = float(bpartXML.findall('length')[0].text)
-            height = float(bpartXML.findall('height')[0].text)
-            buildingpart['o'] = partOrigin
-            buildingpart['type'] = partType
-            buildingpart['x'] = width
-            buildingpart['y'] = length
-            buildingpart['z'] = height
-        else:
-            buildingpart = None
-    else:
-        buildingpart = None
-
-    #-- Roof
-    roof = b.findall('roof')[0]
-    roofType = roof.findall('roofType')[0]
-    roofType = roofType.text
-    if roofType == 'Flat':
-        h = None
-        r = None
-        ovh = roof.findall('overhangs')[0]
-        ovhx = ovh.findall('xlength')[0]
-        ovhy = ovh.findall('ylength')[0]
-        ovhx = float(ovhx.text)
-        ovhy = float(ovhy.text)
-    elif roofType == 'Hipped' or roofType == 'Pyramidal':
-        h = roof.findall('h')[0]
-        h = float(h.text)
-        r = roof.findall('r')[0]
-        r = float(r.text)
-        ovh = roof.findall('overhangs')[0]
-        ovhx = ovh.findall('xlength')[0]
-        ovhy = ovh.findall('ylength')[0]
-        ovhx = float(ovhx.text)
-        ovhy = float(ovhy.text)
-    else:
-        h = roof.findall('h')[0]
-        h = float(h.text)
-        r = None
-        ovh = roof.findall('overhangs')[0]
-        ovhx = ovh.findall('xlength')[0]
-        ovhy = ovh.findall('ylength')[0]
-        ovhx = float(ovhx.text)
-        ovhy = float(ovhy.text)
-
-    #-- Overhangs
-    if ovh is not None:
-        ovh = [ovhx, ovhy]
-
-
-    #-- Chimney
-    chimney = []
-    chimneyXML = roof.findall('chimney')
-    if len(chimneyXML) > 0:
-        chimneyXML = chimneyXML[0]
-        chimneyFace = chimneyXML.findall('side')[0]
-        chimneyOrigin = chimneyXML.findall('origin')[0]
-        chimneyOriginX = chimneyOrigin.findall('x')[0]
-        chimneyOriginX = float(chimneyOriginX.text)
-        chimneyOriginY = chimneyOrigin.findall('y')[0]
-        chimneyOriginY = float(chimneyOriginY.text)
-        chimneySize = chimneyXML.findall('size')[0]
-        chimneyWidth = chimneySize.findall('width')[0]
-        chimneyWidth = float(chimneyWidth.text)
-        chimneyHeight = chimneySize.findall('height')[0]
-        chimneyHeight = float(chimneyHeight.text)
-        chimneyDict = {}
-        chimneyDict['side'] = int(chimneyFace.text)
-        chimneyDict['origin'] = [chimneyOriginX, chimneyOriginY]
-        chimneyDict['size'] = [chimneyWidth, chimneyWidth, chimneyHeight]
-        chimney.append(chimneyDict)
-
-    #-- Door
-    door = b.findall('door')[0]
-    doorFace = door.findall('wall')[0]
-    doorOrigin = door.findall('origin')[0]
-    doorOriginX = doorOrigin.findall('x')[0]
-    doorOriginX = float(doorOriginX.text)
-    doorOriginY = doorOrigin.findall('y')[0]
-    doorOriginY = float(doorOriginY.text)
-    doorSize = door.findall('size')[0]
-    doorWidth = doorSize.findall('width')[0]
-    doorWidth = float(doorWidth.text)
-    doorHeight = doorSize.findall('height')[0]
-    doorHeight = float(doorHeight.text)
-
-    doorDict = {}
-    doorDict['wall'] = int(doorFace.text)
-    doorDict['origin'] = [doorOriginX, doorOriginY]
-    doorDict['size'] = [doorWidth, doorHeight]
-
-    #-- Wall windows
-    wallWindows = []
-    allwindowsXML = b.findall('windows')
-    if len(allwindowsXML) > 0:
-        allwindowsXML = allwindowsXML[0]
-        for winXML in allwindowsXML.findall('window'):
-            wallWindows.append({'wall' : int(winXML.findall('wall')[0].text), 'size' : [float((winXML.findall('size')[0]).findall('width')[0].text), float((winXML.findall('size')[0]).findall('height')[0].text)], 'origin' : [float((winXML.findall('origin')[0]).findall('x')[0].text), float((winXML.findall('origin')[0]).findall('y')[0].text)]})
-        embrasure = float(winXML.findall('depth')[0].text)
-    else:
-        embrasure = 0.0
-
-    #-- Dormers
-    dormers = []
-    alldormersXML = roof.findall('dormers')
-    if len(alldormersXML) > 0:
-        alldormersXML = alldormersXML[0]
-        for dormXML in alldormersXML.findall('dormer'):
-            dormers.append({'side' : int(dormXML.findall('side')[0].text), 'size' : [float((dormXML.findall('size')[0]).findall('width')[0].text), float((dormXML.findall('size')[0]).findall('height')[0].text)], 'origin' : [float((dormXML.findall('origin')[0]).findall('x')[0].text), float((dormXML.findall('origin')[0]).findall('y')[0].text)]})
-
-
-    roofWindows = []
-    allrfwinXML = roof.findall('roofWindows')
-    if len(allrfwinXML) > 0:
-        allrfwinXML = allrfwinXML[0]
-        for rfwinXML in allrfwinXML.findall('roofWindow'):
-            roofWindows.append({'side' : int(rfwinXML.findall('side')[0].text), 'size' : [float((rfwinXML.findall('size')[0]).findall('width')[0].text), float((rfwinXML.findall('size')[0]).findall('height')[0].text)], 'origin' : [float((rfwinXML.findall('origin')[0]).findall('x')[0].text), float((rfwinXML.findall('origin')[0]).findall('y')[0].text)]})
-
-    #-- Additional data
-    additional = {'overhangs' : ovh, 'embrasure': embrasure}
-
-    valueDict = {'ovh' : ovh, 'doorDict' : doorDict, 'wallWindows' : wallWindows, 'dormers' : dormers, 'roofWindows' : roofWindows, 'chimney' : chimney, 'embrasure' : embrasure}
-
-    #-- LOD3, first because we need the output of many parameters like absolute height of the chimney, eaves and corrected overhang lenghts 
-    CityGMLs['dummyLOD3'] = createCityGML('dummyLOD3')
-    chimneyHeight, eaves, ovhy_recalculated = CityGMLbuildingLOD3Semantics(CityGMLs['dummyLOD3'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, valueDict['doorDict'], valueDict['wallWindows'], valueDict['dormers'], valueDict['roofWindows'], valueDict['chimney'], valueDict['embrasure'], 1, None, None)
-    del CityGMLs['dummyLOD3']
-
-    #-- Adjust for footprint as the roof overhangs projection (modelling rule F1)
-    adjorigin = [origin_coords[0]-ovhx, origin_coords[1]-ovhy_recalculated, origin_coords[2]]
-    adjxsize = xsize + 2 * ovhx
-    adjysize = ysize + 2 * ovhy_recalculated
-    adjzsize = zsize - (zsize - eaves)
-
-    #-- Adjust the height of the roof
-    if h is not None:
-        if roofType == 'Shed':
-            adjh = h + 2 * (zsize - eaves)
-        else:
-            adjh = h + (zsize - eaves)
-    else:
-        adjh = None
-
-    if r is not None:
-        adjr = r + ovhy_recalculated
-    else:
-        adjr = None
-
-    #-- Adjust for footprint as the offset from the roof overhangs projection (modelling rule Fd)
-    offset = 0.2
-    #-- Defined here because the coordinates of the roof features have to be adjusted
-    
-    #-- Edges and other things for the offset
-    adjorigin_offset = [origin_coords[0]-ovhx+offset, origin_coords[1]-ovhy_recalculated+offset, origin_coords[2]]
-    adjxsize_offset = xsize + 2*(ovhx-offset)
-    adjysize_offset = ysize + 2*(ovhy_recalculated-offset)
-
-    #-- Auxiliary data in a dictionary
-    aux = {}
-    aux['ovhx'] = ovhx
-    aux['ovhy'] = ovhy_recalculated
-    aux['origin'] = origin_coords
-    aux['xsize'] = xsize
-    aux['ysize'] = ysize
-    aux['zsize'] = zsize
-    aux['offset'] = offset
-    aux['adjxsize_offset'] = adjxsize_offset
-    aux['adjysize_offset'] = adjysize_offset
-
-
-    if h is not None:
-        if offset < ovhx:
-            eo = (zsize - eaves) * (ovhx - offset) / ovhx
-            adjzsize_offset = zsize - eo
-            adjh_offset = h + eo
-            if roofType == 'Shed':
-                adjh_offset = h + 2*eo
-        elif offset == ovhx:
-            adjzsize_offset = zsize
-            adjh_offset = h
-        elif offset > ovhx and ovhx != 0.0:
-            eo = (zsize - eaves) * (offset/ovhx) - zsize + eaves
-            adjzsize_offset = zsize + eo
-            adjh_offset = h - eo
-            if roofType == 'Shed':
-                adjh_offset = h - 2*eo
-        elif ovhx == 0.0:
-            eo = h * (offset/(xsize*.5))
-            adjzsize_offset = zsize + eo
-            adjh_offset = h - eo
-            if roofType == 'Shed':
-                adjh_offset = h - 2*eo
-
+                CityGMLstreets(CityGMLs['Road-LOD0'], street_data)
+
+    if VEGETATION and ('PlantCover-LOD0' in CityGMLs or 'PlantCover-LOD1' in CityGMLs):
+        for pccollection in plantcover:
+            pcs = pccollection.findall('park')
+            for pc in pcs:
+                park_outline = pc.findall('outline')[0]
+                park_outline_coors = [float(x) for x in park_outline.text.split(" ")]
+                park_height = pc.findall('height')[0].text
+                pc_data = [park_outline_coors, park_height]
+                CityGMLplantCoverLOD0(CityGMLs['PlantCover-LOD0'], pc_data)
+                CityGMLplantCoverLOD1(CityGMLs['PlantCover-LOD1'], pc_data)
+
+    for representation in CityGMLs:
+        CityGMLfragments[representation].append(serialiseFragment(representation))
+
+    #-- A plan is done once its sample is generated
+    if PLAN:
+        if REPORT:
+            stopReporter(reporter)
+        reportPlan()
+        return len(buildings)
+
+    if PREVIOUS:
+        #-- Release the previous files before they are overwritten
+        for representation in previousCityGMLs:
+            previousCityGMLs[representation][0].close()
+    if WORKERS:
+        reportphase = 'workers'
+        reusedcounter += stopWorkers(workers)
+    if CACHE or PREVIOUS:
+        message("\nReused", reusedcounter, "building(s) generated before.")
+
+    #-- Write to file(s)
+    writingstart = time.time()
+    reportphase = 'writing'
+    if SCHEDULER:
+        message("\nDividing", len(CityGMLs), "CityGML file(s) among", REPRESENTATIONWORKERS, "representation worker(s)...")
+        runRepresentationWorkers()
+        if REPORT:
+            #-- The files are written by the representation workers, so the end reports their size on the disk
+            filecounter = len(CityGMLs)
+            for representation in CityGMLheads:
+                if COMPRESS:
+                    serialisedbytes[representation] = os.path.getsize(CityGMLfilename(representation) + '.gz')
+                else:
+                    serialisedbytes[representation] = os.path.getsize(CityGMLfilename(representation))
+    elif WRITERS:
+        message("\nGenerated", len(CityGMLs), "CityGML file(s). Waiting for the writers to complete them...")
+        stopWriters()
     else:
-        adjzsize_offset = zsize
-        adjh_offset = None
-
-    #-- Workaround to calculate the pyramidal and hipped building overhang in y direction
-    CityGMLs['dummy'] = createCityGML('dummy')
-    dummy1, eaves_offset, ovhy_recalculated_offset = CityGMLbuildingLOD3Semantics(CityGMLs['dummy'], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, [offset, offset], r, valueDict['doorDict'], valueDict['wallWindows'], valueDict['dormers'], valueDict['roofWindows'], valueDict['chimney'], valueDict['embrasure'], 1, aux, buildingpart)
-    del CityGMLs['dummy']
+        message("\nGenerated", len(CityGMLs), "CityGML file(s) in the memory. Now writing to disk...")
+        for element in CityGMLs:
+            storeCityGML(element)
+            #-- Read by the reporter
+            filecounter += 1
+    for table in tables:
+        storeTable(table)
+    #-- Checked by a later run that reuses the buildings of this one
+    if GROUP is None:
+        storeOptions()
+    if VALIDATE:
+        reportValidity()
+    if QUARANTINE and GROUP is None:
+        reportQuarantine()
+    if ENSEMBLE:
+        reportphase = 'ensemble'
+        message("\nWriting", ENSEMBLE, "realisation(s) of the city with noise...")
+        writeEnsemble()
+
+    message("\nWritten the CityGML file(s). Cleaning the memory...")
+
+    #-- The checkpoint and the spool files are not needed anymore once all the files are complete
+    if CHECKPOINT:
+        shutil.rmtree(DIRECTORY + '/checkpoint')
+    if WORKERS:
+        shutil.rmtree(DIRECTORY + '/spool')
+
+    #-- Timings of the run, appended to the benchmark file to track them between runs
+    if BENCHMARK:
+        end = time.time()
+        timings = {'date': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(STARTTIME)), 'arguments': ARGUMENTS, 'buildings': len(buildings), 'representations': len(CityGMLs),
+                   'interpreter': STARTCPU, 'setup': generationstart - STARTTIME, 'generation': writingstart - generationstart, 'writing': end - writingstart, 'total': STARTCPU + end - STARTTIME}
+        benchmarkFile = open(BENCHMARK, "a")
+        benchmarkFile.write(json.dumps(timings, sort_keys=True) + '\n')
+        benchmarkFile.close()
 
-    if r is not None:
-        if r > 0:
-            adjr_offset = r + ovhy_recalculated - offset
-        else:
-            adjr_offset = 0
-    else:
-        adjr_offset = None
-
-
-    chimney_ovh = []
-    chimney_offset = []
-    for chi in chimney:
-        chi_ovh = copy.deepcopy(chi)
-        chi_offset = copy.deepcopy(chi)
-        chi_ovh['origin'] = adjustRoofFeatures(roofType, zsize - eaves, chi['origin'], ovhx, ovhy_recalculated, chi['side'])
-        chi_offset['origin'] = adjustRoofFeatures(roofType, zsize - adjzsize_offset, chi['origin'], ovhx - offset, ovhy_recalculated - offset, chi['side'])
-        chimney_ovh.append(chi_ovh)
-        chimney_offset.append(chi_offset)
-
-    dormers_ovh = []
-    dormers_offset = []
-    for dor in dormers:
-        dor_ovh = copy.deepcopy(dor)
-        dor_offset = copy.deepcopy(dor)
-        dor_ovh['origin'] = adjustRoofFeatures(roofType, zsize - eaves, dor['origin'], ovhx, ovhy_recalculated, dor['side'])
-        dor_offset['origin'] = adjustRoofFeatures(roofType, zsize - adjzsize_offset, dor['origin'], ovhx - offset, ovhy_recalculated - offset, dor['side'])
-        dormers_ovh.append(dor_ovh)
-        dormers_offset.append(dor_offset)
-
-    roofWindows_ovh = []
-    roofWindows_offset = []
-    for roofwindow in roofWindows:
-        roofwindow_ovh = copy.deepcopy(roofwindow)
-        roofwindow_offset = copy.deepcopy(roofwindow)
-        roofwindow_ovh['origin'] = adjustRoofFeatures(roofType, zsize - eaves, roofwindow['origin'], ovhx, ovhy_recalculated, roofwindow['side'])
-        roofwindow_offset['origin'] = adjustRoofFeatures(roofType, zsize - adjzsize_offset, roofwindow['origin'], ovhx - offset, ovhy_recalculated - offset, roofwindow['side'])
-        roofWindows_ovh.append(roofwindow_ovh)
-        roofWindows_offset.append(roofwindow_offset)
-
-
-    #-- Geometric reference for the height
-    if adjh is not None:
-        onethird = adjh * (1.0/3.0) + adjzsize
-        half = adjh * .5 + adjzsize
-        twothird = adjh * (2.0/3.0) + adjzsize
-    else:
-        onethird = adjzsize
-        half = adjzsize
-        twothird = adjzsize
-
-    ##-- Start generating the CityGML buildings
-
-    #-- Tentative aggregation
-    cellsize = 20.0
-    if order[0] % 3 == 0 and order[1] % 3 == 0:
-        xo = order[0] * cellsize
-        yo = order[1] * cellsize
-        gxsize = cellsize * 3 - 6.0
-        gysize = cellsize * 3 - 6.0
-        gen_roofType = 'Flat'
-        CityGMLbuildingLOD0(CityGMLs["LOD0_0"], ID, attributes, [xo, yo, 0.0], gxsize, gysize, zsize, h, gen_roofType, None, eaves, '0.0')
-        CityGMLbuildingLOD1(CityGMLs["LOD1_0_HMin"], ID, attributes, [xo, yo, 0.0], gxsize, gysize, zsize, h, gen_roofType, None, eaves, '1.0') #-- This one is with the eaves
-        if SOLIDS:
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_0_HMin_solid"], ID, attributes, [xo, yo, 0.0], gxsize, gysize, zsize, h, gen_roofType, None, eaves, '1.0') #-- This one is with the eaves
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_0_HMin_semantics"], ID, attributes, [xo, yo, 0.0], gxsize, gysize, zsize, h, gen_roofType, None, eaves, '1.0') #-- This one is with the eaves
-
-    #####-- LOD0
-    ##-- LOD0.1
-    if VARIANTS:
-        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F0_H0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '0.1', aux, buildingpart) #-- This one is with the eaves
-        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F0_H1"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '0.1', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F0_H2"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '0.1', aux, buildingpart)
-    CityGMLbuildingLOD0(CityGMLs["LOD0_1_F0_H3"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '0.1', aux, buildingpart)
-    if VARIANTS:
-        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F0_H4"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '0.1', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F0_H5"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '0.1', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F0_H6"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '0.1', aux, buildingpart) #-- This one is with the chimney or eaves
-
-    if VARIANTS:
-        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F1_H0"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '0.1', aux, buildingpart) #-- This one is with the eaves
-        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F1_H1"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '0.1', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F1_H2"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '0.1', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F1_H3"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '0.1', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F1_H4"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '0.1', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F1_H5"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '0.1', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F1_H6"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '0.1', aux, buildingpart) #-- This one is with the chimney or eaves
-
-    if VARIANTS:
-        CityGMLbuildingLOD0(CityGMLs["LOD0_1_Fd_H0"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '0.1', aux, buildingpart, True) #-- This one is with the eaves
-        CityGMLbuildingLOD0(CityGMLs["LOD0_1_Fd_H1"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '0.1', aux, buildingpart, True)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_1_Fd_H2"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '0.1', aux, buildingpart, True)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_1_Fd_H3"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '0.1', aux, buildingpart, True)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_1_Fd_H4"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '0.1', aux, buildingpart, True)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_1_Fd_H5"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '0.1', aux, buildingpart, True)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_1_Fd_H6"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '0.1', aux, buildingpart, True) #-- This one is with the chimney or eaves
-
-    ##-- LOD0.2
-    if VARIANTS:
-        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F0_H0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '0.2', aux, buildingpart) #-- This one is with the eaves
-        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F0_H1"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '0.2', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F0_H2"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '0.2', aux, buildingpart)
-    CityGMLbuildingLOD0(CityGMLs["LOD0_2_F0_H3"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '0.2', aux, buildingpart)
-    if VARIANTS:
-        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F0_H4"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '0.2', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F0_H5"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '0.2', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F0_H6"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '0.2', aux, buildingpart) #-- This one is with the chimney or eaves
-
-    if VARIANTS:
-        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F1_H0"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '0.2', aux, buildingpart) #-- This one is with the eaves
-        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F1_H1"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '0.2', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F1_H2"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '0.2', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F1_H3"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '0.2', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F1_H4"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '0.2', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F1_H5"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '0.2', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F1_H6"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '0.2', aux, buildingpart) #-- This one is with the chimney or eaves
-
-    if VARIANTS:
-        CityGMLbuildingLOD0(CityGMLs["LOD0_2_Fd_H0"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '0.2', aux, buildingpart, True) #-- This one is with the eaves
-        CityGMLbuildingLOD0(CityGMLs["LOD0_2_Fd_H1"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '0.2', aux, buildingpart, True)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_2_Fd_H2"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '0.2', aux, buildingpart, True)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_2_Fd_H3"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '0.2', aux, buildingpart, True)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_2_Fd_H4"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '0.2', aux, buildingpart, True)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_2_Fd_H5"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '0.2', aux, buildingpart, True)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_2_Fd_H6"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '0.2', aux, buildingpart, True) #-- This one is with the chimney or eaves
-
-    ##-- LOD0.3
-    if VARIANTS:
-        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F0_H0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '0.3', aux, buildingpart) #-- This one is with the eaves
-        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F0_H1"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '0.3', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F0_H2"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '0.3', aux, buildingpart)
-    CityGMLbuildingLOD0(CityGMLs["LOD0_3_F0_H3"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '0.3', aux, buildingpart)
-    if VARIANTS:
-        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F0_H4"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '0.3', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F0_H5"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '0.3', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F0_H6"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '0.3', aux, buildingpart) #-- This one is with the chimney or eaves
-
-    if VARIANTS:
-        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F1_H0"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '0.3', aux, buildingpart) #-- This one is with the eaves
-        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F1_H1"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '0.3', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F1_H2"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '0.3', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F1_H3"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '0.3', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F1_H4"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '0.3', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F1_H5"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '0.3', aux, buildingpart)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F1_H6"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '0.3', aux, buildingpart) #-- This one is with the chimney or eaves
-
-    if VARIANTS:
-        CityGMLbuildingLOD0(CityGMLs["LOD0_3_Fd_H0"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '0.3', aux, buildingpart, True) #-- This one is with the eaves
-        CityGMLbuildingLOD0(CityGMLs["LOD0_3_Fd_H1"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '0.3', aux, buildingpart, True)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_3_Fd_H2"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '0.3', aux, buildingpart, True)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_3_Fd_H3"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '0.3', aux, buildingpart, True)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_3_Fd_H4"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '0.3', aux, buildingpart, True)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_3_Fd_H5"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '0.3', aux, buildingpart, True)
-        CityGMLbuildingLOD0(CityGMLs["LOD0_3_Fd_H6"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '0.3', aux, buildingpart, True) #-- This one is with the chimney or eaves
-
-
-    #####-- LOD1
-
-    ##-- LOD1.3
-    #- Multisurface (brep)
-    if VARIANTS:
-        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F0_H0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '1.1', aux, buildingpart) #-- This one is with the eaves
-        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F0_H1"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '1.1', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F0_H2"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '1.1', aux, buildingpart)
-    CityGMLbuildingLOD1(CityGMLs["LOD1_1_F0_H3"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '1.1', aux, buildingpart)
-    if VARIANTS:
-        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F0_H4"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '1.1', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F0_H5"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '1.1', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F0_H6"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '1.1', aux, buildingpart) #-- This one is with the chimney or eaves
-
-    if VARIANTS:
-        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F1_H0"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '1.1', aux, buildingpart) #-- This one is with the eaves
-        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F1_H1"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '1.1', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F1_H2"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '1.1', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F1_H3"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '1.1', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F1_H4"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '1.1', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F1_H5"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '1.1', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F1_H6"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '1.1', aux, buildingpart) #-- This one is with the chimney or eaves
-
-    if VARIANTS:
-        CityGMLbuildingLOD1(CityGMLs["LOD1_1_Fd_H0"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '1.1', aux, buildingpart, True) #-- This one is with the eaves
-        CityGMLbuildingLOD1(CityGMLs["LOD1_1_Fd_H1"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '1.1', aux, buildingpart, True)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_1_Fd_H2"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '1.1', aux, buildingpart, True)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_1_Fd_H3"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '1.1', aux, buildingpart, True)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_1_Fd_H4"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '1.1', aux, buildingpart, True)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_1_Fd_H5"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '1.1', aux, buildingpart, True)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_1_Fd_H6"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '1.1', aux, buildingpart, True) #-- This one is with the chimney or eaves
-    
-    #- Solids
-    if SOLIDS:
-        if VARIANTS:
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F0_H0_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '1.1', aux, buildingpart) #-- This one is with the eaves
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F0_H1_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '1.1', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F0_H2_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '1.1', aux, buildingpart)
-        CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F0_H3_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '1.1', aux, buildingpart)
-        if VARIANTS:
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F0_H4_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '1.1', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F0_H5_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '1.1', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F0_H6_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '1.1', aux, buildingpart) #-- This one is with the chimney or eaves
-
-        if VARIANTS:
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F1_H0_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '1.1', aux, buildingpart) #-- This one is with the eaves
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F1_H1_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '1.1', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F1_H2_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '1.1', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F1_H3_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '1.1', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F1_H4_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '1.1', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F1_H5_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '1.1', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F1_H6_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '1.1', aux, buildingpart) #-- This one is with the chimney or eaves
-
-        if VARIANTS:
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_Fd_H0_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '1.1', aux, buildingpart, True) #-- This one is with the eaves
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_Fd_H1_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '1.1', aux, buildingpart, True)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_Fd_H2_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '1.1', aux, buildingpart, True)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_Fd_H3_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '1.1', aux, buildingpart, True)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_Fd_H4_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '1.1', aux, buildingpart, True)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_Fd_H5_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '1.1', aux, buildingpart, True)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_Fd_H6_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '1.1', aux, buildingpart, True) #-- This one is with the chimney or eaves
-
-        #- Enhanced semantics
-        if VARIANTS:
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F0_H0_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '1.1', aux, buildingpart) #-- This one is with the eaves
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F0_H1_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '1.1', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F0_H2_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '1.1', aux, buildingpart)
-        CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F0_H3_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '1.1', aux, buildingpart)
-        if VARIANTS:
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F0_H4_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '1.1', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F0_H5_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '1.1', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F0_H6_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '1.1', aux, buildingpart) #-- This one is with the chimney or eaves
-
-        if VARIANTS:
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F1_H0_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '1.1', aux, buildingpart) #-- This one is with the eaves
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F1_H1_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '1.1', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F1_H2_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '1.1', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F1_H3_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '1.1', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F1_H4_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '1.1', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F1_H5_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '1.1', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F1_H6_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '1.1', aux, buildingpart) #-- This one is with the chimney or eaves
-
-        if VARIANTS:
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_Fd_H0_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '1.1', aux, buildingpart, True) #-- This one is with the eaves
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_Fd_H1_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '1.1', aux, buildingpart, True)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_Fd_H2_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '1.1', aux, buildingpart, True)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_Fd_H3_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '1.1', aux, buildingpart, True)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_Fd_H4_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '1.1', aux, buildingpart, True)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_Fd_H5_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '1.1', aux, buildingpart, True)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_Fd_H6_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '1.1', aux, buildingpart, True) #-- This one is with the chimney or eaves
-
-
-    ##-- LOD1.2
-    #- Multisurface (brep)
-    if VARIANTS:
-        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F0_H0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '1.2', aux, buildingpart) #-- This one is with the eaves
-        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F0_H1"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '1.2', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F0_H2"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '1.2', aux, buildingpart)
-    CityGMLbuildingLOD1(CityGMLs["LOD1_2_F0_H3"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '1.2', aux, buildingpart)
-    if VARIANTS:
-        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F0_H4"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '1.2', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F0_H5"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '1.2', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F0_H6"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '1.2', aux, buildingpart) #-- This one is with the chimney or eaves
-
-    if VARIANTS:
-        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F1_H0"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '1.2', aux, buildingpart) #-- This one is with the eaves
-        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F1_H1"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '1.2', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F1_H2"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '1.2', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F1_H3"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '1.2', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F1_H4"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '1.2', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F1_H5"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '1.2', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F1_H6"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '1.2', aux, buildingpart) #-- This one is with the chimney or eaves
-
-    if VARIANTS:
-        CityGMLbuildingLOD1(CityGMLs["LOD1_2_Fd_H0"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '1.2', aux, buildingpart, True) #-- This one is with the eaves
-        CityGMLbuildingLOD1(CityGMLs["LOD1_2_Fd_H1"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '1.2', aux, buildingpart, True)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_2_Fd_H2"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '1.2', aux, buildingpart, True)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_2_Fd_H3"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '1.2', aux, buildingpart, True)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_2_Fd_H4"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '1.2', aux, buildingpart, True)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_2_Fd_H5"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '1.2', aux, buildingpart, True)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_2_Fd_H6"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '1.2', aux, buildingpart, True) #-- This one is with the chimney or eaves
-
-    #- Solids
-    if SOLIDS:
-        if VARIANTS:
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F0_H0_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '1.2', aux, buildingpart) #-- This one is with the eaves
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F0_H1_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '1.2', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F0_H2_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '1.2', aux, buildingpart)
-        CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F0_H3_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '1.2', aux, buildingpart)
-        if VARIANTS:
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F0_H4_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '1.2', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F0_H5_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '1.2', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F0_H6_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '1.2', aux, buildingpart) #-- This one is with the chimney or eaves
-
-        if VARIANTS:
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F1_H0_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '1.2', aux, buildingpart) #-- This one is with the eaves
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F1_H1_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '1.2', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F1_H2_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '1.2', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F1_H3_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '1.2', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F1_H4_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '1.2', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F1_H5_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '1.2', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F1_H6_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '1.2', aux, buildingpart) #-- This one is with the chimney or eaves
-
-        if VARIANTS:
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_Fd_H0_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '1.2', aux, buildingpart, True) #-- This one is with the eaves
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_Fd_H1_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '1.2', aux, buildingpart, True)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_Fd_H2_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '1.2', aux, buildingpart, True)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_Fd_H3_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '1.2', aux, buildingpart, True)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_Fd_H4_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '1.2', aux, buildingpart, True)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_Fd_H5_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '1.2', aux, buildingpart, True)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_Fd_H6_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '1.2', aux, buildingpart, True) #-- This one is with the chimney or eaves
-
-
-        #- Semantics
-        if VARIANTS:
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F0_H0_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '1.2', aux, buildingpart) #-- This one is with the eaves
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F0_H1_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '1.2', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F0_H2_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '1.2', aux, buildingpart)
-        CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F0_H3_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '1.2', aux, buildingpart)
-        if VARIANTS:
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F0_H4_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '1.2', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F0_H5_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '1.2', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F0_H6_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '1.2', aux, buildingpart) #-- This one is with the chimney or eaves
-
-        if VARIANTS:
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F1_H0_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '1.2', aux, buildingpart) #-- This one is with the eaves
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F1_H1_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '1.2', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F1_H2_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '1.2', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F1_H3_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '1.2', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F1_H4_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '1.2', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F1_H5_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '1.2', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F1_H6_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '1.2', aux, buildingpart) #-- This one is with the chimney or eaves
-
-        if VARIANTS:
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_Fd_H0_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '1.2', aux, buildingpart, True) #-- This one is with the eaves
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_Fd_H1_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '1.2', aux, buildingpart, True)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_Fd_H2_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '1.2', aux, buildingpart, True)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_Fd_H3_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '1.2', aux, buildingpart, True)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_Fd_H4_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '1.2', aux, buildingpart, True)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_Fd_H5_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '1.2', aux, buildingpart, True)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_Fd_H6_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '1.2', aux, buildingpart, True) #-- This one is with the chimney or eaves
-
-
-    ##-- LOD1.3
-    #- Multisurface (brep)
-    if VARIANTS:
-        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F0_H0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '1.3', aux, buildingpart) #-- This one is with the eaves
-        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F0_H1"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '1.3', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F0_H2"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '1.3', aux, buildingpart)
-    CityGMLbuildingLOD1(CityGMLs["LOD1_3_F0_H3"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '1.3', aux, buildingpart)
-    if VARIANTS:
-        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F0_H4"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '1.3', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F0_H5"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '1.3', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F0_H6"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '1.3', aux, buildingpart) #-- This one is with the chimney or eaves
-
-    if VARIANTS:
-        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F1_H0"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '1.3', aux, buildingpart) #-- This one is with the eaves
-        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F1_H1"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '1.3', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F1_H2"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '1.3', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F1_H3"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '1.3', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F1_H4"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '1.3', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F1_H5"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '1.3', aux, buildingpart)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F1_H6"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '1.3', aux, buildingpart) #-- This one is with the chimney or eaves
-
-    if VARIANTS:
-        CityGMLbuildingLOD1(CityGMLs["LOD1_3_Fd_H0"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '1.3', aux, buildingpart, True) #-- This one is with the eaves
-        CityGMLbuildingLOD1(CityGMLs["LOD1_3_Fd_H1"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '1.3', aux, buildingpart, True)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_3_Fd_H2"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '1.3', aux, buildingpart, True)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_3_Fd_H3"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '1.3', aux, buildingpart, True)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_3_Fd_H4"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '1.3', aux, buildingpart, True)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_3_Fd_H5"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '1.3', aux, buildingpart, True)
-        CityGMLbuildingLOD1(CityGMLs["LOD1_3_Fd_H6"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '1.3', aux, buildingpart, True) #-- This one is with the chimney or eaves
-
-    #- Solids
-    if SOLIDS:
-        if VARIANTS:
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F0_H0_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '1.3', aux, buildingpart) #-- This one is with the eaves
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F0_H1_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '1.3', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F0_H2_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '1.3', aux, buildingpart)
-        CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F0_H3_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '1.3', aux, buildingpart)
-        if VARIANTS:
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F0_H4_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '1.3', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F0_H5_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '1.3', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F0_H6_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '1.3', aux, buildingpart) #-- This one is with the chimney or eaves
-
-        if VARIANTS:
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F1_H0_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '1.3', aux, buildingpart) #-- This one is with the eaves
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F1_H1_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '1.3', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F1_H2_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '1.3', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F1_H3_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '1.3', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F1_H4_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '1.3', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F1_H5_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '1.3', aux, buildingpart)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F1_H6_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '1.3', aux, buildingpart) #-- This one is with the chimney or eaves
-
-        if VARIANTS:
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_Fd_H0_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '1.3', aux, buildingpart, True) #-- This one is with the eaves
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_Fd_H1_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '1.3', aux, buildingpart, True)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_Fd_H2_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '1.3', aux, buildingpart, True)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_Fd_H3_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '1.3', aux, buildingpart, True)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_Fd_H4_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '1.3', aux, buildingpart, True)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_Fd_H5_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '1.3', aux, buildingpart, True)
-            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_Fd_H6_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '1.3', aux, buildingpart, True) #-- This one is with the chimney or eaves
-
-        #- Semantics
-        if VARIANTS:
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F0_H0_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '1.3', aux, buildingpart) #-- This one is with the eaves
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F0_H1_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '1.3', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F0_H2_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '1.3', aux, buildingpart)
-        CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F0_H3_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '1.3', aux, buildingpart)
-        if VARIANTS:
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F0_H4_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '1.3', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F0_H5_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '1.3', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F0_H6_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '1.3', aux, buildingpart) #-- This one is with the chimney or eaves
-
-        if VARIANTS:
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F1_H0_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '1.3', aux, buildingpart) #-- This one is with the eaves
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F1_H1_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '1.3', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F1_H2_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '1.3', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F1_H3_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '1.3', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F1_H4_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '1.3', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F1_H5_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '1.3', aux, buildingpart)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F1_H6_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '1.3', aux, buildingpart) #-- This one is with the chimney or eaves
-
-        if VARIANTS:
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_Fd_H0_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '1.3', aux, buildingpart, True) #-- This one is with the eaves
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_Fd_H1_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '1.3', aux, buildingpart, True)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_Fd_H2_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '1.3', aux, buildingpart, True)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_Fd_H3_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '1.3', aux, buildingpart, True)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_Fd_H4_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '1.3', aux, buildingpart, True)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_Fd_H5_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '1.3', aux, buildingpart, True)
-            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_Fd_H6_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '1.3', aux, buildingpart, True) #-- This one is with the chimney or eaves
-
-
-    #--LOD2
-    #-LOD2.0
-    CityGMLbuildingLOD2Semantics(CityGMLs["LOD2_0_F0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, r, None, '2.0', aux, buildingpart)
-    if VARIANTS:
-        CityGMLbuildingLOD2Semantics(CityGMLs["LOD2_0_F1"], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, adjr, None, '2.0', aux, buildingpart)
-        CityGMLbuildingLOD2Semantics(CityGMLs["LOD2_0_Fd"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, adjr_offset, None, '2.0', aux, buildingpart, True)
-    if SOLIDS:
-        CityGMLbuildingLOD2Solid(CityGMLs["LOD2_0_F0_S0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, r, None, 'brep', '2.0', aux, buildingpart)
-    if SOLIDS:
-        if VARIANTS:
-            CityGMLbuildingLOD2Solid(CityGMLs["LOD2_0_F1_S0"], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, adjr, None, 'brep', '2.0', aux, buildingpart)
-            CityGMLbuildingLOD2Solid(CityGMLs["LOD2_0_Fd_S0"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, adjr_offset, None, 'brep', '2.0', aux, buildingpart, True)
-        CityGMLbuildingLOD2Solid(CityGMLs["LOD2_0_F0_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, r, None, 'solid', '2.0', aux, buildingpart)
-        if VARIANTS:
-            CityGMLbuildingLOD2Solid(CityGMLs["LOD2_0_F1_solid"], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, adjr, None, 'solid', '2.0', aux, buildingpart)
-            CityGMLbuildingLOD2Solid(CityGMLs["LOD2_0_Fd_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, adjr_offset, None, 'solid', '2.0', aux, buildingpart, True)
-
-    #-LOD2.1
-    CityGMLbuildingLOD2Semantics(CityGMLs["LOD2_1_F0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, r, None, '2.1', aux, buildingpart)
-    if VARIANTS:
-        CityGMLbuildingLOD2Semantics(CityGMLs["LOD2_1_F1"], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, adjr, None, '2.1', aux, buildingpart)
-        CityGMLbuildingLOD2Semantics(CityGMLs["LOD2_1_Fd"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, adjr_offset, None, '2.1', aux, buildingpart, True)
-    if SOLIDS: 
-        CityGMLbuildingLOD2Solid(CityGMLs["LOD2_1_F0_S0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, r, None, 'brep', '2.1', aux, buildingpart)
-        if VARIANTS:
-            CityGMLbuildingLOD2Solid(CityGMLs["LOD2_1_F1_S0"], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, adjr, None, 'brep', '2.1', aux, buildingpart)
-            CityGMLbuildingLOD2Solid(CityGMLs["LOD2_1_Fd_S0"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, adjr_offset, None, 'brep', '2.1', aux, buildingpart, True)   
-        CityGMLbuildingLOD2Solid(CityGMLs["LOD2_1_F0_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, r, None, 'solid', '2.1', aux, buildingpart)
-        if VARIANTS:
-            CityGMLbuildingLOD2Solid(CityGMLs["LOD2_1_F1_solid"], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, adjr, None, 'solid', '2.1', aux, buildingpart)
-            CityGMLbuildingLOD2Solid(CityGMLs["LOD2_1_Fd_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, adjr_offset, None, 'solid', '2.1', aux, buildingpart, True)
-
-
-    #-LOD2.2
-    #-Realised with LOD3 functions for programming reasons
-    CityGMLbuildingLOD3Semantics(CityGMLs['LOD2_2_F0'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, [0.0, 0.0], r, None, None, dormers, None, None, None, 1, aux, buildingpart, True)
-    if SOLIDS:
-        CityGMLbuildingLOD3Solid(CityGMLs['LOD2_2_F0_solid'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, [0.0, 0.0], r, None, None, dormers, None, None, None, additional, 'solid', aux, buildingpart)
-        CityGMLbuildingLOD3Solid(CityGMLs['LOD2_2_F0_S0'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, [0.0, 0.0], r, None, None, dormers, None, None, None, additional, 'brep', aux, buildingpart)
-    if VARIANTS:
-        CityGMLbuildingLOD3Semantics(CityGMLs['LOD2_2_F1'], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, [0.0, 0.0], adjr, None, None, dormers_ovh, None, None, None, 1, aux, buildingpart, True)
-        CityGMLbuildingLOD3Semantics(CityGMLs['LOD2_2_Fd'], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, [offset, offset], adjr_offset, None, None, dormers_offset, None, None, None, 1, aux, buildingpart, True)
-        if SOLIDS:
-            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_2_F1_solid'], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, [0.0, 0.0], adjr, None, None, dormers_ovh, None, None, None, additional, 'solid', aux, buildingpart)
-            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_2_F1_S0'], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, [0.0, 0.0], adjr, None, None, dormers_ovh, None, None, None, additional, 'brep', aux, buildingpart)
-            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_2_Fd_solid'], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, [offset, offset], adjr_offset, None, None, dormers_offset, None, None, None, additional, 'solid', aux, buildingpart)
-            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_2_Fd_S0'], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, [offset, offset], adjr_offset, None, None, dormers_offset, None, None, None, additional, 'brep', aux, buildingpart)
-
-    #-LOD2.3
-    CityGMLbuildingLOD2Semantics(CityGMLs["LOD2_3_F0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, r, ovh, '2.3', aux, buildingpart)
-
-    if VARIANTS:
-        CityGMLbuildingLOD2Semantics(CityGMLs["LOD2_3_Fd"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, adjr_offset, [offset, offset], '2.3', aux, buildingpart, True)
-        if SOLIDS:
-            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_3_F0_S0'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, None, None, None, None, None, None, additional, 'brep', aux, buildingpart)
-        if VARIANTS and SOLIDS:
-            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_3_Fd_S0'], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, [offset, offset], adjr_offset, None, None, None, None, None, None, additional, 'brep', aux, buildingpart)
-        if SOLIDS:
-            CityGMLbuildingLOD3Solid(CityGMLs["LOD2_3_F0_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, [0.0, 0.0], r, None, None, None, None, None, None, additional, 'solid', aux, buildingpart)
-        if VARIANTS and SOLIDS:
-            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_3_Fd_solid'], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, [offset, offset], adjr_offset, None, None, None, None, None, None, additional, 'solid', aux, buildingpart)
-
-    #-LOD2.3 with dormers
-    #-Realised with LOD3 functions for programming reasons
-    if VARIANTS:
-        CityGMLbuildingLOD3Semantics(CityGMLs['LOD2_3_F0_with_dormers'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, None, None, dormers, None, None, None, 1, aux, buildingpart, True)
-        if SOLIDS:
-            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_3_F0_solid_with_dormers'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, None, None, dormers, None, None, None, additional, 'solid', aux, buildingpart)
-            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_3_F0_S0_with_dormers'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, None, None, dormers, None, None, None, additional, 'brep', aux, buildingpart)
-        CityGMLbuildingLOD3Semantics(CityGMLs['LOD2_3_Fd_with_dormers'], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, [offset, offset], adjr_offset, None, None, dormers_offset, None, None, None, 1, aux, buildingpart, True)
-        if SOLIDS:
-            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_3_Fd_solid_with_dormers'], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, [offset, offset], adjr_offset, None, None, dormers_offset, None, None, None, additional, 'solid', aux, buildingpart)
-            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_3_Fd_S0_with_dormers'], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, [offset, offset], adjr_offset, None, None, dormers_offset, None, None, None, additional, 'brep', aux, buildingpart)
-
-
-
-    #-- LOD3 variants
-    #-- LOD3.0
-    CityGMLbuildingLOD3Semantics(CityGMLs['LOD3_2'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, doorDict, wallWindows, dormers, roofWindows, chimney, None, 1, aux, buildingpart)
-    if SOLIDS:
-        CityGMLbuildingLOD3Solid(CityGMLs['LOD3_2_solid'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, None, None, dormers, None, None, None, additional, 'solid', aux, buildingpart)
-        CityGMLbuildingLOD3Solid(CityGMLs['LOD3_2_S0'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, None, None, dormers, None, None, None, additional, 'brep', aux, buildingpart)
-    #-- LOD3.1
-    CityGMLbuildingLOD3Semantics(CityGMLs['LOD3_3'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, doorDict, wallWindows, dormers, roofWindows, chimney, embrasure, 1, aux, buildingpart)
-    if SOLIDS:
-        CityGMLbuildingLOD3Solid(CityGMLs['LOD3_3_solid'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, doorDict, wallWindows, dormers, roofWindows, chimney, embrasure, 1, 'solid', aux, buildingpart)
-        CityGMLbuildingLOD3Solid(CityGMLs['LOD3_3_S0'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, doorDict, wallWindows, dormers, roofWindows, chimney, embrasure, 1, 'brep', aux, buildingpart)
-    #-- Hybrid models
-    CityGMLbuildingLOD3Semantics(CityGMLs['LOD3_1'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, doorDict, wallWindows, None, None, None, None, 1, aux, buildingpart)
-    CityGMLbuildingLOD3Semantics(CityGMLs['LOD3_0'], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, [0.0, 0.0], adjr, None, None, dormers_ovh, roofWindows_ovh, chimney_ovh, None, 1, aux, buildingpart, True)
-    if SOLIDS:
-        CityGMLbuildingLOD3Solid(CityGMLs['LOD3_1_solid'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, doorDict, wallWindows, None, None, None, None, 1, 'solid', aux, buildingpart)
-        CityGMLbuildingLOD3Solid(CityGMLs['LOD3_0_solid'], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, [0.0, 0.0], adjr, None, None, dormers_ovh, roofWindows_ovh, chimney_ovh, None, 1, 'solid', aux, buildingpart, True)
-        CityGMLbuildingLOD3Solid(CityGMLs['LOD3_1_S0'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, doorDict, wallWindows, None, None, None, None, 1, 'brep', aux, buildingpart)
-        CityGMLbuildingLOD3Solid(CityGMLs['LOD3_0_S0'], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, [0.0, 0.0], adjr, None, None, dormers_ovh, roofWindows_ovh, chimney_ovh, None, 1, 'brep', aux, buildingpart, True)
-    # #-- BI without structured semantics
-    # CityGMLbuildingLOD3Semantics(CityGMLs['LOD3BI'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, doorDict, wallWindows, dormers, roofWindows, chimney, embrasure, 0)
-    # CityGMLbuildingLOD3Semantics(CityGMLs['LOD3RF1'], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, [0.0, 0.0], adjr, None, None, dormers, roofWindows, chimney, embrasure, additional)
-    # #CityGMLbuildingLOD3Solid(CityGMLs['LOD3-solid'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, None, None, dormers, None, None, None, additional)
-
-    #-- Interior
-    CityGMLbuildingInteriorLOD0(CityGMLs['interior-LOD0'], ID, attributes, origin_coords, xsize, ysize, zsize, h, floors, floorHeight, roofType, r, wallThickness, joist, aux, buildingpart)
-    CityGMLbuildingInteriorLOD1(CityGMLs['interior-LOD1'], ID, attributes, origin_coords, xsize, ysize, zsize, h, floors, floorHeight, roofType, r, wallThickness, joist, aux, buildingpart)
-    CityGMLbuildingInteriorLOD2(CityGMLs['interior-LOD2_2'], ID, attributes, origin_coords, xsize, ysize, zsize, h, floors, floorHeight, roofType, r, wallThickness, joist, aux, buildingpart)
-    CityGMLbuildingInteriorLOD2(CityGMLs['interior-LOD2_3'], ID, attributes, origin_coords, xsize, ysize, zsize, h, floors, floorHeight, roofType, r, wallThickness, joist, aux, buildingpart, dormers)
-
-    #-- Perform the rotation of coordinates
-    if ROTATIONENABLED:
-        radian_rotation = math.radians(angle_of_rotation)
-        sine_rotation = math.sin(radian_rotation)
-        cosine_rotation = math.cos(radian_rotation)
-        for representation in CityGMLs:
-            for entity in CityGMLs[representation]:
-                #-- Iterate cityObjectMembers
-                if entity.tag == "cityObjectMember":
-                    #-- Select the current one
-                    if entity.getchildren()[0].attrib['{%s}id' % ns_gml] == ID:
-                        #-- Get the building XML node
-                        curr_b_inxml = entity.getchildren()[0]
-                        #-- Store all the <gml:posList> in a list
-                        posList_to_rotate = curr_b_inxml.findall(".//{%s}posList" % ns_gml)
-                        for pos in posList_to_rotate:
-                            points_to_rotate = GMLstring2points(pos.text)
-                            new_rotated_points = ''
-                            for point_to_rotate in points_to_rotate:
-                                rotated_point = rotator(point_to_rotate, sine_rotation, cosine_rotation, origin_coords)
-                                new_rotated_points += GMLPointList(rotated_point) + ' '
-                            pos.text = new_rotated_points[:-1]
-
-#-- End of loop of each building
-
-if STREETS:
-    for s in streets:
-        street_outline = s.findall('outline')[0]
-        street_outline_coors = [float(x) for x in street_outline.text.split(" ")]
-        street_holes_collection = s.findall('holes')[0]
-        street_holes = street_holes_collection.findall('hole')
-        street_data = [street_outline_coors, []]
-        for street_hole in street_holes:
-            street_hole_coors = [float(x) for x in street_hole.text.split(" ")]
-            street_data[1].append(street_hole_coors)        
-        CityGMLstreets(CityGMLs['Road-LOD0'], street_data)
-
-if VEGETATION:
-    for pccollection in plantcover:
-        pcs = pccollection.findall('park')
-        for pc in pcs:
-            park_outline = pc.findall('outline')[0]
-            park_outline_coors = [float(x) for x in park_outline.text.split(" ")]
-            park_height = pc.findall('height')[0].text
-            pc_data = [park_outline_coors, park_height]
-            CityGMLplantCoverLOD0(CityGMLs['PlantCover-LOD0'], pc_data)
-            CityGMLplantCoverLOD1(CityGMLs['PlantCover-LOD1'], pc_data)
-
-#-- Write to file(s)
-print("\nGenerated", len(CityGMLs), "CityGML file(s) in the memory. Now writing to disk...")
-filecounter = 0
-if REPORT:
-    fish = ProgressFish(total=len(CityGMLs))
-for element in CityGMLs:
-    #-- Report on the progress
     if REPORT:
-        fish.animate(amount=filecounter+1)
-    filecounter += 1
-    # print(filecounter, "...", end=' ')
-    storeCityGML(element)
+        stopReporter(reporter)
+    return len(buildings)
+
 
-print("\nWritten the CityGML file(s). Cleaning the memory...")
\ No newline at end of file
+#----------------------------------------------------------------------
+#-- Start of the program
+if __name__ == '__main__':
+    generateCity(sys.argv[1:], True, (STARTTIME, STARTCPU))
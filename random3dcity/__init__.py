@@ -0,0 +1,4 @@
+"""
+Components of the engine that constructs the CityGML files (generateCityGML.py).
+Nothing is imported here: the script imports each module only if the run needs it.
+"""
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT)
+
+# This code is part of the Random3Dcity package
+
+# Copyright (c) 2015
+# Filip Biljecki
+# Delft University of Technology
+# fbiljecki@gmail.com
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Geometric metrics, validation and deviations of the polygons of the representations.
+"""
+
+from lxml import etree
+import numpy
+
+from random3dcity.geometry import ns_gml
+
+
+#-- Semantic classes of the surfaces and of the geometric properties of the buildings
+SURFACECLASSES = {'GroundSurface': 'ground', 'WallSurface': 'wall', 'RoofSurface': 'roof', 'Door': 'opening', 'Window': 'opening', 'lod0FootPrint': 'ground', 'lod0RoofEdge': 'roof'}
+#-- Classes that are not covered by the table, e.g. ClosureSurface, OuterCeilingSurface and BuildingInstallation
+OTHERCLASSES = ['ClosureSurface', 'OuterCeilingSurface', 'OuterFloorSurface', 'BuildingInstallation']
+
+#-- Tolerances of the validation, in metres
+PLANARITYTOLERANCE = 0.001
+SNAPTOLERANCE = 0.000001
+#-- Differences between representations below which they are the same, in metres (or square and cubic metres)
+DEVIATIONTOLERANCE = 0.000001
+
+
+def polygonArrays(elements):
+    """Coordinates of all the polygons in CityGML elements.
+    Output: the array of vertices of all the rings, the index of the first vertex of each ring, the polygon of each ring, whether each ring is an interior one, the class of each polygon (None if the polygon has no semantics) and the polygons."""
+    texts = []
+    ringpolygon = []
+    interior = []
+    classes = []
+    polygons = []
+    for Polygon in [Polygon for element in elements for Polygon in element.iter('{%s}Polygon' % ns_gml)]:
+        surfaceclass = None
+        for ancestor in Polygon.iterancestors():
+            name = etree.QName(ancestor).localname
+            if name in SURFACECLASSES:
+                surfaceclass = SURFACECLASSES[name]
+                break
+            elif name in OTHERCLASSES:
+                surfaceclass = 'other'
+                break
+        for posList in Polygon.iter('{%s}posList' % ns_gml):
+            texts.append(posList.text)
+            ringpolygon.append(len(classes))
+            interior.append(posList.getparent().getparent().tag == '{%s}interior' % ns_gml)
+        classes.append(surfaceclass)
+        polygons.append(Polygon)
+    counts = numpy.array([len(text.split()) // 3 for text in texts], dtype=int)
+    vertices = numpy.array(' '.join(texts).split(), dtype=float).reshape(-1, 3)
+    starts = numpy.cumsum(counts) - counts
+    return vertices, starts, numpy.array(ringpolygon, dtype=int), numpy.array(interior, dtype=bool), classes, polygons
+
+
+def ringVectorAreas(vertices, starts):
+    """Vector areas (Newell's method) of closed rings stored one after another, computed at once for all the rings."""
+    crossed = numpy.cross(vertices[:-1], vertices[1:])
+    #-- The pairs of the last vertex of a ring and the first vertex of the next ring do not form an edge
+    crossed[starts[1:] - 1] = 0.0
+    return 0.5 * numpy.add.reduceat(crossed, starts, axis=0)
+
+
+def geometricMetrics(arrays):
+    """Volume, areas per semantic class and heights of a building.
+    The volume is given only if the polygons form closed, consistently and outwards oriented shells (see shellErrors), for which it is exact, and is None otherwise.
+    Polygons without semantics are classified by their orientation: horizontal normals are walls, upward normals roofs, and the downward facing polygons at the bottom of the building ground."""
+    vertices, starts, ringpolygon, interior, classes, polygons = arrays
+    if len(classes) == 0:
+        return None
+    ringareas = ringVectorAreas(vertices, starts)
+    polygonareas = numpy.zeros((len(classes), 3))
+    numpy.add.at(polygonareas, ringpolygon, ringareas)
+    areas = numpy.sqrt((polygonareas ** 2).sum(axis=1))
+    if len(shellErrors(vertices, starts)) == 0:
+        volume = (vertices[starts] * ringareas).sum() / 3.0
+    else:
+        volume = None
+    zMin = vertices[:, 2].min()
+    zMax = vertices[:, 2].max()
+    #-- Mean height of each polygon, for the classification and the height of the roof
+    ends = numpy.append(starts[1:], len(vertices))
+    ringz = (numpy.add.reduceat(vertices[:, 2], starts) - vertices[ends - 1, 2]) / (ends - starts - 1)
+    polygonz = numpy.zeros(len(classes))
+    numpy.add.at(polygonz, ringpolygon, ringz)
+    polygonz /= numpy.bincount(ringpolygon, minlength=len(classes))
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        nz = polygonareas[:, 2] / areas
+    labels = numpy.array(['other'] * len(classes), dtype=object)
+    for i in range(len(classes)):
+        if classes[i] is not None:
+            labels[i] = classes[i]
+        elif abs(nz[i]) < 0.01:
+            labels[i] = 'wall'
+        elif nz[i] > 0:
+            labels[i] = 'roof'
+        elif abs(polygonz[i] - zMin) < 1e-6:
+            labels[i] = 'ground'
+    metrics = {'polygons': len(classes), 'area': areas.sum(), 'volume': volume, 'zMin': zMin, 'zMax': zMax, 'height': zMax - zMin}
+    for label in ['ground', 'wall', 'roof', 'opening', 'other']:
+        metrics[label + 'Area'] = areas[labels == label].sum()
+    metrics['footprintArea'] = numpy.abs(polygonareas[labels == 'ground', 2]).sum()
+    roof = labels == 'roof'
+    if areas[roof].sum() > 0:
+        metrics['roofHeight'] = (polygonz[roof] * areas[roof]).sum() / areas[roof].sum()
+    else:
+        metrics['roofHeight'] = None
+    return metrics
+
+
+def polygonErrors(vertices, starts, ringpolygon, interior, polygons):
+    """Find the rings that are not closed, the polygons that are degenerate or not planar, and the interior rings that are not inside their exterior ring.
+    Output: list of (error, polygon index, value)."""
+    errors = []
+    ends = numpy.append(starts[1:], len(vertices))
+    #-- Closure of the rings
+    gaps = numpy.sqrt(((vertices[starts] - vertices[ends - 1]) ** 2).sum(axis=1))
+    for ring in numpy.nonzero(gaps > SNAPTOLERANCE)[0]:
+        errors.append(('ring not closed', ringpolygon[ring], gaps[ring]))
+    #-- Consecutive vertices at the same location
+    lengths = numpy.sqrt(((vertices[1:] - vertices[:-1]) ** 2).sum(axis=1))
+    lengths[starts[1:] - 1] = numpy.inf
+    shortedges = numpy.zeros(len(starts), dtype=int)
+    numpy.add.at(shortedges, numpy.searchsorted(starts, numpy.nonzero(lengths < SNAPTOLERANCE)[0], side='right') - 1, 1)
+    for ring in numpy.nonzero(shortedges)[0]:
+        errors.append(('repeated consecutive vertices', ringpolygon[ring], shortedges[ring]))
+    #-- Normal of each polygon from its vector area
+    polygonareas = numpy.zeros((len(polygons), 3))
+    numpy.add.at(polygonareas, ringpolygon, ringVectorAreas(vertices, starts))
+    areas = numpy.sqrt((polygonareas ** 2).sum(axis=1))
+    for polygon in numpy.nonzero(areas < SNAPTOLERANCE)[0]:
+        errors.append(('degenerate polygon', polygon, areas[polygon]))
+    normals = polygonareas / numpy.maximum(areas, SNAPTOLERANCE)[:, None]
+    #-- Distance of each vertex to the plane through the first vertex of its polygon
+    vertexring = numpy.repeat(numpy.arange(len(starts)), ends - starts)
+    vertexpolygon = ringpolygon[vertexring]
+    firstvertex = vertices[starts[numpy.searchsorted(ringpolygon, numpy.arange(len(polygons)))]]
+    distances = numpy.abs(((vertices - firstvertex[vertexpolygon]) * normals[vertexpolygon]).sum(axis=1))
+    deviations = numpy.zeros(len(polygons))
+    numpy.maximum.at(deviations, vertexpolygon, distances)
+    for polygon in numpy.nonzero((deviations > PLANARITYTOLERANCE) & (areas >= SNAPTOLERANCE))[0]:
+        errors.append(('non-planar polygon', polygon, deviations[polygon]))
+    #-- Interior rings, tested with their centroid in the plane of the polygon
+    for ring in numpy.nonzero(interior)[0]:
+        polygon = ringpolygon[ring]
+        exterior = numpy.nonzero((ringpolygon == polygon) & ~interior)[0][0]
+        drop = numpy.argmax(numpy.abs(normals[polygon]))
+        axes = [axis for axis in range(3) if axis != drop]
+        outer = vertices[starts[exterior]:ends[exterior]][:, axes]
+        point = vertices[starts[ring]:ends[ring] - 1][:, axes].mean(axis=0)
+        #-- Ray casting against all the edges of the exterior ring at once
+        a = outer[:-1]
+        b = outer[1:]
+        crossing = (a[:, 1] > point[1]) != (b[:, 1] > point[1])
+        with numpy.errstate(invalid='ignore', divide='ignore'):
+            x = a[:, 0] + (point[1] - a[:, 1]) * (b[:, 0] - a[:, 0]) / (b[:, 1] - a[:, 1])
+        if numpy.count_nonzero(crossing & (x > point[0])) % 2 == 0:
+            errors.append(('interior ring outside exterior', polygon, None))
+    return errors
+
+
+def shellErrors(vertices, starts):
+    """Find the edges of a shell which are not shared by exactly two polygons in opposite directions, and the orientation of the shell.
+    Output: list of (error, value)."""
+    errors = []
+    ends = numpy.append(starts[1:], len(vertices))
+    #-- Identify the vertices by their snapped coordinates
+    snapped = numpy.round(vertices / SNAPTOLERANCE).astype(numpy.int64)
+    ids = numpy.unique(snapped, axis=0, return_inverse=True)[1].reshape(-1)
+    edgefrom = ids[:-1]
+    edgeto = ids[1:]
+    valid = numpy.ones(len(edgefrom), dtype=bool)
+    valid[starts[1:] - 1] = False
+    #-- Repeated consecutive vertices are reported with the polygons
+    valid &= edgefrom != edgeto
+    edgefrom = edgefrom[valid]
+    edgeto = edgeto[valid]
+    size = numpy.int64(ids.max() + 1)
+    directed, counts = numpy.unique(edgefrom * size + edgeto, return_counts=True)
+    repeated = numpy.count_nonzero(counts > 1)
+    if repeated > 0:
+        errors.append(('inconsistent orientation', repeated))
+    reverse = (directed % size) * size + directed // size
+    unmatched = numpy.count_nonzero(~numpy.isin(reverse, directed))
+    if unmatched > 0:
+        errors.append(('shell not closed', unmatched))
+    volume = (vertices[starts] * ringVectorAreas(vertices, starts)).sum() / 3.0
+    if volume <= 0:
+        errors.append(('shell oriented inwards', volume))
+    return errors
+
+
+def hausdorffDistance(a, b, block=512):
+    """Hausdorff distance between two sets of vertices. The distances are computed in blocks to bound the memory."""
+    distance = 0.0
+    for first, second in [(a, b), (b, a)]:
+        for i in range(0, len(first), block):
+            squared = ((first[i:i+block, None, :] - second[None, :, :]) ** 2).sum(axis=2)
+            distance = max(distance, numpy.sqrt(squared.min(axis=1).max()))
+    return distance
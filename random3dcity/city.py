@@ -0,0 +1,1548 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT)
+
+# This code is part of the Random3Dcity package
+
+# Copyright (c) 2015
+# Filip Biljecki
+# Delft University of Technology
+# fbiljecki@gmail.com
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Construction of the representations of a building from its specification in the XML of buildings.
+Shared by generateCityGML.py and serveTiles.py: the options are passed as arguments, and the builders of the components as a dictionary.
+"""
+
+from lxml import etree
+import copy
+import math
+
+from random3dcity.geometry import nsmap, ns_gml, GMLPointList, GMLstring2points, adjustRoofFeatures, storeyTemplate, rotator
+
+#-- Components of the engine with the builders of the buildings, and the prefixes of the representations they build (None if they are always needed)
+BUILDINGCOMPONENTS = [('lod0', ['LOD0_'], ['CityGMLbuildingLOD0']),
+                      ('lod1', ['LOD1_'], ['CityGMLbuildingLOD1', 'CityGMLbuildingLOD1Semantics', 'CityGMLbuildingLOD1Solid']),
+                      ('lod2', ['LOD2_'], ['CityGMLbuildingLOD2Solid', 'CityGMLbuildingLOD2Semantics']),
+                      #-- Always needed, the height of the chimney and the eaves are derived from an LOD3 model of each building
+                      ('lod3', None, ['CityGMLbuildingLOD3Semantics', 'CityGMLbuildingLOD3Solid']),
+                      ('interior', ['interior-'], ['CityGMLbuildingInteriorLOD0', 'CityGMLbuildingInteriorLOD1', 'CityGMLbuildingInteriorLOD2'])]
+
+#-- Beginning and end of each CityGML file
+CITYGMLHEADER = b"<?xml version=\"1.0\" encoding=\"utf-8\"?>\n<!-- Generated by Random3Dcity (http://github.com/tudelft3d/Random3Dcity), a tool developed by Filip Biljecki at TU Delft. Version: 2015-03-11. -->\n"
+CITYGMLFOOTER = b"</CityModel>\n"
+
+
+def createCityGML(suffix):
+    """Creates a CityGML foundation to be filled later by the remaining part of the script."""
+    CityModel = etree.Element("CityModel", nsmap=nsmap)
+    citymodelname = etree.SubElement(CityModel, "{%s}name" % ns_gml)
+    citymodelname.text = str(suffix)
+    boundedBy = etree.SubElement(CityModel, "{%s}boundedBy" % ns_gml)
+    Envelope = etree.SubElement(boundedBy, "{%s}Envelope" % ns_gml, srsDimension="3")
+    Envelope.attrib["srsName"] = "EPSG:28992"
+    lowercorner = etree.SubElement(Envelope, "{%s}lowerCorner" % ns_gml)
+    lowercorner.text = '0 0 0'
+    uppercorner = etree.SubElement(Envelope, "{%s}upperCorner" % ns_gml)
+    uppercorner.text = '4000 4000 25'
+    return CityModel
+
+
+class CityModels(dict):
+    """CityModels of the representations. The representations that are not produced have no CityModel, so their builders get None."""
+    def __missing__(self, suffix):
+        return None
+
+
+def producedBuilder(builder):
+    """Wrap a builder so that it skips the representations that are not produced, which do not have a CityModel."""
+    def build(CityModel, *args, **kwargs):
+        if CityModel is None:
+            return None
+        return builder(CityModel, *args, **kwargs)
+    return build
+
+
+def representationNames(variants=False, solids=False, streets=False, vegetation=False):
+    """Names of the representations generated with these options (geometric references, solids and semantic variants, roads, plant cover), in the order of the files."""
+    names = []
+
+    #-- Instances
+
+    ## LOD0
+
+    #-- LOD0.0
+    names.append('LOD0_0')
+
+    #-- LOD0.1
+    if variants:
+        names.append('LOD0_1_F0_H0')
+        names.append('LOD0_1_F0_H1')
+        names.append('LOD0_1_F0_H2')
+
+    names.append('LOD0_1_F0_H3')
+
+    if variants:
+        names.append('LOD0_1_F0_H4')
+        names.append('LOD0_1_F0_H5')
+        names.append('LOD0_1_F0_H6')
+        names.append('LOD0_1_F0_HAvg')
+        names.append('LOD0_1_F0_HMed')
+
+    if variants:
+        names.append('LOD0_1_F1_H0')
+        names.append('LOD0_1_F1_H1')
+        names.append('LOD0_1_F1_H2')
+        names.append('LOD0_1_F1_H3')
+        names.append('LOD0_1_F1_H4')
+        names.append('LOD0_1_F1_H5')
+        names.append('LOD0_1_F1_H6')
+        names.append('LOD0_1_F1_HAvg')
+        names.append('LOD0_1_F1_HMed')
+
+    if variants:
+        names.append('LOD0_1_Fd_H0')
+        names.append('LOD0_1_Fd_H1')
+        names.append('LOD0_1_Fd_H2')
+        names.append('LOD0_1_Fd_H3')
+        names.append('LOD0_1_Fd_H4')
+        names.append('LOD0_1_Fd_H5')
+        names.append('LOD0_1_Fd_H6')
+        names.append('LOD0_1_Fd_HAvg')
+        names.append('LOD0_1_Fd_HMed')
+
+
+    #-- LOD0.2
+    if variants:
+        names.append('LOD0_2_F0_H0')
+        names.append('LOD0_2_F0_H1')
+        names.append('LOD0_2_F0_H2')
+
+    names.append('LOD0_2_F0_H3')
+
+    if variants:
+        names.append('LOD0_2_F0_H4')
+        names.append('LOD0_2_F0_H5')
+        names.append('LOD0_2_F0_H6')
+        names.append('LOD0_2_F0_HAvg')
+        names.append('LOD0_2_F0_HMed')
+
+
+    if variants:
+        names.append('LOD0_2_F1_H0')
+        names.append('LOD0_2_F1_H1')
+        names.append('LOD0_2_F1_H2')
+        names.append('LOD0_2_F1_H3')
+        names.append('LOD0_2_F1_H4')
+        names.append('LOD0_2_F1_H5')
+        names.append('LOD0_2_F1_H6')
+        names.append('LOD0_2_F1_HAvg')
+        names.append('LOD0_2_F1_HMed')
+
+    if variants:
+        names.append('LOD0_2_Fd_H0')
+        names.append('LOD0_2_Fd_H1')
+        names.append('LOD0_2_Fd_H2')
+        names.append('LOD0_2_Fd_H3')
+        names.append('LOD0_2_Fd_H4')
+        names.append('LOD0_2_Fd_H5')
+        names.append('LOD0_2_Fd_H6')
+        names.append('LOD0_2_Fd_HAvg')
+        names.append('LOD0_2_Fd_HMed')
+
+    #-- LOD0.3
+    if variants:
+        names.append('LOD0_3_F0_H0')
+        names.append('LOD0_3_F0_H1')
+        names.append('LOD0_3_F0_H2')
+
+    names.append('LOD0_3_F0_H3')
+
+    if variants:
+        names.append('LOD0_3_F0_H4')
+        names.append('LOD0_3_F0_H5')
+        names.append('LOD0_3_F0_H6')
+        names.append('LOD0_3_F0_HAvg')
+        names.append('LOD0_3_F0_HMed')
+
+    if variants:
+        names.append('LOD0_3_F1_H0')
+        names.append('LOD0_3_F1_H1')
+        names.append('LOD0_3_F1_H2')
+        names.append('LOD0_3_F1_H3')
+        names.append('LOD0_3_F1_H4')
+        names.append('LOD0_3_F1_H5')
+        names.append('LOD0_3_F1_H6')
+        names.append('LOD0_3_F1_HAvg')
+        names.append('LOD0_3_F1_HMed')
+
+    if variants:
+        names.append('LOD0_3_Fd_H0')
+        names.append('LOD0_3_Fd_H1')
+        names.append('LOD0_3_Fd_H2')
+        names.append('LOD0_3_Fd_H3')
+        names.append('LOD0_3_Fd_H4')
+        names.append('LOD0_3_Fd_H5')
+        names.append('LOD0_3_Fd_H6')
+        names.append('LOD0_3_Fd_HAvg')
+        names.append('LOD0_3_Fd_HMed')
+
+    ## LOD1
+
+    #-- LOD1.0
+    names.append('LOD1_0_HMin')
+    if solids:
+        names.append('LOD1_0_HMin_solid')
+        names.append('LOD1_0_HMin_semantics')
+
+    if variants:
+        names.append('LOD1_0_HAvg')
+        if solids:
+            names.append('LOD1_0_HAvg_solid')
+            names.append('LOD1_0_HAvg_semantics')
+
+        names.append('LOD1_0_HMax')
+        if solids:
+            names.append('LOD1_0_HMax_solid')
+            names.append('LOD1_0_HMax_semantics')
+
+        names.append('LOD1_0_HMedian')
+        if solids:
+            names.append('LOD1_0_HMedian_solid')
+            names.append('LOD1_0_HMedian_semantics')
+
+    #-- LOD1.1
+    if variants:
+        names.append('LOD1_1_F0_H0')
+        names.append('LOD1_1_F0_H1')
+        names.append('LOD1_1_F0_H2')
+
+    names.append('LOD1_1_F0_H3')
+
+    if variants:
+        names.append('LOD1_1_F0_H4')
+        names.append('LOD1_1_F0_H5')
+        names.append('LOD1_1_F0_H6')
+        names.append('LOD1_1_F0_HAvg')
+        names.append('LOD1_1_F0_HMed')
+
+    if variants:
+        names.append('LOD1_1_F1_H0')
+        names.append('LOD1_1_F1_H1')
+        names.append('LOD1_1_F1_H2')
+        names.append('LOD1_1_F1_H3')
+        names.append('LOD1_1_F1_H4')
+        names.append('LOD1_1_F1_H5')
+        names.append('LOD1_1_F1_H6')
+        names.append('LOD1_1_F1_HAvg')
+        names.append('LOD1_1_F1_HMed')
+
+    if variants:
+        names.append('LOD1_1_Fd_H0')
+        names.append('LOD1_1_Fd_H1')
+        names.append('LOD1_1_Fd_H2')
+        names.append('LOD1_1_Fd_H3')
+        names.append('LOD1_1_Fd_H4')
+        names.append('LOD1_1_Fd_H5')
+        names.append('LOD1_1_Fd_H6')
+        names.append('LOD1_1_Fd_HAvg')
+        names.append('LOD1_1_Fd_HMed')
+
+    if solids:
+        if variants:
+            names.append('LOD1_1_F0_H0_solid')
+            names.append('LOD1_1_F0_H1_solid')
+            names.append('LOD1_1_F0_H2_solid')
+
+        names.append('LOD1_1_F0_H3_solid')
+
+        if variants:
+            names.append('LOD1_1_F0_H4_solid')
+            names.append('LOD1_1_F0_H5_solid')
+            names.append('LOD1_1_F0_H6_solid')
+            names.append('LOD1_1_F0_HAvg_solid')
+            names.append('LOD1_1_F0_HMed_solid')
+
+        if variants:
+            names.append('LOD1_1_F1_H0_solid')
+            names.append('LOD1_1_F1_H1_solid')
+            names.append('LOD1_1_F1_H2_solid')
+            names.append('LOD1_1_F1_H3_solid')
+            names.append('LOD1_1_F1_H4_solid')
+            names.append('LOD1_1_F1_H5_solid')
+            names.append('LOD1_1_F1_H6_solid')
+            names.append('LOD1_1_F1_HAvg_solid')
+            names.append('LOD1_1_F1_HMed_solid')
+
+        if variants:
+            names.append('LOD1_1_Fd_H0_solid')
+            names.append('LOD1_1_Fd_H1_solid')
+            names.append('LOD1_1_Fd_H2_solid')
+            names.append('LOD1_1_Fd_H3_solid')
+            names.append('LOD1_1_Fd_H4_solid')
+            names.append('LOD1_1_Fd_H5_solid')
+            names.append('LOD1_1_Fd_H6_solid')
+            names.append('LOD1_1_Fd_HAvg_solid')
+            names.append('LOD1_1_Fd_HMed_solid')
+
+        if variants:
+            names.append('LOD1_1_F0_H0_semantics')
+            names.append('LOD1_1_F0_H1_semantics')
+            names.append('LOD1_1_F0_H2_semantics')
+
+        names.append('LOD1_1_F0_H3_semantics')
+
+        if variants:
+            names.append('LOD1_1_F0_H4_semantics')
+            names.append('LOD1_1_F0_H5_semantics')
+            names.append('LOD1_1_F0_H6_semantics')
+            names.append('LOD1_1_F0_HAvg_semantics')
+            names.append('LOD1_1_F0_HMed_semantics')
+
+        if variants:
+            names.append('LOD1_1_F1_H0_semantics')
+            names.append('LOD1_1_F1_H1_semantics')
+            names.append('LOD1_1_F1_H2_semantics')
+            names.append('LOD1_1_F1_H3_semantics')
+            names.append('LOD1_1_F1_H4_semantics')
+            names.append('LOD1_1_F1_H5_semantics')
+            names.append('LOD1_1_F1_H6_semantics')
+            names.append('LOD1_1_F1_HAvg_semantics')
+            names.append('LOD1_1_F1_HMed_semantics')
+
+        if variants:
+            names.append('LOD1_1_Fd_H0_semantics')
+            names.append('LOD1_1_Fd_H1_semantics')
+            names.append('LOD1_1_Fd_H2_semantics')
+            names.append('LOD1_1_Fd_H3_semantics')
+            names.append('LOD1_1_Fd_H4_semantics')
+            names.append('LOD1_1_Fd_H5_semantics')
+            names.append('LOD1_1_Fd_H6_semantics')
+            names.append('LOD1_1_Fd_HAvg_semantics')
+            names.append('LOD1_1_Fd_HMed_semantics')
+
+
+    #-- LOD1.2
+    if variants:
+        names.append('LOD1_2_F0_H0')
+        names.append('LOD1_2_F0_H1')
+        names.append('LOD1_2_F0_H2')
+
+    names.append('LOD1_2_F0_H3')
+
+    if variants:
+        names.append('LOD1_2_F0_H4')
+        names.append('LOD1_2_F0_H5')
+        names.append('LOD1_2_F0_H6')
+        names.append('LOD1_2_F0_HAvg')
+        names.append('LOD1_2_F0_HMed')
+
+    if variants:
+        names.append('LOD1_2_F1_H0')
+        names.append('LOD1_2_F1_H1')
+        names.append('LOD1_2_F1_H2')
+        names.append('LOD1_2_F1_H3')
+        names.append('LOD1_2_F1_H4')
+        names.append('LOD1_2_F1_H5')
+        names.append('LOD1_2_F1_H6')
+        names.append('LOD1_2_F1_HAvg')
+        names.append('LOD1_2_F1_HMed')
+
+    if variants:
+        names.append('LOD1_2_Fd_H0')
+        names.append('LOD1_2_Fd_H1')
+        names.append('LOD1_2_Fd_H2')
+        names.append('LOD1_2_Fd_H3')
+        names.append('LOD1_2_Fd_H4')
+        names.append('LOD1_2_Fd_H5')
+        names.append('LOD1_2_Fd_H6')
+        names.append('LOD1_2_Fd_HAvg')
+        names.append('LOD1_2_Fd_HMed')
+
+
+    if solids:
+        if variants:
+            names.append('LOD1_2_F0_H0_solid')
+            names.append('LOD1_2_F0_H1_solid')
+            names.append('LOD1_2_F0_H2_solid')
+
+        names.append('LOD1_2_F0_H3_solid')
+
+        if variants:
+            names.append('LOD1_2_F0_H4_solid')
+            names.append('LOD1_2_F0_H5_solid')
+            names.append('LOD1_2_F0_H6_solid')
+            names.append('LOD1_2_F0_HAvg_solid')
+            names.append('LOD1_2_F0_HMed_solid')
+
+        if variants:
+            names.append('LOD1_2_F1_H0_solid')
+            names.append('LOD1_2_F1_H1_solid')
+            names.append('LOD1_2_F1_H2_solid')
+            names.append('LOD1_2_F1_H3_solid')
+            names.append('LOD1_2_F1_H4_solid')
+            names.append('LOD1_2_F1_H5_solid')
+            names.append('LOD1_2_F1_H6_solid')
+            names.append('LOD1_2_F1_HAvg_solid')
+            names.append('LOD1_2_F1_HMed_solid')
+
+        if variants:
+            names.append('LOD1_2_Fd_H0_solid')
+            names.append('LOD1_2_Fd_H1_solid')
+            names.append('LOD1_2_Fd_H2_solid')
+            names.append('LOD1_2_Fd_H3_solid')
+            names.append('LOD1_2_Fd_H4_solid')
+            names.append('LOD1_2_Fd_H5_solid')
+            names.append('LOD1_2_Fd_H6_solid')
+            names.append('LOD1_2_Fd_HAvg_solid')
+            names.append('LOD1_2_Fd_HMed_solid')
+
+        if variants:
+            names.append('LOD1_2_F0_H0_semantics')
+            names.append('LOD1_2_F0_H1_semantics')
+            names.append('LOD1_2_F0_H2_semantics')
+
+        names.append('LOD1_2_F0_H3_semantics')
+
+        if variants:
+            names.append('LOD1_2_F0_H4_semantics')
+            names.append('LOD1_2_F0_H5_semantics')
+            names.append('LOD1_2_F0_H6_semantics')
+            names.append('LOD1_2_F0_HAvg_semantics')
+            names.append('LOD1_2_F0_HMed_semantics')
+
+        if variants:
+            names.append('LOD1_2_F1_H0_semantics')
+            names.append('LOD1_2_F1_H1_semantics')
+            names.append('LOD1_2_F1_H2_semantics')
+            names.append('LOD1_2_F1_H3_semantics')
+            names.append('LOD1_2_F1_H4_semantics')
+            names.append('LOD1_2_F1_H5_semantics')
+            names.append('LOD1_2_F1_H6_semantics')
+            names.append('LOD1_2_F1_HAvg_semantics')
+            names.append('LOD1_2_F1_HMed_semantics')
+
+        if variants:
+            names.append('LOD1_2_Fd_H0_semantics')
+            names.append('LOD1_2_Fd_H1_semantics')
+            names.append('LOD1_2_Fd_H2_semantics')
+            names.append('LOD1_2_Fd_H3_semantics')
+            names.append('LOD1_2_Fd_H4_semantics')
+            names.append('LOD1_2_Fd_H5_semantics')
+            names.append('LOD1_2_Fd_H6_semantics')
+            names.append('LOD1_2_Fd_HAvg_semantics')
+            names.append('LOD1_2_Fd_HMed_semantics')
+
+    #-- LOD1.3
+    if variants:
+        names.append('LOD1_3_F0_H0')
+        names.append('LOD1_3_F0_H1')
+        names.append('LOD1_3_F0_H2')
+
+    names.append('LOD1_3_F0_H3')
+
+    if variants:
+        names.append('LOD1_3_F0_H4')
+        names.append('LOD1_3_F0_H5')
+        names.append('LOD1_3_F0_H6')
+        names.append('LOD1_3_F0_HAvg')
+        names.append('LOD1_3_F0_HMed')
+
+    if variants:
+        names.append('LOD1_3_F1_H0')
+        names.append('LOD1_3_F1_H1')
+        names.append('LOD1_3_F1_H2')
+        names.append('LOD1_3_F1_H3')
+        names.append('LOD1_3_F1_H4')
+        names.append('LOD1_3_F1_H5')
+        names.append('LOD1_3_F1_H6')
+        names.append('LOD1_3_F1_HAvg')
+        names.append('LOD1_3_F1_HMed')
+
+    if variants:
+        names.append('LOD1_3_Fd_H0')
+        names.append('LOD1_3_Fd_H1')
+        names.append('LOD1_3_Fd_H2')
+        names.append('LOD1_3_Fd_H3')
+        names.append('LOD1_3_Fd_H4')
+        names.append('LOD1_3_Fd_H5')
+        names.append('LOD1_3_Fd_H6')
+        names.append('LOD1_3_Fd_HAvg')
+        names.append('LOD1_3_Fd_HMed')
+
+    if solids:
+        if variants:
+            names.append('LOD1_3_F0_H0_solid')
+            names.append('LOD1_3_F0_H1_solid')
+            names.append('LOD1_3_F0_H2_solid')
+
+        names.append('LOD1_3_F0_H3_solid')
+
+        if variants:
+            names.append('LOD1_3_F0_H4_solid')
+            names.append('LOD1_3_F0_H5_solid')
+            names.append('LOD1_3_F0_H6_solid')
+            names.append('LOD1_3_F0_HAvg_solid')
+            names.append('LOD1_3_F0_HMed_solid')
+
+        if variants:
+            names.append('LOD1_3_F1_H0_solid')
+            names.append('LOD1_3_F1_H1_solid')
+            names.append('LOD1_3_F1_H2_solid')
+            names.append('LOD1_3_F1_H3_solid')
+            names.append('LOD1_3_F1_H4_solid')
+            names.append('LOD1_3_F1_H5_solid')
+            names.append('LOD1_3_F1_H6_solid')
+            names.append('LOD1_3_F1_HAvg_solid')
+            names.append('LOD1_3_F1_HMed_solid')
+
+        if variants:
+            names.append('LOD1_3_Fd_H0_solid')
+            names.append('LOD1_3_Fd_H1_solid')
+            names.append('LOD1_3_Fd_H2_solid')
+            names.append('LOD1_3_Fd_H3_solid')
+            names.append('LOD1_3_Fd_H4_solid')
+            names.append('LOD1_3_Fd_H5_solid')
+            names.append('LOD1_3_Fd_H6_solid')
+            names.append('LOD1_3_Fd_HAvg_solid')
+            names.append('LOD1_3_Fd_HMed_solid')
+
+        if variants:
+            names.append('LOD1_3_F0_H0_semantics')
+            names.append('LOD1_3_F0_H1_semantics')
+            names.append('LOD1_3_F0_H2_semantics')
+
+        names.append('LOD1_3_F0_H3_semantics')
+
+        if variants:
+            names.append('LOD1_3_F0_H4_semantics')
+            names.append('LOD1_3_F0_H5_semantics')
+            names.append('LOD1_3_F0_H6_semantics')
+            names.append('LOD1_3_F0_HAvg_semantics')
+            names.append('LOD1_3_F0_HMed_semantics')
+
+        if variants:
+            names.append('LOD1_3_F1_H0_semantics')
+            names.append('LOD1_3_F1_H1_semantics')
+            names.append('LOD1_3_F1_H2_semantics')
+            names.append('LOD1_3_F1_H3_semantics')
+            names.append('LOD1_3_F1_H4_semantics')
+            names.append('LOD1_3_F1_H5_semantics')
+            names.append('LOD1_3_F1_H6_semantics')
+            names.append('LOD1_3_F1_HAvg_semantics')
+            names.append('LOD1_3_F1_HMed_semantics')
+
+        if variants:
+            names.append('LOD1_3_Fd_H0_semantics')
+            names.append('LOD1_3_Fd_H1_semantics')
+            names.append('LOD1_3_Fd_H2_semantics')
+            names.append('LOD1_3_Fd_H3_semantics')
+            names.append('LOD1_3_Fd_H4_semantics')
+            names.append('LOD1_3_Fd_H5_semantics')
+            names.append('LOD1_3_Fd_H6_semantics')
+            names.append('LOD1_3_Fd_HAvg_semantics')
+            names.append('LOD1_3_Fd_HMed_semantics')
+
+    ## LOD2
+    #-- LOD2.0
+    names.append('LOD2_0_F0')
+    if variants:
+        names.append('LOD2_0_Fd')
+        names.append('LOD2_0_F1')
+    #-- Non semantic version
+    if solids:
+        names.append('LOD2_0_F0_S0')
+    if variants:
+        names.append('LOD2_0_Fd_S0')
+        names.append('LOD2_0_F1_S0')
+    #--Solids
+    if solids:
+        names.append('LOD2_0_F0_solid')
+        if variants:
+            names.append('LOD2_0_Fd_solid')
+            names.append('LOD2_0_F1_solid')
+
+    #-- LOD2.1
+    names.append('LOD2_1_F0')
+    if variants:
+        names.append('LOD2_1_Fd')
+        names.append('LOD2_1_F1')
+    #-- Non semantic version
+    if solids:
+        names.append('LOD2_1_F0_S0')
+    if variants:
+        names.append('LOD2_1_Fd_S0')
+        names.append('LOD2_1_F1_S0')
+    #--Solids
+    if solids:
+        names.append('LOD2_1_F0_solid')
+        if variants:
+            names.append('LOD2_1_Fd_solid')
+            names.append('LOD2_1_F1_solid')
+
+    #-- LOD2.2
+    names.append('LOD2_2_F0')
+    if variants:
+        names.append('LOD2_2_F1')
+        names.append('LOD2_2_Fd')
+    #-- Non semantic version
+    if solids:
+        names.append('LOD2_2_F0_S0')
+    if variants:
+        names.append('LOD2_2_F1_S0')
+        names.append('LOD2_2_Fd_S0')
+    #--Solids
+    if solids:
+        names.append('LOD2_2_F0_solid')
+        if variants:
+            names.append('LOD2_2_F1_solid')
+            names.append('LOD2_2_Fd_solid')
+
+    #-- LOD2.3
+    names.append('LOD2_3_F0')
+    if variants:
+        names.append('LOD2_3_Fd')
+    #-- Non semantic version
+    if solids:
+        names.append('LOD2_3_F0_S0')
+    if variants:
+        names.append('LOD2_3_Fd_S0')
+    #--Solids
+    if solids:
+        names.append('LOD2_3_F0_solid')
+        if variants:
+            names.append('LOD2_3_Fd_solid')
+
+    #-- LOD2.3 with dormers
+    if variants:
+        names.append('LOD2_3_F0_with_dormers')
+        names.append('LOD2_3_Fd_with_dormers')
+        #-- Non semantic version
+        if solids:
+            names.append('LOD2_3_F0_S0_with_dormers')
+        if variants:
+            names.append('LOD2_3_Fd_S0_with_dormers')
+        #--Solids
+        if solids:
+            names.append('LOD2_3_F0_solid_with_dormers')
+            if variants:
+                names.append('LOD2_3_Fd_solid_with_dormers')
+
+    #--LOD3 variants
+    #--Normal LOD3 with flat openings
+    names.append('LOD3_2')
+    #--The best LOD3 model available, with embrasures at openings
+    names.append('LOD3_3')
+    # #CityGMLs['LOD3BI'] = createCityGML('LOD3BI')
+    #-- Hybrid models
+    names.append('LOD3_1')
+    names.append('LOD3_0')
+    # CityGMLs['LOD3RF1'] = createCityGML('LOD3RF1')
+
+    #-- No semantics
+    if solids:
+        names.append('LOD3_2_S0')
+        names.append('LOD3_3_S0')
+        names.append('LOD3_1_S0')
+        names.append('LOD3_0_S0')
+    #--Solid counterparts
+    if solids:
+        names.append('LOD3_2_solid')
+        names.append('LOD3_3_solid')
+        names.append('LOD3_1_solid')
+        names.append('LOD3_0_solid')
+
+    #-- Interior
+    names.append('interior-LOD0')
+    names.append('interior-LOD1')
+    names.append('interior-LOD2_2')
+    names.append('interior-LOD2_3')
+
+    #-- Non-building features
+    if streets:
+        names.append('Road-LOD0')
+    if vegetation:
+        names.append('PlantCover-LOD0')
+        names.append('PlantCover-LOD1')
+    return names
+
+
+def buildingSpecification(b, parts=True):
+    """
+    Read the specification of a building from the XML of buildings.
+    Input: the element of the building, and whether its part is generated.
+    Output: dictionary of its dimensions, attributes, roof and openings.
+    """
+    #-- Building UUID
+    ID = b.attrib['ID']
+    #-- Origin in (x,y,z) as a list of floats
+    origin = b.findall('origin')[0]
+    origin_coords = [float(x) for x in origin.text.split(" ")]
+    #-- Position in the grid
+    order = b.findall('order')[0]
+    order = [int(x) for x in order.text.split(" ")]
+    #-- Rotation angle
+    angle_of_rotationXML = b.findall('rotation')[0]
+    angle_of_rotation = float(angle_of_rotationXML.text)
+    #-- Dimensions of the building
+    xsize = b.findall('xSize')[0]
+    xsize = float(xsize.text)
+    ysize = b.findall('ySize')[0]
+    ysize = float(ysize.text)
+    zsize = b.findall('zSize')[0]
+    zsize = float(zsize.text)
+    #-- Other building geometric properties
+    floors = b.findall('floors')[0]
+    floors = float(floors.text)
+    floorHeight = b.findall('floorHeight')[0]
+    floorHeight = float(floorHeight.text)
+    embrasure = b.findall('embrasure')[0]
+    embrasure = float(embrasure.text)
+    wallThickness = b.findall('wallThickness')[0]
+    wallThickness = float(wallThickness.text)
+    joist = b.findall('joist')[0]
+    joist = float(joist.text)
+
+    #-- Store the attributes
+    attributes = {}
+    attrs = b.findall('properties')[0]
+    attributes['yearOfConstruction'] = str(attrs.findall('yearOfConstruction')[0].text)
+    attributes['function'] = str(attrs.findall('usage')[0].text)
+    attributes['storeysAboveGround'] = str(int(floors))
+
+    #-- Building part
+    if parts:
+        bpartXML = b.findall('buildingPart')
+        if len(bpartXML) > 0:
+            buildingpart = {}
+            bpartXML = bpartXML[0]
+            partType = bpartXML.findall('partType')[0].text
+            partOrigin = float(bpartXML.findall('partOrigin')[0].text)
+            width = float(bpartXML.findall('width')[0].text)
+            length = float(bpartXML.findall('length')[0].text)
+            height = float(bpartXML.findall('height')[0].text)
+            buildingpart['o'] = partOrigin
+            buildingpart['type'] = partType
+            buildingpart['x'] = width
+            buildingpart['y'] = length
+            buildingpart['z'] = height
+        else:
+            buildingpart = None
+    else:
+        buildingpart = None
+
+    #-- Roof
+    roof = b.findall('roof')[0]
+    roofType = roof.findall('roofType')[0]
+    roofType = roofType.text
+    if roofType == 'Flat':
+        h = None
+        r = None
+        ovh = roof.findall('overhangs')[0]
+        ovhx = ovh.findall('xlength')[0]
+        ovhy = ovh.findall('ylength')[0]
+        ovhx = float(ovhx.text)
+        ovhy = float(ovhy.text)
+    elif roofType == 'Hipped' or roofType == 'Pyramidal':
+        h = roof.findall('h')[0]
+        h = float(h.text)
+        r = roof.findall('r')[0]
+        r = float(r.text)
+        ovh = roof.findall('overhangs')[0]
+        ovhx = ovh.findall('xlength')[0]
+        ovhy = ovh.findall('ylength')[0]
+        ovhx = float(ovhx.text)
+        ovhy = float(ovhy.text)
+    else:
+        h = roof.findall('h')[0]
+        h = float(h.text)
+        r = None
+        ovh = roof.findall('overhangs')[0]
+        ovhx = ovh.findall('xlength')[0]
+        ovhy = ovh.findall('ylength')[0]
+        ovhx = float(ovhx.text)
+        ovhy = float(ovhy.text)
+
+    #-- Overhangs
+    if ovh is not None:
+        ovh = [ovhx, ovhy]
+
+
+    #-- Chimney
+    chimney = []
+    chimneyXML = roof.findall('chimney')
+    if len(chimneyXML) > 0:
+        chimneyXML = chimneyXML[0]
+        chimneyFace = chimneyXML.findall('side')[0]
+        chimneyOrigin = chimneyXML.findall('origin')[0]
+        chimneyOriginX = chimneyOrigin.findall('x')[0]
+        chimneyOriginX = float(chimneyOriginX.text)
+        chimneyOriginY = chimneyOrigin.findall('y')[0]
+        chimneyOriginY = float(chimneyOriginY.text)
+        chimneySize = chimneyXML.findall('size')[0]
+        chimneyWidth = chimneySize.findall('width')[0]
+        chimneyWidth = float(chimneyWidth.text)
+        chimneyHeight = chimneySize.findall('height')[0]
+        chimneyHeight = float(chimneyHeight.text)
+        chimneyDict = {}
+        chimneyDict['side'] = int(chimneyFace.text)
+        chimneyDict['origin'] = [chimneyOriginX, chimneyOriginY]
+        chimneyDict['size'] = [chimneyWidth, chimneyWidth, chimneyHeight]
+        chimney.append(chimneyDict)
+
+    #-- Door
+    door = b.findall('door')[0]
+    doorFace = door.findall('wall')[0]
+    doorOrigin = door.findall('origin')[0]
+    doorOriginX = doorOrigin.findall('x')[0]
+    doorOriginX = float(doorOriginX.text)
+    doorOriginY = doorOrigin.findall('y')[0]
+    doorOriginY = float(doorOriginY.text)
+    doorSize = door.findall('size')[0]
+    doorWidth = doorSize.findall('width')[0]
+    doorWidth = float(doorWidth.text)
+    doorHeight = doorSize.findall('height')[0]
+    doorHeight = float(doorHeight.text)
+
+    doorDict = {}
+    doorDict['wall'] = int(doorFace.text)
+    doorDict['origin'] = [doorOriginX, doorOriginY]
+    doorDict['size'] = [doorWidth, doorHeight]
+
+    #-- Wall windows
+    wallWindows = []
+    allwindowsXML = b.findall('windows')
+    if len(allwindowsXML) > 0:
+        allwindowsXML = allwindowsXML[0]
+        for winXML in allwindowsXML.findall('window'):
+            wallWindows.append({'wall' : int(winXML.findall('wall')[0].text), 'size' : [float((winXML.findall('size')[0]).findall('width')[0].text), float((winXML.findall('size')[0]).findall('height')[0].text)], 'origin' : [float((winXML.findall('origin')[0]).findall('x')[0].text), float((winXML.findall('origin')[0]).findall('y')[0].text)]})
+        embrasure = float(winXML.findall('depth')[0].text)
+    else:
+        embrasure = 0.0
+
+    #-- Dormers
+    dormers = []
+    alldormersXML = roof.findall('dormers')
+    if len(alldormersXML) > 0:
+        alldormersXML = alldormersXML[0]
+        for dormXML in alldormersXML.findall('dormer'):
+            dormers.append({'side' : int(dormXML.findall('side')[0].text), 'size' : [float((dormXML.findall('size')[0]).findall('width')[0].text), float((dormXML.findall('size')[0]).findall('height')[0].text)], 'origin' : [float((dormXML.findall('origin')[0]).findall('x')[0].text), float((dormXML.findall('origin')[0]).findall('y')[0].text)]})
+
+
+    roofWindows = []
+    allrfwinXML = roof.findall('roofWindows')
+    if len(allrfwinXML) > 0:
+        allrfwinXML = allrfwinXML[0]
+        for rfwinXML in allrfwinXML.findall('roofWindow'):
+            roofWindows.append({'side' : int(rfwinXML.findall('side')[0].text), 'size' : [float((rfwinXML.findall('size')[0]).findall('width')[0].text), float((rfwinXML.findall('size')[0]).findall('height')[0].text)], 'origin' : [float((rfwinXML.findall('origin')[0]).findall('x')[0].text), float((rfwinXML.findall('origin')[0]).findall('y')[0].text)]})
+
+    #-- Additional data
+    additional = {'overhangs' : ovh, 'embrasure': embrasure}
+
+    return {'ID': ID, 'origin': origin_coords, 'order': order, 'rotation': angle_of_rotation, 'xsize': xsize, 'ysize': ysize, 'zsize': zsize,
+            'floors': floors, 'floorHeight': floorHeight, 'wallThickness': wallThickness, 'joist': joist, 'attributes': attributes, 'properties': attrs,
+            'buildingpart': buildingpart, 'roofType': roofType, 'h': h, 'r': r, 'ovh': ovh, 'ovhx': ovhx, 'ovhy': ovhy,
+            'chimney': chimney, 'doorDict': doorDict, 'wallWindows': wallWindows, 'embrasure': embrasure, 'dormers': dormers, 'roofWindows': roofWindows, 'additional': additional}
+
+
+def buildingDimensions(spec, chimneyHeight, eaves, ovhy_recalculated):
+    """
+    Derive the dimensions of the generalised representations of a building from the values of its LOD3 model.
+    Input: the specification of the building, the height of its chimney, its eaves and the overhang in y recalculated by LOD3.
+    Output: dictionary of the adjusted origins, sizes and roof features of the footprints F1 and Fd, and the geometric references of the height.
+    """
+    origin_coords, xsize, ysize, zsize = spec['origin'], spec['xsize'], spec['ysize'], spec['zsize']
+    roofType, h, r, ovhx = spec['roofType'], spec['h'], spec['r'], spec['ovhx']
+    chimney, dormers, roofWindows = spec['chimney'], spec['dormers'], spec['roofWindows']
+
+    #-- Adjust for footprint as the roof overhangs projection (modelling rule F1)
+    adjorigin = [origin_coords[0]-ovhx, origin_coords[1]-ovhy_recalculated, origin_coords[2]]
+    adjxsize = xsize + 2 * ovhx
+    adjysize = ysize + 2 * ovhy_recalculated
+    adjzsize = zsize - (zsize - eaves)
+
+    #-- Adjust the height of the roof
+    if h is not None:
+        if roofType == 'Shed':
+            adjh = h + 2 * (zsize - eaves)
+        else:
+            adjh = h + (zsize - eaves)
+    else:
+        adjh = None
+
+    if r is not None:
+        adjr = r + ovhy_recalculated
+    else:
+        adjr = None
+
+    #-- Adjust for footprint as the offset from the roof overhangs projection (modelling rule Fd)
+    offset = 0.2
+    #-- Defined here because the coordinates of the roof features have to be adjusted
+
+    #-- Edges and other things for the offset
+    adjorigin_offset = [origin_coords[0]-ovhx+offset, origin_coords[1]-ovhy_recalculated+offset, origin_coords[2]]
+    adjxsize_offset = xsize + 2*(ovhx-offset)
+    adjysize_offset = ysize + 2*(ovhy_recalculated-offset)
+
+    #-- Auxiliary data in a dictionary
+    aux = {}
+    aux['ovhx'] = ovhx
+    aux['ovhy'] = ovhy_recalculated
+    aux['origin'] = origin_coords
+    aux['xsize'] = xsize
+    aux['ysize'] = ysize
+    aux['zsize'] = zsize
+    aux['offset'] = offset
+    aux['adjxsize_offset'] = adjxsize_offset
+    aux['adjysize_offset'] = adjysize_offset
+
+
+    if h is not None:
+        if offset < ovhx:
+            eo = (zsize - eaves) * (ovhx - offset) / ovhx
+            adjzsize_offset = zsize - eo
+            adjh_offset = h + eo
+            if roofType == 'Shed':
+                adjh_offset = h + 2*eo
+        elif offset == ovhx:
+            adjzsize_offset = zsize
+            adjh_offset = h
+        elif offset > ovhx and ovhx != 0.0:
+            eo = (zsize - eaves) * (offset/ovhx) - zsize + eaves
+            adjzsize_offset = zsize + eo
+            adjh_offset = h - eo
+            if roofType == 'Shed':
+                adjh_offset = h - 2*eo
+        elif ovhx == 0.0:
+            eo = h * (offset/(xsize*.5))
+            adjzsize_offset = zsize + eo
+            adjh_offset = h - eo
+            if roofType == 'Shed':
+                adjh_offset = h - 2*eo
+
+    else:
+        adjzsize_offset = zsize
+        adjh_offset = None
+
+    if r is not None:
+        if r > 0:
+            adjr_offset = r + ovhy_recalculated - offset
+        else:
+            adjr_offset = 0
+    else:
+        adjr_offset = None
+
+
+    chimney_ovh = []
+    chimney_offset = []
+    for chi in chimney:
+        chi_ovh = copy.deepcopy(chi)
+        chi_offset = copy.deepcopy(chi)
+        chi_ovh['origin'] = adjustRoofFeatures(roofType, zsize - eaves, chi['origin'], ovhx, ovhy_recalculated, chi['side'])
+        chi_offset['origin'] = adjustRoofFeatures(roofType, zsize - adjzsize_offset, chi['origin'], ovhx - offset, ovhy_recalculated - offset, chi['side'])
+        chimney_ovh.append(chi_ovh)
+        chimney_offset.append(chi_offset)
+
+    dormers_ovh = []
+    dormers_offset = []
+    for dor in dormers:
+        dor_ovh = copy.deepcopy(dor)
+        dor_offset = copy.deepcopy(dor)
+        dor_ovh['origin'] = adjustRoofFeatures(roofType, zsize - eaves, dor['origin'], ovhx, ovhy_recalculated, dor['side'])
+        dor_offset['origin'] = adjustRoofFeatures(roofType, zsize - adjzsize_offset, dor['origin'], ovhx - offset, ovhy_recalculated - offset, dor['side'])
+        dormers_ovh.append(dor_ovh)
+        dormers_offset.append(dor_offset)
+
+    roofWindows_ovh = []
+    roofWindows_offset = []
+    for roofwindow in roofWindows:
+        roofwindow_ovh = copy.deepcopy(roofwindow)
+        roofwindow_offset = copy.deepcopy(roofwindow)
+        roofwindow_ovh['origin'] = adjustRoofFeatures(roofType, zsize - eaves, roofwindow['origin'], ovhx, ovhy_recalculated, roofwindow['side'])
+        roofwindow_offset['origin'] = adjustRoofFeatures(roofType, zsize - adjzsize_offset, roofwindow['origin'], ovhx - offset, ovhy_recalculated - offset, roofwindow['side'])
+        roofWindows_ovh.append(roofwindow_ovh)
+        roofWindows_offset.append(roofwindow_offset)
+
+
+    #-- Geometric reference for the height
+    if adjh is not None:
+        onethird = adjh * (1.0/3.0) + adjzsize
+        half = adjh * .5 + adjzsize
+        twothird = adjh * (2.0/3.0) + adjzsize
+    else:
+        onethird = adjzsize
+        half = adjzsize
+        twothird = adjzsize
+
+    return {'chimneyHeight': chimneyHeight, 'eaves': eaves, 'aux': aux, 'offset': offset,
+            'adjorigin': adjorigin, 'adjxsize': adjxsize, 'adjysize': adjysize, 'adjzsize': adjzsize, 'adjh': adjh, 'adjr': adjr,
+            'adjorigin_offset': adjorigin_offset, 'adjxsize_offset': adjxsize_offset, 'adjysize_offset': adjysize_offset, 'adjzsize_offset': adjzsize_offset, 'adjh_offset': adjh_offset, 'adjr_offset': adjr_offset,
+            'chimney_ovh': chimney_ovh, 'chimney_offset': chimney_offset, 'dormers_ovh': dormers_ovh, 'dormers_offset': dormers_offset, 'roofWindows_ovh': roofWindows_ovh, 'roofWindows_offset': roofWindows_offset,
+            'onethird': onethird, 'half': half, 'twothird': twothird}
+
+
+def sharedValues(spec, CityGMLbuildingLOD3Semantics):
+    """
+    Values of a building derived from its LOD3 models, on which its other representations depend.
+    Output: the height of the chimney, the eaves and the recalculated overhang in y, and the eaves and overhang of the model with the offset footprint.
+    """
+    ID, attributes, origin_coords, xsize, ysize, zsize = spec['ID'], spec['attributes'], spec['origin'], spec['xsize'], spec['ysize'], spec['zsize']
+    h, r, roofType, ovh, buildingpart = spec['h'], spec['r'], spec['roofType'], spec['ovh'], spec['buildingpart']
+    #-- LOD3, first because we need the output of many parameters like absolute height of the chimney, eaves and corrected overhang lenghts
+    CityModel = createCityGML('dummyLOD3')
+    chimneyHeight, eaves, ovhy_recalculated = CityGMLbuildingLOD3Semantics(CityModel, ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, spec['doorDict'], spec['wallWindows'], spec['dormers'], spec['roofWindows'], spec['chimney'], spec['embrasure'], 1, None, None)
+    #-- Workaround to calculate the pyramidal and hipped building overhang in y direction
+    dimensions = buildingDimensions(spec, chimneyHeight, eaves, ovhy_recalculated)
+    offset = dimensions['offset']
+    CityModel = createCityGML('dummy')
+    dummy1, eaves_offset, ovhy_recalculated_offset = CityGMLbuildingLOD3Semantics(CityModel, ID, attributes, dimensions['adjorigin_offset'], dimensions['adjxsize_offset'], dimensions['adjysize_offset'], dimensions['adjzsize_offset'], dimensions['adjh_offset'], roofType, [offset, offset], r, spec['doorDict'], spec['wallWindows'], spec['dormers'], spec['roofWindows'], spec['chimney'], spec['embrasure'], 1, dimensions['aux'], buildingpart)
+    return [chimneyHeight, eaves, ovhy_recalculated, eaves_offset, ovhy_recalculated_offset]
+
+
+def CityGMLbuilding(CityGMLs, spec, dimensions, builders, variants=False, solids=False):
+    """
+    Construct the representations of a building, each in its CityModel.
+    Input: the CityModels of the representations (None for the ones that are not produced), the specification and the dimensions of the building, the builders by their names, and whether the geometric references and the solids and semantic variants are generated.
+    """
+    CityGMLbuildingLOD0 = builders['CityGMLbuildingLOD0']
+    CityGMLbuildingLOD1, CityGMLbuildingLOD1Semantics, CityGMLbuildingLOD1Solid = builders['CityGMLbuildingLOD1'], builders['CityGMLbuildingLOD1Semantics'], builders['CityGMLbuildingLOD1Solid']
+    CityGMLbuildingLOD2Solid, CityGMLbuildingLOD2Semantics = builders['CityGMLbuildingLOD2Solid'], builders['CityGMLbuildingLOD2Semantics']
+    CityGMLbuildingLOD3Semantics, CityGMLbuildingLOD3Solid = builders['CityGMLbuildingLOD3Semantics'], builders['CityGMLbuildingLOD3Solid']
+    CityGMLbuildingInteriorLOD0, CityGMLbuildingInteriorLOD1, CityGMLbuildingInteriorLOD2 = builders['CityGMLbuildingInteriorLOD0'], builders['CityGMLbuildingInteriorLOD1'], builders['CityGMLbuildingInteriorLOD2']
+    ID, attributes, origin_coords, order, xsize, ysize, zsize = spec['ID'], spec['attributes'], spec['origin'], spec['order'], spec['xsize'], spec['ysize'], spec['zsize']
+    floors, floorHeight, wallThickness, joist, buildingpart = spec['floors'], spec['floorHeight'], spec['wallThickness'], spec['joist'], spec['buildingpart']
+    roofType, h, r, ovh, additional = spec['roofType'], spec['h'], spec['r'], spec['ovh'], spec['additional']
+    chimney, doorDict, wallWindows, embrasure, dormers, roofWindows = spec['chimney'], spec['doorDict'], spec['wallWindows'], spec['embrasure'], spec['dormers'], spec['roofWindows']
+    chimneyHeight, eaves, aux, offset = dimensions['chimneyHeight'], dimensions['eaves'], dimensions['aux'], dimensions['offset']
+    adjorigin, adjxsize, adjysize, adjzsize, adjh, adjr = dimensions['adjorigin'], dimensions['adjxsize'], dimensions['adjysize'], dimensions['adjzsize'], dimensions['adjh'], dimensions['adjr']
+    adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, adjr_offset = dimensions['adjorigin_offset'], dimensions['adjxsize_offset'], dimensions['adjysize_offset'], dimensions['adjzsize_offset'], dimensions['adjh_offset'], dimensions['adjr_offset']
+    chimney_ovh, dormers_ovh, roofWindows_ovh = dimensions['chimney_ovh'], dimensions['dormers_ovh'], dimensions['roofWindows_ovh']
+    dormers_offset = dimensions['dormers_offset']
+    onethird, half, twothird = dimensions['onethird'], dimensions['half'], dimensions['twothird']
+
+    #-- Tentative aggregation
+    cellsize = 20.0
+    if order[0] % 3 == 0 and order[1] % 3 == 0:
+        xo = order[0] * cellsize
+        yo = order[1] * cellsize
+        gxsize = cellsize * 3 - 6.0
+        gysize = cellsize * 3 - 6.0
+        gen_roofType = 'Flat'
+        CityGMLbuildingLOD0(CityGMLs["LOD0_0"], ID, attributes, [xo, yo, 0.0], gxsize, gysize, zsize, h, gen_roofType, None, eaves, '0.0')
+        CityGMLbuildingLOD1(CityGMLs["LOD1_0_HMin"], ID, attributes, [xo, yo, 0.0], gxsize, gysize, zsize, h, gen_roofType, None, eaves, '1.0') #-- This one is with the eaves
+        if solids:
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_0_HMin_solid"], ID, attributes, [xo, yo, 0.0], gxsize, gysize, zsize, h, gen_roofType, None, eaves, '1.0') #-- This one is with the eaves
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_0_HMin_semantics"], ID, attributes, [xo, yo, 0.0], gxsize, gysize, zsize, h, gen_roofType, None, eaves, '1.0') #-- This one is with the eaves
+
+    #####-- LOD0
+    ##-- LOD0.1
+    if variants:
+        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F0_H0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '0.1', aux, buildingpart) #-- This one is with the eaves
+        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F0_H1"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '0.1', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F0_H2"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '0.1', aux, buildingpart)
+    CityGMLbuildingLOD0(CityGMLs["LOD0_1_F0_H3"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '0.1', aux, buildingpart)
+    if variants:
+        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F0_H4"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '0.1', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F0_H5"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '0.1', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F0_H6"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '0.1', aux, buildingpart) #-- This one is with the chimney or eaves
+
+    if variants:
+        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F1_H0"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '0.1', aux, buildingpart) #-- This one is with the eaves
+        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F1_H1"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '0.1', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F1_H2"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '0.1', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F1_H3"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '0.1', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F1_H4"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '0.1', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F1_H5"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '0.1', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_1_F1_H6"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '0.1', aux, buildingpart) #-- This one is with the chimney or eaves
+
+    if variants:
+        CityGMLbuildingLOD0(CityGMLs["LOD0_1_Fd_H0"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '0.1', aux, buildingpart, True) #-- This one is with the eaves
+        CityGMLbuildingLOD0(CityGMLs["LOD0_1_Fd_H1"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '0.1', aux, buildingpart, True)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_1_Fd_H2"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '0.1', aux, buildingpart, True)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_1_Fd_H3"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '0.1', aux, buildingpart, True)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_1_Fd_H4"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '0.1', aux, buildingpart, True)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_1_Fd_H5"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '0.1', aux, buildingpart, True)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_1_Fd_H6"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '0.1', aux, buildingpart, True) #-- This one is with the chimney or eaves
+
+    ##-- LOD0.2
+    if variants:
+        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F0_H0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '0.2', aux, buildingpart) #-- This one is with the eaves
+        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F0_H1"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '0.2', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F0_H2"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '0.2', aux, buildingpart)
+    CityGMLbuildingLOD0(CityGMLs["LOD0_2_F0_H3"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '0.2', aux, buildingpart)
+    if variants:
+        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F0_H4"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '0.2', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F0_H5"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '0.2', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F0_H6"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '0.2', aux, buildingpart) #-- This one is with the chimney or eaves
+
+    if variants:
+        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F1_H0"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '0.2', aux, buildingpart) #-- This one is with the eaves
+        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F1_H1"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '0.2', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F1_H2"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '0.2', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F1_H3"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '0.2', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F1_H4"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '0.2', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F1_H5"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '0.2', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_2_F1_H6"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '0.2', aux, buildingpart) #-- This one is with the chimney or eaves
+
+    if variants:
+        CityGMLbuildingLOD0(CityGMLs["LOD0_2_Fd_H0"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '0.2', aux, buildingpart, True) #-- This one is with the eaves
+        CityGMLbuildingLOD0(CityGMLs["LOD0_2_Fd_H1"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '0.2', aux, buildingpart, True)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_2_Fd_H2"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '0.2', aux, buildingpart, True)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_2_Fd_H3"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '0.2', aux, buildingpart, True)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_2_Fd_H4"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '0.2', aux, buildingpart, True)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_2_Fd_H5"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '0.2', aux, buildingpart, True)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_2_Fd_H6"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '0.2', aux, buildingpart, True) #-- This one is with the chimney or eaves
+
+    ##-- LOD0.3
+    if variants:
+        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F0_H0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '0.3', aux, buildingpart) #-- This one is with the eaves
+        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F0_H1"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '0.3', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F0_H2"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '0.3', aux, buildingpart)
+    CityGMLbuildingLOD0(CityGMLs["LOD0_3_F0_H3"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '0.3', aux, buildingpart)
+    if variants:
+        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F0_H4"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '0.3', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F0_H5"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '0.3', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F0_H6"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '0.3', aux, buildingpart) #-- This one is with the chimney or eaves
+
+    if variants:
+        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F1_H0"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '0.3', aux, buildingpart) #-- This one is with the eaves
+        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F1_H1"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '0.3', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F1_H2"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '0.3', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F1_H3"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '0.3', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F1_H4"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '0.3', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F1_H5"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '0.3', aux, buildingpart)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_3_F1_H6"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '0.3', aux, buildingpart) #-- This one is with the chimney or eaves
+
+    if variants:
+        CityGMLbuildingLOD0(CityGMLs["LOD0_3_Fd_H0"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '0.3', aux, buildingpart, True) #-- This one is with the eaves
+        CityGMLbuildingLOD0(CityGMLs["LOD0_3_Fd_H1"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '0.3', aux, buildingpart, True)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_3_Fd_H2"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '0.3', aux, buildingpart, True)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_3_Fd_H3"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '0.3', aux, buildingpart, True)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_3_Fd_H4"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '0.3', aux, buildingpart, True)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_3_Fd_H5"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '0.3', aux, buildingpart, True)
+        CityGMLbuildingLOD0(CityGMLs["LOD0_3_Fd_H6"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '0.3', aux, buildingpart, True) #-- This one is with the chimney or eaves
+
+
+    #####-- LOD1
+
+    ##-- LOD1.3
+    #- Multisurface (brep)
+    if variants:
+        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F0_H0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '1.1', aux, buildingpart) #-- This one is with the eaves
+        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F0_H1"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '1.1', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F0_H2"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '1.1', aux, buildingpart)
+    CityGMLbuildingLOD1(CityGMLs["LOD1_1_F0_H3"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '1.1', aux, buildingpart)
+    if variants:
+        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F0_H4"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '1.1', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F0_H5"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '1.1', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F0_H6"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '1.1', aux, buildingpart) #-- This one is with the chimney or eaves
+
+    if variants:
+        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F1_H0"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '1.1', aux, buildingpart) #-- This one is with the eaves
+        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F1_H1"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '1.1', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F1_H2"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '1.1', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F1_H3"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '1.1', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F1_H4"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '1.1', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F1_H5"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '1.1', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_1_F1_H6"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '1.1', aux, buildingpart) #-- This one is with the chimney or eaves
+
+    if variants:
+        CityGMLbuildingLOD1(CityGMLs["LOD1_1_Fd_H0"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '1.1', aux, buildingpart, True) #-- This one is with the eaves
+        CityGMLbuildingLOD1(CityGMLs["LOD1_1_Fd_H1"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '1.1', aux, buildingpart, True)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_1_Fd_H2"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '1.1', aux, buildingpart, True)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_1_Fd_H3"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '1.1', aux, buildingpart, True)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_1_Fd_H4"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '1.1', aux, buildingpart, True)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_1_Fd_H5"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '1.1', aux, buildingpart, True)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_1_Fd_H6"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '1.1', aux, buildingpart, True) #-- This one is with the chimney or eaves
+
+    #- Solids
+    if solids:
+        if variants:
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F0_H0_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '1.1', aux, buildingpart) #-- This one is with the eaves
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F0_H1_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '1.1', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F0_H2_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '1.1', aux, buildingpart)
+        CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F0_H3_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '1.1', aux, buildingpart)
+        if variants:
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F0_H4_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '1.1', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F0_H5_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '1.1', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F0_H6_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '1.1', aux, buildingpart) #-- This one is with the chimney or eaves
+
+        if variants:
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F1_H0_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '1.1', aux, buildingpart) #-- This one is with the eaves
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F1_H1_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '1.1', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F1_H2_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '1.1', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F1_H3_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '1.1', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F1_H4_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '1.1', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F1_H5_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '1.1', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_F1_H6_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '1.1', aux, buildingpart) #-- This one is with the chimney or eaves
+
+        if variants:
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_Fd_H0_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '1.1', aux, buildingpart, True) #-- This one is with the eaves
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_Fd_H1_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '1.1', aux, buildingpart, True)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_Fd_H2_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '1.1', aux, buildingpart, True)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_Fd_H3_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '1.1', aux, buildingpart, True)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_Fd_H4_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '1.1', aux, buildingpart, True)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_Fd_H5_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '1.1', aux, buildingpart, True)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_1_Fd_H6_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '1.1', aux, buildingpart, True) #-- This one is with the chimney or eaves
+
+        #- Enhanced semantics
+        if variants:
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F0_H0_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '1.1', aux, buildingpart) #-- This one is with the eaves
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F0_H1_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '1.1', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F0_H2_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '1.1', aux, buildingpart)
+        CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F0_H3_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '1.1', aux, buildingpart)
+        if variants:
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F0_H4_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '1.1', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F0_H5_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '1.1', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F0_H6_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '1.1', aux, buildingpart) #-- This one is with the chimney or eaves
+
+        if variants:
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F1_H0_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '1.1', aux, buildingpart) #-- This one is with the eaves
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F1_H1_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '1.1', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F1_H2_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '1.1', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F1_H3_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '1.1', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F1_H4_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '1.1', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F1_H5_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '1.1', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_F1_H6_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '1.1', aux, buildingpart) #-- This one is with the chimney or eaves
+
+        if variants:
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_Fd_H0_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '1.1', aux, buildingpart, True) #-- This one is with the eaves
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_Fd_H1_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '1.1', aux, buildingpart, True)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_Fd_H2_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '1.1', aux, buildingpart, True)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_Fd_H3_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '1.1', aux, buildingpart, True)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_Fd_H4_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '1.1', aux, buildingpart, True)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_Fd_H5_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '1.1', aux, buildingpart, True)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_1_Fd_H6_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '1.1', aux, buildingpart, True) #-- This one is with the chimney or eaves
+
+
+    ##-- LOD1.2
+    #- Multisurface (brep)
+    if variants:
+        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F0_H0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '1.2', aux, buildingpart) #-- This one is with the eaves
+        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F0_H1"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '1.2', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F0_H2"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '1.2', aux, buildingpart)
+    CityGMLbuildingLOD1(CityGMLs["LOD1_2_F0_H3"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '1.2', aux, buildingpart)
+    if variants:
+        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F0_H4"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '1.2', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F0_H5"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '1.2', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F0_H6"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '1.2', aux, buildingpart) #-- This one is with the chimney or eaves
+
+    if variants:
+        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F1_H0"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '1.2', aux, buildingpart) #-- This one is with the eaves
+        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F1_H1"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '1.2', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F1_H2"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '1.2', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F1_H3"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '1.2', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F1_H4"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '1.2', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F1_H5"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '1.2', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_2_F1_H6"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '1.2', aux, buildingpart) #-- This one is with the chimney or eaves
+
+    if variants:
+        CityGMLbuildingLOD1(CityGMLs["LOD1_2_Fd_H0"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '1.2', aux, buildingpart, True) #-- This one is with the eaves
+        CityGMLbuildingLOD1(CityGMLs["LOD1_2_Fd_H1"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '1.2', aux, buildingpart, True)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_2_Fd_H2"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '1.2', aux, buildingpart, True)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_2_Fd_H3"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '1.2', aux, buildingpart, True)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_2_Fd_H4"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '1.2', aux, buildingpart, True)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_2_Fd_H5"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '1.2', aux, buildingpart, True)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_2_Fd_H6"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '1.2', aux, buildingpart, True) #-- This one is with the chimney or eaves
+
+    #- Solids
+    if solids:
+        if variants:
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F0_H0_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '1.2', aux, buildingpart) #-- This one is with the eaves
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F0_H1_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '1.2', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F0_H2_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '1.2', aux, buildingpart)
+        CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F0_H3_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '1.2', aux, buildingpart)
+        if variants:
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F0_H4_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '1.2', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F0_H5_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '1.2', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F0_H6_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '1.2', aux, buildingpart) #-- This one is with the chimney or eaves
+
+        if variants:
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F1_H0_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '1.2', aux, buildingpart) #-- This one is with the eaves
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F1_H1_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '1.2', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F1_H2_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '1.2', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F1_H3_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '1.2', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F1_H4_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '1.2', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F1_H5_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '1.2', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_F1_H6_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '1.2', aux, buildingpart) #-- This one is with the chimney or eaves
+
+        if variants:
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_Fd_H0_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '1.2', aux, buildingpart, True) #-- This one is with the eaves
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_Fd_H1_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '1.2', aux, buildingpart, True)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_Fd_H2_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '1.2', aux, buildingpart, True)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_Fd_H3_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '1.2', aux, buildingpart, True)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_Fd_H4_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '1.2', aux, buildingpart, True)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_Fd_H5_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '1.2', aux, buildingpart, True)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_2_Fd_H6_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '1.2', aux, buildingpart, True) #-- This one is with the chimney or eaves
+
+
+        #- Semantics
+        if variants:
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F0_H0_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '1.2', aux, buildingpart) #-- This one is with the eaves
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F0_H1_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '1.2', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F0_H2_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '1.2', aux, buildingpart)
+        CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F0_H3_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '1.2', aux, buildingpart)
+        if variants:
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F0_H4_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '1.2', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F0_H5_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '1.2', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F0_H6_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '1.2', aux, buildingpart) #-- This one is with the chimney or eaves
+
+        if variants:
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F1_H0_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '1.2', aux, buildingpart) #-- This one is with the eaves
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F1_H1_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '1.2', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F1_H2_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '1.2', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F1_H3_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '1.2', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F1_H4_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '1.2', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F1_H5_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '1.2', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_F1_H6_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '1.2', aux, buildingpart) #-- This one is with the chimney or eaves
+
+        if variants:
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_Fd_H0_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '1.2', aux, buildingpart, True) #-- This one is with the eaves
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_Fd_H1_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '1.2', aux, buildingpart, True)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_Fd_H2_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '1.2', aux, buildingpart, True)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_Fd_H3_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '1.2', aux, buildingpart, True)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_Fd_H4_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '1.2', aux, buildingpart, True)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_Fd_H5_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '1.2', aux, buildingpart, True)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_2_Fd_H6_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '1.2', aux, buildingpart, True) #-- This one is with the chimney or eaves
+
+
+    ##-- LOD1.3
+    #- Multisurface (brep)
+    if variants:
+        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F0_H0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '1.3', aux, buildingpart) #-- This one is with the eaves
+        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F0_H1"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '1.3', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F0_H2"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '1.3', aux, buildingpart)
+    CityGMLbuildingLOD1(CityGMLs["LOD1_3_F0_H3"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '1.3', aux, buildingpart)
+    if variants:
+        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F0_H4"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '1.3', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F0_H5"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '1.3', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F0_H6"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '1.3', aux, buildingpart) #-- This one is with the chimney or eaves
+
+    if variants:
+        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F1_H0"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '1.3', aux, buildingpart) #-- This one is with the eaves
+        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F1_H1"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '1.3', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F1_H2"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '1.3', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F1_H3"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '1.3', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F1_H4"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '1.3', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F1_H5"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '1.3', aux, buildingpart)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_3_F1_H6"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '1.3', aux, buildingpart) #-- This one is with the chimney or eaves
+
+    if variants:
+        CityGMLbuildingLOD1(CityGMLs["LOD1_3_Fd_H0"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '1.3', aux, buildingpart, True) #-- This one is with the eaves
+        CityGMLbuildingLOD1(CityGMLs["LOD1_3_Fd_H1"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '1.3', aux, buildingpart, True)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_3_Fd_H2"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '1.3', aux, buildingpart, True)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_3_Fd_H3"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '1.3', aux, buildingpart, True)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_3_Fd_H4"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '1.3', aux, buildingpart, True)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_3_Fd_H5"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '1.3', aux, buildingpart, True)
+        CityGMLbuildingLOD1(CityGMLs["LOD1_3_Fd_H6"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '1.3', aux, buildingpart, True) #-- This one is with the chimney or eaves
+
+    #- Solids
+    if solids:
+        if variants:
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F0_H0_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '1.3', aux, buildingpart) #-- This one is with the eaves
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F0_H1_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '1.3', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F0_H2_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '1.3', aux, buildingpart)
+        CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F0_H3_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '1.3', aux, buildingpart)
+        if variants:
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F0_H4_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '1.3', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F0_H5_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '1.3', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F0_H6_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '1.3', aux, buildingpart) #-- This one is with the chimney or eaves
+
+        if variants:
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F1_H0_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '1.3', aux, buildingpart) #-- This one is with the eaves
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F1_H1_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '1.3', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F1_H2_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '1.3', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F1_H3_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '1.3', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F1_H4_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '1.3', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F1_H5_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '1.3', aux, buildingpart)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_F1_H6_solid"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '1.3', aux, buildingpart) #-- This one is with the chimney or eaves
+
+        if variants:
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_Fd_H0_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '1.3', aux, buildingpart, True) #-- This one is with the eaves
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_Fd_H1_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '1.3', aux, buildingpart, True)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_Fd_H2_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '1.3', aux, buildingpart, True)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_Fd_H3_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '1.3', aux, buildingpart, True)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_Fd_H4_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '1.3', aux, buildingpart, True)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_Fd_H5_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '1.3', aux, buildingpart, True)
+            CityGMLbuildingLOD1Solid(CityGMLs["LOD1_3_Fd_H6_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '1.3', aux, buildingpart, True) #-- This one is with the chimney or eaves
+
+        #- Semantics
+        if variants:
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F0_H0_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, eaves, '1.3', aux, buildingpart) #-- This one is with the eaves
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F0_H1_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 0.0, None, '1.3', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F0_H2_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, onethird, '1.3', aux, buildingpart)
+        CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F0_H3_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, half, '1.3', aux, buildingpart)
+        if variants:
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F0_H4_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, twothird, '1.3', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F0_H5_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, 1, chimneyHeight, '1.3', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F0_H6_semantics"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, None, chimneyHeight, '1.3', aux, buildingpart) #-- This one is with the chimney or eaves
+
+        if variants:
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F1_H0_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, eaves, '1.3', aux, buildingpart) #-- This one is with the eaves
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F1_H1_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 0.0, None, '1.3', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F1_H2_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, onethird, '1.3', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F1_H3_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, half, '1.3', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F1_H4_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, twothird, '1.3', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F1_H5_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, 1, chimneyHeight, '1.3', aux, buildingpart)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_F1_H6_semantics"], ID, attributes, adjorigin, adjxsize, adjysize, zsize, h, roofType, None, chimneyHeight, '1.3', aux, buildingpart) #-- This one is with the chimney or eaves
+
+        if variants:
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_Fd_H0_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, eaves, '1.3', aux, buildingpart, True) #-- This one is with the eaves
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_Fd_H1_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 0.0, None, '1.3', aux, buildingpart, True)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_Fd_H2_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, onethird, '1.3', aux, buildingpart, True)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_Fd_H3_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, half, '1.3', aux, buildingpart, True)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_Fd_H4_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, twothird, '1.3', aux, buildingpart, True)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_Fd_H5_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, 1, chimneyHeight, '1.3', aux, buildingpart, True)
+            CityGMLbuildingLOD1Semantics(CityGMLs["LOD1_3_Fd_H6_semantics"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, zsize, h, roofType, None, chimneyHeight, '1.3', aux, buildingpart, True) #-- This one is with the chimney or eaves
+
+
+    #--LOD2
+    #-LOD2.0
+    CityGMLbuildingLOD2Semantics(CityGMLs["LOD2_0_F0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, r, None, '2.0', aux, buildingpart)
+    if variants:
+        CityGMLbuildingLOD2Semantics(CityGMLs["LOD2_0_F1"], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, adjr, None, '2.0', aux, buildingpart)
+        CityGMLbuildingLOD2Semantics(CityGMLs["LOD2_0_Fd"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, adjr_offset, None, '2.0', aux, buildingpart, True)
+    if solids:
+        CityGMLbuildingLOD2Solid(CityGMLs["LOD2_0_F0_S0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, r, None, 'brep', '2.0', aux, buildingpart)
+    if solids:
+        if variants:
+            CityGMLbuildingLOD2Solid(CityGMLs["LOD2_0_F1_S0"], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, adjr, None, 'brep', '2.0', aux, buildingpart)
+            CityGMLbuildingLOD2Solid(CityGMLs["LOD2_0_Fd_S0"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, adjr_offset, None, 'brep', '2.0', aux, buildingpart, True)
+        CityGMLbuildingLOD2Solid(CityGMLs["LOD2_0_F0_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, r, None, 'solid', '2.0', aux, buildingpart)
+        if variants:
+            CityGMLbuildingLOD2Solid(CityGMLs["LOD2_0_F1_solid"], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, adjr, None, 'solid', '2.0', aux, buildingpart)
+            CityGMLbuildingLOD2Solid(CityGMLs["LOD2_0_Fd_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, adjr_offset, None, 'solid', '2.0', aux, buildingpart, True)
+
+    #-LOD2.1
+    CityGMLbuildingLOD2Semantics(CityGMLs["LOD2_1_F0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, r, None, '2.1', aux, buildingpart)
+    if variants:
+        CityGMLbuildingLOD2Semantics(CityGMLs["LOD2_1_F1"], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, adjr, None, '2.1', aux, buildingpart)
+        CityGMLbuildingLOD2Semantics(CityGMLs["LOD2_1_Fd"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, adjr_offset, None, '2.1', aux, buildingpart, True)
+    if solids: 
+        CityGMLbuildingLOD2Solid(CityGMLs["LOD2_1_F0_S0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, r, None, 'brep', '2.1', aux, buildingpart)
+        if variants:
+            CityGMLbuildingLOD2Solid(CityGMLs["LOD2_1_F1_S0"], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, adjr, None, 'brep', '2.1', aux, buildingpart)
+            CityGMLbuildingLOD2Solid(CityGMLs["LOD2_1_Fd_S0"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, adjr_offset, None, 'brep', '2.1', aux, buildingpart, True)   
+        CityGMLbuildingLOD2Solid(CityGMLs["LOD2_1_F0_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, r, None, 'solid', '2.1', aux, buildingpart)
+        if variants:
+            CityGMLbuildingLOD2Solid(CityGMLs["LOD2_1_F1_solid"], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, adjr, None, 'solid', '2.1', aux, buildingpart)
+            CityGMLbuildingLOD2Solid(CityGMLs["LOD2_1_Fd_solid"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, adjr_offset, None, 'solid', '2.1', aux, buildingpart, True)
+
+
+    #-LOD2.2
+    #-Realised with LOD3 functions for programming reasons
+    CityGMLbuildingLOD3Semantics(CityGMLs['LOD2_2_F0'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, [0.0, 0.0], r, None, None, dormers, None, None, None, 1, aux, buildingpart, True)
+    if solids:
+        CityGMLbuildingLOD3Solid(CityGMLs['LOD2_2_F0_solid'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, [0.0, 0.0], r, None, None, dormers, None, None, None, additional, 'solid', aux, buildingpart)
+        CityGMLbuildingLOD3Solid(CityGMLs['LOD2_2_F0_S0'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, [0.0, 0.0], r, None, None, dormers, None, None, None, additional, 'brep', aux, buildingpart)
+    if variants:
+        CityGMLbuildingLOD3Semantics(CityGMLs['LOD2_2_F1'], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, [0.0, 0.0], adjr, None, None, dormers_ovh, None, None, None, 1, aux, buildingpart, True)
+        CityGMLbuildingLOD3Semantics(CityGMLs['LOD2_2_Fd'], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, [offset, offset], adjr_offset, None, None, dormers_offset, None, None, None, 1, aux, buildingpart, True)
+        if solids:
+            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_2_F1_solid'], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, [0.0, 0.0], adjr, None, None, dormers_ovh, None, None, None, additional, 'solid', aux, buildingpart)
+            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_2_F1_S0'], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, [0.0, 0.0], adjr, None, None, dormers_ovh, None, None, None, additional, 'brep', aux, buildingpart)
+            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_2_Fd_solid'], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, [offset, offset], adjr_offset, None, None, dormers_offset, None, None, None, additional, 'solid', aux, buildingpart)
+            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_2_Fd_S0'], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, [offset, offset], adjr_offset, None, None, dormers_offset, None, None, None, additional, 'brep', aux, buildingpart)
+
+    #-LOD2.3
+    CityGMLbuildingLOD2Semantics(CityGMLs["LOD2_3_F0"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, r, ovh, '2.3', aux, buildingpart)
+
+    if variants:
+        CityGMLbuildingLOD2Semantics(CityGMLs["LOD2_3_Fd"], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, adjr_offset, [offset, offset], '2.3', aux, buildingpart, True)
+        if solids:
+            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_3_F0_S0'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, None, None, None, None, None, None, additional, 'brep', aux, buildingpart)
+        if variants and solids:
+            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_3_Fd_S0'], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, [offset, offset], adjr_offset, None, None, None, None, None, None, additional, 'brep', aux, buildingpart)
+        if solids:
+            CityGMLbuildingLOD3Solid(CityGMLs["LOD2_3_F0_solid"], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, [0.0, 0.0], r, None, None, None, None, None, None, additional, 'solid', aux, buildingpart)
+        if variants and solids:
+            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_3_Fd_solid'], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, [offset, offset], adjr_offset, None, None, None, None, None, None, additional, 'solid', aux, buildingpart)
+
+    #-LOD2.3 with dormers
+    #-Realised with LOD3 functions for programming reasons
+    if variants:
+        CityGMLbuildingLOD3Semantics(CityGMLs['LOD2_3_F0_with_dormers'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, None, None, dormers, None, None, None, 1, aux, buildingpart, True)
+        if solids:
+            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_3_F0_solid_with_dormers'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, None, None, dormers, None, None, None, additional, 'solid', aux, buildingpart)
+            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_3_F0_S0_with_dormers'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, None, None, dormers, None, None, None, additional, 'brep', aux, buildingpart)
+        CityGMLbuildingLOD3Semantics(CityGMLs['LOD2_3_Fd_with_dormers'], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, [offset, offset], adjr_offset, None, None, dormers_offset, None, None, None, 1, aux, buildingpart, True)
+        if solids:
+            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_3_Fd_solid_with_dormers'], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, [offset, offset], adjr_offset, None, None, dormers_offset, None, None, None, additional, 'solid', aux, buildingpart)
+            CityGMLbuildingLOD3Solid(CityGMLs['LOD2_3_Fd_S0_with_dormers'], ID, attributes, adjorigin_offset, adjxsize_offset, adjysize_offset, adjzsize_offset, adjh_offset, roofType, [offset, offset], adjr_offset, None, None, dormers_offset, None, None, None, additional, 'brep', aux, buildingpart)
+
+
+
+    #-- LOD3 variants
+    #-- LOD3.0
+    CityGMLbuildingLOD3Semantics(CityGMLs['LOD3_2'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, doorDict, wallWindows, dormers, roofWindows, chimney, None, 1, aux, buildingpart)
+    if solids:
+        CityGMLbuildingLOD3Solid(CityGMLs['LOD3_2_solid'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, None, None, dormers, None, None, None, additional, 'solid', aux, buildingpart)
+        CityGMLbuildingLOD3Solid(CityGMLs['LOD3_2_S0'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, None, None, dormers, None, None, None, additional, 'brep', aux, buildingpart)
+    #-- LOD3.1
+    CityGMLbuildingLOD3Semantics(CityGMLs['LOD3_3'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, doorDict, wallWindows, dormers, roofWindows, chimney, embrasure, 1, aux, buildingpart)
+    if solids:
+        CityGMLbuildingLOD3Solid(CityGMLs['LOD3_3_solid'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, doorDict, wallWindows, dormers, roofWindows, chimney, embrasure, 1, 'solid', aux, buildingpart)
+        CityGMLbuildingLOD3Solid(CityGMLs['LOD3_3_S0'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, doorDict, wallWindows, dormers, roofWindows, chimney, embrasure, 1, 'brep', aux, buildingpart)
+    #-- Hybrid models
+    CityGMLbuildingLOD3Semantics(CityGMLs['LOD3_1'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, doorDict, wallWindows, None, None, None, None, 1, aux, buildingpart)
+    CityGMLbuildingLOD3Semantics(CityGMLs['LOD3_0'], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, [0.0, 0.0], adjr, None, None, dormers_ovh, roofWindows_ovh, chimney_ovh, None, 1, aux, buildingpart, True)
+    if solids:
+        CityGMLbuildingLOD3Solid(CityGMLs['LOD3_1_solid'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, doorDict, wallWindows, None, None, None, None, 1, 'solid', aux, buildingpart)
+        CityGMLbuildingLOD3Solid(CityGMLs['LOD3_0_solid'], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, [0.0, 0.0], adjr, None, None, dormers_ovh, roofWindows_ovh, chimney_ovh, None, 1, 'solid', aux, buildingpart, True)
+        CityGMLbuildingLOD3Solid(CityGMLs['LOD3_1_S0'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, doorDict, wallWindows, None, None, None, None, 1, 'brep', aux, buildingpart)
+        CityGMLbuildingLOD3Solid(CityGMLs['LOD3_0_S0'], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, [0.0, 0.0], adjr, None, None, dormers_ovh, roofWindows_ovh, chimney_ovh, None, 1, 'brep', aux, buildingpart, True)
+    # #-- BI without structured semantics
+    # CityGMLbuildingLOD3Semantics(CityGMLs['LOD3BI'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, doorDict, wallWindows, dormers, roofWindows, chimney, embrasure, 0)
+    # CityGMLbuildingLOD3Semantics(CityGMLs['LOD3RF1'], ID, attributes, adjorigin, adjxsize, adjysize, adjzsize, adjh, roofType, [0.0, 0.0], adjr, None, None, dormers, roofWindows, chimney, embrasure, additional)
+    # #CityGMLbuildingLOD3Solid(CityGMLs['LOD3-solid'], ID, attributes, origin_coords, xsize, ysize, zsize, h, roofType, ovh, r, None, None, dormers, None, None, None, additional)
+
+    #-- Interior
+    #-- The storeys are computed once for all the interior representations
+    storeys = storeyTemplate(origin_coords, xsize, ysize, floors, floorHeight, wallThickness, joist)
+    CityGMLbuildingInteriorLOD0(CityGMLs['interior-LOD0'], ID, attributes, origin_coords, xsize, ysize, zsize, h, floors, floorHeight, roofType, r, wallThickness, joist, aux, buildingpart, storeys)
+    CityGMLbuildingInteriorLOD1(CityGMLs['interior-LOD1'], ID, attributes, origin_coords, xsize, ysize, zsize, h, floors, floorHeight, roofType, r, wallThickness, joist, aux, buildingpart, storeys)
+    CityGMLbuildingInteriorLOD2(CityGMLs['interior-LOD2_2'], ID, attributes, origin_coords, xsize, ysize, zsize, h, floors, floorHeight, roofType, r, wallThickness, joist, aux, buildingpart, None, storeys)
+    CityGMLbuildingInteriorLOD2(CityGMLs['interior-LOD2_3'], ID, attributes, origin_coords, xsize, ysize, zsize, h, floors, floorHeight, roofType, r, wallThickness, joist, aux, buildingpart, dormers, storeys)
+
+
+def rotateBuilding(CityGMLs, ID, angle_of_rotation, origin_coords):
+    """Rotate the coordinates of a building in all the representations by its angle (in degrees) around its origin."""
+    radian_rotation = math.radians(angle_of_rotation)
+    sine_rotation = math.sin(radian_rotation)
+    cosine_rotation = math.cos(radian_rotation)
+    for representation in CityGMLs:
+        for entity in CityGMLs[representation]:
+            #-- Iterate cityObjectMembers
+            if entity.tag == "cityObjectMember":
+                #-- Select the current one
+                if entity.getchildren()[0].attrib['{%s}id' % ns_gml] == ID:
+                    #-- Get the building XML node
+                    curr_b_inxml = entity.getchildren()[0]
+                    #-- Store all the <gml:posList> in a list
+                    posList_to_rotate = curr_b_inxml.findall(".//{%s}posList" % ns_gml)
+                    for pos in posList_to_rotate:
+                        points_to_rotate = GMLstring2points(pos.text)
+                        new_rotated_points = ''
+                        for point_to_rotate in points_to_rotate:
+                            rotated_point = rotator(point_to_rotate, sine_rotation, cosine_rotation, origin_coords)
+                            new_rotated_points += GMLPointList(rotated_point) + ' '
+                        pos.text = new_rotated_points[:-1]
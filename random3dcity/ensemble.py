@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT)
+
+# This code is part of the Random3Dcity package
+
+# Copyright (c) 2015
+# Filip Biljecki
+# Delft University of Technology
+# fbiljecki@gmail.com
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+"""
+Realisations of the city with random noise on its coordinates, for the studies of the propagation of errors.
+The noise is derived from the coordinates and the buildings themselves, so a vertex or a building gets the same noise in every representation of a realisation.
+"""
+
+import bisect
+import math
+import numpy
+
+#-- Constants of the splitmix64 generator
+GOLDENGAMMA = numpy.uint64(0x9E3779B97F4A7C15)
+MIXMULTIPLIERS = [numpy.uint64(0xBF58476D1CE4E5B9), numpy.uint64(0x94D049BB133111EB)]
+#-- Resolution of the coordinates which are considered the same vertex, in metres
+VERTEXRESOLUTION = 0.001
+
+
+def mixHash(h):
+    """Finalizer of splitmix64, which scrambles unsigned 64-bit integers."""
+    with numpy.errstate(over='ignore'):
+        h = (h ^ (h >> numpy.uint64(30))) * MIXMULTIPLIERS[0]
+        h = (h ^ (h >> numpy.uint64(27))) * MIXMULTIPLIERS[1]
+    return h ^ (h >> numpy.uint64(31))
+
+
+def hashedNormal(keys, seed, realisation, salt):
+    """Standard normal numbers derived from the rows of integer keys, always the same for the same keys, seed, realisation and salt."""
+    uniforms = []
+    for pair in range(2):
+        with numpy.errstate(over='ignore'):
+            h = numpy.uint64((seed * 1000003 + realisation * 64 + salt * 2 + pair) % 2 ** 64) * GOLDENGAMMA + numpy.zeros(len(keys), dtype=numpy.uint64)
+            for column in range(keys.shape[1]):
+                h = mixHash(h ^ keys[:, column].view(numpy.uint64))
+        uniforms.append(((h >> numpy.uint64(11)).astype(numpy.float64) + 0.5) / 2.0 ** 53)
+    #-- Box-Muller transform
+    return numpy.sqrt(-2.0 * numpy.log(uniforms[0])) * numpy.cos(2.0 * math.pi * uniforms[1])
+
+
+def coordinateSkeleton(data, buildingIndex, origins):
+    """Split a serialised CityGML file into its coordinates and a template of the file, which is done once for all the realisations.
+    Output: the template, with a %.3f in the place of each coordinate, the points, the index of the building of each point (-1 for the other city objects) and the origin of its building."""
+    #-- City object of each cityObjectMember, which is on the line after its start
+    memberstarts = []
+    memberbuildings = []
+    start = data.find(b'<cityObjectMember>')
+    while start != -1:
+        line = data.find(b'\n', start) + 1
+        objectline = data[line:data.find(b'>', line)]
+        idstart = objectline.find(b' gml:id="')
+        building = -1
+        if idstart != -1:
+            idstart += len(b' gml:id="')
+            building = buildingIndex.get(objectline[idstart:objectline.find(b'"', idstart)].decode('utf-8'), -1)
+        memberstarts.append(start)
+        memberbuildings.append(building)
+        start = data.find(b'<cityObjectMember>', line)
+    pieces = []
+    coordinates = []
+    buildings = []
+    position = 0
+    start = data.find(b'<gml:posList')
+    while start != -1:
+        start = data.find(b'>', start) + 1
+        end = data.find(b'</gml:posList>', start)
+        pieces.append(data[position:start].replace(b'%', b'%%'))
+        coordinates.append(data[start:end])
+        pieces.append(b' '.join([b'%.3f'] * len(coordinates[-1].split())))
+        member = bisect.bisect_right(memberstarts, start) - 1
+        buildings.append(memberbuildings[member] if member >= 0 else -1)
+        position = end
+        start = data.find(b'<gml:posList', end)
+    pieces.append(data[position:].replace(b'%', b'%%'))
+    counts = [len(posList.split()) // 3 for posList in coordinates]
+    points = numpy.array(b' '.join(coordinates).split(), dtype=numpy.float64).reshape(-1, 3)
+    buildings = numpy.repeat(numpy.array(buildings, dtype=numpy.int64), counts)
+    origins = numpy.vstack([numpy.array(origins, dtype=numpy.float64).reshape(-1, 3), numpy.zeros((1, 3))])
+    return b''.join(pieces), points, buildings, origins[buildings]
+
+
+def perturbedPoints(skeleton, noise, realisation):
+    """Points of a realisation: the buildings scaled around their origin in plan (dimensions) and in height (heights) by normal factors, and each vertex moved by normal noise (vertices).
+    The standard deviations of the factors are relative, the one of the vertices is in metres."""
+    template, points, buildings, origins = skeleton
+    seed = int(noise.get('seed', 0))
+    perturbed = points.copy()
+    isbuilding = buildings >= 0
+    keys = buildings.reshape(-1, 1)
+    if noise.get('dimensions'):
+        factors = numpy.where(isbuilding, 1.0 + noise['dimensions'] * hashedNormal(keys, seed, realisation, 0), 1.0)
+        perturbed[:, :2] = origins[:, :2] + (points[:, :2] - origins[:, :2]) * factors[:, numpy.newaxis]
+    if noise.get('heights'):
+        factors = numpy.where(isbuilding, 1.0 + noise['heights'] * hashedNormal(keys, seed, realisation, 1), 1.0)
+        perturbed[:, 2] = origins[:, 2] + (points[:, 2] - origins[:, 2]) * factors
+    if noise.get('vertices'):
+        vertices = numpy.round(points / VERTEXRESOLUTION).astype(numpy.int64)
+        for axis in range(3):
+            perturbed[:, axis] += noise['vertices'] * hashedNormal(vertices, seed, realisation, 2 + axis)
+    return perturbed
+
+
+def perturbedCityGML(skeleton, noise, realisation):
+    """Serialised CityGML of a realisation: the template of the file filled with the perturbed coordinates, in millimetres."""
+    return skeleton[0] % tuple(perturbedPoints(skeleton, noise, realisation).ravel().tolist())
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT)
+
+# This code is part of the Random3Dcity package
+
+# Copyright (c) 2015
+# Filip Biljecki
+# Delft University of Technology
+# fbiljecki@gmail.com
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Builders of the non-building features: road network and vegetation.
+"""
+
+from lxml import etree
+import numpy
+import uuid
+
+from random3dcity.geometry import ns_gml, ns_tran, ns_veg, addsurface
+
+
+#-- Generate an UUID for each polygon, configured by generateCityGML.py according to its options
+ASSIGNID = True
+
+
+def b2p(exts):
+    """Convert two points of a polygon into its bounding box.
+    (Rectangular polygon parallel with axes.)
+    """
+    p0x = exts[0][0]
+    p0y = exts[0][1]
+    p0 = str(p0x) + ' ' + str(p0y) + ' ' + '0.0' 
+    p1x = exts[0][2]
+    p1y = exts[0][3]
+    p1 = str(p1x) + ' ' + str(p1y) + ' ' + '0.0'
+    pb = str(p1x) + ' ' + str(p0y) + ' ' + '0.0' 
+    pu = str(p0x) + ' ' + str(p1y) + ' ' + '0.0' 
+    e = "%s %s %s %s %s" % (p0, pb, p1, pu, p0)
+    i = []
+    if exts[1] is not None:
+        for h in exts[1]:
+            p0x = h[0]
+            p0y = h[1]
+            p0 = str(p0x) + ' ' + str(p0y) + ' ' + '0.0' 
+            p1x = h[2]
+            p1y = h[3]
+            p1 = str(p1x) + ' ' + str(p1y) + ' ' + '0.0'
+            pb = str(p1x) + ' ' + str(p0y) + ' ' + '0.0' 
+            pu = str(p0x) + ' ' + str(p1y) + ' ' + '0.0' 
+            i.append("%s %s %s %s %s" % (p0, pu, p1, pb, p0))
+    return e, i
+
+
+def b2s(exts):
+    """Convert two points of a solid into its bounding box.
+    (Cube-like solid parallel with axes.)
+    """
+    p0x = exts[0][0]
+    p0y = exts[0][1]
+    p0 = str(p0x) + ' ' + str(p0y) + ' ' + '0.0' 
+    p0T = str(p0x) + ' ' + str(p0y) + ' ' + str(exts[1])
+
+    p1x = exts[0][2]
+    p1y = exts[0][3]
+    p1 = str(p1x) + ' ' + str(p1y) + ' ' + '0.0'
+    p1T = str(p1x) + ' ' + str(p1y) + ' ' + str(exts[1])
+
+    pb = str(p1x) + ' ' + str(p0y) + ' ' + '0.0' 
+    pbT = str(p1x) + ' ' + str(p0y) + ' ' + str(exts[1])
+    pu = str(p0x) + ' ' + str(p1y) + ' ' + '0.0' 
+    puT = str(p0x) + ' ' + str(p1y) + ' ' + str(exts[1])
+
+    surfaces = []
+    surfaces.append("%s %s %s %s %s" % (p0, pu, p1, pb, p0))
+    surfaces.append("%s %s %s %s %s" % (p0T, pbT, p1T, puT, p0T))
+    surfaces.append("%s %s %s %s %s" % (p0, pb, pbT, p0T, p0))
+    surfaces.append("%s %s %s %s %s" % (pb, p1, p1T, pbT, pb))
+    surfaces.append("%s %s %s %s %s" % (p1, pu, puT, p1T, p1))
+    surfaces.append("%s %s %s %s %s" % (pu, p0, p0T, puT, pu))
+
+    return surfaces
+
+
+def CityGMLstreets(CityModel, street_data):
+    """Generates a road network with the thematic module for Transportation Objects."""
+    cityObject = etree.SubElement(CityModel, "cityObjectMember")
+    transpobj = etree.SubElement(cityObject, "{%s}Road" % ns_tran)
+    if ASSIGNID:
+        transpobj.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+    transpms = etree.SubElement(transpobj, "{%s}lod1MultiSurface" % ns_tran)
+    MultiSurface = etree.SubElement(transpms, "{%s}MultiSurface" % ns_gml)
+    surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
+    Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
+    if ASSIGNID:
+        Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+
+    street_points = b2p(street_data)
+
+    PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
+    LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
+    posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+    posList.text = street_points[0]
+
+    for h in street_points[1]:
+        PolygonInterior = etree.SubElement(Polygon, "{%s}interior" % ns_gml)
+        LinearRing = etree.SubElement(PolygonInterior, "{%s}LinearRing" % ns_gml)
+        posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+        posList.text = h
+
+
+def streetTiles(street_data):
+    """Decompose the road network into rectangular tiles (road segments and intersections).
+    The coordinates of the outline and of the blocks split the network into a grid of cells, and the cells not covered by a block are the tiles.
+    Returns the tiles as rows of [x0, y0, x1, y1], one row of the grid at a time."""
+    outline = numpy.array(street_data[0], dtype=float)
+    holes = numpy.array(street_data[1], dtype=float).reshape(-1, 4)
+    xs = numpy.unique(numpy.clip(numpy.concatenate((outline[[0, 2]], holes[:, 0], holes[:, 2])), outline[0], outline[2]))
+    ys = numpy.unique(numpy.clip(numpy.concatenate((outline[[1, 3]], holes[:, 1], holes[:, 3])), outline[1], outline[3]))
+    #-- Mark the cells covered by the blocks with a 2D difference array
+    i0 = numpy.searchsorted(xs, numpy.clip(holes[:, 0], outline[0], outline[2]))
+    i1 = numpy.searchsorted(xs, numpy.clip(holes[:, 2], outline[0], outline[2]))
+    j0 = numpy.searchsorted(ys, numpy.clip(holes[:, 1], outline[1], outline[3]))
+    j1 = numpy.searchsorted(ys, numpy.clip(holes[:, 3], outline[1], outline[3]))
+    covered = numpy.zeros((len(xs), len(ys)), dtype=int)
+    numpy.add.at(covered, (i0, j0), 1)
+    numpy.add.at(covered, (i1, j0), -1)
+    numpy.add.at(covered, (i0, j1), -1)
+    numpy.add.at(covered, (i1, j1), 1)
+    road = covered.cumsum(axis=0).cumsum(axis=1)[:-1, :-1] == 0
+    for i in range(len(xs) - 1):
+        j = numpy.nonzero(road[i])[0]
+        if len(j) == 0:
+            continue
+        tiles = numpy.empty((len(j), 4))
+        tiles[:, 0] = xs[i]
+        tiles[:, 1] = ys[j]
+        tiles[:, 2] = xs[i + 1]
+        tiles[:, 3] = ys[j + 1]
+        yield tiles.tolist()
+
+
+def CityGMLplantCoverLOD0(CityModel, pc_data):
+    """Generates a PlantCover as a 2.5D surface."""
+    cityObject = etree.SubElement(CityModel, "cityObjectMember")
+    pcobj = etree.SubElement(cityObject, "{%s}PlantCover" % ns_veg)
+    if ASSIGNID:
+        pcobj.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+    pcms = etree.SubElement(pcobj, "{%s}lod1MultiSurface" % ns_veg)
+    MultiSurface = etree.SubElement(pcms, "{%s}MultiSurface" % ns_gml)
+    surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
+    Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
+    if ASSIGNID:
+        Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+
+    pc_points = b2p([pc_data[0], None])
+
+    PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
+    LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
+    posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+    posList.text = pc_points[0]
+
+
+def CityGMLplantCoverLOD1(CityModel, pc_data):
+    """Generates a PlantCover as a solid."""
+    cityObject = etree.SubElement(CityModel, "cityObjectMember")
+    pcobj = etree.SubElement(cityObject, "{%s}PlantCover" % ns_veg)
+    if ASSIGNID:
+        pcobj.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+    lod1MultiSolid = etree.SubElement(pcobj, "{%s}lod1MultiSolid" % ns_veg)
+    multiSolid = etree.SubElement(lod1MultiSolid, "{%s}MultiSolid" % ns_gml)
+    solidmember = etree.SubElement(multiSolid, "{%s}solidMember" % ns_gml)
+    Solid = etree.SubElement(solidmember, "{%s}Solid" % ns_gml)
+    if ASSIGNID:
+        Solid.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+    exterior = etree.SubElement(Solid, "{%s}exterior" % ns_gml)
+    CompositeSurface = etree.SubElement(exterior, "{%s}CompositeSurface" % ns_gml)
+    
+    pc_surfaces = b2s(pc_data)
+
+    for pc_s in pc_surfaces:
+        addsurface(False, CompositeSurface, pc_s)
@@ -0,0 +1,1300 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT)
+
+# This code is part of the Random3Dcity package
+
+# Copyright (c) 2015
+# Filip Biljecki
+# Delft University of Technology
+# fbiljecki@gmail.com
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Shared geometry of the buildings: vertices of the bodies and roofs, GML coordinate strings, surfaces, roofs, openings and the template of the storeys.
+"""
+
+from lxml import etree
+import uuid
+
+
+#-- Name spaces
+ns_citygml = "http://www.opengis.net/citygml/2.0"
+
+ns_gml = "http://www.opengis.net/gml"
+ns_bldg = "http://www.opengis.net/citygml/building/2.0"
+ns_tran = "http://www.opengis.net/citygml/transportation/2.0"
+ns_veg = "http://www.opengis.net/citygml/vegetation/2.0"
+ns_xsi = "http://www.w3.org/2001/XMLSchema-instance"
+ns_xAL = "urn:oasis:names:tc:ciq:xsdschema:xAL:2.0"
+ns_xlink = "http://www.w3.org/1999/xlink"
+ns_dem = "http://www.opengis.net/citygml/relief/2.0"
+ns_fme = "http://www.safe.com/xml/xmltables"
+
+nsmap = {
+    None: ns_citygml,
+    'gml': ns_gml,
+    'bldg': ns_bldg,
+    'tran': ns_tran,
+    'veg': ns_veg,
+    'xsi': ns_xsi,
+    'xAL': ns_xAL,
+    'xlink': ns_xlink,
+    'dem': ns_dem,
+    'fme': ns_fme
+}
+
+
+#-- Generate an UUID for each polygon, configured by generateCityGML.py according to its options
+ASSIGNID = True
+
+#-- Openings and embrasures of the current building, computed once for all the LOD3 representations
+openingGeometries = {}
+
+
+def verticesBody(o, x, y, z, h=None, top=None, override=None):
+    """Calculates the vertices of the building block/body depending on the input."""
+    #-- If the h value is not supplied than it is zero
+    if not h:
+         h = 0.0
+    if top:
+        if top < 1.5:
+            z = z + float(top) * h
+    elif top is None:
+            if override:
+                z = override
+            else:
+                z = z + h
+
+    p = []
+    p0 = "%s %s %s" % (o[0],o[1],o[2])
+    p.append(p0)
+    p1 = "%s %s %s" % (o[0]+x,o[1],o[2])
+    p.append(p1)
+    p2 = "%s %s %s" % (o[0]+x,o[1]+y,o[2])
+    p.append(p2)
+    p3 = "%s %s %s" % (o[0],o[1]+y,o[2])
+    p.append(p3)
+    p4 = "%s %s %s" % (o[0],o[1],o[2]+z)
+    p.append(p4)
+    p5 = "%s %s %s" % (o[0]+x,o[1],o[2]+z)
+    p.append(p5)
+    p6 = "%s %s %s" % (o[0]+x,o[1]+y,o[2]+z)
+    p.append(p6)
+    p7 = "%s %s %s" % (o[0],o[1]+y,o[2]+z)
+    p.append(p7)
+
+    return p
+
+
+def verticesBodyList(o, x, y, z, h=None, top=None):
+    """Calculates the vertices of the building block/body as a list depending on the input. Redundant function."""
+    #-- If the h value is not supplied than it is zero
+    if not h:
+         h = 0.0
+    if top:
+        z = z + float(top) * h
+
+    p = []
+    p0 = [o[0],o[1],o[2]]
+    p.append(p0)
+    p1 = [o[0]+x,o[1],o[2]]
+    p.append(p1)
+    p2 = [o[0]+x,o[1]+y,o[2]]
+    p.append(p2)
+    p3 = [o[0],o[1]+y,o[2]]
+    p.append(p3)
+    p4 = [o[0],o[1],o[2]+z]
+    p.append(p4)
+    p5 = [o[0]+x,o[1],o[2]+z]
+    p.append(p5)
+    p6 = [o[0]+x,o[1]+y,o[2]+z]
+    p.append(p6)
+    p7 = [o[0],o[1]+y,o[2]+z]
+    p.append(p7)
+    return p
+
+
+def verticesRoof(b, h, rtype, width=None):
+    """Calculates the vertices of the building roof."""
+    #-- The basic information
+    o, x, y, z = b
+    #-- If no roof
+    if not h:
+        h = 0.0
+    #-- Roof points
+    r = []
+    if rtype == 'Gabled':
+        r0 = "%s %s %s" % (o[0]+.5*x, o[1], o[2]+z+h)
+        r.append(r0)
+        r1 = "%s %s %s" % (o[0]+.5*x, o[1]+y, o[2]+z+h)
+        r.append(r1)
+    elif rtype == 'Shed':
+        r0 = "%s %s %s" % (o[0], o[1], o[2]+z+h)
+        r.append(r0)
+        r1 = "%s %s %s" % (o[0], o[1]+y, o[2]+z+h)
+        r.append(r1)
+    elif rtype == 'Hipped' or rtype == 'Pyramidal':
+        r0 = "%s %s %s" % (o[0]+.5*x, o[1]+width, o[2]+z+h)
+        r.append(r0)
+        r1 = "%s %s %s" % (o[0]+.5*x, o[1]+y-width, o[2]+z+h)
+        r.append(r1)        
+    return r
+
+
+def verticesOverhangs(b, p, h, rtype, ovh, r, width=None):
+    """Calculates the vertices of the roof overhangs"""
+    #-- The basic information about the building
+    o, x, y, z = b
+    #-- Roof points
+    if r:
+        r0, r1 = r
+    #-- Overhang lenghts
+    ovhx, ovhy = ovh
+
+    overhangs = []
+    interior = []
+
+    #-- Overhang points
+    if rtype == 'Gabled':
+
+        if ovhx > 0:
+            fx = (.5*x) / ovhx
+            ovhz = h / fx
+        else:
+            ovhz = 0
+
+        overhangs.append("")
+        overhangs[0] += r0
+        overhangs[0] += " %s %s %s" % (o[0]+.5*x, o[1]-ovhy, o[2]+z+h)
+        overhangs[0] += " %s %s %s" % (o[0]+x+ovhx, o[1]-ovhy, o[2]+z-ovhz)
+        overhangs[0] += " %s %s %s" % (o[0]+x+ovhx, o[1]+y+ovhy, o[2]+z-ovhz)
+        overhangs[0] += " %s %s %s" % (o[0]+.5*x, o[1]+y+ovhy, o[2]+z+h)
+        overhangs[0] += " " + r1
+        overhangs[0] += " " + p[6]
+        overhangs[0] += " " + p[5]
+        overhangs[0] += " " + r0
+        #-- The above polygon has no interior
+        interior.append(None)
+        
+        overhangs.append("")
+        overhangs[1] += r1
+        overhangs[1] += " %s %s %s" % (o[0]+.5*x, o[1]+y+ovhy, o[2]+z+h)
+        overhangs[1] += " %s %s %s" % (o[0]-ovhx, o[1]+y+ovhy, o[2]+z-ovhz)
+        overhangs[1] += " %s %s %s" % (o[0]-ovhx, o[1]-ovhy, o[2]+z-ovhz)
+        overhangs[1] += " %s %s %s" % (o[0]+.5*x, o[1]-ovhy, o[2]+z+h)
+        overhangs[1] += " " + r0
+        overhangs[1] += " " + p[4]
+        overhangs[1] += " " + p[7]
+        overhangs[1] += " " + r1
+        #-- The above polygon has no interior
+        interior.append(None)
+
+        eaves = o[2]+z-ovhz
+
+    elif rtype == 'Shed':
+
+        if ovhx > 0:
+            fx = x / ovhx
+            ovhz = h / fx
+        else:
+            ovhz = 0
+
+        overhangs.append("")
+        overhangs[0] += "%s %s %s" % (o[0]-ovhx, o[1]-ovhy, o[2]+z+h+ovhz)
+        overhangs[0] += " %s %s %s" % (o[0]+x+ovhx, o[1]-ovhy, o[2]+z-ovhz)
+        overhangs[0] += " %s %s %s" % (o[0]+x+ovhx, o[1]+y+ovhy, o[2]+z-ovhz)
+        overhangs[0] += " %s %s %s" % (o[0]-ovhx, o[1]+y+ovhy, o[2]+z+h+ovhz)
+        overhangs[0] += " %s %s %s" % (o[0]-ovhx, o[1]-ovhy, o[2]+z+h+ovhz)
+
+        interior.append("")
+        interior[0] += r0
+        interior[0] += " " + r1
+        interior[0] += " " + p[6]
+        interior[0] += " " + p[5]
+        interior[0] += " " + r0
+
+        eaves = o[2]+z-ovhz
+
+    elif rtype == 'Hipped' or rtype == 'Pyramidal':
+
+        if ovhx > 0:
+            fx = (.5*x) / ovhx
+            ovhz = h / fx
+            
+            fy = h / ovhz
+            ovhy = width / fy
+
+        else:
+            ovhy = 0
+            ovhz = 0
+
+        overhangs.append("")
+        overhangs[0] += "%s %s %s" % (o[0]-ovhx, o[1]-ovhy, o[2]+z-ovhz)
+        overhangs[0] += " %s %s %s" % (o[0]+x+ovhx, o[1]-ovhy, o[2]+z-ovhz)
+        overhangs[0] += " " + p[5]
+        overhangs[0] += " " + p[4]
+        overhangs[0] += " %s %s %s" % (o[0]-ovhx, o[1]-ovhy, o[2]+z-ovhz)
+        interior.append(None)
+
+        overhangs.append("")
+        overhangs[1] += "%s %s %s" % (o[0]+x+ovhx, o[1]-ovhy, o[2]+z-ovhz)
+        overhangs[1] += " %s %s %s" % (o[0]+x+ovhx, o[1]+y+ovhy, o[2]+z-ovhz)
+        overhangs[1] += " " + p[6]
+        overhangs[1] += " " + p[5]
+        overhangs[1] += " %s %s %s" % (o[0]+x+ovhx, o[1]-ovhy, o[2]+z-ovhz)
+        interior.append(None)
+
+        overhangs.append("")
+        overhangs[2] += "%s %s %s" % (o[0]-ovhx, o[1]+y+ovhy, o[2]+z-ovhz)
+        overhangs[2] += " " + p[7]
+        overhangs[2] += " " + p[6]
+        overhangs[2] += " %s %s %s" % (o[0]+x+ovhx, o[1]+y+ovhy, o[2]+z-ovhz)
+        overhangs[2] += " %s %s %s" % (o[0]-ovhx, o[1]+y+ovhy, o[2]+z-ovhz)
+        interior.append(None)
+
+        overhangs.append("")
+        overhangs[3] += "%s %s %s" % (o[0]-ovhx, o[1]-ovhy, o[2]+z-ovhz)
+        overhangs[3] += " " + p[4]
+        overhangs[3] += " " + p[7]
+        overhangs[3] += " %s %s %s" % (o[0]-ovhx, o[1]+y+ovhy, o[2]+z-ovhz)
+        overhangs[3] += " %s %s %s" % (o[0]-ovhx, o[1]-ovhy, o[2]+z-ovhz)
+        interior.append(None)
+
+        eaves = o[2]+z-ovhz
+    
+    elif rtype == 'Flat':
+
+        overhangs.append("")
+        overhangs[0] += "%s %s %s" % (o[0]-ovhx,o[1]-ovhy,o[2]+z)
+        overhangs[0] += " %s %s %s" % (o[0]+x+ovhx,o[1]-ovhy,o[2]+z)
+        overhangs[0] += " %s %s %s" % (o[0]+x+ovhx,o[1]+y+ovhy,o[2]+z)
+        overhangs[0] += " %s %s %s" % (o[0]-ovhx,o[1]+y+ovhy,o[2]+z)
+        overhangs[0] += " %s %s %s" % (o[0]-ovhx,o[1]-ovhy,o[2]+z)
+
+        interior.append("")
+        interior[0] += p[4]
+        interior[0] += " " + p[7]
+        interior[0] += " " + p[6]
+        interior[0] += " " + p[5]
+        interior[0] += " " + p[4]
+        eaves = o[2]+z
+
+    ovhy_recalculated = ovhy
+
+    #-- Overhang points
+    return overhangs, interior, eaves, ovhy_recalculated
+
+
+def wallOpeningOrganiser(openings):
+    """Divide the openings per wall."""
+    if openings:
+        holes = [[], [], [], []]
+        opns = [[], [], [], []]
+        for i in range(0,4):
+            opns[i].append([])
+            opns[i].append([])
+        door = openings[0]
+        if door != '':
+            doorwall = int(door['wall'])
+            holes[doorwall].append(door['ring'])
+            opns[doorwall][0] = door
+
+        for o in openings[1]:
+            try:
+                windowwall = int(o['wall'])
+            except:
+                windowwall = int(o['side'])
+            holes[windowwall].append(o['ring'])
+            opns[windowwall][1].append(o)
+
+    else:
+        holes = None
+        opns = None
+
+    return holes, opns
+
+
+def GMLPointList(point):
+    """Translates the list of coordinates of one point to a string representation (GML)."""
+    x = point[0]
+    y = point[1]
+    z = point[2]
+    return "%s %s %s" % (x, y, z)
+
+
+def multiGMLPointList(points):
+    """Translates the list of multiple points to a string representation (GML)."""
+    l = ""
+    for t in points:
+        if len(l) > 0:
+            l += " "
+        l += GMLPointList(t)
+    return l
+
+
+def GMLstring2points(pointstring):
+    """Converts the list of points in string (GML) to a list."""
+    listPoints = []
+    #-- List of coordinates
+    coords = pointstring.split()
+    #-- Store the coordinate tuple
+    assert(len(coords) % 3 == 0)
+    for i in range(0, len(coords), 3):
+        listPoints.append([coords[i], coords[i+1], coords[i+2]])
+    return listPoints
+
+
+def GMLreverser(pointlist):
+    """Reverses the order of the points, i.e. the normal of the ring."""
+    revlist = pointlist[::-1]
+    return revlist
+
+
+def GMLreversedRing(r):
+    """Reverses a ring."""
+    gmllist= GMLstring2points(r)
+    revgmllist= GMLreverser(gmllist)
+    revring = multiGMLPointList(revgmllist)
+    return revring
+
+
+def adjustRoofFeatures(roofType, eaves, old_origin, overhang_x, overhang_y, side):
+    """This function adjusts the location of the features of the roof for models of different geometric references."""
+    old_x = old_origin[0]
+    old_y = old_origin[1]
+
+    if roofType == 'Gabled' or roofType == 'Shed' or roofType == 'Hipped' or roofType == 'Pyramidal':
+        if side == 1 or side == 3:
+            adjusted_x = old_x + overhang_y
+            adjusted_y = old_y + eaves
+        elif side == 0 or side == 2:
+            adjusted_x = old_x + overhang_x
+            adjusted_y = old_y + eaves
+    elif roofType == 'Flat':
+        adjusted_x = old_x + overhang_y
+        adjusted_y = old_y + overhang_x
+        #xperimiter = float(drm['origin'][1])
+
+    return [adjusted_x, adjusted_y]
+
+
+def gabledRoof(XMLelement, p, r, override_wall=None, semantics=None, openings=None, roofopenings=None, rfWindows=None, embrasure=None, pList=None):
+    """Constructs a building with a gabled roof."""
+    #-- Roof Surface
+    roof0 = "%s %s %s %s %s" % (r[0], r[1], p[7], p[4], r[0])
+    roof1 = "%s %s %s %s %s" % (r[1], r[0], p[5], p[6], r[1])
+
+    #-- Wall Surface
+    face0 = "%s %s %s %s %s %s" % (p[4], p[0], p[1], p[5], r[0], p[4])
+    if override_wall:
+        face1 = override_wall['wall']
+    else:
+        face1 = "%s %s %s %s %s" % (p[5], p[1], p[2], p[6], p[5])
+    face2 = "%s %s %s %s %s %s" % (p[6], p[2], p[3], p[7], r[1], p[6])
+    face3 = "%s %s %s %s %s" % (p[7], p[3], p[0], p[4], p[7])
+
+    if openings:
+        holes, opns = wallOpeningOrganiser(openings)
+    else:
+        holes = None
+        opns = None
+
+    if embrasure and openings:
+        embO = embrasuresGeometry(openings, pList, embrasure)
+
+    if semantics:
+        if roofopenings:
+            if rfWindows:
+                multiSurface2(XMLelement, roof0, "RoofSurface", roofopenings[3], 3, rfWindows[3])
+                multiSurface2(XMLelement, roof1, "RoofSurface", roofopenings[1], 3, rfWindows[1])
+            else:
+                multiSurface(XMLelement, roof0, "RoofSurface", roofopenings[3], 3)
+                multiSurface(XMLelement, roof1, "RoofSurface", roofopenings[1], 3)
+        else:
+            multiSurface(XMLelement, roof0, "RoofSurface")
+            multiSurface(XMLelement, roof1, "RoofSurface")
+        if openings:
+            if embrasure:
+                multiSurfaceWithEmbrasure(XMLelement, face0, "WallSurface", holes[0], 3, embO[0])
+            else:
+                multiSurface(XMLelement, face0, "WallSurface", holes[0], 3, opns[0])
+        else:
+            multiSurface(XMLelement, face0, "WallSurface", None)
+        if openings:
+            if embrasure:
+                multiSurfaceWithEmbrasure(XMLelement, face1, "WallSurface", holes[1], 3, embO[1])
+            else:
+                multiSurface(XMLelement, face1, "WallSurface", holes[1], 3, opns[1])
+        else:    
+            multiSurface(XMLelement, face1, "WallSurface", None)
+        if openings:
+            if embrasure:
+                multiSurfaceWithEmbrasure(XMLelement, face2, "WallSurface", holes[2], 3, embO[2])
+            else:
+                multiSurface(XMLelement, face2, "WallSurface", holes[2], 3, opns[2])
+        else:    
+            multiSurface(XMLelement, face2, "WallSurface", None)
+        if openings:
+            if embrasure:
+                multiSurfaceWithEmbrasure(XMLelement, face3, "WallSurface", holes[3], 3, embO[3])
+            else:
+                multiSurface(XMLelement, face3, "WallSurface", holes[3], 3, opns[3])
+        else:    
+            multiSurface(XMLelement, face3, "WallSurface", None)
+
+        #-- Building part
+        for fc in override_wall['rest']:
+            multiSurface(XMLelement, fc, "WallSurface", None)
+        for fc in override_wall['roof']:
+            multiSurface(XMLelement, fc, "RoofSurface", None)
+        for fc in override_wall['outerfloor']:
+            multiSurface(XMLelement, fc, "OuterFloorSurface", None)
+
+    else:
+        if roofopenings is not None:
+            addsurface(False, XMLelement, roof0, roofopenings[3])
+            addsurface(False, XMLelement, roof1, roofopenings[1])
+        else:
+            addsurface(False, XMLelement, roof0)
+            addsurface(False, XMLelement, roof1)
+        if holes is not None:
+            if embrasure:
+                addSurfaceWithEmbrasure(False, XMLelement, face0, holes[0], embO[0])
+                addSurfaceWithEmbrasure(False, XMLelement, face1, holes[1], embO[1])
+                addSurfaceWithEmbrasure(False, XMLelement, face2, holes[2], embO[2])
+                addSurfaceWithEmbrasure(False, XMLelement, face3, holes[3], embO[3])
+            else:
+                addsurface(False, XMLelement, face0)
+                addsurface(False, XMLelement, face1)
+                addsurface(False, XMLelement, face2)
+                addsurface(False, XMLelement, face3)
+
+        else:
+            addsurface(False, XMLelement, face0)
+            addsurface(False, XMLelement, face1)
+            addsurface(False, XMLelement, face2)
+            addsurface(False, XMLelement, face3)
+
+        for fc in override_wall['rest']:
+            addsurface(False, XMLelement, fc)
+        for fc in override_wall['roof']:
+            addsurface(False, XMLelement, fc)
+        for fc in override_wall['outerfloor']:
+            addsurface(False, XMLelement, fc)
+
+
+def shedRoof(XMLelement, p, r, override_wall=None, semantics=None, openings=None, roofopenings=None, rfWindows=None, embrasure=None, pList=None):
+    """Constructs a building with a shed roof."""
+    #-- Roof Surface
+    roof1 = "%s %s %s %s %s" % (r[1], r[0], p[5], p[6], r[1])
+
+    #-- Wall Surface
+    face0 = "%s %s %s %s %s" % (r[0], p[0], p[1], p[5], r[0])
+    if override_wall:
+        face1 = override_wall['wall']
+    else:
+        face1 = "%s %s %s %s %s" % (p[5], p[1], p[2], p[6], p[5])
+    face2 = "%s %s %s %s %s" % (p[6], p[2], p[3], r[1], p[6])
+    face3 = "%s %s %s %s %s" % (r[1], p[3], p[0], r[0], r[1])
+
+    if openings:
+        holes, opns = wallOpeningOrganiser(openings)
+    else:
+        holes = None
+        opns = None
+
+    if embrasure and openings:
+        embO = embrasuresGeometry(openings, pList, embrasure)
+
+
+    if semantics:
+        if roofopenings:
+            if rfWindows:
+                multiSurface2(XMLelement, roof1, "RoofSurface", roofopenings[1], 3, rfWindows[1])
+            else:
+                multiSurface(XMLelement, roof1, "RoofSurface", roofopenings[1], 3)
+        else:
+            multiSurface(XMLelement, roof1, "RoofSurface")
+        if openings:
+            if embrasure:
+                multiSurfaceWithEmbrasure(XMLelement, face0, "WallSurface", holes[0], 3, embO[0])
+            else:
+                multiSurface(XMLelement, face0, "WallSurface", holes[0], 3, opns[0])
+        else:
+            multiSurface(XMLelement, face0, "WallSurface", None)
+        if openings:
+            if embrasure:
+                multiSurfaceWithEmbrasure(XMLelement, face1, "WallSurface", holes[1], 3, embO[1])
+            else:
+                multiSurface(XMLelement, face1, "WallSurface", holes[1], 3, opns[1])
+        else:    
+            multiSurface(XMLelement, face1, "WallSurface", None)
+        if openings:
+            if embrasure:
+                multiSurfaceWithEmbrasure(XMLelement, face2, "WallSurface", holes[2], 3, embO[2])
+            else:
+                multiSurface(XMLelement, face2, "WallSurface", holes[2], 3, opns[2])
+        else:    
+            multiSurface(XMLelement, face2, "WallSurface", None)
+        if openings:
+            if embrasure:
+                multiSurfaceWithEmbrasure(XMLelement, face3, "WallSurface", holes[3], 3, embO[3])
+            else:
+                multiSurface(XMLelement, face3, "WallSurface", holes[3], 3, opns[3])
+        else:    
+            multiSurface(XMLelement, face3, "WallSurface", None) 
+
+        #-- Building part
+        for fc in override_wall['rest']:
+            multiSurface(XMLelement, fc, "WallSurface", None)
+        for fc in override_wall['roof']:
+            multiSurface(XMLelement, fc, "RoofSurface", None)
+        for fc in override_wall['outerfloor']:
+            multiSurface(XMLelement, fc, "OuterFloorSurface", None)
+
+    else:
+        if roofopenings is not None:
+            addsurface(False, XMLelement, roof1, roofopenings[1])
+        else:
+            addsurface(False, XMLelement, roof1)
+        if holes is not None and embrasure:
+            addSurfaceWithEmbrasure(False, XMLelement, face0, holes[0], embO[0])
+            addSurfaceWithEmbrasure(False, XMLelement, face1, holes[1], embO[1])
+            addSurfaceWithEmbrasure(False, XMLelement, face2, holes[2], embO[2])
+            addSurfaceWithEmbrasure(False, XMLelement, face3, holes[3], embO[3])            
+        else:
+            #addsurface(False, XMLelement, roof1)
+            addsurface(False, XMLelement, face0)
+            addsurface(False, XMLelement, face1)
+            addsurface(False, XMLelement, face2)
+            addsurface(False, XMLelement, face3)
+
+        for fc in override_wall['rest']:
+            addsurface(False, XMLelement, fc)
+        for fc in override_wall['roof']:
+            addsurface(False, XMLelement, fc)
+        for fc in override_wall['outerfloor']:
+            addsurface(False, XMLelement, fc)
+
+
+def hippedRoof(XMLelement, p, r, override_wall=None, semantics=None, openings=None, roofopenings=None, rfWindows=None, embrasure=None, pList=None):
+    """Constructs a building with a hipped or pyramidal roof."""
+    #-- Roof Surface
+    #-- Pyramidal roof has the same point r0 and r1
+    if r[0] == r[1]:
+        roof0 = "%s %s %s %s" % (r[0], p[7], p[4], r[0])
+        roof1 = "%s %s %s %s" % (r[1], p[5], p[6], r[1])    
+    else:
+        roof0 = "%s %s %s %s %s" % (r[0], r[1], p[7], p[4], r[0])
+        roof1 = "%s %s %s %s %s" % (r[1], r[0], p[5], p[6], r[1])
+    roofX = "%s %s %s %s" % (r[0], p[4], p[5], r[0])
+    roofY = "%s %s %s %s" % (r[1], p[6], p[7], r[1])
+
+    #-- Wall Surface
+    face0 = "%s %s %s %s %s" % (p[0], p[1], p[5], p[4], p[0])
+    if override_wall:
+        face1 = override_wall['wall']
+    else:
+        face1 = "%s %s %s %s %s" % (p[5], p[1], p[2], p[6], p[5])
+    face2 = "%s %s %s %s %s" % (p[2], p[3], p[7], p[6], p[2])
+    face3 = "%s %s %s %s %s" % (p[3], p[0], p[4], p[7], p[3])   
+
+    if openings:
+        holes, opns = wallOpeningOrganiser(openings)
+    else:
+        holes = None
+        opns = None
+
+    if embrasure and openings:
+        embO = embrasuresGeometry(openings, pList, embrasure)  
+
+    if semantics:
+        if roofopenings:
+            if rfWindows:
+                multiSurface2(XMLelement, roof0, "RoofSurface", roofopenings[3], 3, rfWindows[3])
+                multiSurface2(XMLelement, roof1, "RoofSurface", roofopenings[1], 3, rfWindows[1])
+                multiSurface2(XMLelement, roofX, "RoofSurface", roofopenings[0], 3, rfWindows[0])
+                multiSurface2(XMLelement, roofY, "RoofSurface", roofopenings[2], 3, rfWindows[2])
+            else:
+                multiSurface(XMLelement, roof0, "RoofSurface", roofopenings[3], 3)
+                multiSurface(XMLelement, roof1, "RoofSurface", roofopenings[1], 3)
+                multiSurface(XMLelement, roofX, "RoofSurface", roofopenings[0], 3)
+                multiSurface(XMLelement, roofY, "RoofSurface", roofopenings[2], 3)
+        else:
+            multiSurface(XMLelement, roof0, "RoofSurface")
+            multiSurface(XMLelement, roof1, "RoofSurface")
+            multiSurface(XMLelement, roofX, "RoofSurface")
+            multiSurface(XMLelement, roofY, "RoofSurface")
+        if openings:
+            if embrasure:
+                multiSurfaceWithEmbrasure(XMLelement, face0, "WallSurface", holes[0], 3, embO[0])
+            else:
+                multiSurface(XMLelement, face0, "WallSurface", holes[0], 3, opns[0])
+        else:
+            multiSurface(XMLelement, face0, "WallSurface", None)
+        if openings:
+            if embrasure:
+                multiSurfaceWithEmbrasure(XMLelement, face1, "WallSurface", holes[1], 3, embO[1])
+            else:
+                multiSurface(XMLelement, face1, "WallSurface", holes[1], 3, opns[1])
+        else:    
+            multiSurface(XMLelement, face1, "WallSurface", None)
+        if openings:
+            if embrasure:
+                multiSurfaceWithEmbrasure(XMLelement, face2, "WallSurface", holes[2], 3, embO[2])
+            else:
+                multiSurface(XMLelement, face2, "WallSurface", holes[2], 3, opns[2])
+        else:    
+            multiSurface(XMLelement, face2, "WallSurface", None)
+        if openings:
+            if embrasure:
+                multiSurfaceWithEmbrasure(XMLelement, face3, "WallSurface", holes[3], 3, embO[3])
+            else:
+                multiSurface(XMLelement, face3, "WallSurface", holes[3], 3, opns[3])
+        else:    
+            multiSurface(XMLelement, face3, "WallSurface", None)   
+
+        #-- Building part
+        for fc in override_wall['rest']:
+            multiSurface(XMLelement, fc, "WallSurface", None)
+        for fc in override_wall['roof']:
+            multiSurface(XMLelement, fc, "RoofSurface", None)
+        for fc in override_wall['outerfloor']:
+            multiSurface(XMLelement, fc, "OuterFloorSurface", None)
+
+    else:
+        if roofopenings is not None:
+            addsurface(False, XMLelement, roof0, roofopenings[3])
+            addsurface(False, XMLelement, roof1, roofopenings[1])
+            addsurface(False, XMLelement, roofX, roofopenings[0])
+            addsurface(False, XMLelement, roofY, roofopenings[2])           
+        else:
+            addsurface(False, XMLelement, roof0)
+            addsurface(False, XMLelement, roof1)
+            addsurface(False, XMLelement, roofX)
+            addsurface(False, XMLelement, roofY)
+        if holes is not None and embrasure:
+            addSurfaceWithEmbrasure(False, XMLelement, face0, holes[0], embO[0])
+            addSurfaceWithEmbrasure(False, XMLelement, face1, holes[1], embO[1])
+            addSurfaceWithEmbrasure(False, XMLelement, face2, holes[2], embO[2])
+            addSurfaceWithEmbrasure(False, XMLelement, face3, holes[3], embO[3])            
+        else:
+            addsurface(False, XMLelement, face0)
+            addsurface(False, XMLelement, face1)
+            addsurface(False, XMLelement, face2)
+            addsurface(False, XMLelement, face3)
+
+        for fc in override_wall['rest']:
+            addsurface(False, XMLelement, fc)
+        for fc in override_wall['roof']:
+            addsurface(False, XMLelement, fc)
+        for fc in override_wall['outerfloor']:
+            addsurface(False, XMLelement, fc)
+
+
+def flatRoof(XMLelement, p, r, override_wall=None, semantics=None, openings=None, roofopenings=None, rfWindows=None, embrasure=None, pList=None):
+    """Constructs a building with a flat roof."""
+    #-- Top face / Roof Surface
+    faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
+
+    #-- Wall Surface
+    face0 = "%s %s %s %s %s" % (p[0], p[1], p[5], p[4], p[0])
+    if override_wall:
+        face1 = override_wall['wall']
+    else:
+        face1 = "%s %s %s %s %s" % (p[5], p[1], p[2], p[6], p[5])
+    face2 = "%s %s %s %s %s" % (p[2], p[3], p[7], p[6], p[2])
+    face3 = "%s %s %s %s %s" % (p[3], p[0], p[4], p[7], p[3])
+
+    if openings:
+        holes, opns = wallOpeningOrganiser(openings)
+    else:
+        holes = None
+        opns = None
+
+    if embrasure and openings:
+        embO = embrasuresGeometry(openings, pList, embrasure)        
+
+
+    if semantics:
+        #-- Roofs
+        if roofopenings:
+            multiSurface2(XMLelement, faceTop, "RoofSurface", roofopenings[1], 3, rfWindows[1])
+        else:
+            multiSurface(XMLelement, faceTop, "RoofSurface", None)
+        #-- Walls
+        if openings:
+            if embrasure:
+                multiSurfaceWithEmbrasure(XMLelement, face0, "WallSurface", holes[0], 3, embO[0])
+            else:
+                multiSurface(XMLelement, face0, "WallSurface", holes[0], 3, opns[0])
+        else:
+            multiSurface(XMLelement, face0, "WallSurface", None)
+        if openings:
+            if embrasure:
+                multiSurfaceWithEmbrasure(XMLelement, face1, "WallSurface", holes[1], 3, embO[1])
+            else:
+                multiSurface(XMLelement, face1, "WallSurface", holes[1], 3, opns[1])
+        else:    
+            multiSurface(XMLelement, face1, "WallSurface", None)
+        if openings:
+            if embrasure:
+                multiSurfaceWithEmbrasure(XMLelement, face2, "WallSurface", holes[2], 3, embO[2])
+            else:
+                multiSurface(XMLelement, face2, "WallSurface", holes[2], 3, opns[2])
+        else:    
+            multiSurface(XMLelement, face2, "WallSurface", None)
+        if openings:
+            if embrasure:
+                multiSurfaceWithEmbrasure(XMLelement, face3, "WallSurface", holes[3], 3, embO[3])
+            else:
+                multiSurface(XMLelement, face3, "WallSurface", holes[3], 3, opns[3])
+        else:    
+            multiSurface(XMLelement, face3, "WallSurface", None)
+
+        #-- Building part
+        for fc in override_wall['rest']:
+            multiSurface(XMLelement, fc, "WallSurface", None)
+        for fc in override_wall['roof']:
+            multiSurface(XMLelement, fc, "RoofSurface", None)
+        for fc in override_wall['outerfloor']:
+            multiSurface(XMLelement, fc, "OuterFloorSurface", None)
+
+    else:
+        addsurface(False, XMLelement, faceTop)
+        if holes is not None and embrasure:
+            addSurfaceWithEmbrasure(False, XMLelement, face0, holes[0], embO[0])
+            addSurfaceWithEmbrasure(False, XMLelement, face1, holes[1], embO[1])
+            addSurfaceWithEmbrasure(False, XMLelement, face2, holes[2], embO[2])
+            addSurfaceWithEmbrasure(False, XMLelement, face3, holes[3], embO[3])            
+        else:
+            addsurface(False, XMLelement, face0)
+            addsurface(False, XMLelement, face1)
+            addsurface(False, XMLelement, face2)
+            addsurface(False, XMLelement, face3)
+
+        for fc in override_wall['rest']:
+            addsurface(False, XMLelement, fc)
+        for fc in override_wall['roof']:
+            addsurface(False, XMLelement, fc)
+        for fc in override_wall['outerfloor']:
+            addsurface(False, XMLelement, fc)
+
+
+def roofOverhangs(XMLelement, overhangs, interiors, semantics=None):
+    """Add surfaces for overhangs."""
+    i = 0
+    if semantics:
+        for overhang in overhangs:
+            multiSurface(XMLelement, overhang, "RoofSurface", interiors, 3)
+            i += 1
+    else:
+        for overhang in overhangs:
+            plainMultiSurface(XMLelement, overhang)
+            i += 1
+
+
+def openingRing(op, p):
+    """Makes a linear ring of the feature (opening)."""
+    X = op['origin'][0]
+    Y = op['origin'][1]
+    width = op['size'][0]
+    height = op['size'][1]
+
+    if op['wall'] == 0:
+        ring = "%s %s %s " % (p[0][0]+X, p[0][1], p[0][2]+Y)
+        ring+= "%s %s %s " % (p[0][0]+X, p[0][1], p[0][2]+Y+height)
+        ring+= "%s %s %s " % (p[0][0]+X+width, p[0][1], p[0][2]+Y+height)
+        ring+= "%s %s %s " % (p[0][0]+X+width, p[0][1], p[0][2]+Y)
+        ring+= "%s %s %s" % (p[0][0]+X, p[0][1], p[0][2]+Y)
+    elif op['wall'] == 1:
+        ring = "%s %s %s " % (p[1][0], p[1][1]+X, p[1][2]+Y)
+        ring+= "%s %s %s " % (p[1][0], p[1][1]+X, p[1][2]+Y+height)
+        ring+= "%s %s %s " % (p[1][0], p[1][1]+X+width, p[1][2]+Y+height)
+        ring+= "%s %s %s " % (p[1][0], p[1][1]+X+width, p[1][2]+Y)
+        ring+= "%s %s %s" % (p[1][0], p[1][1]+X, p[1][2]+Y)
+    elif op['wall'] == 2:
+        ring = "%s %s %s " % (p[2][0]-X, p[2][1], p[2][2]+Y)
+        ring+= "%s %s %s " % (p[2][0]-X, p[2][1], p[2][2]+Y+height)
+        ring+= "%s %s %s " % (p[2][0]-X-width, p[2][1], p[2][2]+Y+height)
+        ring+= "%s %s %s " % (p[2][0]-X-width, p[2][1], p[2][2]+Y)
+        ring+= "%s %s %s" % (p[2][0]-X, p[2][1], p[2][2]+Y)
+    elif op['wall'] == 3:
+        ring = "%s %s %s " % (p[3][0], p[3][1]-X, p[3][2]+Y)
+        ring+= "%s %s %s " % (p[3][0], p[3][1]-X, p[3][2]+Y+height)
+        ring+= "%s %s %s " % (p[3][0], p[3][1]-X-width, p[3][2]+Y+height)
+        ring+= "%s %s %s " % (p[3][0], p[3][1]-X-width, p[3][2]+Y)
+        ring+= "%s %s %s" % (p[3][0], p[3][1]-X, p[3][2]+Y)
+
+    else:
+        raise ValueError("The door is positioned on an unknown wall.")
+
+    return ring
+
+
+def buildingOpenings(door, wallWindows, p):
+    """Door and windows with their linear rings, as [door, [windows]] ('' if there are none).
+    Computed once per building and body, and shared by the LOD3 representations. The input dictionaries are not modified."""
+    key = ('openings', repr(door), repr(wallWindows), repr(p))
+    if key not in openingGeometries:
+        openings = []
+        #-- Door
+        if door:
+            openings.append(dict(door, ring=openingRing(door, p)))
+        else:
+            openings.append("")
+        if wallWindows:
+            openings.append([dict(ww, ring=openingRing(ww, p)) for ww in wallWindows])
+        else:
+            openings.append("")
+        openingGeometries[key] = openings
+    return openingGeometries[key]
+
+
+def embrasuresGeometry(openings, p, embrasure):
+    """Makes a linear ring of the feature (opening) with embrasure.
+    The result is kept for the other LOD3 representations of the building with the same openings."""
+    key = ('embrasures', id(openings), repr(p), embrasure)
+    #-- The openings are kept as well, so their id cannot be reused by another list
+    if key in openingGeometries and openingGeometries[key][0] is openings:
+        return openingGeometries[key][1]
+
+    embO = [[], [], [], []]
+
+    j = 0
+
+    for t in openings:
+
+        if j == 0:
+            currentType = 'Door'
+        elif j == 1:
+            currentType = 'Window'
+
+        j += 1
+
+        if type(t) is not list:
+            t = [t]
+        for op in t:
+            if op == '':
+                continue
+            X = float(op['origin'][0])
+            Y = float(op['origin'][1])
+            width = float(op['size'][0])
+            height = float(op['size'][1])
+
+            odict = {}
+
+            if op['wall'] == 0:
+
+                W0 = "%s %s %s" % (p[0][0]+X, p[0][1], p[0][2]+Y)
+                W1 = "%s %s %s" % (p[0][0]+X+width, p[0][1], p[0][2]+Y)
+                W2 = "%s %s %s" % (p[0][0]+X+width, p[0][1], p[0][2]+Y+height)
+                W3 = "%s %s %s" % (p[0][0]+X, p[0][1], p[0][2]+Y+height)
+
+                O0 = "%s %s %s" % (p[0][0]+X, p[0][1]+embrasure, p[0][2]+Y)
+                O1 = "%s %s %s" % (p[0][0]+X+width, p[0][1]+embrasure, p[0][2]+Y)
+                O2 = "%s %s %s" % (p[0][0]+X+width, p[0][1]+embrasure, p[0][2]+Y+height)
+                O3 = "%s %s %s" % (p[0][0]+X, p[0][1]+embrasure, p[0][2]+Y+height)
+
+            elif op['wall'] == 1:
+
+                W0 = "%s %s %s" % (p[1][0], p[1][1]+X, p[1][2]+Y)
+                W1 = "%s %s %s" % (p[1][0], p[1][1]+X+width, p[1][2]+Y)
+                W2 = "%s %s %s" % (p[1][0], p[1][1]+X+width, p[1][2]+Y+height)
+                W3 = "%s %s %s" % (p[1][0], p[1][1]+X, p[1][2]+Y+height)
+
+                O0 = "%s %s %s" % (p[1][0]-embrasure, p[1][1]+X, p[1][2]+Y)
+                O1 = "%s %s %s" % (p[1][0]-embrasure, p[1][1]+X+width, p[1][2]+Y)
+                O2 = "%s %s %s" % (p[1][0]-embrasure, p[1][1]+X+width, p[1][2]+Y+height)
+                O3 = "%s %s %s" % (p[1][0]-embrasure, p[1][1]+X, p[1][2]+Y+height)
+
+
+            elif op['wall'] == 2:
+
+                W0 = "%s %s %s" % (p[2][0]-X, p[2][1], p[2][2]+Y)
+                W1 = "%s %s %s" % (p[2][0]-X-width, p[2][1], p[2][2]+Y)
+                W2 = "%s %s %s" % (p[2][0]-X-width, p[2][1], p[2][2]+Y+height)
+                W3 = "%s %s %s" % (p[2][0]-X, p[2][1], p[2][2]+Y+height)
+
+                O0 = "%s %s %s" % (p[2][0]-X, p[2][1]-embrasure, p[2][2]+Y)
+                O1 = "%s %s %s" % (p[2][0]-X-width, p[2][1]-embrasure, p[2][2]+Y)
+                O2 = "%s %s %s" % (p[2][0]-X-width, p[2][1]-embrasure, p[2][2]+Y+height)
+                O3 = "%s %s %s" % (p[2][0]-X, p[2][1]-embrasure, p[2][2]+Y+height)
+
+            elif op['wall'] == 3:
+
+                W0 = "%s %s %s" % (p[3][0], p[3][1]-X, p[3][2]+Y)
+                W1 = "%s %s %s" % (p[3][0], p[3][1]-X-width, p[3][2]+Y)
+                W2 = "%s %s %s" % (p[3][0], p[3][1]-X-width, p[3][2]+Y+height)
+                W3 = "%s %s %s" % (p[3][0], p[3][1]-X, p[3][2]+Y+height)
+
+                O0 = "%s %s %s" % (p[3][0]+embrasure, p[3][1]-X, p[3][2]+Y)
+                O1 = "%s %s %s" % (p[3][0]+embrasure, p[3][1]-X-width, p[3][2]+Y)
+                O2 = "%s %s %s" % (p[3][0]+embrasure, p[3][1]-X-width, p[3][2]+Y+height)
+                O3 = "%s %s %s" % (p[3][0]+embrasure, p[3][1]-X, p[3][2]+Y+height)
+
+            else:
+                raise ValueError("The door is positioned on an unknown wall.")
+##-- Unchanged
+            ringW = O0 + ' '
+            ringW+= O1 + ' '
+            ringW+= O2 + ' '
+            ringW+= O3 + ' '
+            ringW+= O0
+
+            ring0 = W0 + ' '
+            ring0+= O0 + ' '
+            ring0+= O3 + ' '
+            ring0+= W3 + ' '
+            ring0+= W0
+
+            ring1 = W0 + ' '
+            ring1+= W1 + ' '
+            ring1+= O1 + ' '
+            ring1+= O0 + ' '
+            ring1+= W0
+
+            ring2 = W2 + ' '
+            ring2+= O2 + ' '
+            ring2+= O1 + ' '
+            ring2+= W1 + ' '
+            ring2+= W2
+
+            ring3 = W2 + ' '
+            ring3+= W3 + ' '
+            ring3+= O3 + ' '
+            ring3+= O2 + ' '
+            ring3+= W2
+
+
+            odict['surfaces'] = [ring0, ring1, ring2, ring3]
+            odict['openings'] = [ringW]
+            odict['type'] = currentType
+
+            embO[op['wall']].append(odict)
+
+    openingGeometries[key] = [openings, embO]
+    return embO
+
+
+def addsurface(skipsm, CompositeSurface, coords, interior=None):
+        """
+        Adds a surface to the CompositeSurface (and others).
+        Input: coordinates of the LinearRing of the surface to be added to the CompositeSurface.
+        Output: Upgraded CompositeSurface.
+        If skipsm is toggled, it will skip the creation of the <gml:SurfaceMember>
+        """
+        if skipsm is False:
+            surfaceMember = etree.SubElement(CompositeSurface, "{%s}surfaceMember" % ns_gml)
+            Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
+        else:
+            Polygon = etree.SubElement(CompositeSurface, "{%s}Polygon" % ns_gml)
+        if ASSIGNID:
+            Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+        PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
+        LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
+        posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+        posList.text = coords
+
+        if interior and interior[0] is not None:
+            for hole in interior:
+                PolygonInterior = etree.SubElement(Polygon, "{%s}interior" % ns_gml)
+                LinearRing = etree.SubElement(PolygonInterior, "{%s}LinearRing" % ns_gml)
+                posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+                posList.text = hole
+
+
+def addSurfaceWithEmbrasure(skipsm, CompositeSurface, coords, interior=None, embO=None):
+        """
+        Adds a surface to the CompositeSurface.
+        Input: coordinates of the LinearRing of the surface to be added to the CompositeSurface.
+        Output: Upgraded CompositeSurface.
+        If skipsm is toggled, it will skip the creation of the <gml:SurfaceMember>
+        """
+        if skipsm is False:
+            surfaceMember = etree.SubElement(CompositeSurface, "{%s}surfaceMember" % ns_gml)
+            Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
+        else:
+            Polygon = etree.SubElement(CompositeSurface, "{%s}Polygon" % ns_gml)
+        if ASSIGNID:
+            Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+        PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
+        LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
+        posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+        posList.text = coords
+
+        if interior and interior[0] is not None:
+            for hole in interior:
+                PolygonInterior = etree.SubElement(Polygon, "{%s}interior" % ns_gml)
+                LinearRing = etree.SubElement(PolygonInterior, "{%s}LinearRing" % ns_gml)
+                posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+                posList.text = hole
+
+        for opening in embO:
+            for s in opening['surfaces']:
+                surfaceMember = etree.SubElement(CompositeSurface, "{%s}surfaceMember" % ns_gml)
+                Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
+                if ASSIGNID:
+                    Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+                PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
+                LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
+                posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+                posList.text = s
+            for o in opening['openings']:
+                DoorsurfaceMember = etree.SubElement(CompositeSurface, "{%s}surfaceMember" % ns_gml)
+                DoorPolygon = etree.SubElement(DoorsurfaceMember, "{%s}Polygon" % ns_gml)
+                if ASSIGNID:
+                    DoorPolygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+                DoorPolygonExterior = etree.SubElement(DoorPolygon, "{%s}exterior" % ns_gml)
+                DoorLinearRing = etree.SubElement(DoorPolygonExterior, "{%s}LinearRing" % ns_gml)
+                DoorposList = etree.SubElement(DoorLinearRing, "{%s}posList" % ns_gml)
+                DoorposList.text = o#['ring']
+
+
+def plainMultiSurface(surfaceMember, coords, interior=None):
+    """Adds a polygon to the SurfaceMember."""
+    Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
+    if ASSIGNID:
+        Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+    PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
+    LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
+    posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+    posList.text = coords
+
+    if interior and interior[0] is not None:
+        for hole in interior:
+            PolygonInterior = etree.SubElement(Polygon, "{%s}interior" % ns_gml)
+            LinearRing = etree.SubElement(PolygonInterior, "{%s}LinearRing" % ns_gml)
+            posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+            posList.text = hole
+
+
+def multiSurface(bldg, coords, semantics, interior=None, LOD=None, opening=None):
+    """
+    Write a surface with input coordinates.
+    Input: coordinates of the LinearRing.
+    Output: CompositeSurface.
+    """
+    boundedBy = etree.SubElement(bldg, "{%s}boundedBy" % ns_bldg)
+    semanticSurface = etree.SubElement(boundedBy, "{%s}%s" % (ns_bldg, semantics))
+    if LOD == 3:
+        lodXMultiSurface = etree.SubElement(semanticSurface, "{%s}lod3MultiSurface" % ns_bldg)
+    elif LOD == 2:
+        lodXMultiSurface = etree.SubElement(semanticSurface, "{%s}lod2MultiSurface" % ns_bldg)
+    else:
+        lodXMultiSurface = etree.SubElement(semanticSurface, "{%s}lod2MultiSurface" % ns_bldg)
+    MultiSurface = etree.SubElement(lodXMultiSurface, "{%s}MultiSurface" % ns_gml)
+    surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
+    Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
+    if ASSIGNID:
+        Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+    PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
+    LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
+    posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+    posList.text = coords
+
+    if interior and interior[0] is not None:
+        for hole in interior:
+            PolygonInterior = etree.SubElement(Polygon, "{%s}interior" % ns_gml)
+            LinearRing = etree.SubElement(PolygonInterior, "{%s}LinearRing" % ns_gml)
+            posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+            posList.text = hole
+
+    if opening:
+
+        dooropening = opening[0]
+
+        if dooropening != []:
+            gmlopening = etree.SubElement(semanticSurface, "{%s}opening" % ns_bldg)
+            gmldoor = etree.SubElement(gmlopening, "{%s}Door" % ns_bldg)
+            lod3MultiSurface = etree.SubElement(gmldoor, "{%s}lod3MultiSurface" % ns_bldg)
+            DoorMultiSurface = etree.SubElement(lod3MultiSurface, "{%s}MultiSurface" % ns_gml)
+            DoorsurfaceMember = etree.SubElement(DoorMultiSurface, "{%s}surfaceMember" % ns_gml)
+            DoorPolygon = etree.SubElement(DoorsurfaceMember, "{%s}Polygon" % ns_gml)
+            if ASSIGNID:
+                DoorPolygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+            DoorPolygonExterior = etree.SubElement(DoorPolygon, "{%s}exterior" % ns_gml)
+            DoorLinearRing = etree.SubElement(DoorPolygonExterior, "{%s}LinearRing" % ns_gml)
+            DoorposList = etree.SubElement(DoorLinearRing, "{%s}posList" % ns_gml)
+            DoorposList.text = GMLreversedRing(dooropening['ring'])
+
+        if len(opening[1]) > 0:
+            for win in opening[1]:
+                #print win
+                gmlopening = etree.SubElement(semanticSurface, "{%s}opening" % ns_bldg)
+                gmlwin = etree.SubElement(gmlopening, "{%s}Window" % ns_bldg)
+                lod3MultiSurface = etree.SubElement(gmlwin, "{%s}lod3MultiSurface" % ns_bldg)
+                DoorMultiSurface = etree.SubElement(lod3MultiSurface, "{%s}MultiSurface" % ns_gml)
+                DoorsurfaceMember = etree.SubElement(DoorMultiSurface, "{%s}surfaceMember" % ns_gml)
+                DoorPolygon = etree.SubElement(DoorsurfaceMember, "{%s}Polygon" % ns_gml)
+                if ASSIGNID:
+                    DoorPolygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+                DoorPolygonExterior = etree.SubElement(DoorPolygon, "{%s}exterior" % ns_gml)
+                DoorLinearRing = etree.SubElement(DoorPolygonExterior, "{%s}LinearRing" % ns_gml)
+                DoorposList = etree.SubElement(DoorLinearRing, "{%s}posList" % ns_gml)
+                DoorposList.text = GMLreversedRing(win['ring'])
+
+
+def multiSurface2(bldg, coords, semantics, interior=None, LOD=None, window=None):
+    """
+    Write a surface with input coordinates.
+    Input: coordinates of the LinearRing.
+    Output: MultiSurface.
+    """
+    boundedBy = etree.SubElement(bldg, "{%s}boundedBy" % ns_bldg)
+    semanticSurface = etree.SubElement(boundedBy, "{%s}%s" % (ns_bldg, semantics))
+    if LOD == 3:
+        lodXMultiSurface = etree.SubElement(semanticSurface, "{%s}lod3MultiSurface" % ns_bldg)
+    elif LOD == 2:
+        lodXMultiSurface = etree.SubElement(semanticSurface, "{%s}lod2MultiSurface" % ns_bldg)
+    else:
+        lodXMultiSurface = etree.SubElement(semanticSurface, "{%s}lod2MultiSurface" % ns_bldg)
+    MultiSurface = etree.SubElement(lodXMultiSurface, "{%s}MultiSurface" % ns_gml)
+    surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
+    Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
+    if ASSIGNID:
+        Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+    PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
+    LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
+    posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+    posList.text = coords
+
+    if interior and interior[0] is not None:
+        for hole in interior:
+            PolygonInterior = etree.SubElement(Polygon, "{%s}interior" % ns_gml)
+            LinearRing = etree.SubElement(PolygonInterior, "{%s}LinearRing" % ns_gml)
+            posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+            posList.text = hole
+
+    if window:
+        if len(window) > 0:
+            for win in window:
+                #print win
+                gmlopening = etree.SubElement(semanticSurface, "{%s}opening" % ns_bldg)
+                gmlwin = etree.SubElement(gmlopening, "{%s}Window" % ns_bldg)
+                lod3MultiSurface = etree.SubElement(gmlwin, "{%s}lod3MultiSurface" % ns_bldg)
+                DoorMultiSurface = etree.SubElement(lod3MultiSurface, "{%s}MultiSurface" % ns_gml)
+                DoorsurfaceMember = etree.SubElement(DoorMultiSurface, "{%s}surfaceMember" % ns_gml)
+                DoorPolygon = etree.SubElement(DoorsurfaceMember, "{%s}Polygon" % ns_gml)
+                if ASSIGNID:
+                    DoorPolygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+                DoorPolygonExterior = etree.SubElement(DoorPolygon, "{%s}exterior" % ns_gml)
+                DoorLinearRing = etree.SubElement(DoorPolygonExterior, "{%s}LinearRing" % ns_gml)
+                DoorposList = etree.SubElement(DoorLinearRing, "{%s}posList" % ns_gml)
+                DoorposList.text = win
+
+
+def multiSurfaceWithEmbrasure(bldg, coords, semantics, interior=None, LOD=None, embO=None):
+    """
+    Write a surface with input coordinates, taking into account the embrasures.
+    Input: coordinates of the LinearRing.
+    Output: CompositeSurface.
+    """
+    boundedBy = etree.SubElement(bldg, "{%s}boundedBy" % ns_bldg)
+    semanticSurface = etree.SubElement(boundedBy, "{%s}%s" % (ns_bldg, semantics))
+    if LOD == 3:
+        lodXMultiSurface = etree.SubElement(semanticSurface, "{%s}lod3MultiSurface" % ns_bldg)
+    elif LOD == 2:
+        lodXMultiSurface = etree.SubElement(semanticSurface, "{%s}lod2MultiSurface" % ns_bldg)
+    else:
+        lodXMultiSurface = etree.SubElement(semanticSurface, "{%s}lod2MultiSurface" % ns_bldg)
+    MultiSurface = etree.SubElement(lodXMultiSurface, "{%s}MultiSurface" % ns_gml)
+    surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
+    Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
+    if ASSIGNID:
+        Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+    PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
+    LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
+    posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+    posList.text = coords
+
+    if interior and interior[0] is not None:
+        for hole in interior:
+            PolygonInterior = etree.SubElement(Polygon, "{%s}interior" % ns_gml)
+            LinearRing = etree.SubElement(PolygonInterior, "{%s}LinearRing" % ns_gml)
+            posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+            posList.text = hole
+
+    for opening in embO:
+        for s in opening['surfaces']:
+            # MultiSurface = etree.SubElement(lodXMultiSurface, "{%s}MultiSurface" % ns_gml)
+            surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
+            Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
+            if ASSIGNID:
+                Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+            PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
+            LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
+            posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+            posList.text = s
+        for o in opening['openings']:
+            gmlopening = etree.SubElement(semanticSurface, "{%s}opening" % ns_bldg)
+            if opening['type'] == 'Door':
+                gmldoor = etree.SubElement(gmlopening, "{%s}Door" % ns_bldg)
+            elif opening['type'] == 'Window':
+                gmldoor = etree.SubElement(gmlopening, "{%s}Window" % ns_bldg)
+            else:
+                raise ValueError("Door or window allowed.")
+            lod3MultiSurface = etree.SubElement(gmldoor, "{%s}lod3MultiSurface" % ns_bldg)
+            DoorMultiSurface = etree.SubElement(lod3MultiSurface, "{%s}MultiSurface" % ns_gml)
+            DoorsurfaceMember = etree.SubElement(DoorMultiSurface, "{%s}surfaceMember" % ns_gml)
+            DoorPolygon = etree.SubElement(DoorsurfaceMember, "{%s}Polygon" % ns_gml)
+            if ASSIGNID:
+                DoorPolygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+            DoorPolygonExterior = etree.SubElement(DoorPolygon, "{%s}exterior" % ns_gml)
+            DoorLinearRing = etree.SubElement(DoorPolygonExterior, "{%s}LinearRing" % ns_gml)
+            DoorposList = etree.SubElement(DoorLinearRing, "{%s}posList" % ns_gml)
+            DoorposList.text = o#['ring']
+
+
+def storeyTemplate(o, x, y, floors, floorHeight, wallThickness=0.2, joist=0.2):
+    """Template of the storeys of a building, shared by its interior representations.
+    The corners of a storey (offset from the exterior surface) are computed once, and the elevations of all the storeys (up to the attic) at once.
+    Each storey is a translation of the template in z."""
+    #-- Coordinates of the main interior points (offset from the exterior surface)
+    Xa = o[0] + wallThickness
+    Xb = o[0] + x - wallThickness
+    Ya = o[1] + wallThickness
+    Yb = o[1] + y - wallThickness
+    storeys = range(int(floors) + 1)
+    #-- Floor and ceiling elevations
+    fel = [storey * floorHeight + 0.5*joist for storey in storeys]
+    cel = [(storey + 1) * floorHeight - 0.5*joist for storey in storeys]
+    return {'corners': [str(Xa) + ' ' + str(Ya), str(Xb) + ' ' + str(Ya), str(Xb) + ' ' + str(Yb), str(Xa) + ' ' + str(Yb)],
+            'fel': [' ' + str(e) for e in fel],
+            'cel': [' ' + str(e) for e in cel],
+            'solids': None}
+
+
+def storeyPoints(storeys, floor):
+    """The four points of the floor and the four points of the ceiling of a storey (counted from 1)."""
+    fel = storeys['fel'][floor - 1]
+    cel = storeys['cel'][floor - 1]
+    return [c + fel for c in storeys['corners']], [c + cel for c in storeys['corners']]
+
+
+def rotator(vertex, sine, cos, origin_of_rotation):
+    "Rotate the vertex around the origin by an angle (2D). Cos and sin are already precomputed to make the calculations more efficient due to many repetitions."
+    vertex = [float(vertex[0]), float(vertex[1]), float(vertex[2])]
+    rotated = [None, None, vertex[2]]
+    rotated[0] = ((vertex[0]-origin_of_rotation[0]) * cos - (vertex[1]-origin_of_rotation[1]) * sine) + origin_of_rotation[0]
+    rotated[1] = ((vertex[0]-origin_of_rotation[0]) * sine + (vertex[1]-origin_of_rotation[1]) * cos) + origin_of_rotation[1]
+    return rotated
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT)
+
+# This code is part of the Random3Dcity package
+
+# Copyright (c) 2015
+# Filip Biljecki
+# Delft University of Technology
+# fbiljecki@gmail.com
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Implicit geometries of the repeated building installations and openings.
+"""
+
+from lxml import etree
+import numpy
+import uuid
+import hashlib
+
+from random3dcity.geometry import ns_citygml, ns_gml, ns_bldg, ns_xlink
+
+
+#-- Generate an UUID for each polygon, configured by generateCityGML.py according to its options
+ASSIGNID = True
+
+
+def elementSize(element):
+    """Approximate size of an element in the CityGML file (tags, attributes and text, without the indentation)."""
+    return sum(2 * len(etree.QName(e).localname) + 15 + len(e.text or '') + sum(len(k) + len(v) + 4 for k, v in e.attrib.items()) for e in element.iter())
+
+
+def implicitGeometry(reference, rotation, prototype, relative=None):
+    """ImplicitGeometry placed at the reference point and rotated about the vertical axis by a multiple of 90 degrees.
+    It holds the relative geometry of the prototype, or refers to it."""
+    implicit = etree.Element("{%s}lod3ImplicitRepresentation" % ns_bldg)
+    ImplicitGeometry = etree.SubElement(implicit, "{%s}ImplicitGeometry" % ns_citygml)
+    #-- The matrix is optional, and left out for the identity
+    if rotation != 0:
+        transformationMatrix = etree.SubElement(ImplicitGeometry, "{%s}transformationMatrix" % ns_citygml)
+        c, s = [[1, 0], [0, 1], [-1, 0], [0, -1]][rotation]
+        transformationMatrix.text = "%d %d 0 0 %d %d 0 0 0 0 1 0 0 0 0 1" % (c, -s, s, c)
+    relativeGMLGeometry = etree.SubElement(ImplicitGeometry, "{%s}relativeGMLGeometry" % ns_citygml)
+    if relative is not None:
+        MultiSurface = etree.SubElement(relativeGMLGeometry, "{%s}MultiSurface" % ns_gml)
+        MultiSurface.attrib['{%s}id' % ns_gml] = prototype
+        for polygon in relative:
+            surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
+            Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
+            if ASSIGNID:
+                Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+            for i, ring in enumerate(polygon):
+                PolygonRing = etree.SubElement(Polygon, "{%s}%s" % (ns_gml, 'exterior' if i == 0 else 'interior'))
+                LinearRing = etree.SubElement(PolygonRing, "{%s}LinearRing" % ns_gml)
+                posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+                posList.text = ring
+    else:
+        relativeGMLGeometry.attrib['{%s}href' % ns_xlink] = '#' + prototype
+    referencePoint = etree.SubElement(ImplicitGeometry, "{%s}referencePoint" % ns_citygml)
+    Point = etree.SubElement(referencePoint, "{%s}Point" % ns_gml)
+    pos = etree.SubElement(Point, "{%s}pos" % ns_gml)
+    pos.text = ' '.join(str(c) for c in reference.tolist())
+    return implicit
+
+
+def canonicalShape(rings):
+    """Shape of a set of polygons independent of its position and of its orientation (multiple of 90 degrees about the vertical axis).
+    Returns the rings relative to the lowest corner of the shape in its canonical orientation, the rotation which brings the canonical shape back, and the reference point."""
+    turned = numpy.concatenate([ring for polygon in rings for ring in polygon])
+    candidates = []
+    for rotation in range(4):
+        #-- Rotate by -90 degrees each time, which is exact
+        if rotation > 0:
+            turned = numpy.column_stack((turned[:, 1], -turned[:, 0], turned[:, 2]))
+        corner = turned.min(axis=0)
+        #-- Rounded so that the translated copies have the same coordinates
+        candidates.append(((numpy.round(turned - corner, 6) + 0.0).ravel().tolist(), rotation, corner))
+    #-- The canonical orientation is chosen on the coordinates, and only its rings are formatted
+    relative, rotation, corner = min(candidates, key=lambda candidate: candidate[0])
+    shape = []
+    start = 0
+    for polygon in rings:
+        texts = []
+        for ring in polygon:
+            texts.append(' '.join(str(c) for c in relative[3 * start:3 * (start + len(ring))]))
+            start += len(ring)
+        shape.append(tuple(texts))
+    #-- The reference point is the corner rotated back
+    c, s = [[1, 0], [0, 1], [-1, 0], [0, -1]][rotation]
+    reference = numpy.array([c * corner[0] - s * corner[1], s * corner[0] + c * corner[1], corner[2]]) + 0.0
+    return tuple(shape), rotation, reference
+
+
+def ringPoints(element):
+    """Vertices of the rings of the polygons in an element, rounded so that the same vertex computed twice is found."""
+    coordinates = ' '.join(posList.text for posList in element.iter('{%s}posList' % ns_gml)).split()
+    return set(map(tuple, numpy.round(numpy.array(coordinates, dtype=float).reshape(-1, 3), 6).tolist()))
+
+
+def embrasurePolygons(obj, walls):
+    """Polygons of the surface around an opening which form its embrasure: the ones with an edge on the opening and their other vertices on the holes of the surface.
+    The polygons of each surface and the vertices of its holes are kept in walls, as a surface has several openings."""
+    if etree.QName(obj.getparent()).localname != 'opening':
+        return []
+    surface = obj.getparent().getparent()
+    if surface not in walls:
+        polygons = [Polygon for prop in surface if etree.QName(prop).localname == 'lod3MultiSurface' for Polygon in prop.iter('{%s}Polygon' % ns_gml)]
+        holes = set()
+        for Polygon in polygons:
+            for interior in Polygon.iter('{%s}interior' % ns_gml):
+                holes |= ringPoints(interior)
+        walls[surface] = ([(Polygon, ringPoints(Polygon)) for Polygon in polygons if Polygon.find('{%s}interior' % ns_gml) is None], holes)
+    candidates, holes = walls[surface]
+    points = ringPoints(obj)
+    return [Polygon for Polygon, vertices in candidates if len(vertices & points) >= 2 and vertices <= points | holes]
+
+
+def instanceGeometries(bldg, ID):
+    """Store the geometry of repeated building installations and openings (e.g. the dormers on the two sides of a roof, or the windows of a facade) only once.
+    The objects with the same shape get an ImplicitGeometry: the first one holds the geometry relative to its reference point, and the others refer to it and are placed at their own reference point.
+    Copies translated and rotated about the vertical axis by a multiple of 90 degrees are instanced.
+    An opening is instanced together with its embrasure, whose polygons are moved from the surface around it to the geometry of the opening, so that a window is several polygons rather than one.
+    Only the geometry of an object itself is instanced: the objects with semantic surfaces (boundedBy) are kept as they are, so their surfaces and openings stay, while the openings in them can still be instanced on their own.
+    Objects whose explicit geometry is smaller than a reference to the prototype (e.g. a window without embrasure in a building with few of its kind) are kept as they are."""
+    groups = {}
+    walls = {}
+    #-- The installations are handled first, as their geometry includes the openings of the dormers
+    for kinds in [['BuildingInstallation'], ['Window', 'Door']]:
+        groups.clear()
+        for obj in bldg.iter(*['{%s}%s' % (ns_bldg, kind) for kind in kinds]):
+            if obj.find('{%s}boundedBy' % ns_bldg) is not None:
+                continue
+            properties = [child for child in obj if etree.QName(child).localname in ['lod3Geometry', 'lod3MultiSurface']]
+            polygons = [Polygon for prop in properties for Polygon in prop.iter('{%s}Polygon' % ns_gml)]
+            if len(polygons) == 0 or any('{%s}href' % ns_xlink in element.attrib for prop in properties for element in prop.iter()):
+                continue
+            embrasure = embrasurePolygons(obj, walls)
+            rings = [[numpy.array(posList.text.split(), dtype=float).reshape(-1, 3) for posList in Polygon.iter('{%s}posList' % ns_gml)] for Polygon in polygons + embrasure]
+            relative, rotation, reference = canonicalShape(rings)
+            groups.setdefault(relative, []).append([obj, properties, embrasure, rotation, reference])
+        for relative in groups:
+            if len(groups[relative]) < 2:
+                continue
+            prototype = ID + '_' + hashlib.sha1(' '.join(' '.join(polygon) for polygon in relative).encode('utf-8')).hexdigest()[:16]
+            instances = [implicitGeometry(reference, rotation, prototype, relative if i == 0 else None) for i, (obj, properties, embrasure, rotation, reference) in enumerate(groups[relative][:2])]
+            #-- Worth it only if the prototype and its references (about the same size each) are smaller than the explicit geometries of the copies
+            obj, properties, embrasure, rotation, reference = groups[relative][0]
+            explicit = sum(elementSize(prop) for prop in properties) + sum(elementSize(Polygon.getparent()) for Polygon in embrasure)
+            if elementSize(instances[0]) + (len(groups[relative]) - 1) * elementSize(instances[1]) >= len(groups[relative]) * explicit:
+                continue
+            instances += [implicitGeometry(reference, rotation, prototype) for obj, properties, embrasure, rotation, reference in groups[relative][2:]]
+            for implicit, (obj, properties, embrasure, rotation, reference) in zip(instances, groups[relative]):
+                obj.insert(obj.index(properties[0]), implicit)
+                for prop in properties:
+                    obj.remove(prop)
+                #-- The surfaceMembers of the embrasure in the surface around the opening
+                for Polygon in embrasure:
+                    surfaceMember = Polygon.getparent()
+                    surfaceMember.getparent().remove(surfaceMember)
@@ -0,0 +1,686 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT)
+
+# This code is part of the Random3Dcity package
+
+# Copyright (c) 2015
+# Filip Biljecki
+# Delft University of Technology
+# fbiljecki@gmail.com
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Builders of the interior representations of the buildings (storeys and attics).
+"""
+
+from lxml import etree
+import uuid
+import copy
+
+from random3dcity.geometry import ns_gml, ns_bldg, GMLPointList, GMLstring2points, addsurface, storeyPoints, storeyTemplate, verticesBody, verticesBodyList, verticesRoof
+
+
+#-- Generate an UUID for each polygon, configured by generateCityGML.py according to its options
+ASSIGNID = True
+
+
+def interiordormerVertices(dormers, p, h, rtype, oList, width, wallThickness, rWth, dormerTickness, topThickness, rWth2=None):
+    """Computes the vertices of a dormer."""
+    [o, x, y, z] = oList
+    dList = []
+    dListGML = []
+    for drm in dormers:
+        d = [[], [], [], [], [], []]
+        dGML = [[], [], [], [], [], []]
+        if rtype == 'Gabled':
+            xperimiter = (float(drm['origin'][1]) * x * 0.5) / h
+            xperimiter2 = (float(drm['size'][1]) * x * 0.5) / h + xperimiter
+            intxper = (xperimiter + dormerTickness) - rWth
+            dper2 = ((drm['origin'][1] + float(drm['size'][1]) - dormerTickness) * x * 0.5) / h + rWth
+            hper1 = intxper * h / (.5 * x)
+            if drm['side'] == 1:
+                d[1] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + hper1]
+                d[2] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + hper1]
+                d[4] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                d[5] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                d[0] = [p[1][0]- dper2, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                d[3] = [p[1][0]- dper2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+            elif drm['side'] == 3:
+                # d[1] = [p[1][0]+xperimiter + dormerTickness, p[1][1] - float(drm['origin'][0]) - dormerTickness, p[5][2] + hper1]
+                # d[2] = [p[1][0]+xperimiter + dormerTickness, p[1][1] - float(drm['origin'][0]) - float(drm['size'][0]) + dormerTickness, p[5][2] + hper1]
+                # d[4] = [p[1][0]+xperimiter + dormerTickness, p[1][1] - float(drm['origin'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                # d[5] = [p[1][0]+xperimiter + dormerTickness, p[1][1] - float(drm['origin'][0]) - float(drm['size'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                # d[0] = [p[1][0]+xperimiter2 + (rWth-dormerTickness), p[1][1] - float(drm['origin'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                # d[3] = [p[1][0]+xperimiter2 + (rWth-dormerTickness), p[1][1] - float(drm['origin'][0]) - float(drm['size'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+ 
+                d[1] = [p[4][0]+xperimiter + dormerTickness, p[7][1] - float(drm['origin'][0]) - dormerTickness, p[5][2] + hper1]
+                d[2] = [p[4][0]+xperimiter + dormerTickness, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]) + dormerTickness, p[5][2] + hper1]
+                d[4] = [p[4][0]+xperimiter + dormerTickness, p[7][1] - float(drm['origin'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                d[5] = [p[4][0]+xperimiter + dormerTickness, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                d[0] = [p[4][0] + dper2, p[7][1] - float(drm['origin'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                d[3] = [p[4][0] + dper2, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+        
+        elif rtype == 'Shed':
+            xperimiter = (float(drm['origin'][1]) * x) / h
+            xperimiter2 = (float(drm['size'][1]) * x) / h + xperimiter 
+            intxper = (xperimiter + dormerTickness) - rWth
+            dper2 = ((drm['origin'][1] + float(drm['size'][1]) - dormerTickness) * x) / h + rWth
+            hper1 = intxper * h / x
+            if drm['side'] == 1:
+                # d[1] = [p[1][0]-xperimiter - rWth, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1]]
+                # d[2] = [p[1][0]-xperimiter - rWth, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1]]
+                # d[4] = [p[1][0]-xperimiter - rWth, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - topThickness]
+                # d[5] = [p[1][0]-xperimiter - rWth, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - topThickness]
+                # d[0] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - topThickness]
+                # d[3] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - topThickness]
+                d[1] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + hper1]
+                d[2] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + hper1]
+                d[4] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                d[5] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                d[0] = [p[1][0] - dper2, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                d[3] = [p[1][0] - dper2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+
+        elif rtype == 'Hipped' or rtype == 'Pyramidal':
+            xperimiter = (float(drm['origin'][1]) * x * 0.5) / h
+            xperimiter2 = (float(drm['size'][1]) * x * 0.5) / h + xperimiter
+            yperimiter = (float(drm['origin'][1]) * width) / h
+            yperimiter2 = (float(drm['size'][1]) * width) / h + yperimiter
+            intxper = (xperimiter + dormerTickness) - rWth
+            dper2 = ((drm['origin'][1] + float(drm['size'][1]) - dormerTickness) * x * 0.5) / h + rWth
+            hper1 = intxper * h / (.5 * x)
+
+            intyper = (yperimiter + dormerTickness) - rWth2
+            dper2_2 = ((drm['origin'][1] + float(drm['size'][1]) - dormerTickness) * width) / h + rWth2
+            hper2 = (intyper) * h / width
+            if drm['side'] == 1:
+                # d[1] = [p[1][0]-xperimiter - rWth, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1]]
+                # d[2] = [p[1][0]-xperimiter - rWth, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1]]
+                # d[4] = [p[1][0]-xperimiter - rWth, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - topThickness]
+                # d[5] = [p[1][0]-xperimiter - rWth, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - topThickness]
+                # d[0] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - topThickness]
+                # d[3] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - topThickness]
+                d[1] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + hper1]
+                d[2] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + hper1]
+                d[4] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                d[5] = [p[1][0]-xperimiter - dormerTickness, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                d[0] = [p[1][0] - dper2, p[1][1] + float(drm['origin'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                d[3] = [p[1][0] - dper2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+            elif drm['side'] == 3:
+                d[1] = [p[4][0]+xperimiter + dormerTickness, p[7][1] - float(drm['origin'][0]) - dormerTickness, p[5][2] + hper1]
+                d[2] = [p[4][0]+xperimiter + dormerTickness, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]) + dormerTickness, p[5][2] + hper1]
+                d[4] = [p[4][0]+xperimiter + dormerTickness, p[7][1] - float(drm['origin'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                d[5] = [p[4][0]+xperimiter + dormerTickness, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                d[0] = [p[4][0]+ dper2, p[7][1] - float(drm['origin'][0]) - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                d[3] = [p[4][0]+ dper2, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]) + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+            elif drm['side'] == 0:
+                d[1] = [p[4][0]+float(drm['origin'][0]) + dormerTickness, p[4][1] + yperimiter + dormerTickness, p[5][2] + hper2]
+                d[2] = [p[4][0]+float(drm['origin'][0])+float(drm['size'][0]) - dormerTickness, p[4][1] + yperimiter + dormerTickness, p[5][2] + hper2]
+                d[4] = [p[4][0]+float(drm['origin'][0]) + dormerTickness, p[4][1]  + yperimiter + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                d[5] = [p[4][0]+float(drm['origin'][0])+float(drm['size'][0]) - dormerTickness, p[4][1] + yperimiter + dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                d[0] = [p[4][0]+float(drm['origin'][0]) + dormerTickness, p[4][1] + dper2_2, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                d[3] = [p[4][0]+float(drm['origin'][0])+float(drm['size'][0]) - dormerTickness, p[4][1] + dper2_2, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+            elif drm['side'] == 2:
+                d[1] = [p[6][0]-float(drm['origin'][0]) - dormerTickness, p[6][1] - yperimiter - dormerTickness, p[5][2] + hper2]
+                d[2] = [p[6][0]-float(drm['origin'][0])-float(drm['size'][0]) + dormerTickness, p[6][1]  - yperimiter - dormerTickness, p[5][2] + hper2]
+                d[4] = [p[6][0]-float(drm['origin'][0]) - dormerTickness, p[6][1] - yperimiter - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                d[5] = [p[6][0]-float(drm['origin'][0])-float(drm['size'][0]) + dormerTickness, p[6][1]  - yperimiter - dormerTickness, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                d[0] = [p[6][0]-float(drm['origin'][0]) - dormerTickness, p[6][1] - dper2_2, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]
+                d[3] = [p[6][0]-float(drm['origin'][0])-float(drm['size'][0]) + dormerTickness, p[6][1] - dper2_2, p[5][2] + drm['origin'][1] + float(drm['size'][1]) - dormerTickness]              
+
+        if d != [[], [], [], [], [], []]:
+            for i in range(0, 6):
+                #for j in range(0, 3):
+                #    d[i][j] = round(d[i][j], 2)
+                dGML[i] = GMLPointList(d[i])
+        dList.append(d)
+        dListGML.append(dGML)
+
+    return dList, dListGML
+
+
+def hippedAttic(CompositeSurface, intcoor, p, r, fel, cel, wallThickness, topThickness, atticbottom=False, roofopenings=None):
+    """Constructs the interior of the attic of a hipped roof."""
+    [Xa, Ya, Xb, Yb] = intcoor
+    rA = str(r[0][0]) + ' ' + str(float(r[0][1]) + wallThickness) + ' ' + str(cel)
+    rB = str(r[1][0]) + ' ' + str(float(r[1][1]) - wallThickness) + ' ' + str(cel)
+    p0F = str(Xa) + ' ' + str(Ya) + ' ' + str(fel)
+    p1F = str(Xb) + ' ' + str(Ya) + ' ' + str(fel)
+    p2F = str(Xb) + ' ' + str(Yb) + ' ' + str(fel)
+    p3F = str(Xa) + ' ' + str(Yb) + ' ' + str(fel)
+    S = "%s %s %s %s" % (p0F, p1F, rA, p0F)
+    E = "%s %s %s %s %s" % (p1F, p2F, rB, rA, p1F)
+    N = "%s %s %s %s" % (p2F, p3F, rB, p2F)
+    W = "%s %s %s %s %s" % (p3F, p0F, rA, rB, p3F)
+    bottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
+
+    if roofopenings is not None:
+        addsurface(False, CompositeSurface, S, roofopenings[0])
+        addsurface(False, CompositeSurface, E, roofopenings[1])
+        addsurface(False, CompositeSurface, N, roofopenings[2])
+        addsurface(False, CompositeSurface, W, roofopenings[3])
+
+    else:
+        addsurface(False, CompositeSurface, S)
+        addsurface(False, CompositeSurface, E)
+        addsurface(False, CompositeSurface, N)
+        addsurface(False, CompositeSurface, W)
+    if atticbottom is True:
+        addsurface(False, CompositeSurface, bottom)
+
+
+def gabledAttic(CompositeSurface, intcoor, p, r, fel, cel, wallThickness, topThickness, atticbottom=False, roofopenings=None):
+    """Constructs the interior of the attic of a gabled roof."""
+    [Xa, Ya, Xb, Yb] = intcoor
+    rA = str(r[0][0]) + ' ' + str(float(r[0][1]) + wallThickness) + ' ' + str(cel)
+    rB = str(r[1][0]) + ' ' + str(float(r[1][1]) - wallThickness) + ' ' + str(cel)
+    p0F = str(Xa) + ' ' + str(Ya) + ' ' + str(fel)
+    p1F = str(Xb) + ' ' + str(Ya) + ' ' + str(fel)
+    p2F = str(Xb) + ' ' + str(Yb) + ' ' + str(fel)
+    p3F = str(Xa) + ' ' + str(Yb) + ' ' + str(fel)
+    bottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
+    S = "%s %s %s %s" % (p0F, p1F, rA, p0F)
+    E = "%s %s %s %s %s" % (p1F, p2F, rB, rA, p1F)
+    N = "%s %s %s %s" % (p2F, p3F, rB, p2F)
+    W = "%s %s %s %s %s" % (p3F, p0F, rA, rB, p3F)
+
+    if roofopenings is not None:
+        addsurface(False, CompositeSurface, S, roofopenings[0])
+        addsurface(False, CompositeSurface, E, roofopenings[1])
+        addsurface(False, CompositeSurface, N, roofopenings[2])
+        addsurface(False, CompositeSurface, W, roofopenings[3])
+
+    else:
+        addsurface(False, CompositeSurface, S)
+        addsurface(False, CompositeSurface, E)
+        addsurface(False, CompositeSurface, N)
+        addsurface(False, CompositeSurface, W)
+
+    if atticbottom is True:
+        addsurface(False, CompositeSurface, bottom)
+
+
+def pyramidalAttic(CompositeSurface, intcoor, p, r, fel, cel, wallThickness, topThickness, atticbottom=False, roofopenings=None):
+    """Constructs the interior of the attic of a pyramidal roof."""
+    [Xa, Ya, Xb, Yb] = intcoor
+    rA = str(r[0][0]) + ' ' + str(r[0][1]) + ' ' + str(cel)
+    p0F = str(Xa) + ' ' + str(Ya) + ' ' + str(fel)
+    p1F = str(Xb) + ' ' + str(Ya) + ' ' + str(fel)
+    p2F = str(Xb) + ' ' + str(Yb) + ' ' + str(fel)
+    p3F = str(Xa) + ' ' + str(Yb) + ' ' + str(fel)
+    bottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
+    S = "%s %s %s %s" % (p0F, p1F, rA, p0F)
+    E = "%s %s %s %s" % (p1F, p2F, rA, p1F)
+    N = "%s %s %s %s" % (p2F, p3F, rA, p2F)
+    W = "%s %s %s %s" % (p3F, p0F, rA, p3F)
+    addsurface(False, CompositeSurface, bottom)
+    addsurface(False, CompositeSurface, S)
+    addsurface(False, CompositeSurface, E)
+    addsurface(False, CompositeSurface, N)
+    addsurface(False, CompositeSurface, W)
+
+    if roofopenings is not None:
+        addsurface(False, CompositeSurface, S, roofopenings[0])
+        addsurface(False, CompositeSurface, E, roofopenings[1])
+        addsurface(False, CompositeSurface, N, roofopenings[2])
+        addsurface(False, CompositeSurface, W, roofopenings[3])
+
+    else:
+        addsurface(False, CompositeSurface, S)
+        addsurface(False, CompositeSurface, E)
+        addsurface(False, CompositeSurface, N)
+        addsurface(False, CompositeSurface, W)
+    if atticbottom is True:
+        addsurface(False, CompositeSurface, bottom)
+
+
+def shedAttic(CompositeSurface, intcoor, p, r, fel, cel, wallThickness, topThickness, atticbottom=False, roofopenings=None):
+    """Constructs the interior of the attic of a shed roof."""
+    [Xa, Ya, Xb, Yb] = intcoor
+    rA = str(float(r[0][0]) + wallThickness) + ' ' + str(float(r[0][1]) + wallThickness) + ' ' + str(cel)
+    rB = str(float(r[1][0]) + wallThickness) + ' ' + str(float(r[1][1]) - wallThickness) + ' ' + str(cel)
+    p0F = str(Xa) + ' ' + str(Ya) + ' ' + str(fel)
+    p1F = str(Xb) + ' ' + str(Ya) + ' ' + str(fel)
+    p2F = str(Xb) + ' ' + str(Yb) + ' ' + str(fel)
+    p3F = str(Xa) + ' ' + str(Yb) + ' ' + str(fel)
+    bottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
+    top = "%s %s %s %s %s" % (rA, p1F, p2F, rB, rA)
+    S = "%s %s %s %s" % (p0F, p1F, rA, p0F)
+    N = "%s %s %s %s" % (p2F, p3F, rB, p2F)
+    W = "%s %s %s %s %s" % (p0F, rA, rB, p3F, p0F)
+    addsurface(False, CompositeSurface, bottom)
+    addsurface(False, CompositeSurface, top)
+    addsurface(False, CompositeSurface, S)
+    addsurface(False, CompositeSurface, N)
+    addsurface(False, CompositeSurface, W)
+
+    if roofopenings is not None:
+        addsurface(False, CompositeSurface, S, roofopenings[0])
+        #addsurface(False, CompositeSurface, E, roofopenings[1])
+        addsurface(False, CompositeSurface, N, roofopenings[2])
+        addsurface(False, CompositeSurface, W, roofopenings[3])
+
+    else:
+        addsurface(False, CompositeSurface, S)
+        #addsurface(False, CompositeSurface, E)
+        addsurface(False, CompositeSurface, N)
+        addsurface(False, CompositeSurface, W)
+    if atticbottom is True:
+        addsurface(False, CompositeSurface, bottom)
+
+
+def interiorDormer(cs, d, side):
+    """Interior of a dormer."""
+    dList, dListGML = d
+    d1 = dListGML[0] + ' ' + dListGML[1] + ' ' + dListGML[4] + ' ' + dListGML[0]
+    d2 = dListGML[0] + ' ' + dListGML[4] + ' ' + dListGML[5] + ' ' + dListGML[3] + ' ' + dListGML[0]
+    d3 = dListGML[5] + ' ' + dListGML[2] + ' ' + dListGML[3] + ' ' + dListGML[5]
+    addsurface(False, cs, d1) 
+    addsurface(False, cs, d2) 
+    addsurface(False, cs, d3)
+    d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
+    addsurface(False, cs, d4)
+
+
+def CityGMLbuildingInteriorLOD0(CityModel, ID, attributes, o, x, y, z, h, floors, floorHeight, rtype=None, width=None, wallThickness=0.2, joist=0.2, aux=None, buildingpart=None, storeys=None):
+    """Create the interior footprints. One for each storey."""
+    cityObject = etree.SubElement(CityModel, "cityObjectMember")
+    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
+    bldg.attrib['{%s}id' % ns_gml] = ID
+    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
+    roofType.text = rtype
+
+    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
+    yearOfConstructionXML.text = attributes['yearOfConstruction']
+    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
+    functionXML.text = attributes['function']
+    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
+    storeysAboveGroundXML.text = attributes['storeysAboveGround']
+
+    if storeys is None:
+        storeys = storeyTemplate(o, x, y, floors, floorHeight, wallThickness, joist)
+
+    if rtype != 'Flat':
+        floors += 1
+
+    #-- Construct a surface for each floor
+    for floor in range(1, int(floors) + 1):
+        #-- XML tree
+        lod1MultiSurface = etree.SubElement(bldg, "{%s}lod1MultiSurface" % ns_bldg)
+        ms = etree.SubElement(lod1MultiSurface, "{%s}MultiSurface" % ns_gml)
+        if ASSIGNID:
+            ms.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+        #-- The points of the floor, translated from the template
+        p0F, p1F, p2F, p3F = storeyPoints(storeys, floor)[0]
+        if floor == 1:
+            if buildingpart is not None:
+                if buildingpart['type'] == 'Alcove':
+                    bp = [None] * 8
+                    bp[0] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + 0.5*joist])
+                    bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + 0.5*joist])
+                    bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + 0.5*joist])
+                    bp[3] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + 0.5*joist])
+                    bp[4] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
+                    bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
+                    bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
+                    bp[7] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
+                    #E = "%s %s %s %s %s %s %s %s %s" % (p1F, bp[0], bp[4], bp[7], bp[3], p2F, p2C, p1C, p1F)
+                    faceBottom = "%s %s %s %s %s %s %s %s %s" % (p0F, p3F, p2F, bp[3], bp[2], bp[1], bp[0], p1F, p0F)
+
+                elif buildingpart['type'] == 'Garage':
+                    #E = "%s %s %s %s %s" % (p1F, p2F, p2C, p1C, p1F)
+                    faceBottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
+                    #top = "%s %s %s %s %s" % (p0C, p1C, p2C, p3C, p0C)
+                    bp = [None] * 8
+                    bp[0] = GMLPointList([o[0] + x + wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + 0.5*joist])
+                    bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + 0.5*joist])
+                    bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + 0.5*joist])
+                    bp[3] = GMLPointList([o[0] + x + wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + 0.5*joist])
+                    bp[4] = GMLPointList([o[0] + x + wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
+                    bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
+                    bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
+                    bp[7] = GMLPointList([o[0] + x + wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
+                    gbottom = "%s %s %s %s %s" % (bp[0], bp[3], bp[2], bp[1], bp[0])
+                    addsurface(False, ms, gbottom)
+
+            else:
+                # E = "%s %s %s %s %s" % (p1F, p2F, p2C, p1C, p1F)
+                faceBottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
+                # top = "%s %s %s %s %s" % (p0C, p1C, p2C, p3C, p0C)
+        else:
+            faceBottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
+
+        addsurface(False, ms, faceBottom)
+
+
+def CityGMLbuildingInteriorLOD1(CityModel, ID, attributes, o, x, y, z, h, floors, floorHeight, rtype=None, width=None, wallThickness=0.2, joist=0.2, aux=None, buildingpart=None, storeys=None):
+    """Create the interior of an "LOD1+" according to (Boeters et al., 2015)."""
+    cityObject = etree.SubElement(CityModel, "cityObjectMember")
+    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
+    bldg.attrib['{%s}id' % ns_gml] = ID
+    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
+    roofType.text = rtype
+
+    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
+    yearOfConstructionXML.text = attributes['yearOfConstruction']
+    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
+    functionXML.text = attributes['function']
+    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
+    storeysAboveGroundXML.text = attributes['storeysAboveGround']
+
+    if storeys is None:
+        storeys = storeyTemplate(o, x, y, floors, floorHeight, wallThickness, joist)
+
+    #-- Ceiling elevation
+    if rtype == 'Flat':
+        cel = floors * floorHeight - 0.5*joist
+    else:
+        cel = floors * floorHeight + 0.5*joist
+    #-- XML tree
+    lod2Solid = etree.SubElement(bldg, "{%s}lod2Solid" % ns_bldg)
+    Solid = etree.SubElement(lod2Solid, "{%s}Solid" % ns_gml)
+    if ASSIGNID:
+        Solid.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+    exterior = etree.SubElement(Solid, "{%s}exterior" % ns_gml)
+    CompositeSurface = etree.SubElement(exterior, "{%s}CompositeSurface" % ns_gml)
+    #-- The eight points of the solid. F=Floor (of the first storey), C=Ceiling
+    p0F, p1F, p2F, p3F = storeyPoints(storeys, 1)[0]
+    p0C, p1C, p2C, p3C = [c + ' ' + str(cel) for c in storeys['corners']]
+    
+    S = "%s %s %s %s %s" % (p0F, p1F, p1C, p0C, p0F)
+    if buildingpart is not None:
+        bp = [None] * 8
+        bp[0] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + 0.5*joist])
+        bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + 0.5*joist])
+        bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + 0.5*joist])
+        bp[3] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + 0.5*joist])
+        bp[4] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
+        bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
+        bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
+        bp[7] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
+        E = "%s %s %s %s %s %s %s %s %s" % (p1F, bp[0], bp[4], bp[7], bp[3], p2F, p2C, p1C, p1F)
+        faceBottom = "%s %s %s %s %s %s %s %s %s" % (p0F, p3F, p2F, bp[3], bp[2], bp[1], bp[0], p1F, p0F)
+        gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
+        gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
+        gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
+        gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
+        addsurface(False, CompositeSurface, gface0)
+        addsurface(False, CompositeSurface, gface1)
+        addsurface(False, CompositeSurface, gface3)
+        addsurface(False, CompositeSurface, gtop)
+    else:
+        E = "%s %s %s %s %s" % (p1F, p2F, p2C, p1C, p1F)
+        faceBottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
+    N = "%s %s %s %s %s" % (p2F, p3F, p3C, p2C, p2F)
+    W = "%s %s %s %s %s" % (p3F, p0F, p0C, p3C, p3F)
+    addsurface(False, CompositeSurface, E)
+    addsurface(False, CompositeSurface, faceBottom)
+    addsurface(False, CompositeSurface, S)
+    addsurface(False, CompositeSurface, N)
+    addsurface(False, CompositeSurface, W)
+
+    if rtype != 'Flat':
+        p = verticesBody(o, x, y, z)
+        pList = verticesBodyList(o, x, y, z)
+        if rtype == 'Shed':
+            h2 = (h/x) * (x - 2* wallThickness)
+            topThickness = h - h2 - .5*joist
+            rWth = (topThickness/h)*(x)
+        else:
+            h2 = (h/(.5*x)) * (.5*x - wallThickness)
+            topThickness = h - h2 - .5*joist
+            rWth = (topThickness/h)*(.5*x)
+
+    #-- Extension for the attic
+    if rtype != 'Flat':
+
+        XTa = o[0] + wallThickness
+        XTb = o[0] + x - wallThickness
+        YTa = o[1] + wallThickness
+        YTb = o[1] + y - wallThickness
+
+        r = verticesRoof([o, x, y, z], h, rtype, width)
+        r[0] = GMLstring2points(r[0])[0]
+        r[1] = GMLstring2points(r[1])[0]
+        #-- Floor elevation
+        fel = floors * floorHeight + 0.5*joist
+        #-- Ceiling elevation
+        if rtype == 'Shed':
+            h2 = (h/x) * (x - wallThickness)
+            topThickness = h - h2 - .5*joist
+        else:
+            h2 = (h/(.5*x)) * (.5*x - wallThickness)
+            topThickness = h - h2 - .5*joist
+        cel = float(r[0][2]) - topThickness
+        # #-- XML tree
+        # lod2Solid = etree.SubElement(bldg, "{%s}lod2Solid" % ns_bldg)
+        # Solid = etree.SubElement(lod2Solid, "{%s}Solid" % ns_gml)
+        # if ASSIGNID:
+        #     Solid.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+        # exterior = etree.SubElement(Solid, "{%s}exterior" % ns_gml)
+        # CompositeSurface = etree.SubElement(exterior, "{%s}CompositeSurface" % ns_gml)
+        if rtype == 'Gabled':
+            gabledAttic(CompositeSurface, [XTa, YTa, XTb, YTb], p, r, fel, cel, wallThickness, topThickness)
+        elif rtype == 'Hipped':
+            hippedAttic(CompositeSurface, [XTa, YTa, XTb, YTb], p, r, fel, cel, wallThickness, topThickness)
+
+        elif rtype == 'Pyramidal':
+            pyramidalAttic(CompositeSurface, [XTa, YTa, XTb, YTb], p, r, fel, cel, wallThickness, topThickness)
+
+        elif rtype == 'Shed':
+            shedAttic(CompositeSurface, [XTa, YTa, XTb, YTb], p, r, fel, cel, wallThickness, topThickness)
+
+    else:
+        top = "%s %s %s %s %s" % (p0C, p1C, p2C, p3C, p0C)
+        addsurface(False, CompositeSurface, top)
+
+
+def CityGMLbuildingInteriorLOD2(CityModel, ID, attributes, o, x, y, z, h, floors, floorHeight, rtype=None, width=None, wallThickness=0.2, joist=0.2, aux=None, buildingpart=None, dormers=None, storeys=None):
+    """Create the interior of an "LOD2+" according to (Boeters et al., 2015)."""
+    cityObject = etree.SubElement(CityModel, "cityObjectMember")
+    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
+    bldg.attrib['{%s}id' % ns_gml] = ID
+    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
+    roofType.text = rtype
+
+    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
+    yearOfConstructionXML.text = attributes['yearOfConstruction']
+    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
+    functionXML.text = attributes['function']
+    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
+    storeysAboveGroundXML.text = attributes['storeysAboveGround']
+
+    if storeys is None:
+        storeys = storeyTemplate(o, x, y, floors, floorHeight, wallThickness, joist)
+
+    #-- XML tree
+    lod2Solid = etree.SubElement(bldg, "{%s}lod2Solid" % ns_bldg)
+    MultiSolid = etree.SubElement(lod2Solid, "{%s}MultiSolid" % ns_gml)
+
+    if storeys['solids'] is None:
+        #-- Solids of the storeys, to which the interior of the dormers is added
+        storeySolids = []
+        #-- Construct a solid for each floor
+        for floor in range(1, int(floors) + 1):
+            #-- Add solids of the multisolid
+            Solid = etree.SubElement(MultiSolid, "{%s}Solid" % ns_gml)
+            storeySolids.append(Solid)
+            if ASSIGNID:
+                Solid.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+            exterior = etree.SubElement(Solid, "{%s}exterior" % ns_gml)
+            CompositeSurface = etree.SubElement(exterior, "{%s}CompositeSurface" % ns_gml)
+            #-- The eight points of the solid, translated from the template. F=Floor, C=Ceiling
+            (p0F, p1F, p2F, p3F), (p0C, p1C, p2C, p3C) = storeyPoints(storeys, floor)
+            if floor == 1:
+                if buildingpart is not None:
+                    if buildingpart['type'] == 'Alcove':
+                        bp = [None] * 8
+                        bp[0] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + 0.5*joist])
+                        bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + 0.5*joist])
+                        bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + 0.5*joist])
+                        bp[3] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + 0.5*joist])
+                        bp[4] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
+                        bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
+                        bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
+                        bp[7] = GMLPointList([o[0] + x - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
+                        E = "%s %s %s %s %s %s %s %s %s" % (p1F, bp[0], bp[4], bp[7], bp[3], p2F, p2C, p1C, p1F)
+                        faceBottom = "%s %s %s %s %s %s %s %s %s" % (p0F, p3F, p2F, bp[3], bp[2], bp[1], bp[0], p1F, p0F)
+                        gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
+                        gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
+                        gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
+                        gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
+                        addsurface(False, CompositeSurface, gface0)
+                        addsurface(False, CompositeSurface, gface1)
+                        addsurface(False, CompositeSurface, gface3)
+                        addsurface(False, CompositeSurface, gtop)
+                        top = "%s %s %s %s %s %s %s %s %s" % (p0C, p1C, bp[4], bp[5], bp[6], bp[7], p2C, p3C, p0C)
+                    elif buildingpart['type'] == 'Garage':
+                        GarageSolid = etree.SubElement(MultiSolid, "{%s}Solid" % ns_gml)
+                        GarageExterior = etree.SubElement(GarageSolid, "{%s}exterior" % ns_gml)
+                        GarageCompositeSurface = etree.SubElement(GarageExterior, "{%s}CompositeSurface" % ns_gml)
+                        E = "%s %s %s %s %s" % (p1F, p2F, p2C, p1C, p1F)
+                        faceBottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
+                        top = "%s %s %s %s %s" % (p0C, p1C, p2C, p3C, p0C)
+                        bp = [None] * 8
+                        bp[0] = GMLPointList([o[0] + x + 0.0, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + 0.5*joist])
+                        bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + 0.5*joist])
+                        bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + 0.5*joist])
+                        bp[3] = GMLPointList([o[0] + x + 0.0, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + 0.5*joist])
+                        bp[4] = GMLPointList([o[0] + x + 0.0, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
+                        bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
+                        bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']) - wallThickness, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
+                        bp[7] = GMLPointList([o[0] + x + 0.0, aux['origin'][1] + buildingpart['o'] + buildingpart['y'] - wallThickness, aux['origin'][2] + buildingpart['z'] - 0.5*joist])
+
+                        gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
+                        gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
+                        gface2 = "%s %s %s %s %s" % (bp[0], bp[4], bp[7], bp[3], bp[0])
+                        gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
+                        gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
+                        gbottom = "%s %s %s %s %s" % (bp[0], bp[3], bp[2], bp[1], bp[0])
+                        addsurface(False, GarageCompositeSurface, gface0)
+                        addsurface(False, GarageCompositeSurface, gface1)
+                        addsurface(False, GarageCompositeSurface, gface2)
+                        addsurface(False, GarageCompositeSurface, gface3)
+                        addsurface(False, GarageCompositeSurface, gtop)
+                        addsurface(False, GarageCompositeSurface, gbottom)
+                else:
+                    E = "%s %s %s %s %s" % (p1F, p2F, p2C, p1C, p1F)
+                    faceBottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
+                    top = "%s %s %s %s %s" % (p0C, p1C, p2C, p3C, p0C)
+            else:
+                faceBottom = "%s %s %s %s %s" % (p0F, p3F, p2F, p1F, p0F)
+                top = "%s %s %s %s %s" % (p0C, p1C, p2C, p3C, p0C)
+                E = "%s %s %s %s %s" % (p1F, p2F, p2C, p1C, p1F)
+            S = "%s %s %s %s %s" % (p0F, p1F, p1C, p0C, p0F)
+            N = "%s %s %s %s %s" % (p2F, p3F, p3C, p2C, p2F)
+            W = "%s %s %s %s %s" % (p3F, p0F, p0C, p3C, p3F)
+            addsurface(False, CompositeSurface, faceBottom)
+            addsurface(False, CompositeSurface, top)
+            addsurface(False, CompositeSurface, S)
+            addsurface(False, CompositeSurface, E)
+            addsurface(False, CompositeSurface, N)
+            addsurface(False, CompositeSurface, W)
+        #-- Keep the storeys for the other interior LOD2 of the building, before the dormers are added to them
+        if dormers:
+            storeys['solids'] = [[copy.deepcopy(Solid) for Solid in MultiSolid], [MultiSolid.index(Solid) for Solid in storeySolids]]
+        else:
+            storeys['solids'] = [list(MultiSolid), [MultiSolid.index(Solid) for Solid in storeySolids]]
+    else:
+        #-- The storeys are shared with the other interior LOD2 of the building
+        for Solid in storeys['solids'][0]:
+            Solid = copy.deepcopy(Solid)
+            if ASSIGNID:
+                for element in Solid.iter():
+                    if '{%s}id' % ns_gml in element.attrib:
+                        element.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+            MultiSolid.append(Solid)
+        storeySolids = [MultiSolid[i] for i in storeys['solids'][1]]
+
+    dormerTickness = .1
+    if rtype != 'Flat':
+        if rtype == 'Shed':
+            h2 = (h/x) * (x - 2* wallThickness)
+            topThickness = h - h2 - .5*joist
+            #rWth = (topThickness/h)*(x)
+            rWth = (topThickness/h)*(x) - wallThickness
+            rWth2 = None
+        elif rtype == 'Pyramidal' or rtype == 'Hipped':
+            h2 = (h/(.5*x)) * (.5*x - wallThickness)
+            topThickness = h - h2 - .5*joist
+            rWth = (topThickness/h)*(.5*x)
+            #rWth2 = (topThickness/h)*(width)
+            # auxl1 = (topThickness*width)/h
+            # rWth2 = topThickness**2 * auxl1
+            rWth2 = wallThickness - ((width * .5*joist)/h)
+        else:
+            h2 = (h/(.5*x)) * (.5*x - wallThickness)
+            topThickness = h - h2 - .5*joist
+            rWth = (topThickness/h)*(.5*x)
+            rWth2 = None
+
+    p = verticesBody(o, x, y, z)
+    pList = verticesBodyList(o, x, y, z)
+    ropenings = [[], [], [], []]
+    if dormers and len(dormers) > 0:
+        for drm in dormers:
+            #-- Get a list of vertices of each dormer
+            dList, dListGML = interiordormerVertices([drm], pList, h, rtype, [o, x, y, z], width, wallThickness, rWth, dormerTickness, topThickness, rWth2)
+            #-- Get the opening for creating a hole in the roof surface
+            ropenings[int(drm['side'])].append(str(dListGML[0][0] + ' ' + dListGML[0][3] + ' ' + dListGML[0][2] + ' ' + dListGML[0][1] + ' ' + dListGML[0][0]))
+            #-- The interior of the dormer is the same in each storey
+            for Solid in storeySolids:
+                interiorDormer(Solid[0][0], [dList[0], dListGML[0]], drm['side'])
+
+    #-- Solid for the attic
+    if rtype != 'Flat':
+
+        XTa = o[0] + wallThickness
+        XTb = o[0] + x - wallThickness
+        YTa = o[1] + wallThickness
+        YTb = o[1] + y - wallThickness
+
+        r = verticesRoof([o, x, y, z], h, rtype, width)
+        r[0] = GMLstring2points(r[0])[0]
+        r[1] = GMLstring2points(r[1])[0]
+        #-- Floor elevation
+        fel = floors * floorHeight + 0.5*joist
+        #-- Ceiling elevation of the roof. Requires some computations to preserve parallel walls
+
+        cel = float(r[0][2]) - topThickness
+        #-- XML tree
+        # lod2Solid = etree.SubElement(bldg, "{%s}lod2Solid" % ns_bldg)
+        Solid = etree.SubElement(MultiSolid, "{%s}Solid" % ns_gml)
+        if ASSIGNID:
+            Solid.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+        exterior = etree.SubElement(Solid, "{%s}exterior" % ns_gml)
+        CompositeSurface = etree.SubElement(exterior, "{%s}CompositeSurface" % ns_gml)
+        if rtype == 'Gabled':
+            gabledAttic(CompositeSurface, [XTa, YTa, XTb, YTb], p, r, fel, cel, wallThickness, topThickness, True, ropenings)
+
+        elif rtype == 'Hipped':
+
+            hippedAttic(CompositeSurface, [XTa, YTa, XTb, YTb], p, r, fel, cel, wallThickness, topThickness, True, ropenings)
+                #addsurface(False, CompositeSurface, aS)
+        elif rtype == 'Pyramidal':
+            pyramidalAttic(CompositeSurface, [XTa, YTa, XTb, YTb], p, r, fel, cel, wallThickness, topThickness, True, ropenings)
+
+        elif rtype == 'Shed':
+            shedAttic(CompositeSurface, [XTa, YTa, XTb, YTb], p, r, fel, cel, wallThickness, topThickness, True, ropenings)
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT)
+
+# This code is part of the Random3Dcity package
+
+# Copyright (c) 2015
+# Filip Biljecki
+# Delft University of Technology
+# fbiljecki@gmail.com
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Builder of the LOD0 representations of the buildings (footprints and roof edges).
+"""
+
+from lxml import etree
+import uuid
+
+from random3dcity.geometry import ns_gml, ns_bldg, GMLPointList, GMLreversedRing, GMLstring2points, verticesBody
+
+
+#-- Generate an UUID for each polygon, configured by generateCityGML.py according to its options
+ASSIGNID = True
+
+
+def multiSurfaceLOD0(bldg, coords, footedge):
+    """
+    Write a surface with input coordinates.
+    Input: coordinates of the LinearRing.
+    Output: MultiSurface.
+    """
+    if footedge == "footprint":
+        lod0MultiSurface = etree.SubElement(bldg, "{%s}lod0FootPrint" % ns_bldg)
+    elif footedge == "roofedge":
+        lod0MultiSurface = etree.SubElement(bldg, "{%s}lod0RoofEdge" % ns_bldg)
+    MultiSurface = etree.SubElement(lod0MultiSurface, "{%s}MultiSurface" % ns_gml)
+    surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
+    Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
+    if ASSIGNID:
+        Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+    PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
+    LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
+    posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+    posList.text = coords
+
+
+def CityGMLbuildingLOD0(CityModel, ID, attributes, o, x, y, z, h=None, rtype=None, top=None, override=None, LOD=None, aux=None, buildingpart=None, fd=False):
+    """
+    Generate a cityObjectMember representing a building in LOD0.
+    Output: CityGML code of the cityObjectMember.
+    """
+    cityObject = etree.SubElement(CityModel, "cityObjectMember")
+    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
+    bldg.attrib['{%s}id' % ns_gml] = ID
+    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
+    roofType.text = rtype
+
+    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
+    yearOfConstructionXML.text = attributes['yearOfConstruction']
+    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
+    functionXML.text = attributes['function']
+    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
+    storeysAboveGroundXML.text = attributes['storeysAboveGround']
+    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
+    storeysAboveGroundXML.text = attributes['storeysAboveGround']
+
+    if top is not None:
+        if top == 1.0 and rtype == 'Shed':
+            p = verticesBody(o, x, y, z, h, None, override)
+        else:
+            p = verticesBody(o, x, y, z, h, top)
+    elif top is None:
+        p = verticesBody(o, x, y, z, h, None, override)
+
+    #-- Is the building part covered by overhangs?
+    if buildingpart is not None:
+        if x > aux['xsize'] and aux['ovhx'] >= buildingpart['x']:
+            covered = True
+        else:
+            covered = False
+    else:
+        covered = None
+
+    footprints = []
+    roofedges = []
+
+
+    #-- Account for building parts
+    if buildingpart is not None and not covered:
+
+        #-- Accounting for overhangs
+        if x > aux['xsize']:# or x < aux['xsize']:
+            bp = [None] * 8
+            bp[0] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[3] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+            bp[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+
+            #-- Top with the rest of the building
+            bpT = [None] * 8
+            tH = GMLstring2points(p[4])[0][2]
+            bpT[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], tH])
+            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
+            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+            bpT[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+ 
+        elif fd and x < aux['xsize']:
+
+            bp = [None] * 8
+            eastline = GMLstring2points(p[1])[0][0]
+            bp[0] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[3] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+            bp[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+
+            #-- Top with the rest of the building
+            bpT = [None] * 8
+            tH = GMLstring2points(p[4])[0][2]
+            bpT[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], tH])
+            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
+            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+            bpT[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+
+        else:
+            bp = [None] * 8
+            bp[0] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[1] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[2] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[3] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+            bp[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+
+            #-- Top with the rest of the building
+            bpT = [None] * 8
+            tH = GMLstring2points(p[4])[0][2]
+            bpT[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], tH])
+            bpT[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], tH])
+            bpT[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+            bpT[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+
+        if buildingpart['type'] == 'Alcove':
+            if LOD == '0.1':
+                faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
+                footprints.append(faceBottom)
+                #faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
+                #roofedges.append(faceTop)
+            elif LOD == '0.2':
+                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
+                footprints.append(faceBottom)
+                faceTop = "%s %s %s %s %s %s %s %s %s" % (p[4], p[5], bpT[4], bpT[5], bpT[6], bpT[7], p[6], p[7], p[4])
+                roofedges.append(faceTop)    
+            elif LOD == '0.3':
+                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
+                footprints.append(faceBottom)
+                faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
+                roofedges.append(faceTop)
+                gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
+                roofedges.append(gtop)                         
+        elif buildingpart['type'] == 'Garage':
+            if LOD == '0.1' or LOD == '0.2' or LOD == '0.3':
+                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
+                footprints.append(faceBottom)
+                if LOD == '0.2':
+                    faceTop = "%s %s %s %s %s %s %s %s %s" % (p[4], p[5], bpT[4], bpT[5], bpT[6], bpT[7], p[6], p[7], p[4])
+                    roofedges.append(faceTop)
+                elif LOD == '0.3':
+                    faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
+                    roofedges.append(faceTop)
+                    gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
+                    roofedges.append(gtop)
+    else:
+        footprint = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
+        footprints.append(footprint)
+        if LOD == '0.2' or LOD == '0.3':
+            faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
+            roofedges.append(faceTop)
+
+
+    #-- Bottom face
+    for ft in footprints:
+        multiSurfaceLOD0(bldg, GMLreversedRing(ft), "footprint")
+
+    #-- Top face
+    for re in roofedges:
+        multiSurfaceLOD0(bldg, re, "roofedge")
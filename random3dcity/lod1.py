@@ -0,0 +1,625 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT)
+
+# This code is part of the Random3Dcity package
+
+# Copyright (c) 2015
+# Filip Biljecki
+# Delft University of Technology
+# fbiljecki@gmail.com
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Builders of the LOD1 representations of the buildings (blocks).
+"""
+
+from lxml import etree
+import uuid
+
+from random3dcity.geometry import ns_gml, ns_bldg, GMLPointList, GMLstring2points, addsurface, multiSurface, plainMultiSurface, verticesBody
+
+
+#-- Generate an UUID for each polygon, configured by generateCityGML.py according to its options
+ASSIGNID = True
+
+
+def CityGMLbuildingLOD1(CityModel, ID, attributes, o, x, y, z, h=None, rtype=None, top=None, override=None, LOD=None, aux=None, buildingpart=None, fd=False):
+    """
+    Generate a cityObjectMember representing a building in LOD1.
+    Input: ID, origin, width, depth, height, and optionally: height of the roof, roof type, block model top modelling rule, walls modelling rule.
+    Output: CityGML code of the cityObjectMember.
+    """
+    cityObject = etree.SubElement(CityModel, "cityObjectMember")
+    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
+    bldg.attrib['{%s}id' % ns_gml] = ID
+    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
+    roofType.text = rtype
+
+    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
+    yearOfConstructionXML.text = attributes['yearOfConstruction']
+    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
+    functionXML.text = attributes['function']
+    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
+    storeysAboveGroundXML.text = attributes['storeysAboveGround']
+
+    if top is not None:
+        if top == 1.0 and rtype == 'Shed':
+            p = verticesBody(o, x, y, z, h, None, override)
+        else:
+            p = verticesBody(o, x, y, z, h, top)
+    elif top is None:
+        p = verticesBody(o, x, y, z, h, None, override)
+
+    lod1MultiSurface = etree.SubElement(bldg, "{%s}lod1MultiSurface" % ns_bldg)
+    MultiSurface = etree.SubElement(lod1MultiSurface, "{%s}MultiSurface" % ns_gml)
+    surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
+    
+
+    faces = []
+    face0 = "%s %s %s %s %s" % (p[0], p[1], p[5], p[4], p[0])
+    faces.append(face0)
+    face2 = "%s %s %s %s %s" % (p[2], p[3], p[7], p[6], p[2])
+    faces.append(face2)
+    face3 = "%s %s %s %s %s" % (p[3], p[0], p[4], p[7], p[3])
+    faces.append(face3)
+
+    #-- Is the building part covered by overhangs?
+    if buildingpart is not None:
+        if x > aux['xsize'] and aux['ovhx'] >= buildingpart['x']:
+            covered = True
+        else:
+            covered = False
+    else:
+        covered = None
+
+    #-- Account for building parts
+    if buildingpart is not None and not covered:
+
+        #-- Accounting for overhangs
+        if x > aux['xsize']:# or x < aux['xsize']:
+            bp = [None] * 8
+            bp[0] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[3] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+            bp[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+
+            #-- Top with the rest of the building
+            bpT = [None] * 8
+            tH = GMLstring2points(p[4])[0][2]
+            bpT[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], tH])
+            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
+            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+            bpT[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+
+        elif fd and x < aux['xsize']:
+
+            bp = [None] * 8
+            eastline = GMLstring2points(p[1])[0][0]
+            bp[0] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[3] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+            bp[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+
+            #-- Top with the rest of the building
+            bpT = [None] * 8
+            tH = GMLstring2points(p[4])[0][2]
+            bpT[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], tH])
+            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
+            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+            bpT[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+
+
+        else:
+            bp = [None] * 8
+            bp[0] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[1] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[2] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[3] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+            bp[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+
+            #-- Top with the rest of the building
+            bpT = [None] * 8
+            tH = GMLstring2points(p[4])[0][2]
+            bpT[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], tH])
+            bpT[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], tH])
+            bpT[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+            bpT[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+
+        if buildingpart['type'] == 'Alcove':
+            if LOD == '1.1':
+                face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
+                faces.append(face1)
+                faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
+                faces.append(faceBottom)
+                faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
+                faces.append(faceTop)
+            elif LOD == '1.2':
+                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
+                faces.append(faceBottom)
+                faceTop = "%s %s %s %s %s %s %s %s %s" % (p[4], p[5], bpT[4], bpT[5], bpT[6], bpT[7], p[6], p[7], p[4])
+                faces.append(faceTop)
+                face1_0 = "%s %s %s %s %s" % (p[1], bp[0], bpT[4], p[5], p[1])
+                faces.append(face1_0)
+                face1_1 = "%s %s %s %s %s" % (p[2], p[6], bpT[7], bp[3], p[2])
+                faces.append(face1_1)
+                gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bpT[5], bpT[4], bp[0])
+                faces.append(gface0)
+                gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bpT[6], bpT[5], bp[1])
+                faces.append(gface1)
+                gface3 = "%s %s %s %s %s" % (bp[3], bpT[7], bpT[6], bp[2], bp[3])
+                faces.append(gface3)
+            elif LOD == '1.3':
+                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
+                faces.append(faceBottom)
+                faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
+                faces.append(faceTop)
+                face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
+                faces.append(face1)
+                gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
+                faces.append(gface0)
+                gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
+                faces.append(gface1)
+                gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
+                faces.append(gface3)
+                gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
+                faces.append(gtop)                
+        elif buildingpart['type'] == 'Garage':
+            if LOD == '1.1' or LOD == '1.2' or LOD == '1.3':
+                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
+                faces.append(faceBottom)
+                if LOD == '1.1' or LOD == '1.2':
+                    faceTop = "%s %s %s %s %s %s %s %s %s" % (p[4], p[5], bpT[4], bpT[5], bpT[6], bpT[7], p[6], p[7], p[4])
+                    faces.append(faceTop)
+                    face1_0 = "%s %s %s %s %s" % (p[1], bp[0], bpT[4], p[5], p[1])
+                    faces.append(face1_0)
+                    face1_1 = "%s %s %s %s %s" % (p[2], p[6], bpT[7], bp[3], p[2])
+                    faces.append(face1_1)
+                    gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bpT[5], bpT[4], bp[0])
+                    faces.append(gface0)
+                    gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bpT[6], bpT[5], bp[1])
+                    faces.append(gface1)
+                    gface3 = "%s %s %s %s %s" % (bp[3], bpT[7], bpT[6], bp[2], bp[3])
+                    faces.append(gface3)
+                elif LOD == '1.3':
+                    faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
+                    faces.append(faceTop)
+                    face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
+                    faces.append(face1)
+                    gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
+                    faces.append(gface0)
+                    gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
+                    faces.append(gface1)
+                    gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
+                    faces.append(gface3)
+                    gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
+                    faces.append(gtop)
+    else:
+        face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
+        faces.append(face1)
+        faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
+        faces.append(faceBottom)
+        faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
+        faces.append(faceTop)
+
+    for face in faces:
+        plainMultiSurface(surfaceMember, face)
+
+
+def CityGMLbuildingLOD1Semantics(CityModel, ID, attributes, o, x, y, z, h=None, rtype=None, top=None, override=None, LOD=None, aux=None, buildingpart=None, fd=False):
+    """
+    Generate a cityObjectMember representing a building in a special experimental form of LOD1 currently not really supported by the standard.
+    Input: ID, origin, width, depth, height, and optionally: height of the roof, roof type, block model top modelling rule, walls modelling rule.
+    Output: CityGML code of the cityObjectMember.
+    """
+    cityObject = etree.SubElement(CityModel, "cityObjectMember")
+    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
+    bldg.attrib['{%s}id' % ns_gml] = ID
+    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
+    roofType.text = rtype
+
+    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
+    yearOfConstructionXML.text = attributes['yearOfConstruction']
+    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
+    functionXML.text = attributes['function']
+    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
+    storeysAboveGroundXML.text = attributes['storeysAboveGround']
+
+    if top is not None:
+        if top == 1.0 and rtype == 'Shed':
+            p = verticesBody(o, x, y, z, h, None, override)
+        else:
+            p = verticesBody(o, x, y, z, h, top)
+    elif top is None:
+        p = verticesBody(o, x, y, z, h, None, override)
+
+    Wfaces = []
+    Rfaces = []
+    Gfaces = []
+
+    face0 = "%s %s %s %s %s" % (p[0], p[1], p[5], p[4], p[0])
+    Wfaces.append(face0)
+    face2 = "%s %s %s %s %s" % (p[2], p[3], p[7], p[6], p[2])
+    Wfaces.append(face2)
+    face3 = "%s %s %s %s %s" % (p[3], p[0], p[4], p[7], p[3])
+    Wfaces.append(face3)
+
+    #-- Is the building part covered by overhangs?
+    if buildingpart is not None:
+        if x > aux['xsize'] and aux['ovhx'] >= buildingpart['x']:
+            covered = True
+        else:
+            covered = False
+    else:
+        covered = None
+
+    #-- Account for building parts
+    if buildingpart is not None and not covered:
+
+        #-- Accounting for overhangs
+        if x > aux['xsize']:# or x < aux['xsize']:
+            bp = [None] * 8
+            bp[0] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[3] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+            bp[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+
+            #-- Top with the rest of the building
+            bpT = [None] * 8
+            tH = GMLstring2points(p[4])[0][2]
+            bpT[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], tH])
+            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
+            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+            bpT[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+
+        elif fd and x < aux['xsize']:
+
+            bp = [None] * 8
+            eastline = GMLstring2points(p[1])[0][0]
+            bp[0] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[3] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+            bp[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+
+            #-- Top with the rest of the building
+            bpT = [None] * 8
+            tH = GMLstring2points(p[4])[0][2]
+            bpT[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], tH])
+            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
+            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+            bpT[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+
+
+        else:
+            bp = [None] * 8
+            bp[0] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[1] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[2] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[3] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+            bp[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+
+            #-- Top with the rest of the building
+            bpT = [None] * 8
+            tH = GMLstring2points(p[4])[0][2]
+            bpT[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], tH])
+            bpT[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], tH])
+            bpT[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+            bpT[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+
+        if buildingpart['type'] == 'Alcove':
+            if LOD == '1.1':
+                face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
+                Wfaces.append(face1)
+                faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
+                Gfaces.append(faceBottom)
+                faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
+                Rfaces.append(faceTop)
+            elif LOD == '1.2':
+                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
+                Gfaces.append(faceBottom)
+                faceTop = "%s %s %s %s %s %s %s %s %s" % (p[4], p[5], bpT[4], bpT[5], bpT[6], bpT[7], p[6], p[7], p[4])
+                Rfaces.append(faceTop)
+                face1_0 = "%s %s %s %s %s" % (p[1], bp[0], bpT[4], p[5], p[1])
+                Wfaces.append(face1_0)
+                face1_1 = "%s %s %s %s %s" % (p[2], p[6], bpT[7], bp[3], p[2])
+                Wfaces.append(face1_1)
+                gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bpT[5], bpT[4], bp[0])
+                Wfaces.append(gface0)
+                gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bpT[6], bpT[5], bp[1])
+                Wfaces.append(gface1)
+                gface3 = "%s %s %s %s %s" % (bp[3], bpT[7], bpT[6], bp[2], bp[3])
+                Wfaces.append(gface3)
+            elif LOD == '1.3':
+                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
+                Gfaces.append(faceBottom)
+                faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
+                Rfaces.append(faceTop)
+                face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
+                Wfaces.append(face1)
+                gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
+                Wfaces.append(gface0)
+                gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
+                Wfaces.append(gface1)
+                gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
+                Wfaces.append(gface3)
+                gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
+                Rfaces.append(gtop)                
+        elif buildingpart['type'] == 'Garage':
+            if LOD == '1.1' or LOD == '1.2' or LOD == '1.3':
+                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
+                Gfaces.append(faceBottom)
+                if LOD == '1.1' or LOD == '1.2':
+                    faceTop = "%s %s %s %s %s %s %s %s %s" % (p[4], p[5], bpT[4], bpT[5], bpT[6], bpT[7], p[6], p[7], p[4])
+                    Rfaces.append(faceTop)
+                    face1_0 = "%s %s %s %s %s" % (p[1], bp[0], bpT[4], p[5], p[1])
+                    Wfaces.append(face1_0)
+                    face1_1 = "%s %s %s %s %s" % (p[2], p[6], bpT[7], bp[3], p[2])
+                    Wfaces.append(face1_1)
+                    gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bpT[5], bpT[4], bp[0])
+                    Wfaces.append(gface0)
+                    gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bpT[6], bpT[5], bp[1])
+                    Wfaces.append(gface1)
+                    gface3 = "%s %s %s %s %s" % (bp[3], bpT[7], bpT[6], bp[2], bp[3])
+                    Wfaces.append(gface3)
+                elif LOD == '1.3':
+                    faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
+                    Rfaces.append(faceTop)
+                    face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
+                    Wfaces.append(face1)
+                    gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
+                    Wfaces.append(gface0)
+                    gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
+                    Wfaces.append(gface1)
+                    gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
+                    Wfaces.append(gface3)
+                    gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
+                    Rfaces.append(gtop)
+    else:
+        face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
+        Wfaces.append(face1)
+        faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
+        Gfaces.append(faceBottom)
+        faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
+        Rfaces.append(faceTop)
+
+    for face in Wfaces:
+        multiSurface(bldg, face, "WallSurface", None)
+    for face in Gfaces:
+        multiSurface(bldg, face, "GroundSurface", None)
+    for face in Rfaces:
+        multiSurface(bldg, face, "RoofSurface", None)
+
+
+def CityGMLbuildingLOD1Solid(CityModel, ID, attributes, o, x, y, z, h=None, rtype=None, top=None, override=None, LOD=None, aux=None, buildingpart=None, fd=False):
+    """
+    Generate a cityObjectMember representing a building as an LOD1 solid.
+    Input: ID, origin, width, depth, height, and optionally: height of the roof, roof type, block model top modelling rule, walls modelling rule.
+    Output: CityGML code of the cityObjectMember.
+    """
+    cityObject = etree.SubElement(CityModel, "cityObjectMember")
+    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
+    bldg.attrib['{%s}id' % ns_gml] = ID
+    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
+    roofType.text = rtype
+
+    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
+    yearOfConstructionXML.text = attributes['yearOfConstruction']
+    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
+    functionXML.text = attributes['function']
+    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
+    storeysAboveGroundXML.text = attributes['storeysAboveGround']
+
+    if top is not None:
+        if top == 1.0 and rtype == 'Shed':
+            p = verticesBody(o, x, y, z, h, None, override)
+        else:
+            p = verticesBody(o, x, y, z, h, top)
+    elif top is None:
+        p = verticesBody(o, x, y, z, h, None, override)
+
+    lod1Solid = etree.SubElement(bldg, "{%s}lod1Solid" % ns_bldg)
+    Solid = etree.SubElement(lod1Solid, "{%s}Solid" % ns_gml)
+    if ASSIGNID:
+        Solid.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+    exterior = etree.SubElement(Solid, "{%s}exterior" % ns_gml)
+    CompositeSurface = etree.SubElement(exterior, "{%s}CompositeSurface" % ns_gml)
+
+    faces = []
+    face0 = "%s %s %s %s %s" % (p[0], p[1], p[5], p[4], p[0])
+    faces.append(face0)
+    face2 = "%s %s %s %s %s" % (p[2], p[3], p[7], p[6], p[2])
+    faces.append(face2)
+    face3 = "%s %s %s %s %s" % (p[3], p[0], p[4], p[7], p[3])
+    faces.append(face3)
+
+    #-- Is the building part covered by overhangs?
+    if buildingpart is not None:
+        if x > aux['xsize'] and aux['ovhx'] >= buildingpart['x']:
+            covered = True
+        else:
+            covered = False
+    else:
+        covered = None
+
+    #-- Account for building parts
+    if buildingpart is not None and not covered:
+
+        #-- Accounting for overhangs
+        if x > aux['xsize']:# or x < aux['xsize']:
+            bp = [None] * 8
+            bp[0] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[3] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+            bp[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+
+            #-- Top with the rest of the building
+            bpT = [None] * 8
+            tH = GMLstring2points(p[4])[0][2]
+            bpT[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], tH])
+            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
+            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+            bpT[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+
+        elif fd and x < aux['xsize']:
+
+            bp = [None] * 8
+            eastline = GMLstring2points(p[1])[0][0]
+            bp[0] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[3] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+            bp[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+
+            #-- Top with the rest of the building
+            bpT = [None] * 8
+            tH = GMLstring2points(p[4])[0][2]
+            bpT[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], tH])
+            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
+            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+            bpT[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+
+
+        else:
+            bp = [None] * 8
+            bp[0] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[1] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[2] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[3] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+            bp[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+
+            #-- Top with the rest of the building
+            bpT = [None] * 8
+            tH = GMLstring2points(p[4])[0][2]
+            bpT[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], tH])
+            bpT[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], tH])
+            bpT[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+            bpT[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+
+        if buildingpart['type'] == 'Alcove':
+            if LOD == '1.1':
+                face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
+                faces.append(face1)
+                faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
+                faces.append(faceBottom)
+                faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
+                faces.append(faceTop)
+            elif LOD == '1.2':
+                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
+                faces.append(faceBottom)
+                faceTop = "%s %s %s %s %s %s %s %s %s" % (p[4], p[5], bpT[4], bpT[5], bpT[6], bpT[7], p[6], p[7], p[4])
+                faces.append(faceTop)
+                face1_0 = "%s %s %s %s %s" % (p[1], bp[0], bpT[4], p[5], p[1])
+                faces.append(face1_0)
+                face1_1 = "%s %s %s %s %s" % (p[2], p[6], bpT[7], bp[3], p[2])
+                faces.append(face1_1)
+                gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bpT[5], bpT[4], bp[0])
+                faces.append(gface0)
+                gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bpT[6], bpT[5], bp[1])
+                faces.append(gface1)
+                gface3 = "%s %s %s %s %s" % (bp[3], bpT[7], bpT[6], bp[2], bp[3])
+                faces.append(gface3)
+            elif LOD == '1.3':
+                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
+                faces.append(faceBottom)
+                faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
+                faces.append(faceTop)
+                face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
+                faces.append(face1)
+                gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
+                faces.append(gface0)
+                gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
+                faces.append(gface1)
+                gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
+                faces.append(gface3)
+                gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
+                faces.append(gtop)                
+        elif buildingpart['type'] == 'Garage':
+            if LOD == '1.1' or LOD == '1.2' or LOD == '1.3':
+                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
+                faces.append(faceBottom)
+                if LOD == '1.1' or LOD == '1.2':
+                    faceTop = "%s %s %s %s %s %s %s %s %s" % (p[4], p[5], bpT[4], bpT[5], bpT[6], bpT[7], p[6], p[7], p[4])
+                    faces.append(faceTop)
+                    face1_0 = "%s %s %s %s %s" % (p[1], bp[0], bpT[4], p[5], p[1])
+                    faces.append(face1_0)
+                    face1_1 = "%s %s %s %s %s" % (p[2], p[6], bpT[7], bp[3], p[2])
+                    faces.append(face1_1)
+                    gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bpT[5], bpT[4], bp[0])
+                    faces.append(gface0)
+                    gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bpT[6], bpT[5], bp[1])
+                    faces.append(gface1)
+                    gface3 = "%s %s %s %s %s" % (bp[3], bpT[7], bpT[6], bp[2], bp[3])
+                    faces.append(gface3)
+                elif LOD == '1.3':
+                    faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
+                    faces.append(faceTop)
+                    face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
+                    faces.append(face1)
+                    gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
+                    faces.append(gface0)
+                    gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
+                    faces.append(gface1)
+                    gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
+                    faces.append(gface3)
+                    gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
+                    faces.append(gtop)
+    else:
+        face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
+        faces.append(face1)
+        faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
+        faces.append(faceBottom)
+        faceTop = "%s %s %s %s %s" % (p[4], p[5], p[6], p[7], p[4])
+        faces.append(faceTop)
+
+    for face in faces:
+        addsurface(False, CompositeSurface, face)
@@ -0,0 +1,410 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT)
+
+# This code is part of the Random3Dcity package
+
+# Copyright (c) 2015
+# Filip Biljecki
+# Delft University of Technology
+# fbiljecki@gmail.com
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Builders of the LOD2 representations of the buildings with a simple roof shape.
+"""
+
+from lxml import etree
+import uuid
+
+from random3dcity.geometry import ns_gml, ns_bldg, GMLPointList, GMLstring2points, addsurface, flatRoof, gabledRoof, hippedRoof, multiSurface, plainMultiSurface, roofOverhangs, shedRoof, verticesBody, verticesOverhangs, verticesRoof
+
+
+#-- Generate an UUID for each polygon, configured by generateCityGML.py according to its options
+ASSIGNID = True
+
+
+def CityGMLbuildingLOD2Solid(CityModel, ID, attributes, o, x, y, z, h, rtype=None, width=None, ovh=None, rep=None, LOD=None, aux=None, buildingpart=None, fd=False):
+    """
+    Create LOD2 of the building with a basic roof shape. Solid representation.
+    """
+    cityObject = etree.SubElement(CityModel, "cityObjectMember")
+    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
+    bldg.attrib['{%s}id' % ns_gml] = ID
+    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
+    roofType.text = rtype
+    
+    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
+    yearOfConstructionXML.text = attributes['yearOfConstruction']
+    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
+    functionXML.text = attributes['function']
+    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
+    storeysAboveGroundXML.text = attributes['storeysAboveGround']
+
+    p = verticesBody(o, x, y, z)
+    r = verticesRoof([o, x, y, z], h, rtype, width)
+
+    #-- Computations for the LOD2 with explicit overhangs
+    eaves = z
+    upperEaves = z
+    if ovh is not None:
+        overhangs, interiors, eaves, ovhy_recalculated = verticesOverhangs([o, x, y, z], p, h, rtype, ovh, r, width)
+        if rtype == 'Shed':
+            upperEaves = z + h + (z - eaves)
+    else:
+        overhangs = None
+
+    if rep == 'solid':
+        lod2rep = etree.SubElement(bldg, "{%s}lod2Solid" % ns_bldg)
+        repres = etree.SubElement(lod2rep, "{%s}Solid" % ns_gml)
+        exterior = etree.SubElement(repres, "{%s}exterior" % ns_gml)
+        CompositeSurface = etree.SubElement(exterior, "{%s}CompositeSurface" % ns_gml)
+    elif rep == 'brep':
+        lod2rep = etree.SubElement(bldg, "{%s}lod2MultiSurface" % ns_bldg)
+        repres = etree.SubElement(lod2rep, "{%s}MultiSurface" % ns_gml)
+        surfaceMember = etree.SubElement(repres, "{%s}surfaceMember" % ns_gml)
+    if ASSIGNID:
+        repres.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+    
+
+    #-- Is the building part covered by overhangs?
+    if buildingpart is not None:
+        if x > aux['xsize'] and aux['ovhx'] >= buildingpart['x']:
+            covered = True
+        else:
+            covered = False
+    else:
+        covered = None
+
+    east_faces = {}
+    east_faces['rest'] = []
+    east_faces['roof'] = []
+    east_faces['outerfloor'] = []
+    #-- Account for building parts
+    if buildingpart is not None and not covered:
+
+        #-- Accounting for overhangs
+        if x > aux['xsize']:# or x < aux['xsize']:
+            bp = [None] * 8
+            bp[0] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[3] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+            bp[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+
+            #-- Top with the rest of the building
+            bpT = [None] * 8
+            tH = GMLstring2points(p[4])[0][2]
+            bpT[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], tH])
+            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
+            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+            bpT[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+
+        elif fd and x < aux['xsize']:
+
+            bp = [None] * 8
+            eastline = GMLstring2points(p[1])[0][0]
+            bp[0] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[3] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+            bp[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+
+            #-- Top with the rest of the building
+            bpT = [None] * 8
+            tH = GMLstring2points(p[4])[0][2]
+            bpT[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], tH])
+            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
+            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+            bpT[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+
+
+        else:
+            bp = [None] * 8
+            bp[0] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[1] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[2] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[3] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+            bp[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+
+            #-- Top with the rest of the building
+            bpT = [None] * 8
+            tH = GMLstring2points(p[4])[0][2]
+            bpT[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], tH])
+            bpT[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], tH])
+            bpT[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+            bpT[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+
+        if buildingpart['type'] == 'Alcove':
+            if LOD == '2.0':
+                face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
+                east_faces['wall'] = face1
+                faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
+
+            elif LOD == '2.1' or LOD == '2.2' or LOD == '2.3':
+                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
+
+                face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
+                east_faces['wall'] = face1
+                gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
+                east_faces['rest'].append(gface0)
+                gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
+                east_faces['rest'].append(gface1)
+                gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
+                east_faces['rest'].append(gface3)
+                gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
+                east_faces['outerfloor'].append(gtop)                
+        elif buildingpart['type'] == 'Garage':
+            if LOD == '2.0' or LOD == '2.1' or LOD == '2.2' or LOD == '2.3':
+                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
+                face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
+                east_faces['wall'] = face1
+                gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
+                east_faces['rest'].append(gface0)
+                gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
+                east_faces['rest'].append(gface1)
+                gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
+                east_faces['rest'].append(gface3)
+                gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
+                east_faces['roof'].append(gtop)
+    else:
+        face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
+        east_faces['wall'] = face1
+        faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
+
+    #-- Bottom face (in all cases regardless of the roof type)
+    faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
+    if rep == 'solid':
+        addsurface(False, CompositeSurface, faceBottom)
+    elif rep == 'brep':
+        plainMultiSurface(surfaceMember, faceBottom)
+
+    #-- Roof surfaces and wall surfaces depending on the type of the roof.
+    if rtype == 'Gabled':
+        if rep == 'solid':
+            gabledRoof(CompositeSurface, p, r, east_faces)
+        elif rep == 'brep':
+            gabledRoof(surfaceMember, p, r, east_faces)
+            if overhangs is not None and ovh[0] > 0:
+                roofOverhangs(surfaceMember, overhangs, interiors)
+
+    elif rtype == 'Shed':
+        if rep == 'solid':
+            shedRoof(CompositeSurface, p, r, east_faces)
+        elif rep == 'brep':
+            shedRoof(surfaceMember, p, r, east_faces)
+            if overhangs is not None and ovh[0] > 0:
+                roofOverhangs(surfaceMember, overhangs, interiors)
+        #shedRoof(CompositeSurface, p, r, east_faces)
+
+    elif rtype == 'Hipped' or rtype == 'Pyramidal':
+        if rep == 'solid':
+            hippedRoof(CompositeSurface, p, r, east_faces)
+        elif rep == 'brep':
+            hippedRoof(surfaceMember, p, r, east_faces)
+            if overhangs is not None and ovh[0] > 0:
+                roofOverhangs(surfaceMember, overhangs, interiors)
+        #hippedRoof(CompositeSurface, p, r, east_faces)
+
+    elif rtype == 'Flat' or None:
+        if rep == 'solid':
+            flatRoof(CompositeSurface, p, r, east_faces)
+        elif rep == 'brep':
+            flatRoof(surfaceMember, p, r, east_faces)
+            if overhangs is not None and ovh[0] > 0:
+                roofOverhangs(surfaceMember, overhangs, interiors)
+
+
+def CityGMLbuildingLOD2Semantics(CityModel, ID, attributes, o, x, y, z, h, rtype=None, width=None, ovh=None, LOD=None, aux=None, buildingpart=None, fd=False):
+    """
+    Create LOD2 of the building with a basic roof shape and standard semantics (brep multisurfaces).
+    """
+    cityObject = etree.SubElement(CityModel, "cityObjectMember")
+    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
+    bldg.attrib['{%s}id' % ns_gml] = ID
+    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
+    roofType.text = rtype
+
+    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
+    yearOfConstructionXML.text = attributes['yearOfConstruction']
+    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
+    functionXML.text = attributes['function']
+    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
+    storeysAboveGroundXML.text = attributes['storeysAboveGround']
+
+    p = verticesBody(o, x, y, z)
+    r = verticesRoof([o, x, y, z], h, rtype, width)
+
+    #-- Computations for the LOD2 with explicit overhangs
+    eaves = z
+    upperEaves = z
+    if ovh is not None:
+        overhangs, interiors, eaves, ovhy_recalculated = verticesOverhangs([o, x, y, z], p, h, rtype, ovh, r, width)
+        if rtype == 'Shed':
+            upperEaves = z + h + (z - eaves)
+    else:
+        overhangs = None
+
+    #-- Is the building part covered by overhangs?
+    if buildingpart is not None:
+        if x > aux['xsize'] and aux['ovhx'] >= buildingpart['x']:
+            covered = True
+        else:
+            covered = False
+    else:
+        covered = None
+
+    east_faces = {}
+    east_faces['rest'] = []
+    east_faces['roof'] = []
+    east_faces['outerfloor'] = []
+    #-- Account for building parts
+    if buildingpart is not None and not covered:
+
+        #-- Accounting for overhangs
+        if x > aux['xsize']:# or x < aux['xsize']:
+            bp = [None] * 8
+            bp[0] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[3] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+            bp[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+
+            #-- Top with the rest of the building
+            bpT = [None] * 8
+            tH = GMLstring2points(p[4])[0][2]
+            bpT[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], tH])
+            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
+            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+            bpT[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+
+        elif fd and x < aux['xsize']:
+
+            bp = [None] * 8
+            eastline = GMLstring2points(p[1])[0][0]
+            bp[0] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[3] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+            bp[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+
+            #-- Top with the rest of the building
+            bpT = [None] * 8
+            tH = GMLstring2points(p[4])[0][2]
+            bpT[4] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'], tH])
+            bpT[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], tH])
+            bpT[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+            bpT[7] = GMLPointList([eastline, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+
+
+        else:
+            bp = [None] * 8
+            bp[0] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[1] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+            bp[2] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[3] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+            bp[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+            bp[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+            bp[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+
+            #-- Top with the rest of the building
+            bpT = [None] * 8
+            tH = GMLstring2points(p[4])[0][2]
+            bpT[4] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'], tH])
+            bpT[5] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'], tH])
+            bpT[6] = GMLPointList([aux['origin'][0] + aux['xsize'] + buildingpart['x'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+            bpT[7] = GMLPointList([aux['origin'][0] + aux['xsize'], aux['origin'][1] + buildingpart['o'] + buildingpart['y'], tH])
+
+        if buildingpart['type'] == 'Alcove':
+            if LOD == '2.0':
+                face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
+                east_faces['wall'] = face1
+                faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
+
+            elif LOD == '2.1' or LOD == '2.2' or LOD == '2.3':
+                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
+                face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
+                east_faces['wall'] = face1
+                gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
+                east_faces['rest'].append(gface0)
+                gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
+                east_faces['rest'].append(gface1)
+                gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
+                east_faces['rest'].append(gface3)
+                gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
+                east_faces['outerfloor'].append(gtop)                
+        elif buildingpart['type'] == 'Garage':
+            if LOD == '2.0' or LOD == '2.1' or LOD == '2.2' or LOD == '2.3':
+                faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
+                face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
+                east_faces['wall'] = face1
+                gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
+                east_faces['rest'].append(gface0)
+                gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
+                east_faces['rest'].append(gface1)
+                gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
+                east_faces['rest'].append(gface3)
+                gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
+                east_faces['roof'].append(gtop)
+    else:
+        face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
+        east_faces['wall'] = face1
+        faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
+
+    #-- Bottom face (in all cases regardless of the roof type)
+    multiSurface(bldg, faceBottom, "GroundSurface", None)
+
+    #-- Roof surfaces and wall surfaces depending on the type of the roof.
+    if rtype == 'Gabled':
+        gabledRoof(bldg, p, r, east_faces, True)
+        if overhangs is not None and ovh[0] > 0:
+            roofOverhangs(bldg, overhangs, interiors, True)
+
+    elif rtype == 'Shed':
+        shedRoof(bldg, p, r, east_faces, True)
+        if overhangs is not None and ovh[0] > 0:
+            roofOverhangs(bldg, overhangs, interiors, True)
+
+    elif rtype == 'Hipped' or rtype == 'Pyramidal':
+        hippedRoof(bldg, p, r, east_faces, True)
+        if overhangs is not None and ovh[0] > 0:
+            roofOverhangs(bldg, overhangs, interiors, True)
+
+    elif rtype == 'Flat' or None:
+        flatRoof(bldg, p, r, east_faces, True)
+        if overhangs is not None and ovh[0] > 0:
+            roofOverhangs(bldg, overhangs, interiors, True)
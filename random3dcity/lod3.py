@@ -0,0 +1,1059 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT)
+
+# This code is part of the Random3Dcity package
+
+# Copyright (c) 2015
+# Filip Biljecki
+# Delft University of Technology
+# fbiljecki@gmail.com
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Builders of the representations of the buildings with roof features and openings (LOD3, and LOD2 with dormers).
+"""
+
+from lxml import etree
+import uuid
+
+from random3dcity.geometry import ns_gml, ns_bldg, GMLPointList, GMLreversedRing, addsurface, buildingOpenings, flatRoof, gabledRoof, hippedRoof, multiSurface, plainMultiSurface, roofOverhangs, shedRoof, verticesBody, verticesBodyList, verticesOverhangs, verticesRoof
+
+
+#-- Generate an UUID for each polygon, configured by generateCityGML.py according to its options
+ASSIGNID = True
+
+
+def dormerVertices(dormers, p, h, rtype, oList, width):
+    """Computes the vertices of a dormer."""
+    [o, x, y, z] = oList
+    dList = []
+    dListGML = []
+    for drm in dormers:
+        d = [[], [], [], [], [], []]
+        dGML = [[], [], [], [], [], []]
+        if rtype == 'Gabled':
+            xperimiter = (float(drm['origin'][1]) * x * 0.5) / h
+            xperimiter2 = (float(drm['size'][1]) * x * 0.5) / h + xperimiter
+            if drm['side'] == 1:
+                d[1] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + drm['origin'][1]]
+                d[2] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + drm['origin'][1]]
+                d[4] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[5] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[0] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[3] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+            elif drm['side'] == 3:
+                d[1] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]), p[5][2] + drm['origin'][1]]
+                d[2] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + drm['origin'][1]]
+                d[4] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[5] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[0] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[3] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+        
+        elif rtype == 'Shed':
+            xperimiter = (float(drm['origin'][1]) * x * 1.0) / h
+            xperimiter2 = (float(drm['size'][1]) * x * 1.0) / h + xperimiter            
+            if drm['side'] == 1:
+                d[1] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + drm['origin'][1]]
+                d[2] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + drm['origin'][1]]
+                d[4] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[5] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[0] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[3] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+       
+        elif rtype == 'Hipped' or rtype == 'Pyramidal':
+            xperimiter = (float(drm['origin'][1]) * x * 0.5) / h
+            xperimiter2 = (float(drm['size'][1]) * x * 0.5) / h + xperimiter
+            yperimiter = (float(drm['origin'][1]) * width) / h
+            yperimiter2 = (float(drm['size'][1]) * width) / h + yperimiter
+            if drm['side'] == 1:
+                d[1] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + drm['origin'][1]]
+                d[2] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + drm['origin'][1]]
+                d[4] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[5] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[0] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[3] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+            elif drm['side'] == 3:
+                d[1] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]), p[5][2] + drm['origin'][1]]
+                d[2] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + drm['origin'][1]]
+                d[4] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[5] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[0] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[3] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+            elif drm['side'] == 0:
+                d[1] = [p[4][0]+float(drm['origin'][0]), p[4][1] + yperimiter, p[5][2] + drm['origin'][1]]
+                d[2] = [p[4][0]+float(drm['origin'][0])+float(drm['size'][0]), p[4][1]  + yperimiter, p[5][2] + drm['origin'][1]]
+                d[4] = [p[4][0]+float(drm['origin'][0]), p[4][1]  + yperimiter, p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[5] = [p[4][0]+float(drm['origin'][0])+float(drm['size'][0]), p[4][1]  + yperimiter, p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[0] = [p[4][0]+float(drm['origin'][0]), p[4][1]  + yperimiter2, p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[3] = [p[4][0]+float(drm['origin'][0])+float(drm['size'][0]), p[4][1]  + yperimiter2, p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+            elif drm['side'] == 2:
+                d[1] = [p[6][0]-float(drm['origin'][0]), p[6][1] - yperimiter, p[5][2] + drm['origin'][1]]
+                d[2] = [p[6][0]-float(drm['origin'][0])-float(drm['size'][0]), p[6][1]  - yperimiter, p[5][2] + drm['origin'][1]]
+                d[4] = [p[6][0]-float(drm['origin'][0]), p[6][1] - yperimiter, p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[5] = [p[6][0]-float(drm['origin'][0])-float(drm['size'][0]), p[6][1]  - yperimiter, p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[0] = [p[6][0]-float(drm['origin'][0]), p[6][1] - yperimiter2, p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[3] = [p[6][0]-float(drm['origin'][0])-float(drm['size'][0]), p[6][1] - yperimiter2, p[5][2] + drm['origin'][1] + float(drm['size'][1])]                
+
+        elif rtype == 'Flat':
+            #-- Valid only for roof windows
+            xperimiter = float(drm['origin'][1])
+            xperimiter2 = float(drm['size'][1]) + xperimiter 
+            if drm['side'] == 1:
+                d[1] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2]]
+                d[2] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2]]
+                d[4] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[5] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + drm['origin'][1] + float(drm['size'][1])]
+                d[0] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2]]
+                d[3] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2]]
+
+        if d != [[], [], [], [], [], []]:
+            for i in range(0, 6):
+                #for j in range(0, 3):
+                #    d[i][j] = round(d[i][j], 2)
+                dGML[i] = GMLPointList(d[i])
+        dList.append(d)
+        dListGML.append(dGML)
+
+    return dList, dListGML
+
+
+def chimneyVertices(chimneys, p, h, rtype, oList, width):
+    """
+    Computes the vertices of a chimney.
+    The origin in chimneys is different than the one in dormers, hence a separate function.
+    """
+    [o, x, y, z] = oList
+    dList = []
+    dListGML = []
+    for drm in chimneys:
+        d = [[], [], [], [], [], [], [], []]
+        dGML = [[], [], [], [], [], [], [], []]
+        chHeight = float(drm['size'][2])
+        if rtype == 'Gabled':
+            #xperimiter = (float(drm['origin'][1]) * x * 0.5) / h
+            #xperimiter2 = (float(drm['size'][1]) * x * 0.5) / h + xperimiter
+            xperimiter = float(drm['origin'][1])
+            xperimiter2 = float(drm['size'][1]) + xperimiter
+            zperimiter1 = (xperimiter * h) / (x*.5)
+            zperimiter2 = (xperimiter2 * h) / (x*.5)
+            if drm['side'] == 1:
+                d[1] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter1]
+                d[2] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter1]
+                d[4] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter2 + chHeight]
+                d[5] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter2 + chHeight]
+                d[0] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter2]
+                d[3] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter2]
+                d[7] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter2 + chHeight]
+                d[6] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter2 + chHeight]
+            elif drm['side'] == 3:
+                d[1] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]), p[5][2] + zperimiter1]
+                d[2] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + zperimiter1]
+                d[4] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]), p[5][2] + zperimiter2 + chHeight]
+                d[5] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + zperimiter2 + chHeight]
+                d[0] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]), p[5][2] + zperimiter2]
+                d[3] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + zperimiter2]
+                d[7] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]), p[5][2] + zperimiter2 + chHeight]
+                d[6] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + zperimiter2 + chHeight]
+
+        elif rtype == 'Shed':
+            #xperimiter = (float(drm['origin'][1]) * x * 1.0) / h
+            xperimiter = float(drm['origin'][1]) 
+            #xperimiter2 = (float(drm['size'][1]) * x * 1.0) / h + xperimiter
+            xperimiter2 = float(drm['size'][1]) + xperimiter
+            zperimiter1 = (xperimiter * h) / x
+            zperimiter2 = (xperimiter2 * h) / x
+            if drm['side'] == 1:
+                d[1] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter1]
+                d[2] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter1]
+                d[4] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter2 + chHeight]
+                d[5] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter2 + chHeight]
+                d[0] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter2]
+                d[3] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter2]
+                d[7] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter2 + chHeight]
+                d[6] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter2 + chHeight]
+       
+        elif rtype == 'Hipped' or rtype == 'Pyramidal':
+
+            xperimiter = float(drm['origin'][1])
+            xperimiter2 = float(drm['size'][1]) + xperimiter
+            yperimiter = (float(drm['origin'][1]) * width) / h
+            yperimiter2 = (float(drm['size'][1]) * width) / h + yperimiter
+            zperimiter1 = (xperimiter * h) / (x*.5)
+            zperimiter2 = (xperimiter2 * h) / (x*.5)
+
+            if drm['side'] == 1:
+                d[1] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter1]
+                d[2] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter1]
+                d[4] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter2 + chHeight]
+                d[5] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter2 + chHeight]
+                d[0] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter2]
+                d[3] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter2]
+                d[7] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2] + zperimiter2 + chHeight]
+                d[6] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + zperimiter2 + chHeight]
+            elif drm['side'] == 3:
+                d[1] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]), p[5][2] + zperimiter1]
+                d[2] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + zperimiter1]
+                d[4] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]), p[5][2] + zperimiter2 + chHeight]
+                d[5] = [p[4][0]+xperimiter, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + zperimiter2 + chHeight]
+                d[0] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]), p[5][2] + zperimiter2]
+                d[3] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + zperimiter2]
+                d[7] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]), p[5][2] + zperimiter2 + chHeight]
+                d[6] = [p[4][0]+xperimiter2, p[7][1] - float(drm['origin'][0]) - float(drm['size'][0]), p[5][2] + zperimiter2 + chHeight]
+
+        elif rtype == 'Flat':
+            #-- Not valid for dormers
+            xperimiter = float(drm['origin'][1])
+            xperimiter2 = float(drm['size'][1]) + xperimiter    
+            if drm['side'] == 1:
+                d[1] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2]]
+                d[2] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2]]
+                d[4] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]), p[5][2] + chHeight]
+                d[5] = [p[1][0]-xperimiter, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + chHeight]
+                d[0] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2]]
+                d[3] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2]]
+                d[7] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]), p[5][2] + chHeight]
+                d[6] = [p[1][0]-xperimiter2, p[1][1] + float(drm['origin'][0]) + float(drm['size'][0]), p[5][2] + chHeight]
+
+        if d != [[], [], [], [], [], []]:
+            for i in range(0, 8):
+                #for j in range(0, 3):
+                #    d[i][j] = round(d[i][j], 2)
+                dGML[i] = GMLPointList(d[i])
+        dList.append(d)
+        dListGML.append(dGML)
+
+    return dList, dListGML
+
+
+def buildinginstallation(bldg, kind, d, semantics=0, window=None, side=None, embrasure=None):
+    """Generate a building installation: for dormers and chimneys."""
+    dList, dListGML = d
+
+    if window is not None:
+        pass
+
+    obi = etree.SubElement(bldg, "{%s}outerBuildingInstallation" % ns_bldg)
+    bi = etree.SubElement(obi, "{%s}BuildingInstallation" % ns_bldg)
+
+
+    def binosemantics(XMLelement, coords, window = None):
+        MultiSurface = etree.SubElement(XMLelement, "{%s}MultiSurface" % ns_gml)
+        surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
+        Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
+        if ASSIGNID:
+            Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+        PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
+        LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
+        posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+        posList.text = coords
+
+        if window is not None:
+
+            PolygonInterior = etree.SubElement(Polygon, "{%s}interior" % ns_gml)
+            LinearRing = etree.SubElement(PolygonInterior, "{%s}LinearRing" % ns_gml)
+            posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+            posList.text = window 
+
+    def bisemantics(XMLelement, coords, semantics, window = None, fillHole = True):
+        boundedBy = etree.SubElement(XMLelement, "{%s}boundedBy" % ns_bldg)
+        semanticSurface = etree.SubElement(boundedBy, "{%s}%s" % (ns_bldg, semantics))     
+        lod3geometry = etree.SubElement(semanticSurface, "{%s}lod3MultiSurface" % ns_bldg)   
+        MultiSurface = etree.SubElement(lod3geometry, "{%s}MultiSurface" % ns_gml)
+        surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
+        Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
+        if ASSIGNID:
+            Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+        PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
+        LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
+        posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+        posList.text = coords
+
+        if window is not None:
+
+            PolygonInterior = etree.SubElement(Polygon, "{%s}interior" % ns_gml)
+            LinearRing = etree.SubElement(PolygonInterior, "{%s}LinearRing" % ns_gml)
+            posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+            posList.text = GMLreversedRing(window)
+
+            if fillHole is True:
+
+                gmlopening = etree.SubElement(semanticSurface, "{%s}opening" % ns_bldg)
+                gmlwin = etree.SubElement(gmlopening, "{%s}Window" % ns_bldg)
+                lod3MultiSurface = etree.SubElement(gmlwin, "{%s}lod3MultiSurface" % ns_bldg)
+                DoorMultiSurface = etree.SubElement(lod3MultiSurface, "{%s}MultiSurface" % ns_gml)
+                DoorsurfaceMember = etree.SubElement(DoorMultiSurface, "{%s}surfaceMember" % ns_gml)
+                DoorPolygon = etree.SubElement(DoorsurfaceMember, "{%s}Polygon" % ns_gml)
+                if ASSIGNID:
+                    DoorPolygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+                DoorPolygonExterior = etree.SubElement(DoorPolygon, "{%s}exterior" % ns_gml)
+                DoorLinearRing = etree.SubElement(DoorPolygonExterior, "{%s}LinearRing" % ns_gml)
+                DoorposList = etree.SubElement(DoorLinearRing, "{%s}posList" % ns_gml)
+                DoorposList.text = window
+
+    def bisemanticsMulti(XMLelement, coords, semantics, window = None):
+        boundedBy = etree.SubElement(XMLelement, "{%s}boundedBy" % ns_bldg)
+        semanticSurface = etree.SubElement(boundedBy, "{%s}%s" % (ns_bldg, semantics))     
+        lod3geometry = etree.SubElement(semanticSurface, "{%s}lod3MultiSurface" % ns_bldg)   
+        MultiSurface = etree.SubElement(lod3geometry, "{%s}MultiSurface" % ns_gml)
+        surfaceMember = etree.SubElement(MultiSurface, "{%s}surfaceMember" % ns_gml)
+
+        for coord in coords:
+
+            Polygon = etree.SubElement(surfaceMember, "{%s}Polygon" % ns_gml)
+            if ASSIGNID:
+                Polygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+            PolygonExterior = etree.SubElement(Polygon, "{%s}exterior" % ns_gml)
+            LinearRing = etree.SubElement(PolygonExterior, "{%s}LinearRing" % ns_gml)
+            posList = etree.SubElement(LinearRing, "{%s}posList" % ns_gml)
+            posList.text = coord
+
+        if window is not None:
+
+            gmlopening = etree.SubElement(semanticSurface, "{%s}opening" % ns_bldg)
+            gmlwin = etree.SubElement(gmlopening, "{%s}Window" % ns_bldg)
+            lod3MultiSurface = etree.SubElement(gmlwin, "{%s}lod3MultiSurface" % ns_bldg)
+            DoorMultiSurface = etree.SubElement(lod3MultiSurface, "{%s}MultiSurface" % ns_gml)
+            DoorsurfaceMember = etree.SubElement(DoorMultiSurface, "{%s}surfaceMember" % ns_gml)
+            DoorPolygon = etree.SubElement(DoorsurfaceMember, "{%s}Polygon" % ns_gml)
+            if ASSIGNID:
+                DoorPolygon.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+            DoorPolygonExterior = etree.SubElement(DoorPolygon, "{%s}exterior" % ns_gml)
+            DoorLinearRing = etree.SubElement(DoorPolygonExterior, "{%s}LinearRing" % ns_gml)
+            DoorposList = etree.SubElement(DoorLinearRing, "{%s}posList" % ns_gml)
+            DoorposList.text = window
+
+
+    if semantics == 0:
+        if kind == 'dormer':
+            lod3geometry = etree.SubElement(bi, "{%s}lod3Geometry" % ns_bldg)
+            d1 = dListGML[0] + ' ' + dListGML[1] + ' ' + dListGML[4] + ' ' + dListGML[0]
+            d2 = dListGML[0] + ' ' + dListGML[4] + ' ' + dListGML[5] + ' ' + dListGML[3] + ' ' + dListGML[0]
+            d3 = dListGML[5] + ' ' + dListGML[2] + ' ' + dListGML[3] + ' ' + dListGML[5]
+            binosemantics(lod3geometry, d1) 
+            binosemantics(lod3geometry, d2) 
+            binosemantics(lod3geometry, d3)
+
+            if window is None:
+                d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
+                binosemantics(lod3geometry, d4)
+
+            if window is not None:
+
+                if embrasure is not None and embrasure > 0.0:
+
+                    d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
+
+                    if side == 1:
+                        dw = [[], [], [], []]
+                        ew = [[], [], [], []]
+
+                        dw[0] = [dList[4][0], dList[4][1] + window, dList[4][2] - window]
+                        dw[1] = [dList[1][0], dList[1][1] + window, dList[1][2] + window]
+                        dw[2] = [dList[2][0], dList[2][1] - window, dList[2][2] + window]
+                        dw[3] = [dList[5][0], dList[5][1] - window, dList[5][2] - window]
+
+                        ew[0] = [dList[4][0] - embrasure, dList[4][1] + window, dList[4][2] - window]
+                        ew[1] = [dList[1][0] - embrasure, dList[1][1] + window, dList[1][2] + window]
+                        ew[2] = [dList[2][0] - embrasure, dList[2][1] - window, dList[2][2] + window]
+                        ew[3] = [dList[5][0] - embrasure, dList[5][1] - window, dList[5][2] - window]
+
+                    elif side == 3:
+                        dw = [[], [], [], []]
+                        ew = [[], [], [], []]
+
+                        dw[0] = [dList[4][0], dList[4][1] - window, dList[4][2] - window]
+                        dw[1] = [dList[1][0], dList[1][1] - window, dList[1][2] + window]
+                        dw[2] = [dList[2][0], dList[2][1] + window, dList[2][2] + window]
+                        dw[3] = [dList[5][0], dList[5][1] + window, dList[5][2] - window]
+
+                        ew[0] = [dList[4][0] + embrasure, dList[4][1] - window, dList[4][2] - window]
+                        ew[1] = [dList[1][0] + embrasure, dList[1][1] - window, dList[1][2] + window]
+                        ew[2] = [dList[2][0] + embrasure, dList[2][1] + window, dList[2][2] + window]
+                        ew[3] = [dList[5][0] + embrasure, dList[5][1] + window, dList[5][2] - window]
+
+                    elif side == 0:
+                        dw = [[], [], [], []]
+                        ew = [[], [], [], []]
+                        dw[0] = [dList[4][0] + window, dList[4][1], dList[4][2] - window]
+                        dw[1] = [dList[1][0] + window, dList[1][1], dList[1][2] + window]
+                        dw[2] = [dList[2][0] - window, dList[2][1], dList[2][2] + window]
+                        dw[3] = [dList[5][0] - window, dList[5][1], dList[5][2] - window]
+
+                        ew[0] = [dList[4][0] + window, dList[4][1] + embrasure, dList[4][2] - window]
+                        ew[1] = [dList[1][0] + window, dList[1][1] + embrasure, dList[1][2] + window]
+                        ew[2] = [dList[2][0] - window, dList[2][1] + embrasure, dList[2][2] + window]
+                        ew[3] = [dList[5][0] - window, dList[5][1] + embrasure, dList[5][2] - window]
+
+                    elif side == 2:
+                        dw = [[], [], [], []]
+                        ew = [[], [], [], []]
+
+                        dw[0] = [dList[4][0] - window, dList[4][1], dList[4][2] - window]
+                        dw[1] = [dList[1][0] - window, dList[1][1], dList[1][2] + window]
+                        dw[2] = [dList[2][0] + window, dList[2][1], dList[2][2] + window]
+                        dw[3] = [dList[5][0] + window, dList[5][1], dList[5][2] - window]
+
+                        ew[0] = [dList[4][0] - window, dList[4][1] - embrasure, dList[4][2] - window]
+                        ew[1] = [dList[1][0] - window, dList[1][1] - embrasure, dList[1][2] + window]
+                        ew[2] = [dList[2][0] + window, dList[2][1] - embrasure, dList[2][2] + window]
+                        ew[3] = [dList[5][0] + window, dList[5][1] - embrasure, dList[5][2] - window]      
+
+                    dwring = GMLPointList(dw[0]) + ' ' + GMLPointList(dw[3]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(dw[1]) + ' ' + GMLPointList(dw[0])
+                    binosemantics(lod3geometry, d4, dwring)
+
+
+                    dw0 = GMLPointList(dw[0]) + ' ' + GMLPointList(dw[1]) + ' ' + GMLPointList(ew[1]) + ' ' + GMLPointList(ew[0]) + ' ' + GMLPointList(dw[0])
+                    dw1 = GMLPointList(dw[1]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(ew[2]) + ' ' + GMLPointList(ew[1]) + ' ' + GMLPointList(dw[1])
+                    dw2 = GMLPointList(dw[3]) + ' ' + GMLPointList(ew[3]) + ' ' + GMLPointList(ew[2]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(dw[3])
+                    dw3 = GMLPointList(dw[3]) + ' ' + GMLPointList(dw[0]) + ' ' + GMLPointList(ew[0]) + ' ' + GMLPointList(ew[3]) + ' ' + GMLPointList(dw[3])
+
+                    ew0 = GMLPointList(ew[0]) + ' ' + GMLPointList(ew[1]) + ' ' + GMLPointList(ew[2]) + ' ' + GMLPointList(ew[3]) + ' ' + GMLPointList(ew[0])
+
+                    for bipoly in [dw0, dw1, dw2, dw3]:
+                        binosemantics(lod3geometry, bipoly)
+                    binosemantics(lod3geometry, ew0)
+
+                else:
+
+                    d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
+                    if side == 1:
+                        dw = [[], [], [], []]
+                        ew = [[], [], [], []]
+
+                        dw[0] = [dList[4][0], dList[4][1] + window, dList[4][2] - window]
+                        dw[1] = [dList[1][0], dList[1][1] + window, dList[1][2] + window]
+                        dw[2] = [dList[2][0], dList[2][1] - window, dList[2][2] + window]
+                        dw[3] = [dList[5][0], dList[5][1] - window, dList[5][2] - window]
+
+                        ew[0] = [dList[4][0], dList[4][1] + window, dList[4][2] - window]
+                        ew[1] = [dList[1][0], dList[1][1] + window, dList[1][2] + window]
+                        ew[2] = [dList[2][0], dList[2][1] - window, dList[2][2] + window]
+                        ew[3] = [dList[5][0], dList[5][1] - window, dList[5][2] - window]
+
+                    elif side == 3:
+                        dw = [[], [], [], []]
+                        ew = [[], [], [], []]
+
+                        dw[0] = [dList[4][0], dList[4][1] - window, dList[4][2] - window]
+                        dw[1] = [dList[1][0], dList[1][1] - window, dList[1][2] + window]
+                        dw[2] = [dList[2][0], dList[2][1] + window, dList[2][2] + window]
+                        dw[3] = [dList[5][0], dList[5][1] + window, dList[5][2] - window]
+
+                        ew[0] = [dList[4][0], dList[4][1] - window, dList[4][2] - window]
+                        ew[1] = [dList[1][0], dList[1][1] - window, dList[1][2] + window]
+                        ew[2] = [dList[2][0], dList[2][1] + window, dList[2][2] + window]
+                        ew[3] = [dList[5][0], dList[5][1] + window, dList[5][2] - window]
+
+                    elif side == 0:
+                        dw = [[], [], [], []]
+                        ew = [[], [], [], []]
+                        dw[0] = [dList[4][0] + window, dList[4][1], dList[4][2] - window]
+                        dw[1] = [dList[1][0] + window, dList[1][1], dList[1][2] + window]
+                        dw[2] = [dList[2][0] - window, dList[2][1], dList[2][2] + window]
+                        dw[3] = [dList[5][0] - window, dList[5][1], dList[5][2] - window]
+
+                        ew[0] = [dList[4][0] + window, dList[4][1], dList[4][2] - window]
+                        ew[1] = [dList[1][0] + window, dList[1][1], dList[1][2] + window]
+                        ew[2] = [dList[2][0] - window, dList[2][1], dList[2][2] + window]
+                        ew[3] = [dList[5][0] - window, dList[5][1], dList[5][2] - window]
+
+                    elif side == 2:
+                        dw = [[], [], [], []]
+                        ew = [[], [], [], []]
+                        dw[0] = [dList[4][0] - window, dList[4][1], dList[4][2] - window]
+                        dw[1] = [dList[1][0] - window, dList[1][1], dList[1][2] + window]
+                        dw[2] = [dList[2][0] + window, dList[2][1], dList[2][2] + window]
+                        dw[3] = [dList[5][0] + window, dList[5][1], dList[5][2] - window]
+
+                        ew[0] = [dList[4][0] - window, dList[4][1], dList[4][2] - window]
+                        ew[1] = [dList[1][0] - window, dList[1][1], dList[1][2] + window]
+                        ew[2] = [dList[2][0] + window, dList[2][1], dList[2][2] + window]
+                        ew[3] = [dList[5][0] + window, dList[5][1], dList[5][2] - window]               
+
+                    dwring = GMLPointList(dw[0]) + ' ' + GMLPointList(dw[3]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(dw[1]) + ' ' + GMLPointList(dw[0])
+                    #ew0 = GMLPointList(ew[0]) + ' ' + GMLPointList(ew[1]) + ' ' + GMLPointList(ew[2]) + ' ' + GMLPointList(ew[3]) + ' ' + GMLPointList(ew[0])
+                    binosemantics(lod3geometry, d4, dwring)
+                    #binosemantics(lod3geometry, ew0)
+
+        elif kind == 'chimney':
+            lod3geometry = etree.SubElement(bi, "{%s}lod3Geometry" % ns_bldg)
+            d1 = dListGML[0] + ' ' + dListGML[1] + ' ' + dListGML[4] + ' ' + dListGML[7] + ' ' + dListGML[0]
+            d2 = dListGML[3] + ' ' + dListGML[6] + ' ' + dListGML[5] + ' ' + dListGML[2] + ' ' + dListGML[3]
+            d3 = dListGML[0] + ' ' + dListGML[7] + ' ' + dListGML[6] + ' ' + dListGML[3] + ' ' + dListGML[0]
+            d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
+            binosemantics(lod3geometry, d1) 
+            binosemantics(lod3geometry, d2) 
+            binosemantics(lod3geometry, d3)
+            binosemantics(lod3geometry, d4)
+
+            d5 = dListGML[7] + ' ' + dListGML[4] + ' ' + dListGML[5] + ' ' + dListGML[6] + ' ' + dListGML[7]
+            binosemantics(lod3geometry, d5)
+            #-- Closure surface in the roof
+            # d0 = dListGML[0] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[3] + ' ' + dListGML[0]
+            # binosemantics(lod3geometry, d0)
+            #-- Closure surface in the roof
+            d0 = dListGML[0] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[3] + ' ' + dListGML[0]
+            bisemantics(lod3geometry, d0, "ClosureSurface")
+
+    if semantics == 1:
+        if kind == 'dormer':
+            d1 = dListGML[0] + ' ' + dListGML[1] + ' ' + dListGML[4] + ' ' + dListGML[0]
+            d2 = dListGML[0] + ' ' + dListGML[4] + ' ' + dListGML[5] + ' ' + dListGML[3] + ' ' + dListGML[0]
+            d3 = dListGML[5] + ' ' + dListGML[2] + ' ' + dListGML[3] + ' ' + dListGML[5]
+            bisemantics(bi, d1, "WallSurface") 
+            bisemantics(bi, d2, "RoofSurface") 
+            bisemantics(bi, d3, "WallSurface")
+
+            if window is None:
+
+                d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
+                bisemantics(bi, d4, "WallSurface")
+
+            if window is not None:
+
+                #-- Face with the window
+                if embrasure is not None and embrasure > 0.0:
+
+                    d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
+
+                    if side == 1:
+                        dw = [[], [], [], []]
+                        ew = [[], [], [], []]
+
+                        dw[0] = [dList[4][0], dList[4][1] + window, dList[4][2] - window]
+                        dw[1] = [dList[1][0], dList[1][1] + window, dList[1][2] + window]
+                        dw[2] = [dList[2][0], dList[2][1] - window, dList[2][2] + window]
+                        dw[3] = [dList[5][0], dList[5][1] - window, dList[5][2] - window]
+
+                        ew[0] = [dList[4][0] - embrasure, dList[4][1] + window, dList[4][2] - window]
+                        ew[1] = [dList[1][0] - embrasure, dList[1][1] + window, dList[1][2] + window]
+                        ew[2] = [dList[2][0] - embrasure, dList[2][1] - window, dList[2][2] + window]
+                        ew[3] = [dList[5][0] - embrasure, dList[5][1] - window, dList[5][2] - window]
+
+                    elif side == 3:
+                        dw = [[], [], [], []]
+                        ew = [[], [], [], []]
+
+                        dw[0] = [dList[4][0], dList[4][1] - window, dList[4][2] - window]
+                        dw[1] = [dList[1][0], dList[1][1] - window, dList[1][2] + window]
+                        dw[2] = [dList[2][0], dList[2][1] + window, dList[2][2] + window]
+                        dw[3] = [dList[5][0], dList[5][1] + window, dList[5][2] - window]
+
+                        ew[0] = [dList[4][0] + embrasure, dList[4][1] - window, dList[4][2] - window]
+                        ew[1] = [dList[1][0] + embrasure, dList[1][1] - window, dList[1][2] + window]
+                        ew[2] = [dList[2][0] + embrasure, dList[2][1] + window, dList[2][2] + window]
+                        ew[3] = [dList[5][0] + embrasure, dList[5][1] + window, dList[5][2] - window]
+
+                    elif side == 0:
+                        dw = [[], [], [], []]
+                        ew = [[], [], [], []]
+                        dw[0] = [dList[4][0] + window, dList[4][1], dList[4][2] - window]
+                        dw[1] = [dList[1][0] + window, dList[1][1], dList[1][2] + window]
+                        dw[2] = [dList[2][0] - window, dList[2][1], dList[2][2] + window]
+                        dw[3] = [dList[5][0] - window, dList[5][1], dList[5][2] - window]
+
+                        ew[0] = [dList[4][0] + window, dList[4][1] + embrasure, dList[4][2] - window]
+                        ew[1] = [dList[1][0] + window, dList[1][1] + embrasure, dList[1][2] + window]
+                        ew[2] = [dList[2][0] - window, dList[2][1] + embrasure, dList[2][2] + window]
+                        ew[3] = [dList[5][0] - window, dList[5][1] + embrasure, dList[5][2] - window]
+
+                    elif side == 2:
+                        dw = [[], [], [], []]
+                        ew = [[], [], [], []]
+
+                        dw[0] = [dList[4][0] - window, dList[4][1], dList[4][2] - window]
+                        dw[1] = [dList[1][0] - window, dList[1][1], dList[1][2] + window]
+                        dw[2] = [dList[2][0] + window, dList[2][1], dList[2][2] + window]
+                        dw[3] = [dList[5][0] + window, dList[5][1], dList[5][2] - window]
+
+                        ew[0] = [dList[4][0] - window, dList[4][1] - embrasure, dList[4][2] - window]
+                        ew[1] = [dList[1][0] - window, dList[1][1] - embrasure, dList[1][2] + window]
+                        ew[2] = [dList[2][0] + window, dList[2][1] - embrasure, dList[2][2] + window]
+                        ew[3] = [dList[5][0] + window, dList[5][1] - embrasure, dList[5][2] - window]      
+
+                    dwring = GMLPointList(dw[0]) + ' ' + GMLPointList(dw[3]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(dw[1]) + ' ' + GMLPointList(dw[0])
+                    bisemantics(bi, d4, "WallSurface", dwring, False)
+
+
+                    dw0 = GMLPointList(dw[0]) + ' ' + GMLPointList(dw[1]) + ' ' + GMLPointList(ew[1]) + ' ' + GMLPointList(ew[0]) + ' ' + GMLPointList(dw[0])
+                    dw1 = GMLPointList(dw[1]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(ew[2]) + ' ' + GMLPointList(ew[1]) + ' ' + GMLPointList(dw[1])
+                    dw2 = GMLPointList(dw[3]) + ' ' + GMLPointList(ew[3]) + ' ' + GMLPointList(ew[2]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(dw[3])
+                    dw3 = GMLPointList(dw[3]) + ' ' + GMLPointList(dw[0]) + ' ' + GMLPointList(ew[0]) + ' ' + GMLPointList(ew[3]) + ' ' + GMLPointList(dw[3])
+
+                    ew0 = GMLPointList(ew[0]) + ' ' + GMLPointList(ew[1]) + ' ' + GMLPointList(ew[2]) + ' ' + GMLPointList(ew[3]) + ' ' + GMLPointList(ew[0])
+
+                    bisemanticsMulti(bi, [dw0, dw1, dw2, dw3], "WallSurface", ew0)
+
+                else:
+
+                    d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
+                    if side == 1:
+                        dw = [[], [], [], []]
+                        dw[0] = [dList[4][0], dList[4][1] + window, dList[4][2] - window]
+                        dw[1] = [dList[1][0], dList[1][1] + window, dList[1][2] + window]
+                        dw[2] = [dList[2][0], dList[2][1] - window, dList[2][2] + window]
+                        dw[3] = [dList[5][0], dList[5][1] - window, dList[5][2] - window]
+                    elif side == 3:
+                        dw = [[], [], [], []]
+                        dw[0] = [dList[4][0], dList[4][1] - window, dList[4][2] - window]
+                        dw[1] = [dList[1][0], dList[1][1] - window, dList[1][2] + window]
+                        dw[2] = [dList[2][0], dList[2][1] + window, dList[2][2] + window]
+                        dw[3] = [dList[5][0], dList[5][1] + window, dList[5][2] - window]
+                    elif side == 0:
+                        dw = [[], [], [], []]
+                        dw[0] = [dList[4][0] + window, dList[4][1], dList[4][2] - window]
+                        dw[1] = [dList[1][0] + window, dList[1][1], dList[1][2] + window]
+                        dw[2] = [dList[2][0] - window, dList[2][1], dList[2][2] + window]
+                        dw[3] = [dList[5][0] - window, dList[5][1], dList[5][2] - window]
+                    elif side == 2:
+                        dw = [[], [], [], []]
+                        dw[0] = [dList[4][0] - window, dList[4][1], dList[4][2] - window]
+                        dw[1] = [dList[1][0] - window, dList[1][1], dList[1][2] + window]
+                        dw[2] = [dList[2][0] + window, dList[2][1], dList[2][2] + window]
+                        dw[3] = [dList[5][0] + window, dList[5][1], dList[5][2] - window]                
+
+                    dwring = GMLPointList(dw[0]) + ' ' + GMLPointList(dw[3]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(dw[1]) + ' ' + GMLPointList(dw[0])
+                    ew0 = GMLPointList(dw[0]) + ' ' + GMLPointList(dw[1]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(dw[3]) + ' ' + GMLPointList(dw[0])
+                    bisemantics(bi, d4, "WallSurface", ew0, True)
+                    #bisemantics(bi, d4, "WallSurface", dwring, ew0)
+
+        elif kind == 'chimney':
+            lod3geometry = etree.SubElement(bi, "{%s}lod3Geometry" % ns_bldg)
+            d1 = dListGML[0] + ' ' + dListGML[1] + ' ' + dListGML[4] + ' ' + dListGML[7] + ' ' + dListGML[0]
+            d2 = dListGML[3] + ' ' + dListGML[6] + ' ' + dListGML[5] + ' ' + dListGML[2] + ' ' + dListGML[3]
+            d3 = dListGML[0] + ' ' + dListGML[7] + ' ' + dListGML[6] + ' ' + dListGML[3] + ' ' + dListGML[0]
+            d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
+            bisemantics(lod3geometry, d1, "WallSurface") 
+            bisemantics(lod3geometry, d2, "WallSurface") 
+            bisemantics(lod3geometry, d3, "WallSurface")
+            bisemantics(lod3geometry, d4, "WallSurface")
+
+            #-- Closure surface on the top
+            d5 = dListGML[7] + ' ' + dListGML[4] + ' ' + dListGML[5] + ' ' + dListGML[6] + ' ' + dListGML[7]
+            bisemantics(lod3geometry, d5, "ClosureSurface")
+            #-- Closure surface in the roof
+            d0 = dListGML[0] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[3] + ' ' + dListGML[0]
+            bisemantics(lod3geometry, d0, "ClosureSurface")
+
+
+def buildinginstallationSolid(skipsm, cs, kind, d, semantics=0, window=None, side=None, embrasure=None):
+    """Generate the solid of a building installation."""
+    dList, dListGML = d
+
+    if semantics == 0:
+        if kind == 'dormer':
+            d1 = dListGML[0] + ' ' + dListGML[1] + ' ' + dListGML[4] + ' ' + dListGML[0]
+            d2 = dListGML[0] + ' ' + dListGML[4] + ' ' + dListGML[5] + ' ' + dListGML[3] + ' ' + dListGML[0]
+            d3 = dListGML[5] + ' ' + dListGML[2] + ' ' + dListGML[3] + ' ' + dListGML[5]
+            addsurface(skipsm, cs, d1) 
+            addsurface(skipsm, cs, d2) 
+            addsurface(skipsm, cs, d3)
+
+            #d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
+            #addsurface(skipsm, cs, d4)
+
+            #-- Face with the window
+            if embrasure is not None and embrasure > 0.0:
+
+                d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
+                if side == 1:
+                    dw = [[], [], [], []]
+                    ew = [[], [], [], []]
+
+                    dw[0] = [dList[4][0], dList[4][1] + window, dList[4][2] - window]
+                    dw[1] = [dList[1][0], dList[1][1] + window, dList[1][2] + window]
+                    dw[2] = [dList[2][0], dList[2][1] - window, dList[2][2] + window]
+                    dw[3] = [dList[5][0], dList[5][1] - window, dList[5][2] - window]
+
+                    ew[0] = [dList[4][0] - embrasure, dList[4][1] + window, dList[4][2] - window]
+                    ew[1] = [dList[1][0] - embrasure, dList[1][1] + window, dList[1][2] + window]
+                    ew[2] = [dList[2][0] - embrasure, dList[2][1] - window, dList[2][2] + window]
+                    ew[3] = [dList[5][0] - embrasure, dList[5][1] - window, dList[5][2] - window]
+
+                elif side == 3:
+                    dw = [[], [], [], []]
+                    ew = [[], [], [], []]
+
+                    dw[0] = [dList[4][0], dList[4][1] - window, dList[4][2] - window]
+                    dw[1] = [dList[1][0], dList[1][1] - window, dList[1][2] + window]
+                    dw[2] = [dList[2][0], dList[2][1] + window, dList[2][2] + window]
+                    dw[3] = [dList[5][0], dList[5][1] + window, dList[5][2] - window]
+
+                    ew[0] = [dList[4][0] + embrasure, dList[4][1] - window, dList[4][2] - window]
+                    ew[1] = [dList[1][0] + embrasure, dList[1][1] - window, dList[1][2] + window]
+                    ew[2] = [dList[2][0] + embrasure, dList[2][1] + window, dList[2][2] + window]
+                    ew[3] = [dList[5][0] + embrasure, dList[5][1] + window, dList[5][2] - window]
+
+                elif side == 0:
+                    dw = [[], [], [], []]
+                    ew = [[], [], [], []]
+                    dw[0] = [dList[4][0] + window, dList[4][1], dList[4][2] - window]
+                    dw[1] = [dList[1][0] + window, dList[1][1], dList[1][2] + window]
+                    dw[2] = [dList[2][0] - window, dList[2][1], dList[2][2] + window]
+                    dw[3] = [dList[5][0] - window, dList[5][1], dList[5][2] - window]
+
+                    ew[0] = [dList[4][0] + window, dList[4][1] + embrasure, dList[4][2] - window]
+                    ew[1] = [dList[1][0] + window, dList[1][1] + embrasure, dList[1][2] + window]
+                    ew[2] = [dList[2][0] - window, dList[2][1] + embrasure, dList[2][2] + window]
+                    ew[3] = [dList[5][0] - window, dList[5][1] + embrasure, dList[5][2] - window]
+
+                elif side == 2:
+                    dw = [[], [], [], []]
+                    ew = [[], [], [], []]
+
+                    dw[0] = [dList[4][0] - window, dList[4][1], dList[4][2] - window]
+                    dw[1] = [dList[1][0] - window, dList[1][1], dList[1][2] + window]
+                    dw[2] = [dList[2][0] + window, dList[2][1], dList[2][2] + window]
+                    dw[3] = [dList[5][0] + window, dList[5][1], dList[5][2] - window]
+
+                    ew[0] = [dList[4][0] - window, dList[4][1] - embrasure, dList[4][2] - window]
+                    ew[1] = [dList[1][0] - window, dList[1][1] - embrasure, dList[1][2] + window]
+                    ew[2] = [dList[2][0] + window, dList[2][1] - embrasure, dList[2][2] + window]
+                    ew[3] = [dList[5][0] + window, dList[5][1] - embrasure, dList[5][2] - window]      
+
+                dwring = GMLPointList(dw[0]) + ' ' + GMLPointList(dw[3]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(dw[1]) + ' ' + GMLPointList(dw[0])
+                addsurface(skipsm, cs, d4, [dwring])
+
+
+                dw0 = GMLPointList(dw[0]) + ' ' + GMLPointList(dw[1]) + ' ' + GMLPointList(ew[1]) + ' ' + GMLPointList(ew[0]) + ' ' + GMLPointList(dw[0])
+                dw1 = GMLPointList(dw[1]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(ew[2]) + ' ' + GMLPointList(ew[1]) + ' ' + GMLPointList(dw[1])
+                dw2 = GMLPointList(dw[3]) + ' ' + GMLPointList(ew[3]) + ' ' + GMLPointList(ew[2]) + ' ' + GMLPointList(dw[2]) + ' ' + GMLPointList(dw[3])
+                dw3 = GMLPointList(dw[3]) + ' ' + GMLPointList(dw[0]) + ' ' + GMLPointList(ew[0]) + ' ' + GMLPointList(ew[3]) + ' ' + GMLPointList(dw[3])
+
+                ew0 = GMLPointList(ew[0]) + ' ' + GMLPointList(ew[1]) + ' ' + GMLPointList(ew[2]) + ' ' + GMLPointList(ew[3]) + ' ' + GMLPointList(ew[0])
+
+                addsurface(skipsm, cs, dw0)
+                addsurface(skipsm, cs, dw1)
+                addsurface(skipsm, cs, dw2)
+                addsurface(skipsm, cs, dw3)
+                addsurface(skipsm, cs, ew0)
+
+            else:
+                d4 = dListGML[4] + ' ' + dListGML[1] + ' ' + dListGML[2] + ' ' + dListGML[5] + ' ' + dListGML[4]
+                addsurface(skipsm, cs, d4)
+
+
+def CityGMLbuildingLOD3Semantics(CityModel, ID, attributes, o, x, y, z, h, rtype=None, ovh=None, width=None, door=None, wallWindows=None, dormers=None, roofWindows=None, chimney=None, embrasure=None, BiSem=1, aux=None, buildingpart=None, aerial=False):
+    """
+    Create LOD3 of the building with an advanced roof shape and semantics (multisurfaces).
+    """
+    cityObject = etree.SubElement(CityModel, "cityObjectMember")
+    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
+    bldg.attrib['{%s}id' % ns_gml] = ID
+    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
+    roofType.text = rtype
+
+    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
+    yearOfConstructionXML.text = attributes['yearOfConstruction']
+    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
+    functionXML.text = attributes['function']
+    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
+    storeysAboveGroundXML.text = attributes['storeysAboveGround']
+
+    p = verticesBody(o, x, y, z)
+    pList = verticesBodyList(o, x, y, z)
+    r = verticesRoof([o, x, y, z], h, rtype, width)
+    if r == []:
+        r = None
+
+    eaves = z
+    upperEaves = z
+    if ovh is not None:
+        overhangs, interiors, eaves, ovhy_recalculated = verticesOverhangs([o, x, y, z], p, h, rtype, ovh, r, width)
+        if rtype == 'Shed':
+            upperEaves = z + h + (z - eaves)
+    else:
+        ovhy_recalculated = None
+
+    #-- Is the building part covered by overhangs?
+    if buildingpart is not None and aerial is True:
+        if x > aux['xsize'] and aux['ovhx'] >= buildingpart['x']:
+            covered = True
+        else:
+            covered = False
+    else:
+        covered = None
+
+    east_faces = {}
+    east_faces['rest'] = []
+    east_faces['roof'] = []
+    east_faces['outerfloor'] = []
+    #-- Account for building parts
+    if buildingpart is not None and not covered:
+
+        bp = [None] * 8
+        bp[0] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+        bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+        bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+        bp[3] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+        bp[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+        bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+        bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+        bp[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+
+        faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
+        face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
+        east_faces['wall'] = face1
+        gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
+        east_faces['rest'].append(gface0)
+        gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
+        east_faces['rest'].append(gface1)
+        gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
+        east_faces['rest'].append(gface3)
+        gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
+        if buildingpart['type'] == 'Alcove':
+            east_faces['outerfloor'].append(gtop)
+        elif buildingpart['type'] == 'Garage':
+            east_faces['roof'].append(gtop)
+    else:
+        face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
+        east_faces['wall'] = face1
+        faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
+
+    ropenings = [[], [], [], []]
+    ropenings_rw = [[], [], [], []]
+
+    #-- Dormers
+    if dormers or roofWindows:
+        if dormers and len(dormers) > 0:
+            for drm in dormers:
+                #-- Get a list of vertices of each dormer
+                dList, dListGML = dormerVertices([drm], pList, h, rtype, [o, x, y, z], width)
+                #-- Get the opening for creating a hole in the roof surface
+                #--Inverted
+                ropenings[int(drm['side'])].append(str(dListGML[0][0] + ' ' + dListGML[0][3] + ' ' + dListGML[0][2] + ' ' + dListGML[0][1] + ' ' + dListGML[0][0]))
+                #-- Construct the dormer
+                if aerial is True:
+                    buildinginstallation(bldg, "dormer", [dList[0], dListGML[0]], BiSem, None, drm['side'], embrasure)
+                elif aerial is None or aerial is False:
+                    buildinginstallation(bldg, "dormer", [dList[0], dListGML[0]], BiSem, 0.1, drm['side'], embrasure)
+        elif roofWindows and len(roofWindows) > 0:
+            # ropenings_rw.append("")
+            # ropenings_rw.append([])
+            for rfw in roofWindows:
+                #-- Get a list of vertices of each window. It is the same as for dormer so the same function is used.
+                dList, dListGML = dormerVertices([rfw], pList, h, rtype, [o, x, y, z], width)
+                #-- Get the opening for creating a hole in the roof surface
+                ropenings[int(rfw['side'])].append(str(dListGML[0][0] + ' ' + dListGML[0][3] + ' ' + dListGML[0][2] + ' ' + dListGML[0][1] + ' ' + dListGML[0][0])) 
+                ropenings_rw[int(rfw['side'])].append(str(dListGML[0][0] + ' ' + dListGML[0][1] + ' ' + dListGML[0][2] + ' ' + dListGML[0][3] + ' ' + dListGML[0][0])) 
+
+    #-- Deal with chimney(s)
+    if chimney:
+        if len(chimney) > 0:
+            for ch in chimney:
+                #-- List of vertices
+                dList, dListGML = chimneyVertices([ch], pList, h, rtype, [o, x, y, z], width)
+                #-- Get the opening for creating a hole in the roof surface
+                ropenings[int(ch['side'])].append(str(dListGML[0][0] + ' ' + dListGML[0][3] + ' ' + dListGML[0][2] + ' ' + dListGML[0][1] + ' ' + dListGML[0][0]))
+                #-- Construct the chimney
+                buildinginstallation(bldg, "chimney", [dList[0], dListGML[0]], BiSem, None, ch['side'])
+                chimneyHeight = dList[0][7][2]
+    else:
+        chimneyHeight = None
+
+
+    #-- Bottom face (in all cases the same regardless of the roof type)
+    #faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
+    multiSurface(bldg, faceBottom, "GroundSurface", None, 3)
+
+    #-- Door and windows, shared by all the LOD3 representations of the building
+    openings = buildingOpenings(door, wallWindows, pList)
+
+
+    #-- Roof surfaces and wall surfaces depending on the type of the roof.
+    if rtype == 'Gabled':
+        gabledRoof(bldg, p, r, east_faces, True, openings, ropenings, ropenings_rw, embrasure, pList)
+        if ovh[0] > 0:
+            roofOverhangs(bldg, overhangs, interiors, True)
+
+    elif rtype == 'Shed':
+        shedRoof(bldg, p, r, east_faces, True, openings, ropenings, ropenings_rw, embrasure, pList)
+        if ovh[0] > 0:
+            roofOverhangs(bldg, overhangs, interiors, True)
+
+    elif rtype == 'Hipped' or rtype == 'Pyramidal':
+        hippedRoof(bldg, p, r, east_faces, True, openings, ropenings, ropenings_rw, embrasure, pList)
+        if ovh[0] > 0:
+            roofOverhangs(bldg, overhangs, interiors, True)
+
+    elif rtype == 'Flat' or None:
+        flatRoof(bldg, p, r, east_faces, True, openings, ropenings, ropenings_rw, embrasure, pList)
+        if ovh[0] > 0:
+            roofOverhangs(bldg, overhangs, interiors, True)
+
+
+    if rtype == 'Shed':
+        if chimneyHeight is not None:
+            if chimneyHeight < upperEaves:
+                chimneyHeight = upperEaves
+        else:
+            chimneyHeight = upperEaves
+
+    return chimneyHeight, eaves, ovhy_recalculated
+
+
+def CityGMLbuildingLOD3Solid(CityModel, ID, attributes, o, x, y, z, h, rtype=None, ovh=None, width=None, door=None, wallWindows=None, dormers=None, roofWindows=None, chimney=None, embrasure=None, additional=None, rep=None, aux=None, buildingpart=None, aerial=False):
+    """
+    Create LOD3 solid or plain geometry (brep without semantics).
+    """
+    cityObject = etree.SubElement(CityModel, "cityObjectMember")
+    bldg = etree.SubElement(cityObject, "{%s}Building" % ns_bldg)
+    bldg.attrib['{%s}id' % ns_gml] = ID
+    roofType = etree.SubElement(bldg, "{%s}roofType" % ns_bldg)
+    roofType.text = rtype
+
+    yearOfConstructionXML = etree.SubElement(bldg, "{%s}yearOfConstruction" % ns_bldg)
+    yearOfConstructionXML.text = attributes['yearOfConstruction']
+    functionXML = etree.SubElement(bldg, "{%s}function" % ns_bldg)
+    functionXML.text = attributes['function']
+    storeysAboveGroundXML = etree.SubElement(bldg, "{%s}storeysAboveGround" % ns_bldg)
+    storeysAboveGroundXML.text = attributes['storeysAboveGround']
+
+    if rep == 'solid':
+        lod3rep = etree.SubElement(bldg, "{%s}lod3Solid" % ns_bldg)
+        repres = etree.SubElement(lod3rep, "{%s}Solid" % ns_gml)
+        exterior = etree.SubElement(repres, "{%s}exterior" % ns_gml)
+        CompositeSurface = etree.SubElement(exterior, "{%s}CompositeSurface" % ns_gml)
+    elif rep == 'brep':
+        lod3rep = etree.SubElement(bldg, "{%s}lod3MultiSurface" % ns_bldg)
+        repres = etree.SubElement(lod3rep, "{%s}MultiSurface" % ns_gml)
+        surfaceMember = etree.SubElement(repres, "{%s}surfaceMember" % ns_gml)
+    if ASSIGNID:
+        repres.attrib['{%s}id' % ns_gml] = str(uuid.uuid4())
+    
+    p = verticesBody(o, x, y, z)
+    pList = verticesBodyList(o, x, y, z)
+    r = verticesRoof([o, x, y, z], h, rtype, width)
+    if r == []:
+        r = None
+    if ovh is not None:
+        overhangs, interiors, eaves, ovhy_recalculated = verticesOverhangs([o, x, y, z], p, h, rtype, ovh, r, width)
+
+
+    ropenings = [[], [], [], []]
+    ropenings_rw = [[], [], [], []]
+
+    #-- Is the building part covered by overhangs?
+    if buildingpart is not None and aerial is True:
+        if x > aux['xsize'] and aux['ovhx'] >= buildingpart['x']:
+            covered = True
+        else:
+            covered = False
+    else:
+        covered = None
+
+    east_faces = {}
+    east_faces['rest'] = []
+    east_faces['roof'] = []
+    east_faces['outerfloor'] = []
+    #-- Account for building parts
+    if buildingpart is not None and not covered:
+
+        bp = [None] * 8
+        bp[0] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+        bp[1] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2]])
+        bp[2] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+        bp[3] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2]])
+        bp[4] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+        bp[5] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'], aux['origin'][2] + buildingpart['z']])
+        bp[6] = GMLPointList([o[0] + x + buildingpart['x'] - .5*(x - aux['xsize']), aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+        bp[7] = GMLPointList([o[0] + x, aux['origin'][1] + buildingpart['o'] + buildingpart['y'], aux['origin'][2] + buildingpart['z']])
+
+        faceBottom = "%s %s %s %s %s %s %s %s %s" % (p[0], p[3], p[2], bp[3], bp[2], bp[1], bp[0], p[1], p[0])
+        face1 = "%s %s %s %s %s %s %s %s %s" % (p[1], bp[0], bp[4], bp[7], bp[3], p[2], p[6], p[5], p[1])
+        east_faces['wall'] = face1
+        gface0 = "%s %s %s %s %s" % (bp[0], bp[1], bp[5], bp[4], bp[0])
+        east_faces['rest'].append(gface0)
+        gface1 = "%s %s %s %s %s" % (bp[1], bp[2], bp[6], bp[5], bp[1])
+        east_faces['rest'].append(gface1)
+        gface3 = "%s %s %s %s %s" % (bp[3], bp[7], bp[6], bp[2], bp[3])
+        east_faces['rest'].append(gface3)
+        gtop = "%s %s %s %s %s" % (bp[4], bp[5], bp[6], bp[7], bp[4])
+        east_faces['roof'].append(gtop)
+    else:
+        face1 = "%s %s %s %s %s" % (p[1], p[2], p[6], p[5], p[1])
+        east_faces['wall'] = face1
+        faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
+
+    #-- Dormers
+    roofWindows = None
+    if dormers or roofWindows:
+        if dormers and len(dormers) > 0:
+            for drm in dormers:
+                #-- Get a list of vertices of each dormer
+                dList, dListGML = dormerVertices([drm], pList, h, rtype, [o, x, y, z], width)
+                #-- Get the opening for creating a hole in the roof surface
+                ropenings[int(drm['side'])].append(str(dListGML[0][0] + ' ' + dListGML[0][3] + ' ' + dListGML[0][2] + ' ' + dListGML[0][1] + ' ' + dListGML[0][0]))
+                #-- Construct the dormer
+                if rep == 'solid':
+                    if aerial is True:
+                        buildinginstallationSolid(False, CompositeSurface, "dormer", [dList[0], dListGML[0]], 0, None, drm['side'], embrasure)    
+                    else:
+                        buildinginstallationSolid(False, CompositeSurface, "dormer", [dList[0], dListGML[0]], 0, 0.1, drm['side'], embrasure)
+                elif rep == 'brep':
+                    if aerial is True:
+                        buildinginstallationSolid(False, surfaceMember, "dormer", [dList[0], dListGML[0]], 0, None, drm['side'], embrasure)
+                    else:
+                        buildinginstallationSolid(False, surfaceMember, "dormer", [dList[0], dListGML[0]], 0, 0.1, drm['side'], embrasure)
+
+    #-- Bottom face (in all cases the same regardless of the roof type)
+    #faceBottom = "%s %s %s %s %s" % (p[0], p[3], p[2], p[1], p[0])
+    if rep == 'solid':
+        addsurface(False, CompositeSurface, faceBottom)
+    elif rep == 'brep':
+        plainMultiSurface(surfaceMember, faceBottom)
+
+    #-- Door and windows, shared by all the LOD3 representations of the building
+    openings = buildingOpenings(door, wallWindows, pList)
+
+    #-- Roof surfaces and wall surfaces depending on the type of the roof.
+    if rtype == 'Gabled':
+        if rep == 'solid':
+            gabledRoof(CompositeSurface, p, r, east_faces, None, openings, ropenings, None, embrasure, pList)
+        elif rep == 'brep':
+            gabledRoof(surfaceMember, p, r, east_faces, None, openings, ropenings, None, embrasure, pList)
+            if overhangs is not None and ovh[0] > 0:
+                roofOverhangs(surfaceMember, overhangs, interiors)
+
+    elif rtype == 'Shed':
+        if rep == 'solid':
+            shedRoof(CompositeSurface, p, r, east_faces, None, openings, ropenings, None, embrasure, pList)
+        elif rep == 'brep':
+            shedRoof(surfaceMember, p, r, east_faces, None, openings, ropenings, None, embrasure, pList)
+            if overhangs is not None and ovh[0] > 0:
+                roofOverhangs(surfaceMember, overhangs, interiors)
+
+    elif rtype == 'Hipped' or rtype == 'Pyramidal':
+        if rep == 'solid':
+            hippedRoof(CompositeSurface, p, r, east_faces, None, openings, ropenings, None, embrasure, pList)
+        elif rep == 'brep':
+            hippedRoof(surfaceMember, p, r, east_faces, None, openings, ropenings, None, embrasure, pList)
+            if overhangs is not None and ovh[0] > 0:
+                roofOverhangs(surfaceMember, overhangs, interiors)
+
+    elif rtype == 'Flat' or None:
+        if rep == 'solid':
+            flatRoof(CompositeSurface, p, r, east_faces, None, openings, ropenings, None, embrasure, pList)
+        elif rep == 'brep':
+            flatRoof(surfaceMember, p, r, east_faces, None, openings, ropenings, None, embrasure, pList)
+            if overhangs is not None and ovh[0] > 0:
+                roofOverhangs(surfaceMember, overhangs, interiors)
@@ -35,8 +35,10 @@ Python script to generate ground truth model specifications
 import uuid
 import random
 from lxml import etree
-from math import sqrt, trunc, floor
+from math import sqrt, floor
 import argparse
+import numpy
+import sys
 
 def argRead(ar, default=None):
     """Corrects the argument input in case it is not in the format True/False."""
@@ -69,63 +71,99 @@ PARSER.add_argument('-v', '--vegetation',
     help='Generate vegetation.', required=False)
 PARSER.add_argument('-p', '--parts',
     help='Generate parts of buildings, such as garages.', required=False)
-ARGS = vars(PARSER.parse_args())
-NUMBEROFBUILDINGS = ARGS['number']
-FILENAME = ARGS['filename']
-CRS = ARGS['crs']
-ROTATIONENABLED = argRead(ARGS['rotation'])
-STREETS = argRead(ARGS['street'])
-VEGETATION = argRead(ARGS['vegetation'])
-BUILDINGPARTS = argRead(ARGS['parts'])
-
-#-- Streets and rotated buildings don't look well together. Same with CRS.
-if STREETS and ROTATIONENABLED:
-    raise ValueError("I cannot process both rotated buildings and road network. Please disable one of the two.")
-elif STREETS and CRS:
-    raise ValueError("I cannot process both the non-local CRS and road network. Please disable one of the two.")
+PARSER.add_argument('-rw', '--rows',
+    help='Number of rows of the grid of buildings (by default the grid is square).', required=False)
+PARSER.add_argument('-ar', '--aspect',
+    help='Ratio between the number of columns and rows of the grid of buildings (by default 1).', required=False)
+PARSER.add_argument('-sd', '--seed',
+    help='Seed of the city: each building depends only on the seed and its cell, so the same city can be generated again (also in parts).', required=False)
+
+def configure(arguments):
+    """Set the options of the randomiser from the arguments of the script (a list of strings, as the command line without the name of the script)."""
+    global ARGS, NUMBEROFBUILDINGS, FILENAME, CRS, ROTATIONENABLED, STREETS, VEGETATION, BUILDINGPARTS, ROWS, ASPECT, SEED
+    ARGS = vars(PARSER.parse_args(arguments))
+    NUMBEROFBUILDINGS = ARGS['number']
+    FILENAME = ARGS['filename']
+    CRS = ARGS['crs']
+    ROTATIONENABLED = argRead(ARGS['rotation'])
+    STREETS = argRead(ARGS['street'])
+    VEGETATION = argRead(ARGS['vegetation'])
+    BUILDINGPARTS = argRead(ARGS['parts'])
+    if ARGS['rows'] is not None:
+        ROWS = int(ARGS['rows'])
+    else:
+        ROWS = None
+    if ARGS['aspect'] is not None:
+        ASPECT = float(ARGS['aspect'])
+    else:
+        ASPECT = None
+    SEED = ARGS['seed']
+
+    #-- Streets and rotated buildings don't look well together. Same with CRS.
+    if STREETS and ROTATIONENABLED:
+        raise ValueError("I cannot process both rotated buildings and road network. Please disable one of the two.")
+    elif STREETS and CRS:
+        raise ValueError("I cannot process both the non-local CRS and road network. Please disable one of the two.")
+
+
+#-- The default options, which a script importing this one (e.g. serveTiles.py or batchCities.py) sets as it needs
+configure([])
 
 
 #-- Parametres
 # Size of the cells of buildings in metres
 CELLSIZE = 20.0
 
-def buildinggenerator(n, vegetationcells=False, crs=None):
+def buildinggenerator(n, vegetationcells=None, crs=None):
     """
     Generate n buildings with random properties.
     """
 
     specifications = etree.Element("specifications")
 
-    rmax = 0
-    cmax = 0
+    #-- Location of all the cells at once
+    origins, orders = layout(n, crs, ROWS, ASPECT)
+    buildingcells = numpy.ones(n, dtype=bool)
+    if vegetationcells is not None:
+        buildingcells[vegetationcells] = False
 
     #-- For each building run the randomizer independently
-    for i in range(0, n):
-        #-- Save the location in the cell for each of the building (for the streets)
-        if vegetationcells:
-            if i in vegetationcells:
-                continue
-        cell = buildingParametres(specifications, i, n, crs)
-        r = cell[0]
-        c = cell[1]
-        if r > rmax:
-            rmax = r
-        if c > cmax:
-            cmax = c
+    xy = origins[:, :2].tolist()
+    grid = orders.tolist()
+    for i in numpy.nonzero(buildingcells)[0].tolist():
+        if SEED is not None:
+            random.seed(buildingSeed(SEED, i))
+        buildingParametres(specifications, [xy[i][0], xy[i][1], 0, grid[i]])
+
+    #-- Extent of the cells with buildings (for the streets)
+    if buildingcells.any():
+        rmax, cmax = orders[buildingcells].max(axis=0).tolist()
+    else:
+        rmax, cmax = 0, 0
 
     return specifications, [rmax, cmax]
 
 
-def buildingParametres(specifications, i, n, crs = None):
+def buildingSeed(seed, i):
+    """Seed of the random generator for the building in the i-th cell of a city."""
+    return str(seed) + '/' + str(i)
+
+
+def buildingParametres(specifications, o):
     """
     Generate the properties of a building in a totally random way.
+    Input: origin of the building in the grid, as returned by arranger().
     """
 
     #-- The roof types
     rooftypes = ['Flat', 'Shed', 'Hipped', 'Gabled', 'Pyramidal']
 
     #-- Unique UUID for each building. This will later be translated to gml:id in CityGML
-    name = str(uuid.uuid4())
+    if SEED is not None:
+        #-- Drawn from the seeded generator, so that the building is the same every time
+        name = str(uuid.UUID(int=random.getrandbits(128), version=4))
+    else:
+        name = str(uuid.uuid4())
 
     #-- Element tree, building
     building = etree.SubElement(specifications, "building")
@@ -137,7 +175,6 @@ def buildingParametres(specifications, i, n, crs = None):
 
     #-- Origin of each building in the global system
     origin = etree.SubElement(building, "origin")
-    o = arranger(i, n, crs)
     origin.text = str(o[0]) + " " + str(o[1]) + " " + str(o[2])
 
     #-- Order of the building in the grid
@@ -900,33 +937,46 @@ def randomwindow(side, fl, xs, ys, zs, floorHeight, fixed=None):
 
         return res
 
-def arranger(i, n, crs = None):
-    """Arranges the location of each building."""
-    if crs is not None:
-        if crs == 'Nordoostpolder':
-            shiftx = 173469.0
-            shifty = 526427.0
-        else:
-            shiftx = 0.0
-            shifty = 0.0
+def crsShift(crs=None):
+    """Shift of the origin of the grid according to the reference system."""
+    if crs == 'Nordoostpolder':
+        return 173469.0, 526427.0
+    else:
+        return 0.0, 0.0
+
+
+def gridRows(n, rows=None, aspect=None):
+    """Number of rows of the grid (cells in each column): given, derived from the ratio between the number of columns and rows, or square."""
+    if rows is not None:
+        gridsize = rows
+    elif aspect is not None:
+        gridsize = int(round(sqrt(n / aspect), 0))
     else:
-        shiftx = 0.0
-        shifty = 0.0
-    """Arrange the models in a grid."""
-    i += 1
-    if i > n:
+        #-- Translate the number of buildings to a square
+        gridsize = int(round(sqrt(n), 0))
+    return max(gridsize, 1)
+
+
+def layout(n, crs=None, rows=None, aspect=None):
+    """Arrange all the n cells in a grid at once.
+    Output: array of the origins of the cells (x, y, z) and array of their order in the grid (column, row)."""
+    shiftx, shifty = crsShift(crs)
+    gridsize = gridRows(n, rows, aspect)
+    cells = numpy.arange(n)
+    orders = numpy.column_stack([cells // gridsize, cells % gridsize])
+    origins = numpy.column_stack([shiftx + orders[:, 0] * CELLSIZE, shifty + orders[:, 1] * CELLSIZE, numpy.zeros(n)])
+    return origins, orders
+
+
+def arranger(i, n, crs = None, rows=None, aspect=None):
+    """Arranges the location of a single building, in the same grid as layout()."""
+    if i >= n:
         raise NameError("i cannot be bigger than n.")
-    #-- Size of the grid (translate the number of buildings to a square)
-    gridsize = int(round(sqrt(n),0))
-    #-- Size of the grid cells
-    sx = CELLSIZE
-    sy = CELLSIZE
-    column = trunc(float(i-1)/float(gridsize))
-    if column > 0:
-        row = i % (gridsize * column + 1)
-    elif column == 0:
-        row = i - 1
-    return shiftx + column*sx, shifty + row*sy, 0, [column, row]
+    shiftx, shifty = crsShift(crs)
+    gridsize = gridRows(n, rows, aspect)
+    column = i // gridsize
+    row = i % gridsize
+    return shiftx + column*CELLSIZE, shifty + row*CELLSIZE, 0, [column, row]
 
 
 def streetgenerator(specs, CELLSIZE, grid, skipx, skipy):
@@ -938,20 +988,15 @@ def streetgenerator(specs, CELLSIZE, grid, skipx, skipy):
     row = grid[0]
     col = grid[1]
     networkoutline = [[-width - separation, -width - separation], [row * CELLSIZE + CELLSIZE + width, col * CELLSIZE + CELLSIZE + width]]
-    holes = []
-    for r in range(0, row+1, skipx):
-        for c in range(0, col+1, skipy):
-            p0x = r * CELLSIZE - separation
-            if (r + skipx) * CELLSIZE - separation - width >= row * CELLSIZE:
-                p1x = row * CELLSIZE + CELLSIZE
-            else:
-                p1x = (r + skipx) * CELLSIZE - separation - width
-            p0y = c * CELLSIZE - separation
-            if (c + skipy) * CELLSIZE - separation - width >= col * CELLSIZE:
-                p1y = col * CELLSIZE + CELLSIZE
-            else:
-                p1y = (c + skipy) * CELLSIZE - separation - width
-            holes.append([[p0x, p0y], [p1x, p1y]])
+    #-- All the blocks (holes in the network) at once
+    r, c = numpy.meshgrid(numpy.arange(0, row+1, skipx), numpy.arange(0, col+1, skipy), indexing='ij')
+    r = r.reshape(-1)
+    c = c.reshape(-1)
+    p0x = r * CELLSIZE - separation
+    p1x = numpy.where((r + skipx) * CELLSIZE - separation - width >= row * CELLSIZE, row * CELLSIZE + CELLSIZE, (r + skipx) * CELLSIZE - separation - width)
+    p0y = c * CELLSIZE - separation
+    p1y = numpy.where((c + skipy) * CELLSIZE - separation - width >= col * CELLSIZE, col * CELLSIZE + CELLSIZE, (c + skipy) * CELLSIZE - separation - width)
+    holes = [[[x0, y0], [x1, y1]] for x0, y0, x1, y1 in zip(p0x.tolist(), p0y.tolist(), p1x.tolist(), p1y.tolist())]
 
     streetnetwork = etree.SubElement(specs, "streets")
     outline = etree.SubElement(streetnetwork, "outline")
@@ -968,56 +1013,66 @@ def vegetationgenerator(specs, CELLSIZE, vgcells, n):
     separation = 1.0
     height = 3.0
     parks = etree.SubElement(specs, "parks")
-    for v in vgcells:
+    #-- Parks are placed in the same grid as the buildings
+    origins = layout(n, None, ROWS, ASPECT)[0][vgcells].tolist()
+    for o in origins:
         park = etree.SubElement(parks, "park")
         parkoutline = etree.SubElement(park, "outline")
         parkheight = etree.SubElement(park, "height")
         parkheight.text = str(height)
-        o = arranger(v, n)
         parkoutline.text = str(float(o[0])-separation) + ' ' + str(float(o[1])-separation) + ' ' + str(float(o[0]) + CELLSIZE - width - separation) + ' ' + str(float(o[1]) + CELLSIZE - width - separation)
     return specs
 
-#---- Program start
 
-#-- If there is no input of the number of buildinds then default to 1000
-if NUMBEROFBUILDINGS:
-    n = int(NUMBEROFBUILDINGS)
-else:
-    n = 1000
-#-- Where to write the XML containing building information
-if FILENAME:
-    fname = str(FILENAME)
-else:
-    fname = "BuildingInformation.xml"
-
-#-- Place parks
-if VEGETATION:
-    #- Ratio of parks in the cells
-    rvgs = 0.05
-    nvgs = int(round(rvgs * float(n), 0))
-    vgcells = []
-    allcells = list(range(n))
-    for vgs in range(0, nvgs):
-        vgcells.append(random.choice(allcells))
-else:
-    vgcells = False
-#-- Generate the buildings
-bspecs, cell = buildinggenerator(n, vgcells, CRS)
-#-- Generate streets
-if STREETS:
-    bspecs = streetgenerator(bspecs, CELLSIZE, cell, 3, 3)
-#-- Generate the vegetation
-if VEGETATION:
-    bspecs = vegetationgenerator(bspecs, CELLSIZE, vgcells, n)
-#-- Write the specs in an XML form
-buildings = etree.tostring(bspecs, pretty_print=True)
-#-- Write the XML file from the string
-SpecFile = open(fname, "w")
-#-- Add the header to be politically correct
-SpecFile.write("<?xml version=\"1.0\" encoding=\"utf-8\"?>\n")
-SpecFile.write("<!-- Generated by Random3Dcity (http://github.com/tudelft3d/Random3Dcity), a tool developed by Filip Biljecki at TU Delft. Version: 2015-03-11. -->\n")
-#SpecFile.write(buildings)
-SpecFile.write(buildings.decode('utf-8'))
-SpecFile.close()
-#-- Done
-print('XML with buildings written in file', fname)
\ No newline at end of file
+def writeCity(arguments):
+    """Randomise a city with these arguments of the script and write the XML of its buildings (and streets and parks).
+    Output: the name of the XML file."""
+    configure(arguments)
+    #-- If there is no input of the number of buildinds then default to 1000
+    if NUMBEROFBUILDINGS:
+        n = int(NUMBEROFBUILDINGS)
+    else:
+        n = 1000
+    #-- Where to write the XML containing building information
+    if FILENAME:
+        fname = str(FILENAME)
+    else:
+        fname = "BuildingInformation.xml"
+
+    #-- Place parks
+    if VEGETATION:
+        #- Ratio of parks in the cells
+        rvgs = 0.05
+        nvgs = int(round(rvgs * float(n), 0))
+        #-- Distinct cells
+        if SEED is not None:
+            random.seed(SEED)
+        vgcells = random.sample(range(n), nvgs)
+    else:
+        vgcells = None
+    #-- Generate the buildings
+    bspecs, cell = buildinggenerator(n, vgcells, CRS)
+    #-- Generate streets
+    if STREETS:
+        bspecs = streetgenerator(bspecs, CELLSIZE, cell, 3, 3)
+    #-- Generate the vegetation
+    if VEGETATION:
+        bspecs = vegetationgenerator(bspecs, CELLSIZE, vgcells, n)
+    #-- Write the specs in an XML form
+    buildings = etree.tostring(bspecs, pretty_print=True)
+    #-- Write the XML file from the string
+    SpecFile = open(fname, "w")
+    #-- Add the header to be politically correct
+    SpecFile.write("<?xml version=\"1.0\" encoding=\"utf-8\"?>\n")
+    SpecFile.write("<!-- Generated by Random3Dcity (http://github.com/tudelft3d/Random3Dcity), a tool developed by Filip Biljecki at TU Delft. Version: 2015-03-11. -->\n")
+    #SpecFile.write(buildings)
+    SpecFile.write(buildings.decode('utf-8'))
+    SpecFile.close()
+    return fname
+
+
+#---- Program start
+if __name__ == '__main__':
+    fname = writeCity(sys.argv[1:])
+    #-- Done
+    print('XML with buildings written in file', fname)
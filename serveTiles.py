@@ -0,0 +1,373 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+
+# The MIT License (MIT)
+
+# This code is part of the Random3Dcity package
+
+# Copyright (c) 2015
+# Filip Biljecki
+# Delft University of Technology
+# fbiljecki@gmail.com
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Local HTTP service that generates tiles of synthetic cities in CityGML on demand.
+"""
+
+from lxml import etree
+import argparse
+import random
+import hashlib
+import importlib
+import json
+import os
+import threading
+import collections
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import urlparse, parse_qs
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urlparse import urlparse, parse_qs
+
+import randomiseCity
+from random3dcity import geometry
+from random3dcity.city import BUILDINGCOMPONENTS, CITYGMLHEADER, createCityGML, CityModels, producedBuilder, representationNames, buildingSpecification, sharedValues, buildingDimensions, CityGMLbuilding, rotateBuilding
+
+
+def argRead(ar, default=None):
+    """Corrects the argument input in case it is not in the format True/False."""
+    if ar == "0" or ar == "False":
+        ar = False
+    elif ar == "1" or ar == "True":
+        ar = True
+    elif ar is None:
+        if default:
+            ar = default
+        else:
+            ar = False
+    else:
+        raise ValueError("Argument value not recognised.")
+    return ar
+
+
+#-- Parse command-line arguments
+PARSER = argparse.ArgumentParser(description='Local service generating tiles of synthetic cities in CityGML.')
+PARSER.add_argument('-pt', '--port',
+    help='Port on localhost at which the service listens (default is 8080).', required=False)
+PARSER.add_argument('-ms', '--memorysize',
+    help='Size limit of the tiles kept in the memory in MB (default is 64).', required=False)
+PARSER.add_argument('-ca', '--cache',
+    help='Directory in which the tiles are kept between the runs of the service.', required=False)
+PARSER.add_argument('-cs', '--cachesize',
+    help='Size limit of the directory of tiles in MB (default is 1024).', required=False)
+PARSER.add_argument('-r', '--rotation',
+    help='Rotate the buildings (default is false; allowed values 0/1, True/False).', required=False)
+PARSER.add_argument('-p', '--parts',
+    help='Generate parts of buildings, such as garages (default is false).', required=False)
+PARSER.add_argument('-id', '--id',
+    help='Generate an UUID for each polygon (default is true).', required=False)
+ARGS = vars(PARSER.parse_args())
+if ARGS['port'] is not None:
+    PORT = int(ARGS['port'])
+else:
+    PORT = 8080
+if ARGS['memorysize'] is not None:
+    MEMORYSIZE = float(ARGS['memorysize']) * 1024 * 1024
+else:
+    MEMORYSIZE = 64 * 1024 * 1024
+CACHE = ARGS['cache']
+if ARGS['cachesize'] is not None:
+    CACHESIZE = float(ARGS['cachesize']) * 1024 * 1024
+else:
+    CACHESIZE = 1024 * 1024 * 1024
+ROTATIONENABLED = argRead(ARGS['rotation'], False)
+BUILDINGPARTS = argRead(ARGS['parts'], False)
+ASSIGNID = argRead(ARGS['id'], True)
+
+#-- The scripts of the engine, next to this one
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+GENERATORFILE = DIRECTORY + '/generateCityGML.py'
+
+
+#-- Functions
+
+def serviceVersion():
+    """Digest of the engine, so that the cached tiles are invalidated when the generator changes."""
+    digest = hashlib.sha1()
+    components = DIRECTORY + '/random3dcity'
+    for fname in [DIRECTORY + '/randomiseCity.py', GENERATORFILE] + [components + '/' + name for name in sorted(os.listdir(components)) if name.endswith('.py')]:
+        sourceFile = open(fname, "rb")
+        digest.update(sourceFile.read())
+        sourceFile.close()
+    return digest.hexdigest()
+
+
+def tileParameters(query):
+    """Read the parameters of a requested tile: the seed and the size of the city, the extent of the tile and the representation.
+    Output: a dictionary of the parameters, raises ValueError if they are not valid."""
+    def parameter(name, default=None):
+        values = query.get(name)
+        if not values:
+            if default is None:
+                raise ValueError("The parameter " + name + " is missing.")
+            return default
+        return values[0]
+    parameters = {}
+    parameters['seed'] = parameter('seed')
+    parameters['bbox'] = [float(value) for value in parameter('bbox').split(',')]
+    if len(parameters['bbox']) != 4 or parameters['bbox'][0] >= parameters['bbox'][2] or parameters['bbox'][1] >= parameters['bbox'][3]:
+        raise ValueError("The bbox should be given as xmin,ymin,xmax,ymax.")
+    parameters['representation'] = parameter('representation')
+    #-- One representation, not a pattern of the generator
+    if set(parameters['representation']) & set('*?[],/'):
+        raise ValueError("The representation " + parameters['representation'] + " is not valid.")
+    parameters['n'] = int(parameter('n', '1000'))
+    if parameters['n'] < 1:
+        raise ValueError("The city should have at least one building.")
+    if 'rows' in query:
+        parameters['rows'] = int(parameter('rows'))
+    else:
+        parameters['rows'] = None
+    if 'aspect' in query:
+        parameters['aspect'] = float(parameter('aspect'))
+    else:
+        parameters['aspect'] = None
+    return parameters
+
+
+def tileKey(parameters):
+    """Content address of a tile: its parameters, the options of the service and the version of the engine."""
+    key = hashlib.sha1(VERSION.encode('utf-8'))
+    key.update(json.dumps([parameters, ROTATIONENABLED, BUILDINGPARTS, ASSIGNID], sort_keys=True).encode('utf-8'))
+    return key.hexdigest()
+
+
+def tileBuildings(parameters):
+    """Specifications of the buildings of the city whose cell starts in the tile.
+    Each building is randomised from the seed of the city and its cell, as randomiseCity.py does with the same seed."""
+    specifications = etree.Element("specifications")
+    randomiseCity.SEED = parameters['seed']
+    origins, orders = randomiseCity.layout(parameters['n'], None, parameters['rows'], parameters['aspect'])
+    xmin, ymin, xmax, ymax = parameters['bbox']
+    inside = (origins[:, 0] >= xmin) & (origins[:, 0] < xmax) & (origins[:, 1] >= ymin) & (origins[:, 1] < ymax)
+    xy = origins[:, :2].tolist()
+    grid = orders.tolist()
+    for i in inside.nonzero()[0].tolist():
+        random.seed(randomiseCity.buildingSeed(parameters['seed'], i))
+        randomiseCity.buildingParametres(specifications, [xy[i][0], xy[i][1], 0, grid[i]])
+    return specifications
+
+
+def tileBuilders():
+    """Builders of the buildings of the engine, configured with the options of the service. A builder skips the representations that are not in the tile."""
+    builders = {}
+    geometry.ASSIGNID = ASSIGNID
+    for name, prefixes, names in BUILDINGCOMPONENTS:
+        component = importlib.import_module('random3dcity.' + name)
+        component.ASSIGNID = ASSIGNID
+        for builder in names:
+            builders[builder] = producedBuilder(getattr(component, builder))
+    return builders
+
+
+def generateTile(parameters):
+    """Generate the CityGML file of a representation of the buildings of a tile.
+    The buildings are constructed in the memory by the builders of the engine, loaded when the service started."""
+    representation = parameters['representation']
+    if representation not in REPRESENTATIONS:
+        raise ValueError("The representation " + representation + " is not generated by the service.")
+    CityGMLs = CityModels()
+    CityGMLs[representation] = createCityGML(representation)
+    for b in tileBuildings(parameters).iter('building'):
+        specification = buildingSpecification(b)
+        shared = sharedValues(specification, BUILDERS['CityGMLbuildingLOD3Semantics'])
+        CityGMLbuilding(CityGMLs, specification, buildingDimensions(specification, *shared[:3]), BUILDERS, True, True)
+        #-- Rotated as by generateCityGML.py, whose rotation is on by default (by 0 degrees if the service does not rotate the buildings)
+        rotateBuilding(CityGMLs, specification['ID'], specification['rotation'], specification['origin'])
+        geometry.openingGeometries.clear()
+    return CITYGMLHEADER + etree.tostring(CityGMLs[representation], pretty_print=True)
+
+
+def cacheFilename(key):
+    """Path of a tile in the directory of tiles."""
+    return CACHE + '/' + key[:2] + '/' + key + '.gml'
+
+
+def loadTile(key):
+    """A tile generated before, from the memory or from the directory of tiles.
+    Output: the CityGML of the tile and where it was found, or None if it has to be generated."""
+    with cacheLock:
+        if key in memoryTiles:
+            #-- Mark as recently used
+            data = memoryTiles.pop(key)
+            memoryTiles[key] = data
+            return data, 'memory'
+    if CACHE:
+        try:
+            tileFile = open(cacheFilename(key), "rb")
+        except (IOError, OSError):
+            return None
+        data = tileFile.read()
+        tileFile.close()
+        try:
+            os.utime(cacheFilename(key), None)
+        except OSError:
+            pass
+        storeMemoryTile(key, data)
+        return data, 'disk'
+    return None
+
+
+def storeMemoryTile(key, data):
+    """Keep a tile in the memory, and forget the least recently used ones above the size limit."""
+    global memoryusage
+    with cacheLock:
+        if key in memoryTiles:
+            memoryusage -= len(memoryTiles.pop(key))
+        memoryTiles[key] = data
+        memoryusage += len(data)
+        while memoryusage > MEMORYSIZE and len(memoryTiles) > 1:
+            memoryusage -= len(memoryTiles.popitem(last=False)[1])
+
+
+def storeTile(key, data):
+    """Keep a generated tile in the memory and in the directory of tiles."""
+    global cacheusage
+    storeMemoryTile(key, data)
+    if not CACHE:
+        return
+    fname = cacheFilename(key)
+    if not os.path.isdir(os.path.dirname(fname)):
+        os.makedirs(os.path.dirname(fname))
+    tileFile = open(fname + '.tmp', "wb")
+    tileFile.write(data)
+    tileFile.close()
+    getattr(os, 'replace', os.rename)(fname + '.tmp', fname)
+    with cacheLock:
+        cacheusage += len(data)
+        if cacheusage > CACHESIZE:
+            evictCache()
+
+
+def cacheEntries():
+    """List the tiles in the directory of tiles as (last use, size, path)."""
+    entries = []
+    for dirpath, dirnames, filenames in os.walk(CACHE):
+        for filename in filenames:
+            if filename.endswith('.gml'):
+                path = os.path.join(dirpath, filename)
+                #-- A tile removed in the meantime, e.g. by another service sharing the directory
+                try:
+                    entries.append((os.path.getmtime(path), os.path.getsize(path), path))
+                except OSError:
+                    pass
+    return entries
+
+
+def evictCache():
+    """Remove the least recently used tiles until the directory fits in its size limit."""
+    global cacheusage
+    entries = sorted(cacheEntries())
+    cacheusage = sum(entry[1] for entry in entries)
+    for lastuse, size, path in entries:
+        if cacheusage <= CACHESIZE:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            #-- Removed in the meantime, e.g. by another service sharing the directory
+            pass
+        cacheusage -= size
+
+
+class TileHandler(BaseHTTPRequestHandler):
+    """Answer the requests of tiles: GET /tile?seed=...&bbox=xmin,ymin,xmax,ymax&representation=...[&n=...&rows=...&aspect=...]"""
+
+    def respond(self, code, data, contentType, origin=None):
+        self.send_response(code)
+        self.send_header('Content-Type', contentType)
+        self.send_header('Content-Length', str(len(data)))
+        if origin is not None:
+            self.send_header('X-Tile-Cache', origin)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != '/tile':
+            self.respond(404, b'Unknown path, request /tile.\n', 'text/plain')
+            return
+        try:
+            parameters = tileParameters(parse_qs(url.query))
+            key = tileKey(parameters)
+            tile = loadTile(key)
+            if tile is None:
+                #-- The generator and the random generator are shared by the whole process
+                with generatorLock:
+                    tile = loadTile(key)
+                    if tile is None:
+                        tile = generateTile(parameters), 'generated'
+                        storeTile(key, tile[0])
+        except ValueError as error:
+            self.respond(400, (str(error) + '\n').encode('utf-8'), 'text/plain')
+            return
+        except Exception as error:
+            self.respond(500, (repr(error) + '\n').encode('utf-8'), 'text/plain')
+            return
+        self.respond(200, tile[0], 'application/gml+xml', tile[1])
+
+
+class TileServer(ThreadingMixIn, HTTPServer):
+    """HTTP server answering each request in a thread of its own, so the cached tiles do not wait for a generation."""
+    daemon_threads = True
+
+
+#----------------------------------------------------------------------
+#-- Start of the program
+
+#-- The randomiser and the builders are configured once for all the tiles, which can be of any representation generated with -gr 1 -ov 1
+randomiseCity.ROTATIONENABLED = ROTATIONENABLED
+randomiseCity.BUILDINGPARTS = BUILDINGPARTS
+BUILDERS = tileBuilders()
+REPRESENTATIONS = representationNames(True, True)
+VERSION = serviceVersion()
+
+#-- Tiles kept in the memory, from the least to the most recently used
+memoryTiles = collections.OrderedDict()
+memoryusage = 0
+cacheLock = threading.Lock()
+generatorLock = threading.Lock()
+if CACHE:
+    cacheusage = 0
+    evictCache()
+
+server = TileServer(('127.0.0.1', PORT), TileHandler)
+print("Serving tiles at http://127.0.0.1:" + str(PORT) + "/tile ...")
+try:
+    server.serve_forever()
+except KeyboardInterrupt:
+    print("\nStopped.")
+server.server_close()
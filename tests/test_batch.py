@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""Tests of the generation of many cities in warm processes (batchCities.py)."""
+
+import filecmp
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from test_quarantine import runScript
+
+
+class BatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def batch(self, jobs, processes):
+        jobsname = os.path.join(self.directory, 'jobs.jsonl')
+        jobsFile = open(jobsname, "w")
+        for job in jobs:
+            jobsFile.write(json.dumps(job) + '\n')
+        jobsFile.close()
+        resultsname = os.path.join(self.directory, 'results.jsonl')
+        code, output = runScript('batchCities.py', ['-j', jobsname, '-pr', str(processes), '-rs', resultsname])
+        resultsFile = open(resultsname, "r")
+        results = [json.loads(line) for line in resultsFile]
+        resultsFile.close()
+        return code, output, results
+
+    def test_same_as_the_scripts(self):
+        jobs = [{'directory': os.path.join(self.directory, 'city' + str(seed)), 'seed': seed, 'n': 6, 'city': ['-v', '1'], 'options': ['-id', '0', '-v', '1', '-re', 'LOD1_*,PlantCover-*']} for seed in [1, 2, 3]]
+        code, output, results = self.batch(jobs, 2)
+        self.assertEqual(code, 0, output)
+        self.assertEqual(sorted(result['job'] for result in results), [0, 1, 2])
+        for result in results:
+            self.assertEqual(result['buildings'], 6)
+        #-- The messages of the engine are not printed by the batch
+        self.assertNotIn('Constructing buildings', output)
+        #-- Each city is the same as the one of the scripts with the same seed
+        for seed in [1, 2, 3]:
+            expected = os.path.join(self.directory, 'expected' + str(seed))
+            os.mkdir(expected)
+            xml = os.path.join(expected, 'buildings.xml')
+            code, message = runScript('randomiseCity.py', ['-n', '6', '-sd', str(seed), '-v', '1', '-o', xml])
+            self.assertEqual(code, 0, message)
+            code, message = runScript('generateCityGML.py', ['-i', xml, '-o', expected, '-rp', '0', '-id', '0', '-v', '1', '-re', 'LOD1_*,PlantCover-*'])
+            self.assertEqual(code, 0, message)
+            names = sorted(os.listdir(expected))
+            self.assertEqual(names, sorted(os.listdir(os.path.join(self.directory, 'city' + str(seed)))))
+            match, mismatch, errors = filecmp.cmpfiles(expected, os.path.join(self.directory, 'city' + str(seed)), names, shallow=False)
+            self.assertEqual(mismatch + errors, [])
+
+    def test_failing_job(self):
+        jobs = [{'directory': os.path.join(self.directory, 'wrong'), 'seed': 1, 'n': 2, 'options': ['-zz', '1']},
+                {'directory': os.path.join(self.directory, 'right'), 'seed': 1, 'n': 2, 'options': ['-re', 'LOD0_*']}]
+        code, output, results = self.batch(jobs, 1)
+        #-- The other jobs go on
+        self.assertEqual(code, 1, output)
+        self.assertIn('does not accept the arguments', results[0]['error'])
+        self.assertEqual(results[1]['buildings'], 2)
+        self.assertTrue(os.path.isfile(os.path.join(self.directory, 'right', 'LOD0_0.gml')))
+
+
+if __name__ == '__main__':
+    unittest.main()
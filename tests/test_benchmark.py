@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+"""Tests of the benchmark of the generator (benchmarkCities.py)."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from test_quarantine import runScript
+
+
+class BenchmarkTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_results(self):
+        results = os.path.join(self.directory, 'results.jsonl')
+        code, output = runScript('benchmarkCities.py', ['-cs', 'start', '-rt', '2', '-rs', results])
+        self.assertEqual(code, 0, output)
+        #-- Compared to itself
+        code, output = runScript('benchmarkCities.py', ['-cs', 'start', '-rt', '1', '-rs', results, '-bl', results])
+        self.assertEqual(code, 0, output)
+        self.assertIn('%', output)
+        resultsFile = open(results, "r")
+        lines = [json.loads(line) for line in resultsFile]
+        resultsFile.close()
+        self.assertEqual([result['case'] for result in lines], ['start', 'start'])
+        self.assertEqual([result['repeat'] for result in lines], [2, 1])
+        for result in lines:
+            self.assertEqual(result['buildings'], 1)
+            self.assertEqual(result['representations'], 1)
+            self.assertGreater(result['start'], 0.0)
+            self.assertLess(result['start'], result['wall'])
+
+
+if __name__ == '__main__':
+    unittest.main()
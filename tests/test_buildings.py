@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""Tests of the geometry that generateCityGML.py shares between the representations of a building: the interior storeys and the openings."""
+
+import csv
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+from test_quarantine import runScript
+
+
+class BuildingsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.xml = os.path.join(self.directory, 'buildings.xml')
+        code, output = runScript('randomiseCity.py', ['-n', '6', '-sd', '10', '-r', '1', '-p', '1', '-o', self.xml])
+        self.assertEqual(code, 0, output)
+        self.output = os.path.join(self.directory, 'city')
+        os.mkdir(self.output)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def generate(self, representations):
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output, '-rp', '0', '-id', '0', '-re', representations, '-va', 'csv'])
+        self.assertEqual(code, 0, output)
+        validityFile = open(os.path.join(self.output, 'validity.csv'), "r")
+        errors = list(csv.DictReader(validityFile))
+        validityFile.close()
+        return errors
+
+    def buildings(self, representation):
+        """The members of the buildings of a representation, in the order of the XML."""
+        citygmlFile = open(os.path.join(self.output, representation + '.gml'), "r")
+        data = citygmlFile.read()
+        citygmlFile.close()
+        return re.findall(r'<cityObjectMember>.*?</cityObjectMember>', data, re.S)
+
+    def test_interior_storeys(self):
+        self.generate('interior-*')
+        xmlFile = open(self.xml, "r")
+        floors = [int(floor) for floor in re.findall(r'<floors>(\d+)</floors>', xmlFile.read())]
+        xmlFile.close()
+        lod0 = self.buildings('interior-LOD0')
+        lod1 = self.buildings('interior-LOD1')
+        lod2 = self.buildings('interior-LOD2_2')
+        self.assertEqual([len(lod0), len(lod1), len(lod2)], [6, 6, 6])
+        #-- A footprint in LOD0 and a solid in LOD2 for each storey, at least one for each floor
+        for storeys, lod0member, lod2member in zip(floors, lod0, lod2):
+            self.assertEqual(lod0member.count('<gml:MultiSurface'), lod2member.count('<gml:Solid'))
+            self.assertGreaterEqual(lod0member.count('<gml:MultiSurface'), storeys)
+        self.assertEqual([member.count('<gml:Solid') for member in lod1], [1] * 6)
+        #-- LOD2_3 has the storeys of LOD2_2
+        self.assertEqual([member.count('<gml:Solid') for member in self.buildings('interior-LOD2_3')], [member.count('<gml:Solid') for member in lod2])
+
+    def test_openings_of_the_lod3_variants(self):
+        self.assertEqual(self.generate('LOD3_1,LOD3_2,LOD3_3'), [])
+        windows = {}
+        doors = {}
+        for representation in ['LOD3_1', 'LOD3_2', 'LOD3_3']:
+            windows[representation] = [member.count('<bldg:Window>') for member in self.buildings(representation)]
+            doors[representation] = [member.count('<bldg:Door>') for member in self.buildings(representation)]
+        #-- The same openings in the variants with the same roof, and the same doors in all of them
+        self.assertEqual(windows['LOD3_2'], windows['LOD3_3'])
+        self.assertTrue(all(a <= b for a, b in zip(windows['LOD3_1'], windows['LOD3_2'])))
+        self.assertEqual(doors['LOD3_1'], doors['LOD3_2'])
+        self.assertEqual(doors['LOD3_2'], doors['LOD3_3'])
+        self.assertGreater(sum(windows['LOD3_2']), 0)
+        self.assertGreater(sum(doors['LOD3_2']), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
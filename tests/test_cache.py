@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""Tests of the cache of the buildings (-ca) in generateCityGML.py."""
+
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+
+from test_quarantine import runScript
+
+
+class CacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.xml = os.path.join(self.directory, 'buildings.xml')
+        code, output = runScript('randomiseCity.py', ['-n', '3', '-sd', '1', '-o', self.xml])
+        self.assertEqual(code, 0, output)
+        self.cache = os.path.join(self.directory, 'cache')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def deviations(self, name, pairs):
+        output = os.path.join(self.directory, name)
+        os.mkdir(output)
+        code, message = runScript('generateCityGML.py', ['-i', self.xml, '-o', output, '-rp', '0', '-ca', self.cache, '-re', 'LOD1_2_F0_H3,LOD2_2_F0,LOD3_2', '-dv', pairs])
+        self.assertEqual(code, 0, message)
+        csvFile = open(os.path.join(output, 'deviations.csv'), "r")
+        rows = list(csv.DictReader(csvFile))
+        csvFile.close()
+        return rows
+
+    def test_changed_deviations(self):
+        first = self.deviations('first', 'LOD1_2_F0_H3:LOD3_2')
+        #-- The buildings are in the cache, but their rows are not the ones of these pairs
+        second = self.deviations('second', 'LOD2_2_F0:LOD3_2')
+        self.assertEqual([row['representation'] for row in first], ['LOD1_2_F0_H3'] * 3)
+        self.assertEqual([row['representation'] for row in second], ['LOD2_2_F0'] * 3)
+
+    def test_reused_buildings(self):
+        first = self.deviations('first', 'LOD1_2_F0_H3:LOD3_2')
+        self.assertTrue(os.listdir(self.cache))
+        self.assertEqual(self.deviations('second', 'LOD1_2_F0_H3:LOD3_2'), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
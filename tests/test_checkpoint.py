@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""Tests of the checkpoints and the resumption of an interrupted run (-cp, -rs) in generateCityGML.py."""
+
+import filecmp
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+from test_quarantine import runScript
+
+OPTIONS = ['-rp', '0', '-id', '0', '-re', 'LOD1_2_F0_H3,LOD2_2_F0,interior-LOD1', '-at', 'csv']
+
+
+class CheckpointTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.xml = os.path.join(self.directory, 'buildings.xml')
+        code, output = runScript('randomiseCity.py', ['-n', '6', '-sd', '1', '-o', self.xml])
+        self.assertEqual(code, 0, output)
+        xmlFile = open(self.xml, "r")
+        self.original = xmlFile.read()
+        xmlFile.close()
+        self.output = os.path.join(self.directory, 'city')
+        os.mkdir(self.output)
+        self.expected = os.path.join(self.directory, 'expected')
+        os.mkdir(self.expected)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def writeXML(self, xml):
+        xmlFile = open(self.xml, "w")
+        xmlFile.write(xml)
+        xmlFile.close()
+
+    def assertSameFiles(self):
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.expected] + OPTIONS)
+        self.assertEqual(code, 0, output)
+        names = sorted(os.listdir(self.expected))
+        self.assertEqual(names, sorted(os.listdir(self.output)))
+        match, mismatch, errors = filecmp.cmpfiles(self.expected, self.output, names, shallow=False)
+        self.assertEqual(mismatch + errors, [])
+
+    def test_resume_after_a_failure(self):
+        #-- The run stops at the last building, whose door is put on a wall that does not exist
+        doors = list(re.finditer(r'<door>\s*<wall>\d+</wall>', self.original))
+        last = doors[-1]
+        self.writeXML(self.original[:last.start()] + re.sub(r'<wall>\d+</wall>', '<wall>7</wall>', last.group(0)) + self.original[last.end():])
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output, '-cp', '2', '-qr', '0'] + OPTIONS)
+        self.assertNotEqual(code, 0)
+        self.assertTrue(os.path.isfile(os.path.join(self.output, 'checkpoint', 'journal.json')))
+        #-- Repaired, the run goes on from the checkpoint after 4 buildings
+        self.writeXML(self.original)
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output, '-cp', '2', '-qr', '0', '-rs'] + OPTIONS)
+        self.assertEqual(code, 0, output)
+        self.assertIn('Resuming after 4 building(s)', output)
+        self.assertFalse(os.path.isdir(os.path.join(self.output, 'checkpoint')))
+        self.assertSameFiles()
+
+    def test_resume_without_a_checkpoint(self):
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output, '-rs'] + OPTIONS)
+        self.assertEqual(code, 0, output)
+        self.assertIn('No checkpoint found', output)
+        self.assertSameFiles()
+
+    def test_other_options(self):
+        #-- Interrupted by a failing building
+        doors = list(re.finditer(r'<door>\s*<wall>\d+</wall>', self.original))
+        third = doors[2]
+        self.writeXML(self.original[:third.start()] + re.sub(r'<wall>\d+</wall>', '<wall>7</wall>', third.group(0)) + self.original[third.end():])
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output, '-cp', '2', '-qr', '0'] + OPTIONS)
+        self.assertNotEqual(code, 0)
+        self.writeXML(self.original)
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output, '-cp', '2', '-qr', '0', '-rs', '-p', '0'] + OPTIONS)
+        self.assertNotEqual(code, 0)
+        self.assertIn('The checkpoint was made with different options', output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+"""Tests of the file combining several representations of each building (-cm) in generateCityGML.py."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from test_quarantine import runScript
+
+
+class CombinedTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.xml = os.path.join(self.directory, 'buildings.xml')
+        #-- With this seed the city has a building part
+        code, output = runScript('randomiseCity.py', ['-n', '4', '-sd', '1', '-p', '1', '-o', self.xml])
+        self.assertEqual(code, 0, output)
+        self.output = os.path.join(self.directory, 'city')
+        os.mkdir(self.output)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def combine(self, arguments):
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output, '-rp', '0', '-p', '1'] + arguments)
+        self.assertEqual(code, 0, output)
+        self.assertFalse(os.path.exists(os.path.join(self.output, 'quarantine.jsonl')))
+        citygmlFile = open(os.path.join(self.output, 'combined.gml'), "r")
+        combined = citygmlFile.read()
+        citygmlFile.close()
+        self.assertEqual(combined.count('<bldg:Building '), 4)
+        return combined
+
+    def test_example_of_the_help(self):
+        combined = self.combine(['-cm', 'LOD1_2_F0_H3,LOD2_2_F0,LOD3_2'])
+        #-- The surfaces of LOD2_2_F0 are built as the ones of LOD3, and are put at LOD2
+        self.assertIn('<bldg:lod2MultiSurface>', combined)
+        self.assertIn('<bldg:lod3MultiSurface>', combined)
+
+    def test_example_of_the_readme(self):
+        combined = self.combine(['-ov', '1', '-cm', 'LOD0_2_F0_H3,LOD1_2_F0_H3,LOD2_1_F0,LOD3_2,LOD3_2_solid'])
+        self.assertIn('<bldg:lod0RoofEdge>', combined)
+        self.assertIn('<bldg:lod3Solid>', combined)
+
+    def test_surfaces_at_the_same_lod(self):
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output, '-rp', '0', '-cm', 'LOD3_2,LOD3_3'])
+        self.assertNotEqual(code, 0)
+        self.assertIn('cannot be combined', output)
+        #-- The run stopped before any building failed
+        self.assertFalse(os.path.exists(os.path.join(self.output, 'quarantine.jsonl')))
+
+
+if __name__ == '__main__':
+    unittest.main()
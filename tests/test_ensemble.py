@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""Tests of the realisations of the city with noise (-en, -nm) written by generateCityGML.py."""
+
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+from test_quarantine import runScript
+
+OPTIONS = ['-rp', '0', '-id', '0', '-re', 'LOD1_2_F0_H3,LOD2_2_F0']
+
+
+class EnsembleTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.xml = os.path.join(self.directory, 'buildings.xml')
+        code, output = runScript('randomiseCity.py', ['-n', '4', '-sd', '5', '-o', self.xml])
+        self.assertEqual(code, 0, output)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def generate(self, name, noise):
+        output = os.path.join(self.directory, name)
+        os.mkdir(output)
+        code, message = runScript('generateCityGML.py', ['-i', self.xml, '-o', output, '-en', '2', '-nm', noise] + OPTIONS)
+        self.assertEqual(code, 0, message)
+        return output
+
+    def read(self, fname):
+        citygmlFile = open(fname, "r")
+        data = citygmlFile.read()
+        citygmlFile.close()
+        return data
+
+    def coordinates(self, data):
+        return [float(x) for posList in re.findall(r'<gml:posList[^>]*>([^<]*)</gml:posList>', data) for x in posList.split()]
+
+    def test_noise_on_the_vertices(self):
+        output = self.generate('city', 'vertices=0.05,seed=1')
+        for representation in ['LOD1_2_F0_H3', 'LOD2_2_F0']:
+            city = self.read(os.path.join(output, representation + '.gml'))
+            realisations = [self.read(os.path.join(output, 'ensemble', str(realisation), representation + '.gml')) for realisation in [1, 2]]
+            self.assertNotEqual(realisations[0], realisations[1])
+            for realisation in realisations:
+                #-- The same polygons with other coordinates
+                self.assertEqual(re.sub(r'<gml:posList([^>]*)>[^<]*<', r'<gml:posList\1><', realisation), re.sub(r'<gml:posList([^>]*)>[^<]*<', r'<gml:posList\1><', city))
+                deviations = [abs(a - b) for a, b in zip(self.coordinates(realisation), self.coordinates(city))]
+                self.assertEqual(len(deviations), len(self.coordinates(city)))
+                self.assertGreater(max(deviations), 0.0)
+                self.assertLess(max(deviations), 0.5)
+
+    def test_seeded(self):
+        first = self.generate('first', 'vertices=0.05,heights=0.02,seed=7')
+        second = self.generate('second', 'vertices=0.05,heights=0.02,seed=7')
+        for realisation in ['1', '2']:
+            for representation in ['LOD1_2_F0_H3', 'LOD2_2_F0']:
+                self.assertEqual(self.read(os.path.join(first, 'ensemble', realisation, representation + '.gml')), self.read(os.path.join(second, 'ensemble', realisation, representation + '.gml')))
+
+    def test_without_noise(self):
+        output = os.path.join(self.directory, 'city')
+        os.mkdir(output)
+        code, message = runScript('generateCityGML.py', ['-i', self.xml, '-o', output, '-en', '2'] + OPTIONS)
+        self.assertNotEqual(code, 0)
+        self.assertIn('need a noise model', message)
+
+
+if __name__ == '__main__':
+    unittest.main()
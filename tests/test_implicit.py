@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""Tests of the implicit geometries of the repeated installations and openings (-ig) in generateCityGML.py."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from test_quarantine import runScript
+
+
+class ImplicitTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.xml = os.path.join(self.directory, 'buildings.xml')
+        code, output = runScript('randomiseCity.py', ['-n', '4', '-sd', '1', '-r', '1', '-o', self.xml])
+        self.assertEqual(code, 0, output)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def generate(self, implicit):
+        output = os.path.join(self.directory, 'implicit' + implicit)
+        os.mkdir(output)
+        code, message = runScript('generateCityGML.py', ['-i', self.xml, '-o', output, '-rp', '0', '-re', 'LOD3_2,LOD3_3', '-ig', implicit])
+        self.assertEqual(code, 0, message)
+        citygml = {}
+        for representation in ['LOD3_2', 'LOD3_3']:
+            citygmlFile = open(os.path.join(output, representation + '.gml'), "r")
+            citygml[representation] = citygmlFile.read()
+            citygmlFile.close()
+        return citygml
+
+    def test_size_reduction(self):
+        explicit = self.generate('0')
+        implicit = self.generate('1')
+        for representation in ['LOD3_2', 'LOD3_3']:
+            self.assertEqual(implicit[representation].count('<bldg:Window>'), explicit[representation].count('<bldg:Window>'))
+            self.assertIn('<bldg:lod3ImplicitRepresentation>', implicit[representation])
+            self.assertLess(len(implicit[representation]), len(explicit[representation]))
+        #-- The windows are instanced with their embrasures
+        self.assertLess(len(implicit['LOD3_3']), 0.6 * len(explicit['LOD3_3']))
+
+
+if __name__ == '__main__':
+    unittest.main()
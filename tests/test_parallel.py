@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""Tests of the writer threads (-wt) and the workers (-wk) of generateCityGML.py, whose files are the same as the ones of a single process."""
+
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+
+from test_quarantine import runScript
+
+OPTIONS = ['-rp', '0', '-id', '0', '-re', 'LOD0_*,LOD2_2_F0,LOD3_2,interior-LOD2_2']
+
+
+class ParallelTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        cls.xml = os.path.join(cls.directory, 'buildings.xml')
+        code, output = runScript('randomiseCity.py', ['-n', '9', '-sd', '2', '-r', '1', '-o', cls.xml])
+        assert code == 0, output
+        cls.expected = os.path.join(cls.directory, 'expected')
+        os.mkdir(cls.expected)
+        code, output = runScript('generateCityGML.py', ['-i', cls.xml, '-o', cls.expected] + OPTIONS)
+        assert code == 0, output
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def generate(self, name, arguments):
+        output = os.path.join(self.directory, name)
+        os.mkdir(output)
+        code, message = runScript('generateCityGML.py', ['-i', self.xml, '-o', output] + OPTIONS + arguments)
+        self.assertEqual(code, 0, message)
+        return output
+
+    def assertSameFiles(self, output, compressed=False):
+        names = sorted(name for name in os.listdir(self.expected) if name != 'options.json')
+        for name in names:
+            expectedFile = open(os.path.join(self.expected, name), "rb")
+            if compressed and name.endswith('.gml'):
+                outputFile = gzip.open(os.path.join(output, name + '.gz'), "rb")
+            else:
+                outputFile = open(os.path.join(output, name), "rb")
+            self.assertEqual(outputFile.read(), expectedFile.read(), name)
+            expectedFile.close()
+            outputFile.close()
+
+    def test_writers(self):
+        self.assertSameFiles(self.generate('writers', ['-wt', '2']))
+
+    def test_compressing_writers(self):
+        self.assertSameFiles(self.generate('compressed', ['-wt', '3', '-gz', '1']), True)
+
+    def test_workers(self):
+        output = self.generate('workers', ['-wk', '3'])
+        self.assertSameFiles(output)
+        #-- The spool files of the workers are removed
+        self.assertFalse(os.path.isdir(os.path.join(output, 'spool')))
+
+    def test_representation_workers(self):
+        self.assertSameFiles(self.generate('representations', ['-rw', '2']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""Tests of the plan (-pl) and of the target size (-tg) of generateCityGML.py."""
+
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+from test_quarantine import runScript
+
+OPTIONS = ['-rp', '0', '-id', '0', '-re', 'LOD1_2_F0_H3,LOD2_2_F0']
+
+
+class PlanTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.xml = os.path.join(self.directory, 'buildings.xml')
+        code, output = runScript('randomiseCity.py', ['-n', '8', '-sd', '4', '-o', self.xml])
+        self.assertEqual(code, 0, output)
+        self.output = os.path.join(self.directory, 'city')
+        os.mkdir(self.output)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def citygml(self, representation):
+        citygmlFile = open(os.path.join(self.output, representation + '.gml'), "rb")
+        data = citygmlFile.read()
+        citygmlFile.close()
+        return data
+
+    def polygons(self, data):
+        return data.count(b'<gml:Polygon>') + data.count(b'<gml:Polygon ')
+
+    def test_plan_of_all_the_buildings(self):
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output, '-pl', '8'] + OPTIONS)
+        self.assertEqual(code, 0, output)
+        #-- A plan writes nothing
+        self.assertEqual(os.listdir(self.output), [])
+        planned = dict((line.split()[0], int(line.split()[2])) for line in output.splitlines() if re.match(r'LOD\S+\s+[0-9.]+\s+\d+\s', line))
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output] + OPTIONS)
+        self.assertEqual(code, 0, output)
+        #-- With all the buildings in the sample the polygons are exact
+        for representation in ['LOD1_2_F0_H3', 'LOD2_2_F0']:
+            self.assertEqual(planned[representation], self.polygons(self.citygml(representation)))
+
+    def test_plan_scaled(self):
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output, '-pl', '8', '-pb', '800'] + OPTIONS)
+        self.assertEqual(code, 0, output)
+        self.assertIn('Plan of 800 building(s), predicted from a sample of 8 building(s)', output)
+        planned = dict((line.split()[0], int(line.split()[2])) for line in output.splitlines() if re.match(r'LOD\S+\s+[0-9.]+\s+\d+\s', line))
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output] + OPTIONS)
+        self.assertEqual(code, 0, output)
+        for representation in ['LOD1_2_F0_H3', 'LOD2_2_F0']:
+            self.assertEqual(planned[representation], 100 * self.polygons(self.citygml(representation)))
+
+    def test_target_polygons(self):
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output] + OPTIONS)
+        self.assertEqual(code, 0, output)
+        full = self.citygml('LOD2_2_F0')
+        target = self.polygons(full) // 2
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output, '-tg', 'LOD2_2_F0=' + str(target) + 'polygons'] + OPTIONS)
+        self.assertEqual(code, 0, output)
+        self.assertIn('Reached the target', output)
+        data = self.citygml('LOD2_2_F0')
+        buildings = data.count(b'<bldg:Building ')
+        #-- The first buildings of the XML, just enough to reach the target
+        self.assertGreaterEqual(self.polygons(data), target)
+        self.assertLess(buildings, 8)
+        self.assertEqual(self.citygml('LOD1_2_F0_H3').count(b'<bldg:Building '), buildings)
+        last = data.rindex(b'</cityObjectMember>')
+        self.assertTrue(full.startswith(data[:last]))
+        self.assertLess(self.polygons(data[:data.rindex(b'<cityObjectMember>')]), target)
+
+    def test_target_out_of_reach(self):
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output, '-tg', 'LOD2_2_F0=1GB'] + OPTIONS)
+        self.assertEqual(code, 0, output)
+        self.assertIn('The XML has too few buildings for the target', output)
+        self.assertEqual(self.citygml('LOD2_2_F0').count(b'<bldg:Building '), 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""Tests of the incremental regeneration from the XML of a previous run (-pi) in generateCityGML.py."""
+
+import filecmp
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+from test_quarantine import runScript
+
+OPTIONS = ['-rp', '0', '-id', '0', '-re', 'LOD1_*,LOD2_2_F0', '-at', 'csv']
+
+
+class PreviousTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.old = os.path.join(self.directory, 'old.xml')
+        code, output = runScript('randomiseCity.py', ['-n', '6', '-sd', '1', '-o', self.old])
+        self.assertEqual(code, 0, output)
+        #-- The first building is changed and the last one is removed
+        xmlFile = open(self.old, "r")
+        xml = xmlFile.read()
+        xmlFile.close()
+        xml = re.sub(r'<ySize>[0-9.]+</ySize>', '<ySize>9.5</ySize>', xml, count=1)
+        xml = xml[:xml.rindex('<building ')] + '</specifications>\n'
+        self.new = os.path.join(self.directory, 'new.xml')
+        xmlFile = open(self.new, "w")
+        xmlFile.write(xml)
+        xmlFile.close()
+        self.output = os.path.join(self.directory, 'city')
+        os.mkdir(self.output)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def generate(self, xml, output, arguments):
+        return runScript('generateCityGML.py', ['-i', xml, '-o', output] + OPTIONS + arguments)
+
+    def test_same_as_a_new_run(self):
+        code, output = self.generate(self.old, self.output, [])
+        self.assertEqual(code, 0, output)
+        code, output = self.generate(self.new, self.output, ['-pi', self.old])
+        self.assertEqual(code, 0, output)
+        self.assertIn('1 changed and 1 removed building(s)', output)
+        self.assertIn('Reused 4 building(s)', output)
+        expected = os.path.join(self.directory, 'expected')
+        os.mkdir(expected)
+        code, output = self.generate(self.new, expected, [])
+        self.assertEqual(code, 0, output)
+        names = sorted(os.listdir(expected))
+        self.assertIn('options.json', names)
+        self.assertEqual(names, sorted(os.listdir(self.output)))
+        match, mismatch, errors = filecmp.cmpfiles(expected, self.output, names, shallow=False)
+        self.assertEqual(mismatch + errors, [])
+
+    def test_other_options(self):
+        code, output = self.generate(self.old, self.output, [])
+        self.assertEqual(code, 0, output)
+        code, output = self.generate(self.new, self.output, ['-pi', self.old, '-p', '0'])
+        self.assertNotEqual(code, 0)
+        self.assertIn('another value of the option parts', output)
+        #-- A representation that the previous run did not write
+        code, output = self.generate(self.new, self.output, ['-pi', self.old, '-re', 'LOD1_*,LOD2_2_F0,LOD3_2'])
+        self.assertNotEqual(code, 0)
+        self.assertIn('did not write LOD3_2', output)
+
+    def test_unknown_options(self):
+        code, output = self.generate(self.old, self.output, [])
+        self.assertEqual(code, 0, output)
+        os.remove(os.path.join(self.output, 'options.json'))
+        code, output = self.generate(self.new, self.output, ['-pi', self.old])
+        self.assertNotEqual(code, 0)
+        self.assertIn('options.json is missing', output)
+
+    def test_compressed(self):
+        code, output = self.generate(self.old, self.output, ['-gz', '1'])
+        self.assertEqual(code, 0, output)
+        code, output = self.generate(self.new, self.output, ['-pi', self.old])
+        self.assertNotEqual(code, 0)
+        self.assertIn('are compressed (-gz)', output)
+
+
+if __name__ == '__main__':
+    unittest.main()
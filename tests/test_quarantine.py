@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""Tests of the quarantine of the buildings that fail in generateCityGML.py."""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def runScript(script, arguments):
+    """Run a script of the engine and return its exit code and output."""
+    process = subprocess.Popen([sys.executable, os.path.join(ROOT, script)] + arguments, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    output = process.communicate()[0]
+    return process.returncode, output.decode('utf-8', 'replace')
+
+
+class QuarantineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.xml = os.path.join(self.directory, 'buildings.xml')
+        code, output = runScript('randomiseCity.py', ['-n', '4', '-sd', '1', '-o', self.xml])
+        self.assertEqual(code, 0, output)
+        #-- The door of the last building is put on a wall that does not exist
+        xmlFile = open(self.xml, "r")
+        xml = xmlFile.read()
+        xmlFile.close()
+        doors = list(re.finditer(r'<door>\s*<wall>\d+</wall>', xml))
+        last = doors[-1]
+        xml = xml[:last.start()] + re.sub(r'<wall>\d+</wall>', '<wall>7</wall>', last.group(0)) + xml[last.end():]
+        xmlFile = open(self.xml, "w")
+        xmlFile.write(xml)
+        xmlFile.close()
+        self.output = os.path.join(self.directory, 'city')
+        os.mkdir(self.output)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def quarantined(self):
+        quarantineFile = open(os.path.join(self.output, 'quarantine.jsonl'), "r")
+        records = [json.loads(line) for line in quarantineFile]
+        quarantineFile.close()
+        return records
+
+    def buildingsIn(self, representation):
+        citygmlFile = open(os.path.join(self.output, representation + '.gml'), "r")
+        count = citygmlFile.read().count('<bldg:Building ')
+        citygmlFile.close()
+        return count
+
+    def test_failing_last_building(self):
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output, '-rp', '0'])
+        self.assertEqual(code, 0, output)
+        records = self.quarantined()
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]['position'], 3)
+        self.assertIn('unknown wall', records[0]['error'])
+        self.assertEqual(self.buildingsIn('LOD1_2_F0_H3'), 3)
+        self.assertEqual(self.buildingsIn('LOD3_2'), 3)
+
+    def test_failing_last_building_of_a_worker(self):
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output, '-rp', '0', '-wk', '2'])
+        self.assertEqual(code, 0, output)
+        self.assertEqual(len(self.quarantined()), 1)
+        self.assertEqual(self.buildingsIn('LOD2_2_F0'), 3)
+
+    def test_failing_building_of_a_representation_worker(self):
+        #-- After the 10 buildings on which the main process measures the representations, a building that fails only in interior-LOD1
+        code, output = runScript('randomiseCity.py', ['-n', '16', '-sd', '1', '-o', self.xml])
+        self.assertEqual(code, 0, output)
+        xmlFile = open(self.xml, "r")
+        xml = xmlFile.read()
+        xmlFile.close()
+        last = list(re.finditer(r'<floors>\d+</floors>', xml))[-1]
+        xmlFile = open(self.xml, "w")
+        xmlFile.write(xml[:last.start()] + '<floors>-1</floors>' + xml[last.end():])
+        xmlFile.close()
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output, '-rp', '0', '-rw', '2'])
+        self.assertEqual(code, 0, output)
+        records = self.quarantined()
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]['representation'], 'interior-LOD1')
+        for representation in ['LOD1_2_F0_H3', 'LOD3_3', 'interior-LOD1', 'interior-LOD2_3']:
+            self.assertEqual(self.buildingsIn(representation), 15)
+
+    def test_stop_at_the_first_failure(self):
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output, '-rp', '0', '-qr', '0'])
+        self.assertNotEqual(code, 0)
+        self.assertIn('unknown wall', output)
+
+
+if __name__ == '__main__':
+    unittest.main()
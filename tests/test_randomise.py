@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""Tests of the seeded random cities of randomiseCity.py: their layout and their streets, also split into tiles by generateCityGML.py."""
+
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+from test_quarantine import runScript
+
+
+class RandomiseTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def randomise(self, name, arguments):
+        xml = os.path.join(self.directory, name + '.xml')
+        code, output = runScript('randomiseCity.py', ['-o', xml] + arguments)
+        self.assertEqual(code, 0, output)
+        xmlFile = open(xml, "r")
+        data = xmlFile.read()
+        xmlFile.close()
+        return xml, data
+
+    def test_seed(self):
+        first = self.randomise('first', ['-n', '9', '-sd', '8', '-v', '1', '-r', '1'])[1]
+        second = self.randomise('second', ['-n', '9', '-sd', '8', '-v', '1', '-r', '1'])[1]
+        other = self.randomise('other', ['-n', '9', '-sd', '9', '-v', '1', '-r', '1'])[1]
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+
+    def test_rows(self):
+        data = self.randomise('rows', ['-n', '6', '-sd', '1', '-rw', '2'])[1]
+        orders = [tuple(int(i) for i in order.split()) for order in re.findall(r'<order>([^<]+)</order>', data)]
+        origins = [tuple(float(x) for x in origin.split()[:2]) for origin in re.findall(r'<origin>([^<]+ 0)</origin>', data)]
+        #-- A grid of 3 columns and 2 rows, a cell of 20 m each
+        self.assertEqual(sorted(orders), [(i, j) for i in range(3) for j in range(2)])
+        self.assertEqual([(20.0 * i, 20.0 * j) for i, j in orders], origins)
+
+    def test_street_tiles(self):
+        xml = self.randomise('streets', ['-n', '16', '-sd', '1', '-s', '1'])[0]
+        roads = {}
+        for tiles in ['0', '1']:
+            output = os.path.join(self.directory, 'tiles' + tiles)
+            os.mkdir(output)
+            code, message = runScript('generateCityGML.py', ['-i', xml, '-o', output, '-rp', '0', '-s', '1', '-st', tiles, '-re', 'Road-LOD0'])
+            self.assertEqual(code, 0, message)
+            citygmlFile = open(os.path.join(output, 'Road-LOD0.gml'), "r")
+            roads[tiles] = citygmlFile.read()
+            citygmlFile.close()
+        self.assertEqual(roads['0'].count('<tran:Road'), 1)
+        self.assertGreater(roads['1'].count('<tran:Road'), 1)
+        #-- The tiles cover the same extent as the whole network
+        extents = {}
+        for tiles in roads:
+            coordinates = [float(x) for posList in re.findall(r'<gml:posList[^>]*>([^<]*)<', roads[tiles]) for x in posList.split()]
+            extents[tiles] = (min(coordinates[0::3]), min(coordinates[1::3]), max(coordinates[0::3]), max(coordinates[1::3]))
+        self.assertEqual(extents['0'], extents['1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""Tests of the events of the progress (-rp, -ri) reported by generateCityGML.py."""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from test_quarantine import ROOT, runScript
+
+OPTIONS = ['-id', '0', '-re', 'LOD2_2_F0,LOD3_2']
+
+
+class ReportTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.xml = os.path.join(self.directory, 'buildings.xml')
+        code, output = runScript('randomiseCity.py', ['-n', '6', '-sd', '6', '-o', self.xml])
+        self.assertEqual(code, 0, output)
+        self.output = os.path.join(self.directory, 'city')
+        os.mkdir(self.output)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_events_in_a_file(self):
+        report = os.path.join(self.directory, 'events.jsonl')
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output, '-rp', report, '-ri', '0.01'] + OPTIONS)
+        self.assertEqual(code, 0, output)
+        reportFile = open(report, "r")
+        events = [json.loads(line) for line in reportFile]
+        reportFile.close()
+        self.assertEqual(events[0]['event'], 'start')
+        self.assertEqual(events[0]['total'], 6)
+        self.assertEqual(events[0]['representations'], 2)
+        self.assertEqual(events[-1]['event'], 'end')
+        self.assertEqual(events[-1]['buildings'], 6)
+        self.assertEqual(events[-1]['files'], 2)
+        self.assertEqual([event['event'] for event in events[1:-1]], ['progress'] * (len(events) - 2))
+        #-- The buildings only go up
+        counts = [event['buildings'] for event in events]
+        self.assertEqual(counts, sorted(counts))
+        for representation in ['LOD2_2_F0', 'LOD3_2']:
+            self.assertGreater(events[-1]['bytes'][representation], 0)
+            self.assertLess(events[-1]['bytes'][representation], os.path.getsize(os.path.join(self.output, representation + '.gml')))
+
+    def test_events_on_the_standard_error(self):
+        process = subprocess.Popen([sys.executable, os.path.join(ROOT, 'generateCityGML.py'), '-i', self.xml, '-o', self.output] + OPTIONS, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        messages, events = process.communicate()
+        self.assertEqual(process.returncode, 0, events)
+        events = [json.loads(line) for line in events.decode('utf-8').splitlines()]
+        self.assertEqual([events[0]['event'], events[-1]['event']], ['start', 'end'])
+        self.assertIn(b'Constructing buildings', messages)
+
+    def test_without_events(self):
+        process = subprocess.Popen([sys.executable, os.path.join(ROOT, 'generateCityGML.py'), '-i', self.xml, '-o', self.output, '-rp', '0'] + OPTIONS, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        messages, events = process.communicate()
+        self.assertEqual(process.returncode, 0, events)
+        self.assertEqual(events, b'')
+
+
+if __name__ == '__main__':
+    unittest.main()
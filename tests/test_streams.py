@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""Tests of the representations streamed by generateCityGML.py (-sm) to the standard output and to a Unix socket."""
+
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+
+from test_quarantine import ROOT, runScript
+
+OPTIONS = ['-rp', '0', '-id', '0', '-re', 'LOD1_2_F0_H3,LOD2_2_F0']
+
+
+class StreamsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.xml = os.path.join(self.directory, 'buildings.xml')
+        code, output = runScript('randomiseCity.py', ['-n', '5', '-sd', '3', '-o', self.xml])
+        self.assertEqual(code, 0, output)
+        self.expected = os.path.join(self.directory, 'expected')
+        os.mkdir(self.expected)
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.expected] + OPTIONS)
+        self.assertEqual(code, 0, output)
+        self.output = os.path.join(self.directory, 'city')
+        os.mkdir(self.output)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def citygml(self, directory, representation):
+        citygmlFile = open(os.path.join(directory, representation + '.gml'), "rb")
+        data = citygmlFile.read()
+        citygmlFile.close()
+        return data
+
+    def test_standard_output(self):
+        process = subprocess.Popen([sys.executable, os.path.join(ROOT, 'generateCityGML.py'), '-i', self.xml, '-o', self.output, '-sm', 'LOD2_2_F0=-'] + OPTIONS, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        data, messages = process.communicate()
+        self.assertEqual(process.returncode, 0, messages)
+        #-- The messages go to the standard error, the file is not written
+        self.assertEqual(data, self.citygml(self.expected, 'LOD2_2_F0'))
+        self.assertIn(b'Constructing buildings', messages)
+        self.assertFalse(os.path.isfile(os.path.join(self.output, 'LOD2_2_F0.gml')))
+        self.assertEqual(self.citygml(self.output, 'LOD1_2_F0_H3'), self.citygml(self.expected, 'LOD1_2_F0_H3'))
+
+    @unittest.skipUnless(hasattr(socket, 'AF_UNIX'), "Unix sockets are not available.")
+    def test_unix_socket(self):
+        path = os.path.join(self.directory, 'loader.sock')
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        server.listen(1)
+        received = []
+
+        def load():
+            connection = server.accept()[0]
+            chunks = []
+            while True:
+                chunk = connection.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            connection.close()
+            received.append(b''.join(chunks))
+
+        loader = threading.Thread(target=load)
+        loader.start()
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output, '-sm', 'LOD1_2_F0_H3=unix:' + path] + OPTIONS)
+        loader.join(60)
+        server.close()
+        self.assertEqual(code, 0, output)
+        self.assertEqual(received, [self.citygml(self.expected, 'LOD1_2_F0_H3')])
+
+    def test_same_target(self):
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output, '-sm', 'LOD1_2_F0_H3=-,LOD2_2_F0=-'] + OPTIONS)
+        self.assertNotEqual(code, 0)
+        self.assertIn('Each streamed representation needs a target of its own.', output)
+
+
+if __name__ == '__main__':
+    unittest.main()
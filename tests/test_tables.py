@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""Tests of the tables of attributes, metrics, validation and deviations written by generateCityGML.py."""
+
+import csv
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+from test_quarantine import runScript
+
+
+class TablesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.xml = os.path.join(self.directory, 'buildings.xml')
+        code, output = runScript('randomiseCity.py', ['-n', '3', '-sd', '1', '-o', self.xml])
+        self.assertEqual(code, 0, output)
+        self.output = os.path.join(self.directory, 'city')
+        os.mkdir(self.output)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def table(self, name, arguments):
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output, '-rp', '0'] + arguments)
+        self.assertEqual(code, 0, output)
+        csvFile = open(os.path.join(self.output, name + '.csv'), "r")
+        rows = list(csv.DictReader(csvFile))
+        csvFile.close()
+        return rows
+
+    def test_volume_of_the_outer_shell(self):
+        rows = self.table('metrics', ['-re', 'LOD0_2_F0_H3,LOD2_3_F0,LOD3_2', '-mt', 'csv'])
+        volumes = {}
+        for row in rows:
+            volumes.setdefault(row['representation'], []).append((float(row['volume']), row['volumeOf']))
+        #-- The representations on which the volumes are measured are generated as well
+        self.assertEqual(sorted(volumes), ['LOD0_2_F0_H3', 'LOD1_2_F0_H3', 'LOD1_2_F0_H3_solid', 'LOD2_2_F0', 'LOD2_2_F0_solid', 'LOD2_3_F0', 'LOD3_2', 'LOD3_2_solid'])
+        self.assertEqual(set(source for volume, source in volumes['LOD3_2']), set(['LOD3_2_solid']))
+        #-- Without overhangs LOD2_3_F0 is closed
+        self.assertTrue(set(source for volume, source in volumes['LOD2_3_F0']) <= set(['LOD2_3_F0', 'LOD2_2_F0']))
+        self.assertEqual(set(source for volume, source in volumes['LOD0_2_F0_H3']), set(['LOD1_2_F0_H3']))
+        for volume, source in volumes['LOD3_2']:
+            self.assertGreater(volume, 0.0)
+
+    def test_deviations(self):
+        rows = self.table('deviations', ['-re', 'LOD0_2_F0_H3,LOD1_2_F0_H3,LOD3_2', '-dv', 'LOD0_2_F0_H3:LOD1_2_F0_H3,LOD1_2_F0_H3:LOD3_2'])
+        self.assertEqual(len(rows), 6)
+        for row in rows:
+            #-- Measured on the solid of LOD3_2
+            self.assertNotEqual(row['volumeDifference'], '')
+            if row['representation'] == 'LOD0_2_F0_H3':
+                #-- The same footprint and height: no rounding errors are left
+                self.assertEqual(float(row['volumeDifference']), 0.0)
+                self.assertEqual(float(row['footprintAreaDifference']), 0.0)
+                self.assertEqual(float(row['hausdorffDistance']), 0.0)
+
+    def test_attributes(self):
+        rows = self.table('attributes', ['-re', 'LOD1_2_F0_H3', '-at', 'csv'])
+        xmlFile = open(self.xml, "r")
+        xml = xmlFile.read()
+        xmlFile.close()
+        #-- A row per building in the order of the XML, with its sizes
+        self.assertEqual([row['ID'] for row in rows], re.findall(r'<building ID="([^"]+)"', xml))
+        self.assertEqual([float(row['zSize']) for row in rows], [float(size) for size in re.findall(r'<zSize>([^<]+)</zSize>', xml)])
+        for row in rows:
+            self.assertGreaterEqual(float(row['footprintArea']), float(row['xSize']) * float(row['ySize']) - 1e-6)
+            self.assertGreater(float(row['eaves']), 0.0)
+
+    def test_validity(self):
+        rows = self.table('validity', ['-re', 'LOD1_2_F0_H3,LOD2_2_F0_solid,LOD3_2', '-ov', '1', '-va', 'csv'])
+        #-- The generated solids and polygons have no errors
+        self.assertEqual(rows, [])
+        code, output = runScript('generateCityGML.py', ['-i', self.xml, '-o', self.output, '-rp', '0', '-re', 'LOD2_2_F0_solid', '-ov', '1', '-va', 'csv'])
+        self.assertEqual(code, 0, output)
+        self.assertIn('All the generated polygons and solids are valid.', output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""Tests of the local tile service (serveTiles.py)."""
+
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+try:
+    from urllib.request import urlopen
+    from urllib.error import HTTPError
+except ImportError:
+    from urllib2 import urlopen, HTTPError
+
+from test_quarantine import ROOT, runScript
+
+
+def freePort():
+    """A port on localhost which is not in use."""
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+class TilesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.port = freePort()
+        self.service = subprocess.Popen([sys.executable, os.path.join(ROOT, 'serveTiles.py'), '-pt', str(self.port), '-id', '0'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        #-- Wait until the service listens
+        for attempt in range(100):
+            try:
+                socket.create_connection(('127.0.0.1', self.port)).close()
+                break
+            except (IOError, OSError):
+                time.sleep(0.1)
+
+    def tearDown(self):
+        self.service.kill()
+        self.service.communicate()
+        shutil.rmtree(self.directory)
+
+    def tile(self, query):
+        response = urlopen('http://127.0.0.1:' + str(self.port) + '/tile?' + query)
+        return response.read(), response.headers['X-Tile-Cache']
+
+    def test_same_as_the_generator(self):
+        xml = os.path.join(self.directory, 'buildings.xml')
+        code, output = runScript('randomiseCity.py', ['-n', '9', '-sd', '42', '-r', '0', '-p', '0', '-o', xml])
+        self.assertEqual(code, 0, output)
+        code, output = runScript('generateCityGML.py', ['-i', xml, '-o', self.directory, '-rp', '0', '-id', '0', '-re', 'LOD2_2_F0'])
+        self.assertEqual(code, 0, output)
+        citygmlFile = open(os.path.join(self.directory, 'LOD2_2_F0.gml'), "rb")
+        citygml = citygmlFile.read()
+        citygmlFile.close()
+        #-- The whole city in one tile
+        data, origin = self.tile('seed=42&n=9&bbox=-1000,-1000,10000,10000&representation=LOD2_2_F0')
+        self.assertEqual(origin, 'generated')
+        self.assertEqual(data, citygml)
+        data, origin = self.tile('seed=42&n=9&bbox=-1000,-1000,10000,10000&representation=LOD2_2_F0')
+        self.assertEqual(origin, 'memory')
+        self.assertEqual(data, citygml)
+
+    def test_unknown_representation(self):
+        with self.assertRaises(HTTPError) as context:
+            self.tile('seed=42&n=9&bbox=0,0,100,100&representation=LOD9_9')
+        self.assertEqual(context.exception.code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()